@@ -39,7 +39,7 @@ func SubmitDiary(store *storage.PostgresStore) gin.HandlerFunc {
 		}
 
 		// Submit diary (validates, creates events, materializes snapshot)
-		snapshot, err := store.SubmitDiary(req.AgentID, &req.Payload)
+		result, err := store.SubmitDiary(req.AgentID, &req.Payload)
 		if err != nil {
 			// Check if validation error
 			if validationErr, ok := err.(*validation.ValidationError); ok {
@@ -56,7 +56,8 @@ func SubmitDiary(store *storage.PostgresStore) gin.HandlerFunc {
 
 		c.JSON(http.StatusCreated, gin.H{
 			"agent_id": req.AgentID,
-			"snapshot": snapshot,
+			"snapshot": result.State,
+			"sequence": result.LastEventSequence,
 		})
 	}
 }
@@ -199,7 +199,7 @@ func TestSubmitDiary_MultipleSubmissions(t *testing.T) {
 	}
 
 	totalOperations := 0
-	for _, tc := range testCases {
+	for i, tc := range testCases {
 		t.Run(tc.name, func(t *testing.T) {
 			// Prepare diary submission request
 			diaryPayload := models.DiaryPayload{
@@ -245,6 +245,10 @@ func TestSubmitDiary_MultipleSubmissions(t *testing.T) {
 			assert.Contains(t, response, "agent_id")
 			assert.Equal(t, agentID, response["agent_id"])
 
+			// Each diary adds a metadata event plus one event per operation
+			expectedSequence := totalOperations + tc.operationCount + i + 1
+			assert.Equal(t, float64(expectedSequence), response["sequence"])
+
 			totalOperations += tc.operationCount
 		})
 	}
@@ -6,6 +6,7 @@ import (
 	"nowyouseeme/models"
 	"nowyouseeme/storage"
 	"nowyouseeme/validation"
+	"strconv"
 
 	"github.com/gin-gonic/gin"
 )
@@ -137,7 +138,24 @@ func GetTimeline(store *storage.PostgresStore) gin.HandlerFunc {
 			return
 		}
 
-		events, err := store.GetEventsByAgent(agentID)
+		// Optional: only events after this sequence number (incremental sync)
+		var afterSequence int64
+		if raw := c.Query("after_sequence"); raw != "" {
+			parsed, err := strconv.ParseInt(raw, 10, 64)
+			if err != nil || parsed < 0 {
+				c.JSON(http.StatusBadRequest, gin.H{"error": "after_sequence must be a non-negative integer"})
+				return
+			}
+			afterSequence = parsed
+		}
+
+		var events []*models.Event
+		var err error
+		if afterSequence > 0 {
+			events, err = store.GetUncommittedEvents(agentID, afterSequence)
+		} else {
+			events, err = store.GetEventsByAgent(agentID)
+		}
 		if err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
@@ -0,0 +1,121 @@
+package api
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"nowyouseeme/models"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestGetTimeline_AfterSequence(t *testing.T) {
+	// Skip if not running integration tests
+	if testing.Short() {
+		t.Skip("Skipping integration test in short mode")
+	}
+
+	store := setupTestDB(t)
+	defer cleanupTestDB(t, store)
+
+	gin.SetMode(gin.TestMode)
+	router := gin.New()
+	router.GET("/api/v1/timeline", GetTimeline(store))
+
+	agentID := "test_agent_timeline_001"
+	_, err := store.CreateAgent(&models.CreateAgentRequest{
+		AgentID:     agentID,
+		Name:        "Test Timeline Agent",
+		CurrentMBTI: "INTJ-A",
+	})
+	require.NoError(t, err, "Failed to create test agent")
+
+	// Two diaries: sequences 1-2 and 3-5
+	_, err = store.SubmitDiary(agentID, &models.DiaryPayload{
+		MBTI: "INTJ-A",
+		Operations: []models.Operation{
+			{
+				EntityType:    models.EntityGoal,
+				Op:            models.OpCreate,
+				EntityID:      "goal_1",
+				EntityContent: "Learn Go programming",
+				TargetStatus:  models.StatusPending,
+			},
+		},
+	})
+	require.NoError(t, err)
+	_, err = store.SubmitDiary(agentID, &models.DiaryPayload{
+		MBTI: "INTJ-A",
+		Operations: []models.Operation{
+			{
+				EntityType:   models.EntityGoal,
+				Op:           models.OpUpdate,
+				EntityID:     "goal_1",
+				TargetStatus: models.StatusProgress,
+			},
+			{
+				EntityType:    models.EntityCapability,
+				Op:            models.OpCreate,
+				EntityID:      "cap_1",
+				EntityContent: "Problem solving",
+				TargetStatus:  models.StatusPending,
+			},
+		},
+	})
+	require.NoError(t, err)
+
+	getTimeline := func(query string) (*httptest.ResponseRecorder, map[string]any) {
+		req, err := http.NewRequest(http.MethodGet, "/api/v1/timeline?agent_id="+agentID+query, nil)
+		require.NoError(t, err)
+
+		w := httptest.NewRecorder()
+		router.ServeHTTP(w, req)
+
+		var response map[string]any
+		require.NoError(t, json.Unmarshal(w.Body.Bytes(), &response))
+		return w, response
+	}
+
+	sequences := func(response map[string]any) []int64 {
+		result := []int64{}
+		for _, event := range response["events"].([]any) {
+			result = append(result, int64(event.(map[string]any)["sequence_number"].(float64)))
+		}
+		return result
+	}
+
+	t.Run("Negative after_sequence", func(t *testing.T) {
+		w, response := getTimeline("&after_sequence=-1")
+		assert.Equal(t, http.StatusBadRequest, w.Code)
+		assert.Equal(t, "after_sequence must be a non-negative integer", response["error"])
+	})
+
+	t.Run("Non-integer after_sequence", func(t *testing.T) {
+		w, response := getTimeline("&after_sequence=abc")
+		assert.Equal(t, http.StatusBadRequest, w.Code)
+		assert.Contains(t, response, "error")
+	})
+
+	t.Run("Only events after the sequence", func(t *testing.T) {
+		testCases := []struct {
+			query    string
+			expected []int64
+		}{
+			{"", []int64{1, 2, 3, 4, 5}},
+			{"&after_sequence=0", []int64{1, 2, 3, 4, 5}},
+			{"&after_sequence=2", []int64{3, 4, 5}},
+			{"&after_sequence=4", []int64{5}},
+			{"&after_sequence=5", []int64{}},
+		}
+
+		for _, tc := range testCases {
+			w, response := getTimeline(tc.query)
+			assert.Equal(t, http.StatusOK, w.Code, tc.query)
+			assert.Equal(t, tc.expected, sequences(response), tc.query)
+			assert.Equal(t, float64(len(tc.expected)), response["total_events"], tc.query)
+		}
+	})
+}
@@ -68,8 +68,9 @@ func (s *PostgresStore) AcquireLock(tx *sql.Tx, agentID string) error {
 	return nil
 }
 
-// SubmitDiary handles complete diary submission with transaction
-func (s *PostgresStore) SubmitDiary(agentID string, payload *models.DiaryPayload) (*models.AgentState, error) {
+// SubmitDiary handles complete diary submission with transaction.
+// It returns the new state together with the sequence number of the diary's last event.
+func (s *PostgresStore) SubmitDiary(agentID string, payload *models.DiaryPayload) (*models.AgentSnapshotResult, error) {
 	// Begin transaction with 5 second timeout
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
@@ -175,7 +176,8 @@ func (s *PostgresStore) SubmitDiary(agentID string, payload *models.DiaryPayload
 		return nil, fmt.Errorf("failed to commit transaction: %w", err)
 	}
 
-	return latestSnapshot.State, nil
+	latestSnapshot.LastEventSequence = nextSeq
+	return latestSnapshot, nil
 }
 
 // insertMBTITimeline inserts a new MBTI timeline record
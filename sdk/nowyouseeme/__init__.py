@@ -9,28 +9,113 @@ from .client import (
     AgentState,
     AgentSnapshotResult,
     AgentWithSnapshot,
+    DiaryResult,
+    DiarySkippedError,
     Operation,
     SelfReflection,
     Entity,
-    EntityCollection
+    EntityCollection,
+    Event
 )
+from .analytics import GalleryTables, gallery_to_table, write_gallery_parquet
+from .async_client import AsyncNowYouSeeMeClient
+from .cache import SnapshotCache
+from .codec import JSONCodec, StdlibJSONCodec, OrjsonCodec, get_codec
+from .compression import Compression, CompressionStats
+from .diff import ChangeKind, EntityChange, FieldChange, StateDiff, changes_to_operations, diff_states
+from .compact import CompactEntity, CompactEntityCollection, CompactAgentState, CompactAgentSnapshotResult
+from .optimize import optimize_operations
 from .operation_types import OperationType, get_all_operation_types, is_valid_operation_type
 from .entity_types import EntityType, Status
+from .event_types import EventType
+from .lifecycle import GoalLifecycle, GoalLifecycleBuilder, goal_lifecycle
+from .mirror import EventMirror, SyncResult
+from .mbti import MBTIPopulation, encode_mbti, decode_mbti, encode_mbti_array, decode_mbti_array
+from .search import EntityIndex, SearchHit
+from .shadow import ShadowState, ShadowStateStore
+from .watch import AgentChange
+from .bulk import ImportCheckpoint, ImportResult, SequenceMismatchError, bulk_import
+from .workload import WorkloadResult, WorkloadWriter, read_workload, replay_workload, replay_workload_async
+from .transitions import MBTISequences, MBTITransitions, fetch_mbti_sequences, fetch_mbti_sequences_async
+from .replay import ReplayEngine, ReplayError, apply_event_to_snapshot, replay_events_on_snapshot
+from .validation import ValidationError, validate_operations, find_operation_errors, is_valid_goal_transition
 
 __version__ = "0.3.0"
 __all__ = [
     "NowYouSeeMeClient",
+    "AsyncNowYouSeeMeClient",
+    "SnapshotCache",
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "get_codec",
+    "Compression",
+    "CompressionStats",
+    "ShadowState",
+    "ShadowStateStore",
+    "GalleryTables",
+    "gallery_to_table",
+    "write_gallery_parquet",
+    "MBTIPopulation",
+    "encode_mbti",
+    "decode_mbti",
+    "encode_mbti_array",
+    "decode_mbti_array",
+    "MBTISequences",
+    "MBTITransitions",
+    "fetch_mbti_sequences",
+    "fetch_mbti_sequences_async",
+    "GoalLifecycle",
+    "GoalLifecycleBuilder",
+    "goal_lifecycle",
+    "EventMirror",
+    "SyncResult",
+    "EntityIndex",
+    "SearchHit",
+    "AgentChange",
+    "ChangeKind",
+    "EntityChange",
+    "FieldChange",
+    "StateDiff",
+    "diff_states",
+    "changes_to_operations",
+    "optimize_operations",
+    "WorkloadWriter",
+    "WorkloadResult",
+    "read_workload",
+    "replay_workload",
+    "replay_workload_async",
+    "ImportCheckpoint",
+    "ImportResult",
+    "SequenceMismatchError",
+    "bulk_import",
     "Agent",
     "AgentState",
     "AgentSnapshotResult",
     "AgentWithSnapshot",
+    "DiaryResult",
+    "DiarySkippedError",
     "Operation",
     "SelfReflection",
     "Entity",
     "EntityCollection",
+    "CompactEntity",
+    "CompactEntityCollection",
+    "CompactAgentState",
+    "CompactAgentSnapshotResult",
+    "Event",
     "OperationType",
     "EntityType",
     "Status",
+    "EventType",
+    "ReplayEngine",
+    "ReplayError",
+    "apply_event_to_snapshot",
+    "replay_events_on_snapshot",
+    "ValidationError",
+    "validate_operations",
+    "find_operation_errors",
+    "is_valid_goal_transition",
     "get_all_operation_types",
     "is_valid_operation_type",
 ]
@@ -0,0 +1,382 @@
+"""
+Columnar gallery export
+
+Flattens a gallery into two column-oriented tables, one row per agent and one row per
+entity, as Arrow tables, Parquet files or NumPy record arrays. The raw GET /gallery JSON is
+read directly (no AgentWithSnapshot objects), each value is touched once, and low-cardinality
+columns (mbti, entity_type, status and the entities' agent_id) are built as integer codes
+into a dictionary, so 100k-agent galleries convert in seconds.
+
+The mbti column comes from GET /agents (current_mbti): the backend keeps an agent's MBTI
+there and leaves the snapshot state's mbti and mbti_confidence empty.
+
+pyarrow and numpy are imported on first use (pip install nowyouseeme[analytics]).
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import timezone
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .client import AgentWithSnapshot, NowYouSeeMeClient, _gallery_items as _response_items
+from .timestamps import parse_timestamp
+
+FORMATS = ("arrow", "numpy")
+
+AGENT_COLUMNS = ("agent_id", "name", "mbti", "mbti_confidence", "sequence", "updated_at")
+ENTITY_COLUMNS = ("agent_id", "entity_type", "entity_id", "status", "content")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        raise ImportError(
+            "Arrow/Parquet export requires pyarrow. Install it with: pip install nowyouseeme[analytics]"
+        ) from None
+    return pyarrow
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy export requires numpy. Install it with: pip install nowyouseeme[analytics]"
+        ) from None
+    return numpy
+
+
+class _Codes:
+    """Assigns dense integer codes to repeated strings, in first-seen order"""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _GalleryColumns:
+    """Column lists for both tables, filled in one pass over the gallery"""
+
+    def __init__(self, include_content: bool):
+        self.include_content = include_content
+        # One entry per agent
+        self.agent_ids: List[str] = []
+        self.names: List[str] = []
+        self.mbti = _Codes()
+        self.mbti_codes: List[int] = []
+        self.confidences: List[float] = []
+        self.sequences: List[int] = []
+        self.updated_at: List[Optional[Any]] = []
+        # One entry per entity
+        self.entity_agents: List[int] = []
+        self.entity_types = _Codes()
+        self.entity_type_codes: List[int] = []
+        self.entity_ids: List[str] = []
+        self.statuses = _Codes()
+        self.status_codes: List[int] = []
+        self.contents: List[str] = []
+
+    def add_dicts(self, items: Iterable[Dict[str, Any]], mbtis: Dict[str, str]) -> None:
+        """Flatten decoded GET /gallery items, taking MBTIs from mbtis where listed"""
+        agent_ids, names, confidences = self.agent_ids, self.names, self.confidences
+        sequences, updated_at, mbti_codes = self.sequences, self.updated_at, self.mbti_codes
+        mbti_code = self.mbti.code
+        entity_agents, entity_type_codes, entity_ids = self.entity_agents, self.entity_type_codes, self.entity_ids
+        status_codes, contents = self.status_codes, self.contents
+        entity_type_code, status_code = self.entity_types.code, self.statuses.code
+        include_content = self.include_content
+
+        for item in items:
+            index = len(agent_ids)
+            snapshot = item.get('snapshot') or {}
+            state = snapshot.get('state') or {}
+            agent_id = item.get('id') or snapshot.get('agent_id', '')
+            agent_ids.append(agent_id)
+            names.append(item.get('name', ''))
+            mbti_codes.append(mbti_code(mbtis.get(agent_id) or state.get('mbti') or ''))
+            confidences.append(state.get('mbti_confidence') or 0.0)
+            sequences.append(snapshot.get('sequence') or 0)
+            updated_at.append(snapshot.get('updated_at') or None)
+
+            for entity_type, collection in (state.get('entity_collections') or {}).items():
+                entities = (collection or {}).get('entities_by_id') or {}
+                if not entities:
+                    continue
+                count = len(entities)
+                entity_agents.extend(repeat(index, count))
+                entity_type_codes.extend(repeat(entity_type_code(entity_type), count))
+                entity_ids.extend(entities)
+                values = entities.values()
+                status_codes.extend([status_code(entity.get('status') or '') for entity in values])
+                if include_content:
+                    contents.extend([entity.get('content') or '' for entity in values])
+
+    def add_objects(self, items: Iterable[AgentWithSnapshot], mbtis: Dict[str, str]) -> None:
+        """Flatten AgentWithSnapshot objects (regular or compact snapshots), taking MBTIs from mbtis"""
+        include_content = self.include_content
+        for item in items:
+            index = len(self.agent_ids)
+            snapshot = item.snapshot
+            state = snapshot.state if snapshot is not None else None
+            self.agent_ids.append(item.id)
+            self.names.append(item.name)
+            mbti = mbtis.get(item.id) or (state.mbti if state is not None else '')
+            self.mbti_codes.append(self.mbti.code(mbti))
+            self.confidences.append(state.mbti_confidence if state is not None else 0.0)
+            self.sequences.append(snapshot.sequence if snapshot is not None else 0)
+            # Already parsed; kept as datetimes
+            self.updated_at.append(snapshot.updated_at if snapshot is not None else None)
+            if state is None:
+                continue
+
+            for entity_type, collection in state.entity_collections.items():
+                entities = collection.entities_by_id
+                if not entities:
+                    continue
+                count = len(entities)
+                self.entity_agents.extend(repeat(index, count))
+                self.entity_type_codes.extend(repeat(self.entity_types.code(entity_type), count))
+                self.entity_ids.extend(entities)
+                self.status_codes.extend([self.statuses.code(entity.status) for entity in entities.values()])
+                if include_content:
+                    self.contents.extend([entity.content for entity in entities.values()])
+
+
+@dataclass
+class GalleryTables:
+    """
+    A gallery as two tables.
+
+    agents has one row per agent: agent_id, name, mbti, mbti_confidence, sequence, updated_at.
+    entities has one row per entity: agent_id, entity_type, entity_id, status, content
+    (content only with include_content). In the NumPy form entities also carry agent_index,
+    the row of the entity's agent in agents.
+    """
+    agents: Any    # pyarrow.Table or numpy.recarray
+    entities: Any  # pyarrow.Table or numpy.recarray
+
+
+def _gallery_items(gallery: Any):
+    """Return ("dicts" | "objects", items) for any supported gallery source"""
+    if isinstance(gallery, NowYouSeeMeClient):
+        response = gallery._get("get_gallery", "/gallery")
+        response.raise_for_status()
+        gallery = gallery.codec.loads(response.content)
+    if isinstance(gallery, dict):
+        return "dicts", _response_items(gallery)
+    items = gallery if isinstance(gallery, Sequence) else list(gallery)
+    if items and isinstance(items[0], dict):
+        return "dicts", items
+    return "objects", items
+
+
+def _current_mbtis(gallery: Any, agents: Any = None) -> Dict[str, str]:
+    """
+    agent_id -> current_mbti, from agents or, for a client, from GET /agents.
+
+    Args:
+        gallery: The gallery source; GET /agents is only fetched when it is a client
+        agents: A decoded GET /agents response, its items, or Agent objects
+    """
+    if agents is None:
+        if not isinstance(gallery, NowYouSeeMeClient):
+            return {}
+        response = gallery._get("get_agents", "/agents")
+        response.raise_for_status()
+        agents = gallery.codec.loads(response.content)
+    if isinstance(agents, dict):
+        agents = agents.get('agents') or []
+    mbtis = {}
+    for agent in agents:
+        if isinstance(agent, dict):
+            mbtis[agent.get('id', '')] = agent.get('current_mbti') or ''
+        else:
+            mbtis[agent.id] = agent.current_mbti
+    return mbtis
+
+
+def _to_arrow(columns: _GalleryColumns) -> GalleryTables:
+    pa = _require_pyarrow()
+    pc = pa.compute
+
+    def dictionary(codes: List[int], values: List[str]):
+        return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), pa.array(values, pa.string()))
+
+    updated_at = columns.updated_at
+    if updated_at and any(isinstance(value, str) for value in updated_at):
+        # RFC3339 strings from the JSON; Arrow's cast parses them (offsets, 1-9 fraction digits) in C
+        updated_at = pc.cast(pa.array(updated_at, pa.string()), pa.timestamp("ns", tz="UTC"))
+    else:
+        updated_at = pa.array(updated_at, pa.timestamp("us", tz="UTC")).cast(pa.timestamp("ns", tz="UTC"))
+
+    agent_ids = pa.array(columns.agent_ids, pa.string())
+    agents = pa.table({
+        "agent_id": agent_ids,
+        "name": pa.array(columns.names, pa.string()),
+        "mbti": dictionary(columns.mbti_codes, columns.mbti.values),
+        "mbti_confidence": pa.array(columns.confidences, pa.float64()),
+        "sequence": pa.array(columns.sequences, pa.int64()),
+        "updated_at": updated_at,
+    })
+
+    entity_columns = {
+        # Indices into the agents' id column, so each id string is stored once
+        "agent_id": pa.DictionaryArray.from_arrays(pa.array(columns.entity_agents, pa.int32()), agent_ids),
+        "entity_type": dictionary(columns.entity_type_codes, columns.entity_types.values),
+        "entity_id": pa.array(columns.entity_ids, pa.string()),
+        "status": dictionary(columns.status_codes, columns.statuses.values),
+    }
+    if columns.include_content:
+        entity_columns["content"] = pa.array(columns.contents, pa.string())
+    return GalleryTables(agents=agents, entities=pa.table(entity_columns))
+
+
+def _datetime64(np, values: List[Optional[Any]]):
+    """UTC datetime64[ns] array from RFC3339 strings or datetimes (NaT for missing values)"""
+    normalized = []
+    for value in values:
+        if not value:
+            normalized.append("NaT")
+        elif isinstance(value, str) and value.endswith("Z"):
+            # NumPy parses the rest (up to 9 fraction digits) itself
+            normalized.append(value[:-1])
+        else:
+            parsed = parse_timestamp(value) if isinstance(value, str) else value
+            normalized.append(parsed.astimezone(timezone.utc).replace(tzinfo=None).isoformat())
+    return np.array(normalized, dtype="datetime64[ns]")
+
+
+def _to_numpy(columns: _GalleryColumns) -> GalleryTables:
+    np = _require_numpy()
+
+    def take(values: List[str], codes: List[int]):
+        # Expand codes with one vectorized lookup rather than per-row Python work
+        lookup = np.array(values if values else [""], dtype=object)
+        return lookup[np.asarray(codes, dtype=np.int32)] if codes else np.empty(0, dtype=object)
+
+    updated_at = _datetime64(np, columns.updated_at)
+
+    agent_ids = np.array(columns.agent_ids, dtype=object)
+    agents = np.rec.fromarrays([
+        agent_ids,
+        np.array(columns.names, dtype=object),
+        take(columns.mbti.values, columns.mbti_codes).astype("U6"),
+        np.array(columns.confidences, dtype=np.float64),
+        np.array(columns.sequences, dtype=np.int64),
+        updated_at,
+    ], names=list(AGENT_COLUMNS))
+
+    agent_index = np.array(columns.entity_agents, dtype=np.int32)
+    arrays = [
+        agent_index,
+        agent_ids[agent_index] if len(agent_index) else np.empty(0, dtype=object),
+        take(columns.entity_types.values, columns.entity_type_codes),
+        np.array(columns.entity_ids, dtype=object),
+        take(columns.statuses.values, columns.status_codes),
+    ]
+    names = ["agent_index"] + list(ENTITY_COLUMNS[:4])
+    if columns.include_content:
+        arrays.append(np.array(columns.contents, dtype=object))
+        names.append("content")
+    entities = np.rec.fromarrays(arrays, names=names)
+    return GalleryTables(agents=agents, entities=entities)
+
+
+def gallery_to_table(
+    gallery: Union[NowYouSeeMeClient, Dict[str, Any], Iterable[Dict[str, Any]], Iterable[AgentWithSnapshot]],
+    format: str = "arrow",
+    include_content: bool = True,
+    agents: Any = None
+) -> GalleryTables:
+    """
+    Flatten a gallery into agent and entity tables.
+
+    Example usage:
+        ```python
+        tables = gallery_to_table(client)                  # fetches GET /gallery
+        df = tables.entities.to_pandas()                   # categorical type/status columns
+        progress = tables.entities.filter(pc.equal(tables.entities["status"], "progress"))
+
+        arrays = gallery_to_table(client, format="numpy")
+        arrays.agents.sequence.mean()
+        ```
+
+    Args:
+        gallery: A client (GET /gallery is fetched and decoded without building objects), a
+            decoded GET /gallery response, its list of items, or AgentWithSnapshot objects
+        format: "arrow" for pyarrow Tables, "numpy" for NumPy record arrays
+        include_content: Include the entities' free-text content column
+        agents: The agents' current MBTIs, as a decoded GET /agents response, its items or
+            Agent objects (fetched when gallery is a client); agents not listed fall back to
+            the snapshot state's mbti, which the backend leaves empty
+
+    Returns:
+        GalleryTables with agents and entities
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If pyarrow (arrow) or numpy (numpy) is not installed
+        requests.RequestException: If fetching the gallery fails
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown format: {format!r} (expected one of {FORMATS})")
+
+    kind, items = _gallery_items(gallery)
+    # After the gallery, so every agent in it is listed
+    mbtis = _current_mbtis(gallery, agents)
+    columns = _GalleryColumns(include_content)
+    if kind == "dicts":
+        columns.add_dicts(items, mbtis)
+    else:
+        columns.add_objects(items, mbtis)
+
+    if format == "arrow":
+        return _to_arrow(columns)
+    return _to_numpy(columns)
+
+
+def write_gallery_parquet(
+    gallery: Union[NowYouSeeMeClient, Dict[str, Any], Iterable[Dict[str, Any]], Iterable[AgentWithSnapshot]],
+    directory: str,
+    include_content: bool = True,
+    compression: str = "zstd",
+    agents: Any = None
+) -> Dict[str, str]:
+    """
+    Write a gallery as agents.parquet and entities.parquet.
+
+    Dictionary-encoded columns stay dictionary-encoded in the files.
+
+    Args:
+        gallery: Anything gallery_to_table accepts
+        directory: Output directory (created if missing)
+        include_content: Include the entities' free-text content column
+        compression: Parquet compression codec
+        agents: The agents' current MBTIs (see gallery_to_table)
+
+    Returns:
+        Paths of the written files, keyed "agents" and "entities"
+    """
+    tables = gallery_to_table(gallery, format="arrow", include_content=include_content, agents=agents)
+    import pyarrow.parquet as pq
+
+    os.makedirs(directory, exist_ok=True)
+    paths = {
+        "agents": os.path.join(directory, "agents.parquet"),
+        "entities": os.path.join(directory, "entities.parquet"),
+    }
+    pq.write_table(tables.agents, paths["agents"], compression=compression)
+    pq.write_table(tables.entities, paths["entities"], compression=compression)
+    return paths
@@ -0,0 +1,610 @@
+"""
+NowYouSeeMe asyncio API Client
+
+Async counterpart to NowYouSeeMeClient. All agents driven from one event loop share
+a pooled aiohttp connector, so many diary submissions can be in flight at once.
+"""
+
+import asyncio
+import time
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable, Tuple, Union, TYPE_CHECKING
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency: pip install nowyouseeme[async]
+    aiohttp = None
+
+from .client import (
+    Agent,
+    AgentState,
+    AgentSnapshotResult,
+    AgentWithSnapshot,
+    DiaryResult,
+    DiarySkippedError,
+    Event,
+    Operation,
+    SelfReflection,
+    _group_batch_by_agent,
+    _gallery_from_dict,
+    _timeline_events,
+    _timeline_params,
+    _build_diary_request,
+    _prevalidate_diary,
+    _report_diary_failure,
+    _diary_response_to_snapshot,
+    _invalidate_cached_snapshot,
+    _empty_snapshot,
+    TIMELINE_KEYS,
+)
+from .codec import JSONCodec, get_codec
+from .compression import Compression
+from .streaming import JSONArrayStreamParser
+
+if TYPE_CHECKING:
+    from .cache import SnapshotCache
+    from .shadow import ShadowState, ShadowStateStore
+    from .watch import AgentChange
+
+
+class AsyncNowYouSeeMeClient:
+    """
+    Asyncio client for the NowYouSeeMe Event Sourcing API.
+
+    Exposes the same methods and return types as NowYouSeeMeClient, as coroutines.
+
+    Example usage:
+        ```python
+        import asyncio
+        from nowyouseeme import AsyncNowYouSeeMeClient
+
+        async def main():
+            async with AsyncNowYouSeeMeClient(max_concurrency=500) as client:
+                states = await asyncio.gather(*[
+                    client.submit_diary(agent_id=agent_id, mbti="INTP-A", operations=[])
+                    for agent_id in agent_ids
+                ])
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_base_url: str = "http://localhost:8080/api/v1",
+        max_concurrency: int = 1000,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        timeout: float = 30.0,
+        snapshot_cache: Optional["SnapshotCache"] = None,
+        prevalidate: bool = False,
+        shadow_states: Optional["ShadowStateStore"] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        compression: Optional[Compression] = None,
+        optimize: bool = False
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_base_url: Base URL for the API
+            max_concurrency: Maximum number of requests in flight at once (further calls wait)
+            max_connections: Size of the pooled connection limit (0 = unlimited)
+            max_connections_per_host: Per-host connection limit (0 = unlimited)
+            timeout: Total timeout for a single request, in seconds
+            snapshot_cache: Optional SnapshotCache serving repeated get_snapshot/get_agent reads;
+                an agent's entry is invalidated whenever its submit_diary succeeds
+            prevalidate: Validate submit_diary operations against the agent's shadow or cached
+                snapshot (when one is held) before sending
+            shadow_states: Optional ShadowStateStore tracking each agent's state from
+                create_agent/submit_diary responses; read it with shadow()
+            codec: JSON codec for request and response bodies: a JSONCodec, "json", "orjson",
+                or None for the fastest installed one
+            compression: Optional Compression settings: compressed request bodies, Accept-Encoding
+                for responses, and per-call sizes/timings in compression.stats
+            optimize: Fold each diary's operations into the shortest equivalent sequence
+                before sending (see optimize_operations), so fewer events are stored
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncNowYouSeeMeClient requires aiohttp. Install it with: pip install nowyouseeme[async]"
+            )
+
+        self.api_base_url = api_base_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.snapshot_cache = snapshot_cache
+        self.prevalidate = prevalidate
+        self.shadow_states = shadow_states
+        self.codec = get_codec(codec)
+        self.compression = compression
+        self.optimize = optimize
+
+        # Session and semaphore are bound to the running loop, so create them lazily
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncNowYouSeeMeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            headers = {'Content-Type': 'application/json'}
+            if self.compression is not None:
+                headers['Accept-Encoding'] = self.compression.accept_encoding
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                # With compression on, bodies are decoded in _read so the cost is recorded
+                auto_decompress=self.compression is None
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    def _encode(self, method: str, payload: Dict[str, Any]) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """Encode a JSON request body, compressed when compression is on; returns (body, extra headers)"""
+        body = self.codec.dumps(payload)
+        if self.compression is not None:
+            body, encoding = self.compression.encode_request(method, body)
+            if encoding is not None:
+                return body, {'Content-Encoding': encoding}
+        return body, None
+
+    async def _read(self, method: str, response: "aiohttp.ClientResponse") -> bytes:
+        body = await response.read()
+        if self.compression is not None:
+            body = self.compression.decode_response(method, body, response.headers.get('Content-Encoding'))
+        return body
+
+    async def _get_json(self, method: str, path: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.get(f"{self.api_base_url}{path}", params=params) as response:
+                response.raise_for_status()
+                return self.codec.loads(await self._read(method, response))
+
+    async def create_agent(
+        self,
+        agent_id: str,
+        name: str,
+        current_mbti: str
+    ) -> Agent:
+        """
+        Create a new agent.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            name: Display name of the agent
+            current_mbti: Initial MBTI type (e.g., "INTP-A", "ENFP-T")
+
+        Returns:
+            Created Agent object
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        payload = {
+            "agent_id": agent_id,
+            "name": name,
+            "current_mbti": current_mbti
+        }
+
+        body, headers = self._encode("create_agent", payload)
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.post(f"{self.api_base_url}/agents", data=body, headers=headers) as response:
+                response.raise_for_status()
+                agent = Agent.from_dict(self.codec.loads(await self._read("create_agent", response)))
+
+        if self.shadow_states is not None:
+            self.shadow_states.start(agent_id)
+        return agent
+
+    async def submit_diary(
+        self,
+        agent_id: str,
+        mbti: str,
+        operations: List[Operation],
+        mbti_confidence: float = 0.0,
+        geometry_representation: str = "",
+        context: str = "",
+        current_mood: str = "",
+        philosophy: str = "",
+        self_reflection: Optional[SelfReflection] = None,
+        validate_against: Optional[AgentState] = None
+    ) -> AgentState:
+        """
+        Submit a diary entry with operations to evolve the agent's state.
+
+        Diaries for the same agent must be awaited in order; the backend assigns
+        per-agent sequence numbers in submission order.
+
+        Args:
+            agent_id: ID of the agent submitting the diary
+            mbti: Current MBTI type
+            operations: List of state-changing operations
+            mbti_confidence: Confidence level for MBTI (0.0-1.0)
+            geometry_representation: URL or description of visual representation
+            context: Background context for current state
+            current_mood: Current emotional state
+            philosophy: Core beliefs and worldview
+            self_reflection: Daily reflections
+            validate_against: Agent's current state; if given, operations are checked against
+                it locally and nothing is sent when they would be rejected
+
+        Returns:
+            Updated AgentState after applying operations
+
+        Raises:
+            ValidationError: If local validation fails (nothing was sent)
+            aiohttp.ClientError: If the API request fails
+        """
+        _prevalidate_diary(
+            agent_id, operations, validate_against, self.prevalidate, self.snapshot_cache, self.shadow_states
+        )
+        if self.optimize:
+            from .optimize import optimize_operations
+            operations = optimize_operations(operations, validate_against)
+
+        payload = _build_diary_request(
+            agent_id=agent_id,
+            mbti=mbti,
+            operations=operations,
+            mbti_confidence=mbti_confidence,
+            geometry_representation=geometry_representation,
+            context=context,
+            current_mood=current_mood,
+            philosophy=philosophy,
+            self_reflection=self_reflection
+        )
+
+        body, headers = self._encode("submit_diary", payload)
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.post(f"{self.api_base_url}/diaries", data=body, headers=headers) as response:
+                content = await self._read("submit_diary", response)
+                if response.status != 201:
+                    _report_diary_failure(agent_id, response.status, content.decode("utf-8", "replace"), payload)
+                    if response.status == 400 and self.shadow_states is not None:
+                        # The server disagreed with what the shadow said was valid
+                        self.shadow_states.invalidate(agent_id)
+                response.raise_for_status()
+                result = self.codec.loads(content)
+
+        snapshot = _diary_response_to_snapshot(agent_id, result)
+        if self.snapshot_cache is not None:
+            _invalidate_cached_snapshot(self.snapshot_cache, agent_id, snapshot)
+        if self.shadow_states is not None:
+            self.shadow_states.record_submission(agent_id, operations, snapshot)
+        return snapshot.state if snapshot is not None else AgentState.from_dict({})
+
+    async def submit_diaries(
+        self,
+        batch: Iterable[Tuple[str, Dict[str, Any]]],
+        stop_on_error: bool = True
+    ) -> List[DiaryResult]:
+        """
+        Submit many diaries, pipelining different agents concurrently.
+
+        Each agent's diaries are awaited one after another in batch order; agents run as
+        separate tasks, bounded by max_concurrency.
+
+        Args:
+            batch: Iterable of (agent_id, payload) pairs, where payload holds the keyword
+                arguments of submit_diary (mbti, operations, mood, ...)
+            stop_on_error: If an agent's diary fails, skip that agent's remaining diaries
+
+        Returns:
+            One DiaryResult per batch item, in batch order
+        """
+        count, queues = _group_batch_by_agent(batch)
+        results: List[Optional[DiaryResult]] = [None] * count
+
+        async def submit_agent_queue(agent_id: str, queue: List[Tuple[int, Dict[str, Any]]]) -> None:
+            failed = False
+            for index, payload in queue:
+                if failed:
+                    results[index] = DiaryResult(
+                        agent_id=agent_id,
+                        error=DiarySkippedError(f"earlier diary for agent {agent_id} failed")
+                    )
+                    continue
+                try:
+                    state = await self.submit_diary(agent_id=agent_id, **payload)
+                    results[index] = DiaryResult(agent_id=agent_id, state=state)
+                except Exception as e:
+                    results[index] = DiaryResult(agent_id=agent_id, error=e)
+                    failed = stop_on_error
+
+        await asyncio.gather(*[
+            submit_agent_queue(agent_id, queue) for agent_id, queue in queues.items()
+        ])
+
+        return results
+
+    async def get_gallery(self, compact: bool = False) -> List[AgentWithSnapshot]:
+        """
+        Get all agents with their current state snapshots.
+
+        Args:
+            compact: Decode snapshots into slotted, string-interned objects
+
+        Returns:
+            List of agents with snapshots
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        data = await self._get_json("get_gallery", "/gallery")
+        return _gallery_from_dict(data, compact)
+
+    async def get_agent(self, agent_id: str) -> Dict[str, Any]:
+        """
+        Get a specific agent with its current snapshot.
+
+        Args:
+            agent_id: ID of the agent
+
+        Returns:
+            Dictionary with 'agent' and 'snapshot' keys
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        if self.snapshot_cache is not None:
+            cached = self.snapshot_cache.get_agent(agent_id)
+            if cached is not None:
+                return cached
+
+        data = await self._get_json("get_agent", "/agents", params={"agent_id": agent_id})
+        snapshot_data = data.get('snapshot')
+        result = {
+            'agent': Agent.from_dict(data['agent']),
+            'snapshot': AgentSnapshotResult.from_dict(snapshot_data) if snapshot_data else None
+        }
+        if self.snapshot_cache is not None:
+            self.snapshot_cache.put(agent_id, result['snapshot'], agent=result['agent'])
+        return result
+
+    async def get_snapshot(self, agent_id: str) -> AgentSnapshotResult:
+        """
+        Get current state snapshot for an agent.
+
+        Args:
+            agent_id: ID of the agent
+
+        Returns:
+            AgentSnapshotResult with complete snapshot info
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        if self.snapshot_cache is not None:
+            cached = self.snapshot_cache.get(agent_id)
+            if cached is not None:
+                return cached
+
+        data = await self._get_json("get_snapshot", "/snapshot", params={"agent_id": agent_id})
+        snapshot_data = data.get('snapshot')
+        if snapshot_data:
+            snapshot = AgentSnapshotResult.from_dict(snapshot_data)
+            if self.snapshot_cache is not None:
+                self.snapshot_cache.put(agent_id, snapshot)
+            return snapshot
+        # Return empty snapshot if none exists
+        return _empty_snapshot(agent_id)
+
+    async def shadow(self, agent_id: str) -> "ShadowState":
+        """
+        Get the client's shadow of an agent's state.
+
+        The shadow follows create_agent and submit_diary responses, so it is only fetched
+        with get_snapshot when the agent isn't tracked yet or a rejected diary showed it
+        was out of date.
+
+        Args:
+            agent_id: ID of the agent
+
+        Returns:
+            ShadowState to query entities and statuses
+
+        Raises:
+            ValueError: If the client was created without shadow_states
+            aiohttp.ClientError: If the snapshot has to be fetched and the request fails
+        """
+        if self.shadow_states is None:
+            raise ValueError("shadow state tracking is not enabled (pass shadow_states)")
+        shadow = self.shadow_states.get(agent_id)
+        if shadow is None:
+            shadow = self.shadow_states.resync(await self.get_snapshot(agent_id))
+        return shadow
+
+    async def get_timeline(self, agent_id: str, after_sequence: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the timeline of diary submissions for an agent.
+
+        Args:
+            agent_id: ID of the agent
+            after_sequence: Only return events with a higher sequence number
+
+        Returns:
+            List of diary entries with events
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        data = await self._get_json("get_timeline", "/timeline", params=_timeline_params(agent_id, after_sequence))
+        return _timeline_events(data, after_sequence)
+
+    async def iter_timeline(
+        self,
+        agent_id: str,
+        chunk_size: int = 64 * 1024,
+        after_sequence: Optional[int] = None
+    ) -> AsyncIterator[Event]:
+        """
+        Stream an agent's timeline, yielding one typed Event at a time.
+
+        Events are decoded incrementally from the response body, so peak memory stays
+        flat regardless of history length. Stopping iteration early releases the connection.
+
+        Args:
+            agent_id: ID of the agent
+            chunk_size: Number of bytes read from the socket at a time
+            after_sequence: Only yield events with a higher sequence number
+
+        Yields:
+            Events in the order the server returns them
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+            ValueError: If the response body is not valid JSON
+        """
+        session = self._get_session()
+        parser = JSONArrayStreamParser(TIMELINE_KEYS)
+        async with self._semaphore:
+            async with session.get(
+                f"{self.api_base_url}/timeline", params=_timeline_params(agent_id, after_sequence)
+            ) as response:
+                response.raise_for_status()
+                decoder = None
+                if self.compression is not None:
+                    decoder = self.compression.stream_decoder("iter_timeline", response.headers.get('Content-Encoding'))
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if decoder is not None:
+                            chunk = decoder.decode(chunk)
+                        for item in parser.feed(chunk):
+                            if after_sequence is None or item.get('sequence_number', 0) > after_sequence:
+                                yield Event.from_dict(item)
+                        if parser.done:
+                            return
+                    tail = decoder.finish() if decoder is not None else b""
+                    for item in parser.feed(tail) + parser.close():
+                        if after_sequence is None or item.get('sequence_number', 0) > after_sequence:
+                            yield Event.from_dict(item)
+                finally:
+                    if decoder is not None:
+                        decoder.close()
+
+    async def watch(
+        self,
+        agent_ids: Iterable[str],
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator["AgentChange"]:
+        """
+        Watch agents for new events, yielding each agent whose sequence moved.
+
+        Each agent's snapshot is fetched once; after that a check only asks for the timeline
+        after the last sequence seen and replays the new events locally. Agents due at the
+        same time are checked together, concurrently (bounded by max_concurrency); an agent
+        whose check finds nothing is checked backoff times less often, up to max_interval,
+        until it changes again.
+
+        Example usage:
+            ```python
+            async for change in client.watch(agent_ids, interval=0.5):
+                for entity in change.diff:
+                    print(change.agent_id, entity.kind, entity.entity_id)
+            ```
+
+        Args:
+            agent_ids: Agents to watch
+            interval: Seconds between checks of an active agent
+            max_interval: Longest wait between checks of a quiet agent
+            backoff: Factor a quiet agent's interval grows by after each empty check
+            timeout: Stop after this many seconds (None = until the caller stops iterating)
+
+        Yields:
+            AgentChange with the new events, the resulting snapshot and its diff
+
+        Raises:
+            aiohttp.ClientError: If a request fails
+        """
+        from .watch import WatchSchedule, _Watched, _advance, _changed
+
+        agent_ids = list(dict.fromkeys(agent_ids))
+
+        async def check(agent_id: str) -> Optional["AgentChange"]:
+            watched = agents[agent_id]
+            events = await self.get_timeline(agent_id, after_sequence=watched.last_sequence)
+            if not events:
+                return None
+            change = _advance(watched, agent_id, events)
+            if change is None:
+                # The events don't replay onto our copy; take the server's state instead
+                change = _changed(watched, agent_id, events, await self.get_snapshot(agent_id))
+            return change
+
+        snapshots = await asyncio.gather(*[self.get_snapshot(agent_id) for agent_id in agent_ids])
+        agents = {agent_id: _Watched(snapshot) for agent_id, snapshot in zip(agent_ids, snapshots)}
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        schedule = WatchSchedule(agent_ids, interval, max_interval, backoff, now=start)
+        while schedule:
+            due = schedule.pop_due(time.monotonic())
+            if due:
+                changes = await asyncio.gather(*[check(agent_id) for agent_id in due])
+                # One timestamp for the whole batch keeps agents with equal intervals together
+                now = time.monotonic()
+                for agent_id, change in zip(due, changes):
+                    schedule.reschedule(agent_id, change is not None, now)
+                for change in changes:
+                    if change is not None:
+                        yield change
+
+            now = time.monotonic()
+            wake = schedule.next_due()
+            if deadline is not None:
+                if now >= deadline:
+                    return
+                wake = min(wake, deadline)
+            if wake > now:
+                await asyncio.sleep(wake - now)
+
+    async def get_snapshots_by_mbti(self, mbti_type: str) -> List[Dict[str, Any]]:
+        """
+        Get all agents filtered by MBTI type.
+
+        Args:
+            mbti_type: MBTI type to filter by (e.g., "INTP", "ENFP")
+
+        Returns:
+            List of agents with matching MBTI type
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        data = await self._get_json("get_snapshots_by_mbti", "/snapshots", params={"mbti": mbti_type})
+        return data.get('snapshots', [])
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check if the API server is healthy.
+
+        Returns:
+            Health status dictionary
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        return await self._get_json("health_check", "/health")
@@ -0,0 +1,576 @@
+"""
+Load-testing harness
+
+Drives a weighted mix of SDK calls (create_agent, submit_diary, get_gallery, get_snapshot,
+get_timeline, get_snapshots_by_mbti) at a fixed concurrency or a target request rate,
+records a log-linear (HDR-style) latency histogram per operation and writes JSON/CSV
+reports that can be compared between releases.
+
+Usage:
+    python -m nowyouseeme.bench --concurrency 32 --duration 30
+    python -m nowyouseeme.bench --rps 500 --duration 60 --json report.json --csv report.csv
+    python -m nowyouseeme.bench --mix submit_diary=50,get_snapshot=50 --requests 10000
+    python -m nowyouseeme.bench --standin            # offline, in-process stand-in (no sockets)
+    python -m nowyouseeme.bench --standin http       # offline, stand-in over loopback HTTP
+    python -m nowyouseeme.bench --standin http --compression zstd
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .client import NowYouSeeMeClient, Operation, SelfReflection
+from .compression import Compression, CompressionStats, available_encodings
+from .entity_types import EntityType, Status
+from .operation_types import OperationType
+from .standin import StandInServer, standin_client
+
+WRITE_OPERATIONS = ("create_agent", "submit_diary")
+READ_OPERATIONS = ("get_gallery", "get_snapshot", "get_timeline", "get_snapshots_by_mbti")
+
+# Read-heavy mix loosely matching gallery traffic
+DEFAULT_MIX = {
+    "create_agent": 2,
+    "submit_diary": 28,
+    "get_gallery": 5,
+    "get_snapshot": 35,
+    "get_timeline": 15,
+    "get_snapshots_by_mbti": 15,
+}
+
+# README targets: "Write < 50ms, Read < 10ms"
+DEFAULT_WRITE_TARGET_MS = 50.0
+DEFAULT_READ_TARGET_MS = 10.0
+
+REPORT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+MBTI_TYPES = [f"{a}{b}{c}{d}-{e}" for a in "IE" for b in "NS" for c in "TF" for d in "JP" for e in "AT"]
+
+CSV_FIELDS = [
+    "operation", "count", "errors", "throughput_rps", "min_ms", "mean_ms",
+    "p50_ms", "p90_ms", "p99_ms", "p99_9_ms", "max_ms", "target_ms", "meets_target",
+]
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram with bounded relative error (HDR histogram layout).
+
+    Values are recorded in integer microseconds. Below 2**sub_bucket_bits every microsecond
+    has its own bucket; above that, each power of two is split into 2**(sub_bucket_bits - 1)
+    linear buckets, so any recorded value is reported within 1 / 2**(sub_bucket_bits - 1)
+    of its true value (< 0.8% with the default 8 bits) while memory stays logarithmic in range.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.sum_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (shift + 1) * self._half_count + (value >> shift) - self._half_count
+
+    def _bucket_range(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest value (inclusive) that fall into a bucket"""
+        if index < self._sub_bucket_count:
+            return index, index
+        shift = index // self._half_count - 1
+        lowest = (index % self._half_count + self._half_count) << shift
+        return lowest, lowest + (1 << shift) - 1
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Record a latency given in seconds"""
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.sum_us += value * count
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if self.max_us is None or value > self.max_us:
+            self.max_us = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of another histogram with the same bucket layout"""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("cannot merge histograms with different sub_bucket_bits")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        if other.max_us is not None:
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+
+    def percentile(self, percentile: float) -> float:
+        """Latency in milliseconds at or below which the given percentage of samples fall"""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100.0 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                _, highest = self._bucket_range(index)
+                return min(highest, self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds"""
+        return self.sum_us / self.total / 1000.0 if self.total else 0.0
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Non-empty buckets as (upper bound in ms, count), in increasing order"""
+        return [(self._bucket_range(index)[1] / 1000.0, self.counts[index]) for index in sorted(self.counts)]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as "submit_diary=40,get_snapshot=60".
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is not a positive number
+    """
+    known = WRITE_OPERATIONS + READ_OPERATIONS
+    mix = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in known:
+            raise ValueError(f"unknown operation {name!r}; expected one of: {', '.join(known)}")
+        try:
+            value = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"invalid weight for {name}: {weight!r}") from None
+        if value <= 0:
+            raise ValueError(f"weight for {name} must be positive")
+        mix[name] = value
+    if not mix:
+        raise ValueError("operation mix is empty")
+    return mix
+
+
+class LoadTest:
+    """
+    Run a weighted operation mix against the API and collect per-operation histograms.
+
+    In closed-loop mode (rps=None) `concurrency` workers issue requests back to back. With
+    a target rps, requests are scheduled at fixed intervals and latency is measured from the
+    scheduled start, so a stalled server shows up as queueing delay rather than being hidden
+    (coordinated omission); `concurrency` then caps the requests in flight.
+
+    Example usage:
+        ```python
+        test = LoadTest(NowYouSeeMeClient(pool_maxsize=32), concurrency=32, duration=30)
+        report = test.run()
+        print(format_report(report))
+        ```
+    """
+
+    def __init__(
+        self,
+        client: NowYouSeeMeClient,
+        mix: Optional[Dict[str, float]] = None,
+        concurrency: int = 16,
+        rps: Optional[float] = None,
+        duration: float = 10.0,
+        max_requests: Optional[int] = None,
+        seed_agents: int = 20,
+        seed: Optional[int] = None,
+        write_target_ms: float = DEFAULT_WRITE_TARGET_MS,
+        read_target_ms: float = DEFAULT_READ_TARGET_MS,
+        target_percentile: float = 99.0
+    ):
+        """
+        Args:
+            client: Client used by all workers (its connection pool should cover `concurrency`)
+            mix: Relative weight per operation name (default: DEFAULT_MIX)
+            concurrency: Number of worker threads
+            rps: Target requests per second across all workers (None = as fast as possible)
+            duration: Seconds to run (ignored when only max_requests should bound the run: pass 0)
+            max_requests: Stop after this many requests
+            seed_agents: Agents created (with an initial diary) before measuring starts
+            seed: Random seed for reproducible operation sequences
+            write_target_ms: Latency target for write operations
+            read_target_ms: Latency target for read operations
+            target_percentile: Percentile compared against the targets
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if rps is not None and rps <= 0:
+            raise ValueError("rps must be positive")
+        if not duration and not max_requests:
+            raise ValueError("either duration or max_requests must be set")
+
+        self.client = client
+        self.mix = dict(mix or DEFAULT_MIX)
+        self.concurrency = concurrency
+        self.rps = rps
+        self.duration = duration
+        self.max_requests = max_requests
+        self.seed_agents = seed_agents
+        self.seed = seed if seed is not None else random.randrange(1 << 30)
+        self.write_target_ms = write_target_ms
+        self.read_target_ms = read_target_ms
+        self.target_percentile = target_percentile
+
+        self.agent_ids: List[str] = []
+        self._agent_lock = threading.Lock()
+        self._entity_counter = itertools.count(1)
+        self._run_id = f"{int(time.time())}_{random.randrange(1 << 24):06x}"
+
+    # --- operations -----------------------------------------------------------
+
+    def _create_agent(self, rng: random.Random, with_diary: bool = False) -> None:
+        agent_id = f"bench_{self._run_id}_{next(self._entity_counter)}"
+        mbti = rng.choice(MBTI_TYPES)
+        self.client.create_agent(agent_id=agent_id, name=f"Bench {agent_id}", current_mbti=mbti)
+        if with_diary:
+            self._submit(agent_id, mbti, rng)
+        with self._agent_lock:
+            self.agent_ids.append(agent_id)
+
+    def _submit(self, agent_id: str, mbti: str, rng: random.Random) -> None:
+        # A fresh entity id per diary keeps every submission valid, even when several
+        # workers write to the same agent
+        self.client.submit_diary(
+            agent_id=agent_id,
+            mbti=mbti,
+            mbti_confidence=round(rng.uniform(0.6, 0.95), 2),
+            current_mood="Benchmarking",
+            philosophy="Measure, don't guess",
+            self_reflection=SelfReflection(what_happened_today="Another load test"),
+            operations=[Operation(
+                entity_type=EntityType.CAPABILITY,
+                op=OperationType.CREATE,
+                entity_id=f"cap_{next(self._entity_counter)}",
+                entity_content="Handling load",
+                target_status=Status.PENDING
+            )]
+        )
+
+    def _call(self, operation: str, rng: random.Random) -> None:
+        if operation == "create_agent":
+            self._create_agent(rng)
+        elif operation == "submit_diary":
+            self._submit(rng.choice(self.agent_ids), rng.choice(MBTI_TYPES), rng)
+        elif operation == "get_gallery":
+            self.client.get_gallery()
+        elif operation == "get_snapshot":
+            self.client.get_snapshot(rng.choice(self.agent_ids))
+        elif operation == "get_timeline":
+            self.client.get_timeline(rng.choice(self.agent_ids))
+        elif operation == "get_snapshots_by_mbti":
+            self.client.get_snapshots_by_mbti(rng.choice(MBTI_TYPES))
+        else:
+            raise ValueError(f"unknown operation: {operation}")
+
+    # --- driver ---------------------------------------------------------------
+
+    def setup(self) -> None:
+        """Create the seed agents that reads and diary submissions target"""
+        rng = random.Random(self.seed)
+        while len(self.agent_ids) < max(1, self.seed_agents):
+            self._create_agent(rng, with_diary=True)
+
+    def run(self) -> Dict[str, Any]:
+        """Set up seed agents, run the load and return the report dict"""
+        self.setup()
+
+        operations = list(self.mix)
+        cum_weights = list(itertools.accumulate(self.mix[name] for name in operations))
+        histograms = {name: LatencyHistogram() for name in operations}
+        errors = {name: 0 for name in operations}
+        error_samples: Dict[str, str] = {}
+        lock = threading.Lock()
+        slots = itertools.count()
+
+        start = time.perf_counter()
+        deadline = start + self.duration if self.duration else None
+
+        def worker(index: int) -> None:
+            rng = random.Random(self.seed * 1000003 + index)
+            local = {name: LatencyHistogram() for name in operations}
+            local_errors = {name: 0 for name in operations}
+            while True:
+                slot = next(slots)
+                if self.max_requests is not None and slot >= self.max_requests:
+                    break
+                if self.rps:
+                    scheduled = start + slot / self.rps
+                    if deadline is not None and scheduled >= deadline:
+                        break
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    scheduled = time.perf_counter()
+                    if deadline is not None and scheduled >= deadline:
+                        break
+
+                operation = rng.choices(operations, cum_weights=cum_weights)[0]
+                try:
+                    self._call(operation, rng)
+                except Exception as e:
+                    local_errors[operation] += 1
+                    error_samples.setdefault(operation, f"{type(e).__name__}: {e}")
+                    continue
+                local[operation].record(time.perf_counter() - scheduled)
+
+            with lock:
+                for name in operations:
+                    histograms[name].merge(local[name])
+                    errors[name] += local_errors[name]
+
+        threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        return self._report(histograms, errors, error_samples, elapsed)
+
+    def _report(
+        self,
+        histograms: Dict[str, LatencyHistogram],
+        errors: Dict[str, int],
+        error_samples: Dict[str, str],
+        elapsed: float
+    ) -> Dict[str, Any]:
+        report_operations = {}
+        for name, histogram in histograms.items():
+            target = self.write_target_ms if name in WRITE_OPERATIONS else self.read_target_ms
+            entry = {
+                "count": histogram.total,
+                "errors": errors[name],
+                "throughput_rps": histogram.total / elapsed if elapsed > 0 else 0.0,
+                "min_ms": (histogram.min_us or 0) / 1000.0,
+                "mean_ms": histogram.mean,
+                "max_ms": (histogram.max_us or 0) / 1000.0,
+            }
+            for percentile in REPORT_PERCENTILES:
+                entry[_percentile_key(percentile)] = histogram.percentile(percentile)
+            entry["target_ms"] = target
+            entry["meets_target"] = bool(histogram.total) and histogram.percentile(self.target_percentile) < target
+            entry["histogram"] = histogram.buckets()
+            if name in error_samples:
+                entry["error_sample"] = error_samples[name]
+            report_operations[name] = entry
+
+        total = sum(histogram.total for histogram in histograms.values())
+        return {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "api_base_url": getattr(self.client, "api_base_url", ""),
+            "config": {
+                "mix": self.mix,
+                "concurrency": self.concurrency,
+                "rps": self.rps,
+                "duration": self.duration,
+                "max_requests": self.max_requests,
+                "seed_agents": self.seed_agents,
+                "seed": self.seed,
+                "target_percentile": self.target_percentile,
+            },
+            "elapsed_seconds": elapsed,
+            "total_requests": total,
+            "total_errors": sum(errors.values()),
+            "throughput_rps": total / elapsed if elapsed > 0 else 0.0,
+            "operations": report_operations,
+        }
+
+
+def _percentile_key(percentile: float) -> str:
+    return f"p{percentile:g}_ms".replace(".", "_")
+
+
+def write_json_report(report: Dict[str, Any], path: str) -> None:
+    """Write the full report, including histogram buckets, as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv_report(report: Dict[str, Any], path: str) -> None:
+    """Write one summary row per operation as CSV"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for name, entry in report["operations"].items():
+            writer.writerow({"operation": name, **entry})
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary table"""
+    target_percentile = report["config"]["target_percentile"]
+    lines = [
+        "=" * 96,
+        f"{report['total_requests']} requests in {report['elapsed_seconds']:.2f}s "
+        f"({report['throughput_rps']:.1f} req/s), {report['total_errors']} errors",
+        "-" * 96,
+        f"{'operation':<24}{'count':>8}{'err':>6}{'req/s':>9}{'mean':>8}{'p50':>8}{'p90':>8}"
+        f"{'p99':>8}{'p99.9':>8}{'max':>8}  target (p{target_percentile:g})",
+    ]
+    for name, entry in report["operations"].items():
+        verdict = "ok" if entry["meets_target"] else "MISS"
+        lines.append(
+            f"{name:<24}{entry['count']:>8}{entry['errors']:>6}{entry['throughput_rps']:>9.1f}"
+            f"{entry['mean_ms']:>8.1f}{entry['p50_ms']:>8.1f}{entry['p90_ms']:>8.1f}"
+            f"{entry['p99_ms']:>8.1f}{entry['p99_9_ms']:>8.1f}{entry['max_ms']:>8.1f}"
+            f"  < {entry['target_ms']:g}ms {verdict}"
+        )
+    lines.append("-" * 96)
+    lines.append("latencies in ms")
+    for name, entry in report["operations"].items():
+        if "error_sample" in entry:
+            lines.append(f"first {name} error: {entry['error_sample']}")
+    lines.append("=" * 96)
+    return "\n".join(lines)
+
+
+def compression_report(stats: CompressionStats) -> Dict[str, Any]:
+    """Compression totals per operation and direction, keyed by '<operation> <direction>'"""
+    return {f"{method} {direction}": row for (method, direction), row in sorted(stats.summary().items())}
+
+
+def format_compression_report(rows: Dict[str, Any]) -> str:
+    """Human-readable compression table"""
+    lines = [
+        f"{'operation':<34}{'calls':>8}{'raw KB':>12}{'wire KB':>12}{'ratio':>8}{'ms/call':>10}",
+    ]
+    for name, row in rows.items():
+        lines.append(
+            f"{name:<34}{row['calls']:>8}{row['raw_bytes'] / 1024:>12.1f}{row['wire_bytes'] / 1024:>12.1f}"
+            f"{row['ratio']:>7.2f}x{row['ms_per_call']:>10.3f}"
+        )
+    lines.append("=" * 96)
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m nowyouseeme.bench",
+        description="Load-test the NowYouSeeMe API through the Python SDK"
+    )
+    parser.add_argument("--api-url", default="http://localhost:8080/api/v1",
+                        help="API base URL (default: http://localhost:8080/api/v1)")
+    parser.add_argument("--standin", nargs="?", const="inprocess", choices=["inprocess", "http"], default=None,
+                        help="Run against a local in-memory stand-in instead of --api-url "
+                             "(inprocess: no sockets, http: loopback server)")
+    parser.add_argument("--compression", choices=available_encodings(), default=None,
+                        help="Compress request bodies with this encoding and accept compressed responses "
+                             "(the stand-in then decodes and compresses too; the Go backend decodes neither)")
+    parser.add_argument("-c", "--concurrency", type=int, default=16,
+                        help="Worker threads / max requests in flight (default: 16)")
+    parser.add_argument("--rps", type=float, default=None,
+                        help="Target requests per second (default: unthrottled closed loop)")
+    parser.add_argument("-d", "--duration", type=float, default=10.0,
+                        help="Seconds to run (default: 10, 0 = until --requests)")
+    parser.add_argument("-n", "--requests", type=int, default=None,
+                        help="Stop after this many requests")
+    parser.add_argument("--mix", default=None,
+                        help="Operation weights, e.g. submit_diary=40,get_snapshot=60 (default: read-heavy mix)")
+    parser.add_argument("--seed-agents", type=int, default=20,
+                        help="Agents created before measuring (default: 20)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--write-target-ms", type=float, default=DEFAULT_WRITE_TARGET_MS,
+                        help=f"Write latency target (default: {DEFAULT_WRITE_TARGET_MS:g})")
+    parser.add_argument("--read-target-ms", type=float, default=DEFAULT_READ_TARGET_MS,
+                        help=f"Read latency target (default: {DEFAULT_READ_TARGET_MS:g})")
+    parser.add_argument("--target-percentile", type=float, default=99.0,
+                        help="Percentile compared against the targets (default: 99)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the full report to this JSON file")
+    parser.add_argument("--csv", dest="csv_path", default=None, help="Write per-operation summary rows to this CSV file")
+    return parser
+
+
+def main(argv: Optional[Iterable[str]] = None, client_factory: Optional[Callable[[argparse.Namespace], NowYouSeeMeClient]] = None) -> Dict[str, Any]:
+    """
+    Command line entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        client_factory: Builds the client from parsed arguments (default: pooled
+            NowYouSeeMeClient for --api-url, or the stand-in with --standin)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix) if args.mix else None
+    except ValueError as e:
+        parser.error(str(e))
+
+    compression = Compression(request_encoding=args.compression) if args.compression else None
+    compress_responses = compression is not None
+    server = None
+    if client_factory is not None:
+        client = client_factory(args)
+    elif args.standin == "http":
+        server = StandInServer(compress_responses=compress_responses, decompress_requests=compress_responses).start()
+        client = NowYouSeeMeClient(api_base_url=server.url, pool_maxsize=args.concurrency, compression=compression)
+    elif args.standin:
+        client = standin_client(
+            compress_responses=compress_responses, decompress_requests=compress_responses,
+            pool_maxsize=args.concurrency, compression=compression
+        )
+    else:
+        client = NowYouSeeMeClient(api_base_url=args.api_url, pool_maxsize=args.concurrency, compression=compression)
+
+    try:
+        test = LoadTest(
+            client,
+            mix=mix,
+            concurrency=args.concurrency,
+            rps=args.rps,
+            duration=args.duration,
+            max_requests=args.requests,
+            seed_agents=args.seed_agents,
+            seed=args.seed,
+            write_target_ms=args.write_target_ms,
+            read_target_ms=args.read_target_ms,
+            target_percentile=args.target_percentile
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        report = test.run()
+    finally:
+        if server is not None:
+            server.stop()
+    print(format_report(report))
+    if getattr(client, "compression", None) is not None:
+        report["compression"] = compression_report(client.compression.stats)
+        print(format_compression_report(report["compression"]))
+
+    if args.json_path:
+        write_json_report(report, args.json_path)
+        print(f"✓ JSON report: {args.json_path}")
+    if args.csv_path:
+        write_csv_report(report, args.csv_path)
+        print(f"✓ CSV report: {args.csv_path}")
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+Resumable bulk import
+
+Submits diaries from an NDJSON file (workload files included) with bounded parallelism and
+records, per agent, the file line of the last acknowledged diary and the sequence number it
+left the agent at. Progress lives in a SQLite checkpoint, so a restarted import skips what
+was acknowledged. Diaries that were accepted but not yet checkpointed when the process died
+are found by comparing the agent's snapshot sequence with the checkpoint: each diary adds
+one metadata event plus one event per operation, so the server's sequence says exactly how
+many of the following diaries already landed.
+
+Input records, one JSON object per line:
+    {"type": "agent", "agent_id": ..., "name": ..., "current_mbti": ...}   # optional
+    {"agent_id": ..., "payload": {"mbti": ..., "operations": [...], ...}}   # POST /diaries body
+    {"agent_id": ..., "mbti": ..., "operations": [...], ...}                # submit_diary arguments
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
+
+from .client import NowYouSeeMeClient
+from .codec import JSONCodec
+from .workload import open_ndjson, run_keyed
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    agent_id TEXT PRIMARY KEY,
+    last_line INTEGER NOT NULL,
+    sequence INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS import_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# submit_diary arguments and their defaults, for records that aren't POST /diaries bodies
+# (operations and self_reflection already in their JSON form)
+_DIARY_FIELDS = {
+    "mbti": "",
+    "mbti_confidence": 0.0,
+    "geometry_representation": "",
+    "context": "",
+    "current_mood": "",
+    "philosophy": "",
+    "self_reflection": {"rumination_for_yesterday": "", "what_happened_today": "", "expectations_for_tomorrow": ""},
+    "operations": [],
+}
+
+
+class SequenceMismatchError(Exception):
+    """Raised when an agent's server sequence doesn't match its checkpointed diaries"""
+
+
+class ImportCheckpoint:
+    """
+    Per-agent import progress in a SQLite file (thread-safe).
+
+    Acknowledged diaries are buffered and committed every commit_every acknowledgements or
+    commit_interval seconds, whichever comes first; an agent's first entry is committed
+    at once, before any of its diaries are sent.
+    """
+
+    def __init__(self, path: str, commit_every: int = 1000, commit_interval: float = 5.0):
+        self.path = path
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._dirty: Dict[str, Tuple[int, int]] = {}
+        self._committed_at = time.monotonic()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ImportCheckpoint":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of agents with progress"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM progress").fetchone()[0]
+
+    def meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM import_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO import_meta (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+    @property
+    def watermark(self) -> int:
+        """Number of input lines that are fully done (a restart skips them without parsing)"""
+        return int(self.meta("watermark") or 0)
+
+    def get(self, agent_id: str) -> Optional[Tuple[int, int]]:
+        """(last acknowledged line, sequence after it) of an agent, or None if it has no progress"""
+        with self._lock:
+            pending = self._dirty.get(agent_id)
+            if pending is not None:
+                return pending
+            row = self._conn.execute(
+                "SELECT last_line, sequence FROM progress WHERE agent_id = ?", (agent_id,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def begin(self, agent_id: str, sequence: int) -> None:
+        """Record an agent's starting sequence, committed before its first diary is sent"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO progress (agent_id, last_line, sequence) VALUES (?, -1, ?)",
+                (agent_id, sequence)
+            )
+            self._conn.commit()
+
+    def ack(self, agent_id: str, line: int, sequence: int, watermark: Optional[int] = None) -> None:
+        """Record an acknowledged diary; committed with the next batch"""
+        with self._lock:
+            self._dirty[agent_id] = (line, sequence)
+            if (len(self._dirty) >= self.commit_every
+                    or time.monotonic() - self._committed_at >= self.commit_interval):
+                self._commit(watermark)
+
+    def flush(self, watermark: Optional[int] = None) -> None:
+        """Commit buffered acknowledgements (and the line watermark)"""
+        with self._lock:
+            self._commit(watermark)
+
+    def _commit(self, watermark: Optional[int]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO progress (agent_id, last_line, sequence) VALUES (?, ?, ?)",
+            [(agent_id, line, sequence) for agent_id, (line, sequence) in self._dirty.items()]
+        )
+        if watermark is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO import_meta (key, value) VALUES ('watermark', ?)", (str(watermark),)
+            )
+        self._conn.commit()
+        self._dirty.clear()
+        self._committed_at = time.monotonic()
+
+
+class _Watermark:
+    """Lowest input line not yet done; lines finish out of order"""
+
+    def __init__(self, start: int):
+        self.value = start
+        self._done: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def done(self, line: int) -> None:
+        with self._lock:
+            self._done.add(line)
+            while self.value in self._done:
+                self._done.remove(self.value)
+                self.value += 1
+
+
+@dataclass
+class ImportResult:
+    """Outcome of one bulk_import run"""
+    agents_created: int = 0
+    submitted: int = 0  # diaries sent and acknowledged in this run
+    already_done: int = 0  # diaries skipped because the checkpoint had them
+    recovered: int = 0  # diaries found applied on the server but missing from the checkpoint
+    failed: int = 0
+    skipped: int = 0  # records of agents whose earlier record failed
+    resumed_at_line: int = 0
+    seconds: float = 0.0
+    # First error of each failed agent
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class _AgentProgress:
+    __slots__ = ("last_line", "sequence", "server_sequence")
+
+    def __init__(self, last_line: int, sequence: int, server_sequence: int):
+        self.last_line = last_line
+        self.sequence = sequence
+        self.server_sequence = server_sequence
+
+
+def _diary_body(record: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /diaries body of a diary record"""
+    payload = record.get("payload")
+    if payload is None:
+        payload = {name: record.get(name, default) for name, default in _DIARY_FIELDS.items()}
+    return {"agent_id": record["agent_id"], "payload": payload}
+
+
+def _read_lines(path: str, start: int, codec: JSONCodec) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """(line number, record) from line start on; record is None for blank lines"""
+    with open_ndjson(path) as f:
+        for line_number, line in enumerate(f):
+            if line_number < start:
+                continue
+            yield line_number, codec.loads(line) if line.strip() else None
+
+
+def _server_sequence(client: NowYouSeeMeClient, agent_id: str) -> Optional[int]:
+    """The agent's snapshot sequence (0 before its first diary), or None if it doesn't exist"""
+    response = client._get("get_agent", "/agents", params={"agent_id": agent_id})
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    snapshot = client.codec.loads(response.content).get('snapshot') or {}
+    return snapshot.get('sequence') or 0
+
+
+def bulk_import(
+    client: NowYouSeeMeClient,
+    path: str,
+    checkpoint: Union[str, ImportCheckpoint],
+    max_workers: Optional[int] = None,
+    max_pending: int = 10000,
+    progress: Optional[Any] = None
+) -> ImportResult:
+    """
+    Import diaries from an NDJSON file, resuming from a checkpoint.
+
+    Each agent's records are sent in file order, different agents concurrently. On the
+    first record of an agent the checkpoint doesn't know, the agent is created (if the file
+    has an agent record) and its current sequence is committed to the checkpoint before
+    any of its diaries are sent. On a restart, each agent's server sequence is compared with
+    the checkpoint: diaries that landed but weren't checkpointed are recognised by the
+    events they added and not sent again; if the sequence doesn't line up with the file, the
+    agent is reported as failed and nothing more is sent for it.
+
+    Example usage:
+        ```python
+        client = NowYouSeeMeClient(pool_maxsize=32)
+        result = bulk_import(client, "history.ndjson.gz", "history.checkpoint", max_workers=32)
+        # After a crash, the same call continues where the last one stopped
+        ```
+
+    Args:
+        client: Client to submit with (its connection pool should cover max_workers)
+        path: NDJSON file, optionally gzip-compressed
+        checkpoint: Checkpoint file, or an open ImportCheckpoint
+        max_workers: Number of agents submitted concurrently (defaults to pool_maxsize)
+        max_pending: Records read ahead of the ones submitted
+        progress: Called with the running ImportResult after each diary
+
+    Returns:
+        ImportResult; an agent whose record failed is listed in errors and its later
+        records are skipped (a rerun retries them)
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different input file
+    """
+    own_checkpoint = isinstance(checkpoint, str)
+    store = ImportCheckpoint(checkpoint) if own_checkpoint else checkpoint
+    try:
+        source = f"{os.path.basename(path)}:{os.path.getsize(path)}"
+        recorded = store.meta("source")
+        if recorded is not None and recorded != source:
+            raise ValueError(f"checkpoint {store.path} belongs to {recorded}, not {source}")
+        store.set_meta("source", source)
+
+        resumed = len(store) > 0
+        start_line = store.watermark
+        watermark = _Watermark(start_line)
+        result = ImportResult(resumed_at_line=start_line)
+        agents: Dict[str, _AgentProgress] = {}
+        lock = threading.Lock()
+
+        def fail(agent_id: str, error: Exception) -> None:
+            with lock:
+                result.failed += 1
+                result.errors.setdefault(agent_id, f"{type(error).__name__}: {error}")
+
+        def count(name: str) -> None:
+            with lock:
+                setattr(result, name, getattr(result, name) + 1)
+            if progress is not None:
+                progress(result)
+
+        def contact(agent_id: str, record: Dict[str, Any]) -> _AgentProgress:
+            """The agent's progress, setting it up on its first record in this run"""
+            state = agents.get(agent_id)
+            if state is not None:
+                return state
+            saved = store.get(agent_id)
+            if saved is None:
+                server_sequence = _server_sequence(client, agent_id)
+                if server_sequence is None:
+                    if record.get("type") != "agent":
+                        raise LookupError(f"agent {agent_id} does not exist and the file doesn't create it")
+                    client.create_agent(agent_id, record["name"], record["current_mbti"])
+                    count("agents_created")
+                    server_sequence = 0
+                store.begin(agent_id, server_sequence)
+                state = _AgentProgress(-1, server_sequence, server_sequence)
+            else:
+                last_line, sequence = saved
+                # Only a resumed import can have sent diaries the checkpoint doesn't know of
+                server_sequence = _server_sequence(client, agent_id) if resumed else sequence
+                if server_sequence is None:
+                    raise LookupError(f"agent {agent_id} is in the checkpoint but not on the server")
+                if server_sequence < sequence:
+                    raise SequenceMismatchError(
+                        f"agent {agent_id} is at sequence {server_sequence}, the checkpoint says {sequence}"
+                    )
+                state = _AgentProgress(last_line, sequence, server_sequence)
+            agents[agent_id] = state
+            return state
+
+        def handle(item: Tuple[int, Dict[str, Any]]) -> None:
+            line, record = item
+            agent_id = record["agent_id"]
+            if agent_id in result.errors:
+                count("skipped")
+                return
+            try:
+                state = contact(agent_id, record)
+                if record.get("type") == "agent" or line <= state.last_line:
+                    if record.get("type") != "agent":
+                        count("already_done")
+                    watermark.done(line)
+                    return
+
+                body = _diary_body(record)
+                after = state.sequence + 1 + len(body["payload"].get("operations") or [])
+                if state.sequence < state.server_sequence:
+                    # Sent before the last run stopped, but not checkpointed
+                    if after > state.server_sequence:
+                        raise SequenceMismatchError(
+                            f"agent {agent_id} is at sequence {state.server_sequence}, which doesn't match "
+                            f"the diaries after line {state.last_line}"
+                        )
+                    count("recovered")
+                else:
+                    response = client._post("submit_diary", "/diaries", body)
+                    response.raise_for_status()
+                    count("submitted")
+                state.sequence = after
+                state.last_line = line
+                store.ack(agent_id, line, after, watermark.value)
+                watermark.done(line)
+            except Exception as e:
+                fail(agent_id, e)
+
+        def records() -> Iterator[Tuple[int, Dict[str, Any]]]:
+            for line, record in _read_lines(path, start_line, client.codec):
+                if record is None or record.get("type") == "workload" or "agent_id" not in record:
+                    watermark.done(line)
+                    continue
+                yield line, record
+
+        start = time.perf_counter()
+        try:
+            run_keyed(records(), lambda item: item[1]["agent_id"], handle, max_workers or client.pool_maxsize,
+                      max_pending)
+        finally:
+            store.flush(watermark.value)
+            result.seconds = time.perf_counter() - start
+        return result
+    finally:
+        if own_checkpoint:
+            store.close()
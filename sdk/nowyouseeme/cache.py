@@ -0,0 +1,179 @@
+"""
+Snapshot cache
+
+Opt-in client-side cache of AgentSnapshotResult keyed by agent_id, with TTL and LRU eviction.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from .client import Agent, AgentSnapshotResult
+
+
+class _CacheEntry:
+    __slots__ = ("snapshot", "agent", "expires_at")
+
+    def __init__(self, snapshot: Optional[AgentSnapshotResult], agent: Optional[Agent], expires_at: float):
+        self.snapshot = snapshot
+        self.agent = agent
+        self.expires_at = expires_at
+
+
+class SnapshotCache:
+    """
+    LRU + TTL cache of agent snapshots.
+
+    Entries remember the snapshot's sequence; a put carrying an older sequence than the
+    cached one is ignored, so a slow response can't overwrite a newer snapshot. Invalidating
+    with min_sequence keeps that guarantee after the entry is gone: a read that started
+    before a diary and finishes after it can't put the pre-diary snapshot back.
+    Cached objects are shared between callers and should be treated as read-only.
+
+    Example usage:
+        ```python
+        from nowyouseeme import NowYouSeeMeClient, SnapshotCache
+
+        client = NowYouSeeMeClient(snapshot_cache=SnapshotCache(max_entries=10000, ttl=5.0))
+        client.get_snapshot("agent_1")  # network
+        client.get_snapshot("agent_1")  # dictionary lookup
+        client.submit_diary(agent_id="agent_1", ...)  # invalidates agent_1
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Maximum number of agents kept; least recently used are evicted first
+            ttl: Seconds an entry stays valid (None = until evicted or invalidated)
+            clock: Time source, in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Agent id -> lowest sequence put() still accepts, set by invalidate(min_sequence=...)
+        self._floors: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return self._lookup(agent_id, count=False) is not None
+
+    def _lookup(self, agent_id: str, count: bool = True) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(agent_id)
+            if entry is not None and entry.expires_at < self._clock():
+                del self._entries[agent_id]
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(agent_id)
+            if count:
+                self.hits += 1
+            return entry
+
+    def get(self, agent_id: str) -> Optional[AgentSnapshotResult]:
+        """
+        Get a cached snapshot.
+
+        Returns:
+            The cached snapshot, or None on a miss. Agents cached without a snapshot
+            (no diary submitted yet) also return None; use `agent_id in cache` to tell them apart.
+        """
+        entry = self._lookup(agent_id)
+        return entry.snapshot if entry is not None else None
+
+    def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an agent cached by the client's get_agent.
+
+        Returns:
+            Dictionary with 'agent' and 'snapshot' keys (same shape as client.get_agent),
+            or None if the agent itself isn't cached
+        """
+        entry = self._lookup(agent_id)
+        if entry is None or entry.agent is None:
+            return None
+        return {'agent': entry.agent, 'snapshot': entry.snapshot}
+
+    def sequence(self, agent_id: str) -> Optional[int]:
+        """Sequence of the cached snapshot, or None if nothing valid is cached"""
+        entry = self._lookup(agent_id, count=False)
+        if entry is None or entry.snapshot is None:
+            return None
+        return entry.snapshot.sequence
+
+    def put(
+        self,
+        agent_id: str,
+        snapshot: Optional[AgentSnapshotResult],
+        agent: Optional[Agent] = None
+    ) -> None:
+        """
+        Store a snapshot (and optionally its Agent) for an agent.
+
+        Ignored if a newer snapshot is already cached, or if the snapshot is older than the
+        min_sequence of the agent's last invalidation.
+        """
+        now = self._clock()
+        expires_at = now + self.ttl if self.ttl is not None else float("inf")
+
+        with self._lock:
+            floor = self._floors.get(agent_id)
+            if floor is not None and (snapshot is None or snapshot.sequence < floor):
+                return
+            existing = self._entries.get(agent_id)
+            if existing is not None and existing.expires_at >= now:
+                if (existing.snapshot is not None and snapshot is not None
+                        and existing.snapshot.sequence > snapshot.sequence):
+                    return
+                if agent is None:
+                    agent = existing.agent
+
+            self._entries[agent_id] = _CacheEntry(snapshot, agent, expires_at)
+            self._entries.move_to_end(agent_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: str, min_sequence: Optional[int] = None) -> None:
+        """
+        Drop an agent's entry.
+
+        Args:
+            agent_id: Agent to drop
+            min_sequence: Sequence the agent is known to have reached, e.g. from a diary
+                response; later puts of older snapshots (reads already in flight) are
+                ignored. Floors are kept for the max_entries most recently invalidated agents.
+        """
+        with self._lock:
+            self._entries.pop(agent_id, None)
+            if min_sequence is not None:
+                floor = max(min_sequence, self._floors.get(agent_id, min_sequence))
+                self._floors[agent_id] = floor
+                self._floors.move_to_end(agent_id)
+                while len(self._floors) > self.max_entries:
+                    self._floors.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset hit/miss counters"""
+        with self._lock:
+            self._entries.clear()
+            self._floors.clear()
+            self.hits = 0
+            self.misses = 0
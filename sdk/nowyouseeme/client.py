@@ -5,11 +5,29 @@ This client supports the new Event Sourcing architecture where agents submit dia
 with operations to evolve their state over time.
 """
 
-import re
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+
+from .codec import JSONCodec, get_codec
+from .compression import Compression, StreamDecoder
+from .compact import CompactAgentSnapshotResult
+from .streaming import iter_json_array
+from .timestamps import parse_timestamp, parse_optional_timestamp
+from .validation import validate_operations
+
+# GET /timeline lists events under "events"; "timeline" is what stand-in servers from
+# earlier SDK versions returned
+TIMELINE_KEYS = ("events", "timeline")
+
+if TYPE_CHECKING:
+    from .cache import SnapshotCache
+    from .shadow import ShadowState, ShadowStateStore
+    from .watch import AgentChange
 
 
 @dataclass
@@ -77,26 +95,12 @@ class Agent:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Agent':
-        # Parse timestamp - handle various formats from backend
-        timestamp_str = data['created_at'].replace('Z', '+00:00')
-
-        # Handle Go's variable-precision timestamps by normalizing to 6 digits of microseconds
-        # Example: 2026-05-03T19:03:29.6392+08:00 -> 2026-05-03T19:03:29.639200+08:00
-        # Match timestamp with fractional seconds
-        match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)([\+\-]\d{2}:\d{2})', timestamp_str)
-        if match:
-            date_part, fractional, tz_part = match.groups()
-            # Pad or truncate fractional seconds to 6 digits
-            fractional = fractional.ljust(6, '0')[:6]
-            timestamp_str = f"{date_part}.{fractional}{tz_part}"
-
-        created_at = datetime.fromisoformat(timestamp_str)
-
         return cls(
             id=data['id'],
             name=data['name'],
             current_mbti=data.get('current_mbti', data.get('initial_mbti', '')),
-            created_at=created_at
+            # Handles Go's variable-precision fractional seconds, 'Z' and offsets
+            created_at=parse_timestamp(data['created_at'])
         )
 
 
@@ -163,7 +167,7 @@ class AgentSnapshotResult:
     agent_id: str
     state: AgentState
     sequence: int
-    updated_at: Optional[str]  # ISO 8601 timestamp
+    updated_at: Optional[datetime]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AgentSnapshotResult':
@@ -172,7 +176,27 @@ class AgentSnapshotResult:
             agent_id=data.get('agent_id', ''),
             state=AgentState.from_dict(state_data),
             sequence=data.get('sequence', 0),
-            updated_at=data.get('updated_at')
+            updated_at=parse_optional_timestamp(data.get('updated_at'))
+        )
+
+
+@dataclass
+class Event:
+    """A single event from an agent's timeline (metadata submission or entity operation)"""
+    event_id: int
+    sequence_number: int
+    event_type: str  # EventType
+    timestamp: Optional[datetime]
+    raw_payload: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
+        return cls(
+            event_id=data.get('event_id', 0),
+            sequence_number=data.get('sequence_number', 0),
+            event_type=data.get('event_type', ''),
+            timestamp=parse_optional_timestamp(data.get('timestamp')),
+            raw_payload=data.get('raw_payload') or {}
         )
 
 
@@ -196,6 +220,190 @@ class AgentWithSnapshot:
         )
 
 
+@dataclass
+class DiaryResult:
+    """Outcome of a single diary in a submit_diaries batch (state on success, error on failure)"""
+    agent_id: str
+    state: Optional[AgentState] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DiarySkippedError(Exception):
+    """Raised in place of a diary that was not sent because an earlier diary for the same agent failed"""
+
+
+def _group_batch_by_agent(
+    batch: Iterable[Tuple[str, Dict[str, Any]]]
+) -> Tuple[int, Dict[str, List[Tuple[int, Dict[str, Any]]]]]:
+    """Split a diary batch into per-agent queues, keeping submission order and original indices"""
+    queues: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+    count = 0
+    for index, (agent_id, payload) in enumerate(batch):
+        queues.setdefault(agent_id, []).append((index, payload))
+        count = index + 1
+    return count, queues
+
+
+def _timeline_params(agent_id: str, after_sequence: Optional[int]) -> Dict[str, str]:
+    params = {"agent_id": agent_id}
+    if after_sequence is not None:
+        params["after_sequence"] = str(after_sequence)
+    return params
+
+
+def _timeline_events(data: Dict[str, Any], after_sequence: Optional[int] = None) -> List[Dict[str, Any]]:
+    """The events of a decoded GET /timeline response, past after_sequence if given"""
+    events = next((data[key] for key in TIMELINE_KEYS if key in data), None) or []
+    if after_sequence is not None:
+        # Servers without after_sequence support return the whole history
+        events = [event for event in events if event.get('sequence_number', 0) > after_sequence]
+    return events
+
+
+def _gallery_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The agent items of a decoded GET /gallery response"""
+    return data.get('snapshots') or []
+
+
+def _gallery_from_dict(data: Dict[str, Any], compact: bool = False) -> List[AgentWithSnapshot]:
+    """Decode a GET /gallery response, optionally into compact snapshots"""
+    if not compact:
+        return [AgentWithSnapshot.from_dict(a) for a in _gallery_items(data)]
+    return [
+        AgentWithSnapshot(
+            id=a['id'],
+            name=a['name'],
+            snapshot=CompactAgentSnapshotResult.from_dict(a['snapshot']) if a.get('snapshot') else None
+        )
+        for a in _gallery_items(data)
+    ]
+
+
+def _build_diary_request(
+    agent_id: str,
+    mbti: str,
+    operations: List[Operation],
+    mbti_confidence: float = 0.0,
+    geometry_representation: str = "",
+    context: str = "",
+    current_mood: str = "",
+    philosophy: str = "",
+    self_reflection: Optional[SelfReflection] = None
+) -> Dict[str, Any]:
+    """Build the POST /diaries request body (shared by the sync and async clients)"""
+    diary_payload = {
+        "mbti": mbti,
+        "mbti_confidence": mbti_confidence,
+        "geometry_representation": geometry_representation,
+        "context": context,
+        "current_mood": current_mood,
+        "philosophy": philosophy,
+        "self_reflection": self_reflection.to_dict() if self_reflection else {
+            "rumination_for_yesterday": "",
+            "what_happened_today": "",
+            "expectations_for_tomorrow": ""
+        },
+        "operations": [op.to_dict() for op in operations]
+    }
+
+    return {
+        "agent_id": agent_id,
+        "payload": diary_payload
+    }
+
+
+def _prevalidate_diary(
+    agent_id: str,
+    operations: List[Operation],
+    validate_against: Optional[AgentState],
+    prevalidate: bool,
+    snapshot_cache: Optional["SnapshotCache"],
+    shadow_states: Optional["ShadowStateStore"] = None
+) -> None:
+    """Validate a diary's operations locally when a state to check them against is known"""
+    state = validate_against
+    if state is None and prevalidate and shadow_states is not None:
+        shadow = shadow_states.get(agent_id)
+        if shadow is not None:
+            state = shadow.state
+    if state is None and prevalidate and snapshot_cache is not None:
+        cached = snapshot_cache.get(agent_id)
+        if cached is not None:
+            state = cached.state
+    if state is not None:
+        validate_operations(operations, state)
+
+
+def _report_diary_failure(agent_id: str, status_code: int, error_text: str, payload: Dict[str, Any]) -> None:
+    """Print details of a rejected diary submission"""
+    print(f"\n✗ Diary submission failed ({status_code})")
+    print(f"  Agent: {agent_id}")
+    print(f"  Error: {error_text}")
+    if payload.get("payload", {}).get("operations"):
+        print(f"  Operations:")
+        for i, op in enumerate(payload["payload"]["operations"]):
+            print(f"    {i}: {op}")
+
+
+def _diary_response_to_snapshot(agent_id: str, result: Dict[str, Any]) -> Optional[AgentSnapshotResult]:
+    """
+    Decode the post-submission snapshot from a POST /diaries response.
+
+    The backend returns the bare AgentState under "snapshot" and the sequence number of the
+    diary's last event under "sequence". Backends built before "sequence" was added leave
+    it out, and the snapshot's sequence is then 0. Returns None when the response carries
+    no state.
+    """
+    snapshot_data = result.get('snapshot')
+    if not snapshot_data:
+        return None
+    return AgentSnapshotResult(
+        agent_id=agent_id,
+        state=AgentState.from_dict(snapshot_data),
+        sequence=result.get('sequence') or 0,
+        updated_at=None
+    )
+
+
+def _invalidate_cached_snapshot(
+    snapshot_cache: "SnapshotCache",
+    agent_id: str,
+    snapshot: Optional[AgentSnapshotResult]
+) -> None:
+    """Drop an agent's cached snapshot after a diary, so reads still in flight can't restore it"""
+    min_sequence = snapshot.sequence if snapshot is not None else 0
+    if not min_sequence:
+        # No sequence in the response: the diary at least moved past the cached snapshot
+        cached = snapshot_cache.sequence(agent_id)
+        min_sequence = cached + 1 if cached is not None else None
+    snapshot_cache.invalidate(agent_id, min_sequence=min_sequence)
+
+
+def _decode_stream(chunks: Iterable[bytes], decoder: StreamDecoder) -> Iterator[bytes]:
+    """Decode a compressed body chunk by chunk"""
+    for chunk in chunks:
+        data = decoder.decode(chunk)
+        if data:
+            yield data
+    tail = decoder.finish()
+    if tail:
+        yield tail
+
+
+def _empty_snapshot(agent_id: str) -> AgentSnapshotResult:
+    """Snapshot returned for agents that have not submitted a diary yet"""
+    return AgentSnapshotResult(
+        agent_id=agent_id,
+        state=AgentState.from_dict({}),
+        sequence=0,
+        updated_at=None
+    )
+
+
 class NowYouSeeMeClient:
     """
     Client for the NowYouSeeMe Event Sourcing API.
@@ -241,16 +449,87 @@ class NowYouSeeMeClient:
         ```
     """
 
-    def __init__(self, api_base_url: str = "http://localhost:8080/api/v1"):
+    def __init__(
+        self,
+        api_base_url: str = "http://localhost:8080/api/v1",
+        pool_maxsize: int = 10,
+        snapshot_cache: Optional["SnapshotCache"] = None,
+        prevalidate: bool = False,
+        shadow_states: Optional["ShadowStateStore"] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        compression: Optional[Compression] = None,
+        optimize: bool = False
+    ):
         """
         Initialize the client.
 
         Args:
             api_base_url: Base URL for the API
+            pool_maxsize: Number of keep-alive connections to pool (should cover submit_diaries workers)
+            snapshot_cache: Optional SnapshotCache serving repeated get_snapshot/get_agent reads;
+                an agent's entry is invalidated whenever its submit_diary succeeds
+            prevalidate: Validate submit_diary operations against the agent's shadow or cached
+                snapshot (when one is held) before sending
+            shadow_states: Optional ShadowStateStore tracking each agent's state from
+                create_agent/submit_diary responses; read it with shadow()
+            codec: JSON codec for request and response bodies: a JSONCodec, "json", "orjson",
+                or None for the fastest installed one
+            compression: Optional Compression settings: compressed request bodies, Accept-Encoding
+                for responses, and per-call sizes/timings in compression.stats
+            optimize: Fold each diary's operations into the shortest equivalent sequence
+                before sending (see optimize_operations), so fewer events are stored
         """
         self.api_base_url = api_base_url.rstrip('/')
+        self.pool_maxsize = pool_maxsize
+        self.snapshot_cache = snapshot_cache
+        self.prevalidate = prevalidate
+        self.shadow_states = shadow_states
+        self.codec = get_codec(codec)
+        self.compression = compression
+        self.optimize = optimize
         self.session = requests.Session()
         self.session.headers.update({'Content-Type': 'application/json'})
+        if compression is not None:
+            self.session.headers['Accept-Encoding'] = compression.accept_encoding
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _post(self, method: str, path: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST a JSON body, compressed when compression is on"""
+        body = self.codec.dumps(payload)
+        headers = None
+        if self.compression is not None:
+            body, encoding = self.compression.encode_request(method, body)
+            if encoding is not None:
+                headers = {'Content-Encoding': encoding}
+        response = self.session.post(
+            f"{self.api_base_url}{path}",
+            data=body,
+            headers=headers,
+            stream=self.compression is not None
+        )
+        return self._read_body(method, response)
+
+    def _get(self, method: str, path: str, params: Optional[Dict[str, str]] = None) -> requests.Response:
+        response = self.session.get(
+            f"{self.api_base_url}{path}",
+            params=params,
+            stream=self.compression is not None
+        )
+        return self._read_body(method, response)
+
+    def _read_body(self, method: str, response: requests.Response) -> requests.Response:
+        """With compression on, read the body undecoded and decode it here so the cost is recorded"""
+        if self.compression is None:
+            return response
+        try:
+            body = response.raw.read(decode_content=False)
+        finally:
+            response.raw.release_conn()
+        response._content = self.compression.decode_response(method, body, response.headers.get('Content-Encoding'))
+        response._content_consumed = True
+        return response
 
     def create_agent(
         self,
@@ -278,15 +557,13 @@ class NowYouSeeMeClient:
             "current_mbti": current_mbti
         }
 
-        print(f"======== Creating agent with ID: {agent_id}, Name: {name}, MBTI: {current_mbti}")
-
-        response = self.session.post(
-            f"{self.api_base_url}/agents",
-            json=payload
-        )
+        response = self._post("create_agent", "/agents", payload)
         response.raise_for_status()
 
-        return Agent.from_dict(response.json())
+        if self.shadow_states is not None:
+            self.shadow_states.start(agent_id)
+
+        return Agent.from_dict(self.codec.loads(response.content))
 
     def submit_diary(
         self,
@@ -298,7 +575,8 @@ class NowYouSeeMeClient:
         context: str = "",
         current_mood: str = "",
         philosophy: str = "",
-        self_reflection: Optional[SelfReflection] = None
+        self_reflection: Optional[SelfReflection] = None,
+        validate_against: Optional[AgentState] = None
     ) -> AgentState:
         """
         Submit a diary entry with operations to evolve the agent's state.
@@ -313,72 +591,123 @@ class NowYouSeeMeClient:
             current_mood: Current emotional state
             philosophy: Core beliefs and worldview
             self_reflection: Daily reflections
+            validate_against: Agent's current state; if given, operations are checked against
+                it locally and nothing is sent when they would be rejected
 
         Returns:
             Updated AgentState after applying operations
 
         Raises:
+            ValidationError: If local validation fails (nothing was sent)
             requests.RequestException: If the API request fails
         """
-        diary_payload = {
-            "mbti": mbti,
-            "mbti_confidence": mbti_confidence,
-            "geometry_representation": geometry_representation,
-            "context": context,
-            "current_mood": current_mood,
-            "philosophy": philosophy,
-            "self_reflection": self_reflection.to_dict() if self_reflection else {
-                "rumination_for_yesterday": "",
-                "what_happened_today": "",
-                "expectations_for_tomorrow": ""
-            },
-            "operations": [op.to_dict() for op in operations]
-        }
-
-        payload = {
-            "agent_id": agent_id,
-            "payload": diary_payload
-        }
+        _prevalidate_diary(
+            agent_id, operations, validate_against, self.prevalidate, self.snapshot_cache, self.shadow_states
+        )
+        if self.optimize:
+            from .optimize import optimize_operations
+            operations = optimize_operations(operations, validate_against)
 
-        response = self.session.post(
-            f"{self.api_base_url}/diaries",
-            json=payload
+        payload = _build_diary_request(
+            agent_id=agent_id,
+            mbti=mbti,
+            operations=operations,
+            mbti_confidence=mbti_confidence,
+            geometry_representation=geometry_representation,
+            context=context,
+            current_mood=current_mood,
+            philosophy=philosophy,
+            self_reflection=self_reflection
         )
 
+        response = self._post("submit_diary", "/diaries", payload)
+
         if response.status_code != 201:
-            print(f"\n✗ Diary submission failed ({response.status_code})")
-            print(f"  Agent: {agent_id}")
-            print(f"  Error: {response.text}")
-            if payload.get("payload", {}).get("operations"):
-                print(f"  Operations:")
-                for i, op in enumerate(payload["payload"]["operations"]):
-                    print(f"    {i}: {op}")
+            _report_diary_failure(agent_id, response.status_code, response.text, payload)
+            if response.status_code == 400 and self.shadow_states is not None:
+                # The server disagreed with what the shadow said was valid
+                self.shadow_states.invalidate(agent_id)
 
         response.raise_for_status()
 
-        result = response.json()
-        # API returns snapshot as AgentSnapshotResult
-        snapshot_data = result.get('snapshot')
-        if snapshot_data:
-            snapshot_result = AgentSnapshotResult.from_dict(snapshot_data)
-            return snapshot_result.state
-        return AgentState.from_dict({})
+        snapshot = _diary_response_to_snapshot(agent_id, self.codec.loads(response.content))
+        if self.snapshot_cache is not None:
+            _invalidate_cached_snapshot(self.snapshot_cache, agent_id, snapshot)
+        if self.shadow_states is not None:
+            self.shadow_states.record_submission(agent_id, operations, snapshot)
+        return snapshot.state if snapshot is not None else AgentState.from_dict({})
+
+    def submit_diaries(
+        self,
+        batch: Iterable[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        stop_on_error: bool = True
+    ) -> List[DiaryResult]:
+        """
+        Submit many diaries, pipelining different agents in parallel.
+
+        Diaries for the same agent are sent one after another in batch order (the backend
+        locks the agent and assigns sequence numbers per submission); diaries for different
+        agents run concurrently on a thread pool.
+
+        Args:
+            batch: Iterable of (agent_id, payload) pairs, where payload holds the keyword
+                arguments of submit_diary (mbti, operations, mood, ...)
+            max_workers: Number of agents submitted concurrently (defaults to pool_maxsize)
+            stop_on_error: If an agent's diary fails, skip that agent's remaining diaries
+                (they would be validated against a state that is missing the failed operations)
 
-    def get_gallery(self) -> List[AgentWithSnapshot]:
+        Returns:
+            One DiaryResult per batch item, in batch order
+        """
+        count, queues = _group_batch_by_agent(batch)
+        results: List[Optional[DiaryResult]] = [None] * count
+
+        def submit_agent_queue(agent_id: str, queue: List[Tuple[int, Dict[str, Any]]]) -> None:
+            failed = False
+            for index, payload in queue:
+                if failed:
+                    results[index] = DiaryResult(
+                        agent_id=agent_id,
+                        error=DiarySkippedError(f"earlier diary for agent {agent_id} failed")
+                    )
+                    continue
+                try:
+                    state = self.submit_diary(agent_id=agent_id, **payload)
+                    results[index] = DiaryResult(agent_id=agent_id, state=state)
+                except Exception as e:
+                    results[index] = DiaryResult(agent_id=agent_id, error=e)
+                    failed = stop_on_error
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize) as executor:
+            futures = [
+                executor.submit(submit_agent_queue, agent_id, queue)
+                for agent_id, queue in queues.items()
+            ]
+            for future in futures:
+                future.result()
+
+        return results
+
+    def get_gallery(self, compact: bool = False) -> List[AgentWithSnapshot]:
         """
         Get all agents with their current state snapshots.
 
+        Args:
+            compact: Decode snapshots into slotted, string-interned objects
+                (CompactAgentSnapshotResult) to cut memory on large galleries
+
         Returns:
             List of agents with snapshots
 
         Raises:
             requests.RequestException: If the API request fails
         """
-        response = self.session.get(f"{self.api_base_url}/gallery")
+        response = self._get("get_gallery", "/gallery")
         response.raise_for_status()
 
-        data = response.json()
-        return [AgentWithSnapshot.from_dict(a) for a in data.get('agents', [])]
+        data = self.codec.loads(response.content)
+        return _gallery_from_dict(data, compact)
 
     def get_agent(self, agent_id: str) -> Dict[str, Any]:
         """
@@ -393,18 +722,23 @@ class NowYouSeeMeClient:
         Raises:
             requests.RequestException: If the API request fails
         """
-        response = self.session.get(
-            f"{self.api_base_url}/agents",
-            params={"agent_id": agent_id}
-        )
+        if self.snapshot_cache is not None:
+            cached = self.snapshot_cache.get_agent(agent_id)
+            if cached is not None:
+                return cached
+
+        response = self._get("get_agent", "/agents", params={"agent_id": agent_id})
         response.raise_for_status()
 
-        data = response.json()
+        data = self.codec.loads(response.content)
         snapshot_data = data.get('snapshot')
-        return {
+        result = {
             'agent': Agent.from_dict(data['agent']),
             'snapshot': AgentSnapshotResult.from_dict(snapshot_data) if snapshot_data else None
         }
+        if self.snapshot_cache is not None:
+            self.snapshot_cache.put(agent_id, result['snapshot'], agent=result['agent'])
+        return result
 
     def get_snapshot(self, agent_id: str) -> AgentSnapshotResult:
         """
@@ -419,30 +753,56 @@ class NowYouSeeMeClient:
         Raises:
             requests.RequestException: If the API request fails
         """
-        response = self.session.get(
-            f"{self.api_base_url}/snapshots",
-            params={"agent_id": agent_id}
-        )
+        if self.snapshot_cache is not None:
+            cached = self.snapshot_cache.get(agent_id)
+            if cached is not None:
+                return cached
+
+        response = self._get("get_snapshot", "/snapshot", params={"agent_id": agent_id})
         response.raise_for_status()
 
-        data = response.json()
+        data = self.codec.loads(response.content)
         snapshot_data = data.get('snapshot')
         if snapshot_data:
-            return AgentSnapshotResult.from_dict(snapshot_data)
+            snapshot = AgentSnapshotResult.from_dict(snapshot_data)
+            if self.snapshot_cache is not None:
+                self.snapshot_cache.put(agent_id, snapshot)
+            return snapshot
         # Return empty snapshot if none exists
-        return AgentSnapshotResult(
-            agent_id=agent_id,
-            state=AgentState.from_dict({}),
-            sequence=0,
-            updated_at=None
-        )
+        return _empty_snapshot(agent_id)
+
+    def shadow(self, agent_id: str) -> "ShadowState":
+        """
+        Get the client's shadow of an agent's state.
 
-    def get_timeline(self, agent_id: str) -> List[Dict[str, Any]]:
+        The shadow follows create_agent and submit_diary responses, so it is only fetched
+        with get_snapshot when the agent isn't tracked yet or a rejected diary showed it
+        was out of date.
+
+        Args:
+            agent_id: ID of the agent
+
+        Returns:
+            ShadowState to query entities and statuses
+
+        Raises:
+            ValueError: If the client was created without shadow_states
+            requests.RequestException: If the snapshot has to be fetched and the request fails
+        """
+        if self.shadow_states is None:
+            raise ValueError("shadow state tracking is not enabled (pass shadow_states)")
+        shadow = self.shadow_states.get(agent_id)
+        if shadow is None:
+            shadow = self.shadow_states.resync(self.get_snapshot(agent_id))
+        return shadow
+
+    def get_timeline(self, agent_id: str, after_sequence: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get the timeline of diary submissions for an agent.
 
         Args:
             agent_id: ID of the agent
+            after_sequence: Only return events with a higher sequence number
 
         Returns:
             List of diary entries with events
@@ -450,13 +810,138 @@ class NowYouSeeMeClient:
         Raises:
             requests.RequestException: If the API request fails
         """
+        response = self._get("get_timeline", "/timeline", params=_timeline_params(agent_id, after_sequence))
+        response.raise_for_status()
+
+        return _timeline_events(self.codec.loads(response.content), after_sequence)
+
+    def iter_timeline(
+        self,
+        agent_id: str,
+        chunk_size: int = 64 * 1024,
+        after_sequence: Optional[int] = None
+    ) -> Iterator[Event]:
+        """
+        Stream an agent's timeline, yielding one typed Event at a time.
+
+        Events are decoded incrementally from the response body, so peak memory stays
+        flat regardless of history length. Stopping iteration early closes the response.
+
+        Args:
+            agent_id: ID of the agent
+            chunk_size: Number of bytes read from the socket at a time
+            after_sequence: Only yield events with a higher sequence number
+
+        Yields:
+            Events in the order the server returns them
+
+        Raises:
+            requests.RequestException: If the API request fails
+            ValueError: If the response body is not valid JSON
+        """
         response = self.session.get(
             f"{self.api_base_url}/timeline",
-            params={"agent_id": agent_id}
+            params=_timeline_params(agent_id, after_sequence),
+            stream=True
         )
-        response.raise_for_status()
+        decoder = None
+        try:
+            response.raise_for_status()
+            if self.compression is None:
+                chunks = response.iter_content(chunk_size)
+            else:
+                decoder = self.compression.stream_decoder("iter_timeline", response.headers.get('Content-Encoding'))
+                chunks = _decode_stream(response.raw.stream(chunk_size, decode_content=False), decoder)
+            for item in iter_json_array(chunks, TIMELINE_KEYS):
+                # Servers without after_sequence support return the whole history
+                if after_sequence is None or item.get('sequence_number', 0) > after_sequence:
+                    yield Event.from_dict(item)
+        finally:
+            if decoder is not None:
+                decoder.close()
+            response.close()
+
+    def watch(
+        self,
+        agent_ids: Iterable[str],
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Iterator["AgentChange"]:
+        """
+        Watch agents for new events, yielding each agent whose sequence moved.
+
+        Each agent's snapshot is fetched once; after that a check only asks for the timeline
+        after the last sequence seen and replays the new events locally. Agents due at the
+        same time are checked together, concurrently; an agent whose check finds nothing is
+        checked backoff times less often, up to max_interval, until it changes again.
+
+        Example usage:
+            ```python
+            for change in client.watch(agent_ids, interval=0.5):
+                for entity in change.diff:
+                    print(change.agent_id, entity.kind, entity.entity_id)
+            ```
 
-        return response.json().get('timeline', [])
+        Args:
+            agent_ids: Agents to watch
+            interval: Seconds between checks of an active agent
+            max_interval: Longest wait between checks of a quiet agent
+            backoff: Factor a quiet agent's interval grows by after each empty check
+            max_workers: Number of agents checked concurrently (defaults to pool_maxsize)
+            timeout: Stop after this many seconds (None = until the caller stops iterating)
+
+        Yields:
+            AgentChange with the new events, the resulting snapshot and its diff
+
+        Raises:
+            requests.RequestException: If a request fails
+        """
+        from .watch import WatchSchedule, _Watched, _advance, _changed
+
+        agent_ids = list(dict.fromkeys(agent_ids))
+
+        def check(agent_id: str) -> Optional["AgentChange"]:
+            watched = agents[agent_id]
+            events = self.get_timeline(agent_id, after_sequence=watched.last_sequence)
+            if not events:
+                return None
+            change = _advance(watched, agent_id, events)
+            if change is None:
+                # The events don't replay onto our copy; take the server's state instead
+                change = _changed(watched, agent_id, events, self.get_snapshot(agent_id))
+            return change
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize) as executor:
+            agents = {
+                agent_id: _Watched(snapshot)
+                for agent_id, snapshot in zip(agent_ids, executor.map(self.get_snapshot, agent_ids))
+            }
+            start = time.monotonic()
+            deadline = None if timeout is None else start + timeout
+            schedule = WatchSchedule(agent_ids, interval, max_interval, backoff, now=start)
+            while schedule:
+                due = schedule.pop_due(time.monotonic())
+                if due:
+                    changes = list(executor.map(check, due))
+                    # One timestamp for the whole batch keeps agents with equal intervals together
+                    now = time.monotonic()
+                    for agent_id, change in zip(due, changes):
+                        schedule.reschedule(agent_id, change is not None, now)
+                    for change in changes:
+                        if change is not None:
+                            yield change
+
+                now = time.monotonic()
+                wake = schedule.next_due()
+                if deadline is not None:
+                    if now >= deadline:
+                        return
+                    wake = min(wake, deadline)
+                if wake > now:
+                    time.sleep(wake - now)
 
     def get_snapshots_by_mbti(self, mbti_type: str) -> List[Dict[str, Any]]:
         """
@@ -471,13 +956,10 @@ class NowYouSeeMeClient:
         Raises:
             requests.RequestException: If the API request fails
         """
-        response = self.session.get(
-            f"{self.api_base_url}/snapshots",
-            params={"mbti": mbti_type}
-        )
+        response = self._get("get_snapshots_by_mbti", "/snapshots", params={"mbti": mbti_type})
         response.raise_for_status()
 
-        return response.json().get('snapshots', [])
+        return self.codec.loads(response.content).get('snapshots', [])
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -489,6 +971,6 @@ class NowYouSeeMeClient:
         Raises:
             requests.RequestException: If the API request fails
         """
-        response = self.session.get(f"{self.api_base_url}/health")
+        response = self._get("health_check", "/health")
         response.raise_for_status()
-        return response.json()
+        return self.codec.loads(response.content)
@@ -0,0 +1,103 @@
+"""
+JSON codecs
+
+Request encoding and response decoding for the clients, bytes in and bytes out. Uses orjson
+when it is installed (pip install nowyouseeme[fast]) and the stdlib json module otherwise.
+Decoding takes the raw response body, so no intermediate str copy of a multi-megabyte
+gallery or timeline is made.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes request bodies to bytes and decodes response bodies from bytes"""
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The stdlib json module; always available"""
+
+    name = "json"
+
+    def __init__(self):
+        # ASCII output skips a UTF-8 encoding pass in the C encoder
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("ascii")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson: encodes straight to bytes and decodes bytes without a str round trip"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install nowyouseeme[fast]")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        # orjson.JSONDecodeError is a ValueError, like json's
+        return orjson.loads(data)
+
+
+CODECS = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec argument.
+
+    Args:
+        codec: A JSONCodec instance, a codec name ("json", "orjson"), or None / "auto"
+            for the fastest installed one
+
+    Returns:
+        JSONCodec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None or codec == "auto":
+        return OrjsonCodec() if orjson is not None else StdlibJSONCodec()
+    codec_class: Optional[type] = CODECS.get(codec)
+    if codec_class is None:
+        raise ValueError(f"unknown JSON codec: {codec!r} (expected one of {sorted(CODECS)} or 'auto')")
+    return codec_class()
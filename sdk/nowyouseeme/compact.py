@@ -0,0 +1,142 @@
+"""
+Memory-compact snapshot representations
+
+Slotted counterparts of Entity, EntityCollection, AgentState and AgentSnapshotResult for
+holding large galleries in memory. Attribute names match the dataclasses in client.py, so
+code reading snapshots works with either form. Repeated strings (statuses, entity types,
+entity ids, MBTI types) are interned so every agent shares a single copy.
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .timestamps import parse_optional_timestamp
+
+_intern = sys.intern
+
+
+class CompactEntity:
+    """Slotted Entity"""
+    __slots__ = ("id", "content", "status")
+
+    def __init__(self, id: str, content: str, status: str):
+        self.id = id
+        self.content = content
+        self.status = status
+
+    def __repr__(self) -> str:
+        return f"CompactEntity(id={self.id!r}, content={self.content!r}, status={self.status!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactEntity):
+            return NotImplemented
+        return (self.id, self.content, self.status) == (other.id, other.content, other.status)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactEntity':
+        return cls(
+            id=_intern(data.get('id', '')),
+            content=data.get('content', ''),
+            status=_intern(data.get('status', 'pending'))
+        )
+
+
+class CompactEntityCollection:
+    """Slotted EntityCollection"""
+    __slots__ = ("entities_by_id",)
+
+    def __init__(self, entities_by_id: Optional[Dict[str, CompactEntity]] = None):
+        self.entities_by_id = entities_by_id if entities_by_id is not None else {}
+
+    def __repr__(self) -> str:
+        return f"CompactEntityCollection(entities_by_id={self.entities_by_id!r})"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactEntityCollection':
+        entities_by_id = {}
+        for entity_id, entity_data in data.get('entities_by_id', {}).items():
+            entity = CompactEntity.from_dict(entity_data)
+            # Key the dict with the entity's own (interned) id rather than a second copy
+            entities_by_id[entity.id if entity.id == entity_id else _intern(entity_id)] = entity
+        return cls(entities_by_id=entities_by_id)
+
+
+class CompactAgentState:
+    """Slotted AgentState"""
+    __slots__ = (
+        "mbti",
+        "mbti_confidence",
+        "geometry_representation",
+        "current_mood",
+        "philosophy",
+        "current_self_reflection",
+        "entity_collections",
+    )
+
+    def __init__(
+        self,
+        mbti: str,
+        mbti_confidence: float = 0.0,
+        geometry_representation: str = "",
+        current_mood: str = "",
+        philosophy: str = "",
+        current_self_reflection: Optional[Dict[str, str]] = None,
+        entity_collections: Optional[Dict[str, CompactEntityCollection]] = None
+    ):
+        self.mbti = mbti
+        self.mbti_confidence = mbti_confidence
+        self.geometry_representation = geometry_representation
+        self.current_mood = current_mood
+        self.philosophy = philosophy
+        self.current_self_reflection = current_self_reflection if current_self_reflection is not None else {}
+        self.entity_collections = entity_collections if entity_collections is not None else {}
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactAgentState(mbti={self.mbti!r}, mbti_confidence={self.mbti_confidence!r}, "
+            f"entity_collections={self.entity_collections!r})"
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactAgentState':
+        entity_collections = {}
+        for entity_type, collection_data in data.get('entity_collections', {}).items():
+            entity_collections[_intern(entity_type)] = CompactEntityCollection.from_dict(collection_data)
+
+        return cls(
+            mbti=_intern(data.get('mbti', '')),
+            mbti_confidence=data.get('mbti_confidence', 0.0),
+            geometry_representation=data.get('geometry_representation', ''),
+            current_mood=data.get('current_mood', ''),
+            philosophy=data.get('philosophy', ''),
+            current_self_reflection=data.get('current_self_reflection', {}),
+            entity_collections=entity_collections
+        )
+
+
+class CompactAgentSnapshotResult:
+    """Slotted AgentSnapshotResult"""
+    __slots__ = ("agent_id", "state", "sequence", "updated_at")
+
+    def __init__(self, agent_id: str, state: CompactAgentState, sequence: int, updated_at: Optional[datetime]):
+        self.agent_id = agent_id
+        self.state = state
+        self.sequence = sequence
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactAgentSnapshotResult(agent_id={self.agent_id!r}, sequence={self.sequence!r}, "
+            f"updated_at={self.updated_at!r}, state={self.state!r})"
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactAgentSnapshotResult':
+        state_data = data.get('state', {})
+        return cls(
+            agent_id=data.get('agent_id', ''),
+            state=CompactAgentState.from_dict(state_data),
+            sequence=data.get('sequence', 0),
+            updated_at=parse_optional_timestamp(data.get('updated_at'))
+        )
@@ -0,0 +1,363 @@
+"""
+Request/response compression
+
+Opt-in gzip/zstd compression of request bodies and Accept-Encoding negotiation for
+responses, with a per-call record of sizes and compression time. zstd needs the zstandard
+package (pip install nowyouseeme[zstd]); gzip is always available.
+
+Compressed request bodies need a server that honours Content-Encoding. The Go backend
+doesn't (it answers 400), so request compression is off unless asked for; the stand-in
+decodes them with decompress_requests. Response compression only needs a server or proxy
+that answers Accept-Encoding.
+"""
+
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+GZIP = "gzip"
+ZSTD = "zstd"
+DEFLATE = "deflate"
+IDENTITY = "identity"
+
+DEFAULT_LEVELS = {GZIP: 6, ZSTD: 3}
+
+# zlib wbits: 31 writes a gzip wrapper, 47 reads either a gzip or a zlib wrapper
+_GZIP_WBITS = 31
+_AUTO_WBITS = 47
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings this installation can produce and read, most preferred first"""
+    return (ZSTD, GZIP) if zstandard is not None else (GZIP,)
+
+
+def _require(encoding: str) -> None:
+    if encoding == ZSTD and zstandard is None:
+        raise ImportError("zstd compression requires zstandard. Install it with: pip install nowyouseeme[zstd]")
+    if encoding not in (GZIP, ZSTD, DEFLATE):
+        raise ValueError(f"unsupported content encoding: {encoding!r}")
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a body for a Content-Encoding.
+
+    Raises:
+        ValueError: If the encoding is not supported
+        ImportError: If zstd is requested without zstandard installed
+    """
+    _require(encoding)
+    level = DEFAULT_LEVELS.get(encoding, 6) if level is None else level
+    if encoding == ZSTD:
+        # Compressor objects aren't safe to share between threads, and are cheap to create
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == DEFLATE:
+        return zlib.compress(data, level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _Identity:
+    """Streaming decoder for uncompressed bodies"""
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _ZstdStream:
+    """Streaming zstd decoder with the same decompress()/flush() interface as zlib's"""
+
+    def __init__(self):
+        self._decoder = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decoder.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def decompressor(encoding: Optional[str]):
+    """
+    Streaming decoder for a Content-Encoding: call decompress(chunk) per chunk, then flush().
+
+    Raises:
+        ValueError: If the encoding is not supported
+        ImportError: If the body is zstd and zstandard is not installed
+    """
+    encoding = (encoding or IDENTITY).strip().lower()
+    if encoding == IDENTITY:
+        return _Identity()
+    _require(encoding)
+    if encoding == ZSTD:
+        return _ZstdStream()
+    return zlib.decompressobj(_AUTO_WBITS)
+
+
+def decompress(data: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Decode a body sent with a Content-Encoding ("" / None / identity pass it through).
+
+    Raises:
+        ValueError: If the encoding is not supported or the data is corrupt
+        ImportError: If the body is zstd and zstandard is not installed
+    """
+    decoder = decompressor(encoding)
+    try:
+        return decoder.decompress(data) + decoder.flush()
+    except zlib.error as e:
+        raise ValueError(f"invalid {encoding} body: {e}") from None
+    except Exception as e:
+        if zstandard is not None and isinstance(e, zstandard.ZstdError):
+            raise ValueError(f"invalid {encoding} body: {e}") from None
+        raise
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map each encoding in an Accept-Encoding header to its q-value"""
+    accepted = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def negotiate_encoding(header: Optional[str], supported: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header.
+
+    Args:
+        header: The request's Accept-Encoding value
+        supported: Encodings the server can produce, in its order of preference
+
+    Returns:
+        The chosen encoding, or None to send the body uncompressed
+    """
+    accepted = parse_accept_encoding(header)
+    if not accepted:
+        return None
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in supported if supported is not None else available_encodings():
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+@dataclass
+class CompressionSample:
+    """Sizes and codec time of one compressed (or eligible) request or response body"""
+    method: str
+    direction: str  # "request" or "response"
+    encoding: str   # identity when the body was sent/received uncompressed
+    raw_bytes: int
+    wire_bytes: int
+    seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """raw / wire size (1.0 for uncompressed bodies)"""
+        return self.raw_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+
+class StreamDecoder:
+    """
+    Decodes a streamed response chunk by chunk.
+
+    finish() flushes the decoder at the end of the body; close() (or finish()) records one
+    sample for everything decoded, including when the reader stopped early.
+    """
+
+    def __init__(self, method: str, encoding: Optional[str], stats: "CompressionStats"):
+        self.method = method
+        self.encoding = (encoding or IDENTITY).strip().lower()
+        self.stats = stats
+        self._decoder = decompressor(self.encoding)
+        self._raw_bytes = 0
+        self._wire_bytes = 0
+        self._seconds = 0.0
+        self._recorded = False
+
+    def decode(self, chunk: bytes) -> bytes:
+        start = time.perf_counter()
+        data = self._decoder.decompress(chunk)
+        self._seconds += time.perf_counter() - start
+        self._wire_bytes += len(chunk)
+        self._raw_bytes += len(data)
+        return data
+
+    def finish(self) -> bytes:
+        data = self._decoder.flush()
+        self._raw_bytes += len(data)
+        self.close()
+        return data
+
+    def close(self) -> None:
+        if not self._recorded:
+            self._recorded = True
+            self.stats.record(CompressionSample(
+                self.method, "response", self.encoding, self._raw_bytes, self._wire_bytes, self._seconds
+            ))
+
+
+class CompressionStats:
+    """
+    Rolling record of the most recent compression samples (thread-safe).
+
+    Example usage:
+        ```python
+        stats = client.compression.stats
+        for (method, direction), row in stats.summary().items():
+            print(method, direction, f"{row['ratio']:.1f}x", f"{row['ms_per_call']:.2f}ms")
+        ```
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self.samples: Deque[CompressionSample] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def record(self, sample: CompressionSample) -> None:
+        with self._lock:
+            self.samples.append(sample)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.samples.clear()
+
+    def summary(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Totals per (method, direction).
+
+        Returns:
+            Dict of calls, raw_bytes, wire_bytes, ratio, seconds and ms_per_call per key
+        """
+        with self._lock:
+            samples: List[CompressionSample] = list(self.samples)
+        totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for sample in samples:
+            row = totals.setdefault((sample.method, sample.direction), {
+                "calls": 0, "raw_bytes": 0, "wire_bytes": 0, "seconds": 0.0
+            })
+            row["calls"] += 1
+            row["raw_bytes"] += sample.raw_bytes
+            row["wire_bytes"] += sample.wire_bytes
+            row["seconds"] += sample.seconds
+        for row in totals.values():
+            row["ratio"] = row["raw_bytes"] / row["wire_bytes"] if row["wire_bytes"] else 1.0
+            row["ms_per_call"] = row["seconds"] / row["calls"] * 1000
+        return totals
+
+
+class Compression:
+    """
+    Compression settings for a client, plus the stats of every call made with them.
+
+    Example usage:
+        ```python
+        # request_encoding only for servers that decode compressed request bodies
+        client = NowYouSeeMeClient(compression=Compression(request_encoding="zstd"))
+        client.submit_diary(...)          # body sent with Content-Encoding: zstd
+        client.get_timeline("agent_1")    # Accept-Encoding: zstd, gzip
+        print(client.compression.stats.summary())
+        ```
+    """
+
+    def __init__(
+        self,
+        request_encoding: Optional[str] = None,
+        accept_encodings: Optional[Sequence[str]] = None,
+        level: Optional[int] = None,
+        min_size: int = 1024,
+        stats: Optional[CompressionStats] = None
+    ):
+        """
+        Args:
+            request_encoding: Encoding for request bodies (gzip or zstd), or None to send them as
+                is; only set it for servers that decode Content-Encoding, which the Go
+                backend doesn't
+            accept_encodings: Encodings to advertise for responses, preferred first
+                (default: every available one)
+            level: Compression level (default: 6 for gzip, 3 for zstd)
+            min_size: Request bodies smaller than this are sent uncompressed
+            stats: Where to record samples (a fresh CompressionStats by default)
+
+        Raises:
+            ValueError: If an encoding is not supported
+            ImportError: If zstd is requested without zstandard installed
+        """
+        if request_encoding is not None:
+            _require(request_encoding)
+        accept_encodings = tuple(accept_encodings) if accept_encodings is not None else available_encodings()
+        for encoding in accept_encodings:
+            _require(encoding)
+        self.request_encoding = request_encoding
+        self.accept_encodings = accept_encodings
+        self.level = level
+        self.min_size = min_size
+        self.stats = stats if stats is not None else CompressionStats()
+
+    @property
+    def accept_encoding(self) -> str:
+        """Accept-Encoding header value"""
+        return ", ".join(self.accept_encodings) if self.accept_encodings else IDENTITY
+
+    def encode_request(self, method: str, body: bytes) -> Tuple[bytes, Optional[str]]:
+        """
+        Compress a request body if it is large enough.
+
+        Returns:
+            Tuple of (body to send, Content-Encoding or None)
+        """
+        if self.request_encoding is None or len(body) < self.min_size:
+            return body, None
+        start = time.perf_counter()
+        compressed = compress(body, self.request_encoding, self.level)
+        elapsed = time.perf_counter() - start
+        self.stats.record(CompressionSample(
+            method, "request", self.request_encoding, len(body), len(compressed), elapsed
+        ))
+        return compressed, self.request_encoding
+
+    def decode_response(self, method: str, body: bytes, encoding: Optional[str]) -> bytes:
+        """
+        Decode a response body received with a Content-Encoding.
+
+        Raises:
+            ValueError: If the body can't be decoded
+        """
+        encoding = (encoding or IDENTITY).strip().lower()
+        start = time.perf_counter()
+        decoded = decompress(body, encoding)
+        elapsed = time.perf_counter() - start
+        self.stats.record(CompressionSample(method, "response", encoding, len(decoded), len(body), elapsed))
+        return decoded
+
+    def stream_decoder(self, method: str, encoding: Optional[str]) -> StreamDecoder:
+        """Decoder for a streamed response body (e.g. iter_timeline)"""
+        return StreamDecoder(method, encoding, self.stats)
@@ -0,0 +1,251 @@
+"""
+Structural state diff
+
+Compares two AgentStates field by field and entity by entity instead of diffing JSON
+dumps. Each entity type is walked once with dict lookups, so a diff is linear in the number
+of entities. A diff's entity changes convert back into the fewest operations a diary needs
+to move one state to the other, following the goal state machine.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import AgentSnapshotResult, AgentState, Entity, Operation
+from .entity_types import EntityType, Status
+from .operation_types import OperationType
+from .validation import goal_status_path
+
+# Scalar AgentState fields; they travel as submit_diary arguments rather than operations
+STATE_FIELDS = (
+    "mbti",
+    "mbti_confidence",
+    "geometry_representation",
+    "current_mood",
+    "philosophy",
+    "current_self_reflection",
+)
+
+_STATUSES = frozenset(status.value for status in Status)
+_CREATE_STATUSES = (Status.PENDING.value, Status.PROGRESS.value)
+
+
+class ChangeKind(str, Enum):
+    """How an entity differs between two states"""
+    ADDED = "added"
+    REMOVED = "removed"
+    CONTENT_CHANGED = "content_changed"
+    STATUS_CHANGED = "status_changed"
+
+
+@dataclass(frozen=True)
+class EntityChange:
+    """One difference in one entity; old is None when added, new is None when removed"""
+    kind: ChangeKind
+    entity_type: str
+    entity_id: str
+    old: Optional[Entity]
+    new: Optional[Entity]
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A scalar AgentState field (one of STATE_FIELDS) that differs"""
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class StateDiff:
+    """
+    Differences between two states: entity changes, grouped by entity type in state order,
+    and scalar field changes.
+
+    An entity whose content and status both changed contributes a CONTENT_CHANGED and a
+    STATUS_CHANGED change. len() and iteration cover the entity changes; the diff is falsy
+    only when neither entities nor fields differ.
+    """
+    changes: List[EntityChange] = field(default_factory=list)
+    fields: List[FieldChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes or self.fields)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[EntityChange]:
+        return iter(self.changes)
+
+    def of_kind(self, kind: Union[ChangeKind, str]) -> List[EntityChange]:
+        return [change for change in self.changes if change.kind == kind]
+
+    def by_type(self) -> Dict[str, List[EntityChange]]:
+        """Changes keyed by entity type"""
+        grouped: Dict[str, List[EntityChange]] = {}
+        for change in self.changes:
+            grouped.setdefault(change.entity_type, []).append(change)
+        return grouped
+
+    def to_operations(self) -> List[Operation]:
+        """Operations moving the old state's entities to the new state's (see changes_to_operations)"""
+        return changes_to_operations(self.changes)
+
+
+StateLike = Union[AgentState, AgentSnapshotResult, None]
+
+
+def _state(state: StateLike) -> Optional[AgentState]:
+    return state.state if isinstance(state, AgentSnapshotResult) else state
+
+
+def _entities(state: Optional[AgentState]) -> Dict[str, Dict[str, Entity]]:
+    if state is None:
+        return {}
+    return {entity_type: collection.entities_by_id for entity_type, collection in state.entity_collections.items()}
+
+
+def _field_changes(old: Optional[AgentState], new: Optional[AgentState]) -> List[FieldChange]:
+    # A missing state has the defaults of an empty one
+    empty = AgentState(mbti="")
+    old = old if old is not None else empty
+    new = new if new is not None else empty
+    changes = []
+    for name in STATE_FIELDS:
+        before, after = getattr(old, name), getattr(new, name)
+        if before != after:
+            changes.append(FieldChange(name, before, after))
+    return changes
+
+
+def diff_states(old: StateLike, new: StateLike) -> StateDiff:
+    """
+    Diff two states.
+
+    Args:
+        old: State (or snapshot) before; None for an empty state
+        new: State (or snapshot) after; None for an empty state
+
+    Returns:
+        StateDiff moving old to new
+    """
+    old, new = _state(old), _state(new)
+    old_types = _entities(old)
+    new_types = _entities(new)
+    changes: List[EntityChange] = []
+    append = changes.append
+    for entity_type in list(old_types) + [t for t in new_types if t not in old_types]:
+        before = old_types.get(entity_type) or {}
+        after = new_types.get(entity_type) or {}
+        for entity_id, entity in before.items():
+            current = after.get(entity_id)
+            if current is None:
+                append(EntityChange(ChangeKind.REMOVED, entity_type, entity_id, entity, None))
+                continue
+            if current is entity:
+                continue
+            if current.content != entity.content:
+                append(EntityChange(ChangeKind.CONTENT_CHANGED, entity_type, entity_id, entity, current))
+            if current.status != entity.status:
+                append(EntityChange(ChangeKind.STATUS_CHANGED, entity_type, entity_id, entity, current))
+        for entity_id, entity in after.items():
+            if entity_id not in before:
+                append(EntityChange(ChangeKind.ADDED, entity_type, entity_id, None, entity))
+    return StateDiff(changes, _field_changes(old, new))
+
+
+def _status_path(entity_type: str, from_status: str, to_status: str) -> Optional[Tuple[str, ...]]:
+    if entity_type == EntityType.GOAL.value:
+        return goal_status_path(from_status, to_status)
+    # Only goals have a state machine
+    return () if from_status == to_status else (to_status,)
+
+
+def _create(entity_type: str, entity_id: str, entity: Entity) -> List[Operation]:
+    if not entity.content:
+        raise ValueError(f"{entity_type} {entity_id} has no content and can't be created")
+    if entity.status not in _STATUSES:
+        raise ValueError(f"{entity_type} {entity_id} has an invalid status: {entity.status!r}")
+
+    # Start from whichever creatable status is closest to the target
+    best: Optional[Tuple[str, Tuple[str, ...]]] = None
+    for status in _CREATE_STATUSES:
+        path = _status_path(entity_type, status, entity.status)
+        if path is not None and (best is None or len(path) < len(best[1])):
+            best = (status, path)
+    if best is None:
+        raise ValueError(f"{entity_type} {entity_id} can't reach status {entity.status!r}")
+
+    status, path = best
+    operations = [Operation(entity_type, OperationType.CREATE.value, entity_id,
+                            entity_content=entity.content, target_status=status)]
+    operations.extend(Operation(entity_type, OperationType.UPDATE.value, entity_id, target_status=step)
+                      for step in path)
+    return operations
+
+
+def _entity_operations(
+    entity_type: str,
+    entity_id: str,
+    old: Optional[Entity],
+    new: Optional[Entity]
+) -> List[Operation]:
+    if new is None:
+        return [Operation(entity_type, OperationType.DELETE.value, entity_id)]
+    if old is None:
+        return _create(entity_type, entity_id, new)
+
+    if new.content != old.content and not new.content:
+        raise ValueError(f"{entity_type} {entity_id}: content can't be cleared by an operation")
+    if new.status != old.status and new.status not in _STATUSES:
+        raise ValueError(f"{entity_type} {entity_id} has an invalid status: {new.status!r}")
+    content = new.content if new.content != old.content else None
+    path = _status_path(entity_type, old.status, new.status)
+    if path is None:
+        # No legal transition (e.g. out of completed): delete and create it again
+        return [Operation(entity_type, OperationType.DELETE.value, entity_id)] + _create(entity_type, entity_id, new)
+    if not path:
+        return [Operation(entity_type, OperationType.UPDATE.value, entity_id, entity_content=content)]
+
+    # Content rides along with the first status step
+    operations = [Operation(entity_type, OperationType.UPDATE.value, entity_id,
+                            entity_content=content, target_status=path[0])]
+    operations.extend(Operation(entity_type, OperationType.UPDATE.value, entity_id, target_status=step)
+                      for step in path[1:])
+    return operations
+
+
+def changes_to_operations(changes: Iterable[EntityChange]) -> List[Operation]:
+    """
+    The fewest operations that move entities from their old to their new versions.
+
+    Each entity gets at most one create, delete or combined content/status update, plus the
+    extra status updates the goal state machine requires (pending -> completed goes through
+    progress). A goal that can't legally reach its new status is deleted and created again.
+
+    Example usage:
+        ```python
+        diff = diff_states(before, after)
+        client.submit_diary(agent_id=agent_id, mbti=after.mbti, operations=diff.to_operations())
+        ```
+
+    Args:
+        changes: EntityChanges, e.g. a StateDiff
+
+    Returns:
+        Operations in change order, valid against the old state (validate_operations passes)
+
+    Raises:
+        ValueError: If an entity's new version can't be produced by operations (empty
+            content or an unknown status)
+    """
+    # Content and status changes of one entity carry the same old and new versions
+    entities: Dict[Tuple[str, str], EntityChange] = {}
+    for change in changes:
+        entities.setdefault((change.entity_type, change.entity_id), change)
+
+    operations: List[Operation] = []
+    for (entity_type, entity_id), change in entities.items():
+        operations.extend(_entity_operations(entity_type, entity_id, change.old, change.new))
+    return operations
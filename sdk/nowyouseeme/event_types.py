@@ -0,0 +1,28 @@
+"""
+Event types - CRUD events plus metadata submissions
+Must match backend models/event_types.go
+"""
+
+from enum import Enum
+
+
+class EventType(str, Enum):
+    """Event type enumeration"""
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    METADATA = "metadata_submission"
+
+
+def get_all_event_types():
+    """Get all valid event types"""
+    return [event_type.value for event_type in EventType]
+
+
+def is_valid_event_type(value: str) -> bool:
+    """Check if a string is a valid event type"""
+    try:
+        EventType(value)
+        return True
+    except ValueError:
+        return False
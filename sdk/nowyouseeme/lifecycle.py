@@ -0,0 +1,438 @@
+"""
+Goal lifecycle analytics
+
+Reads timeline events for goals (create, status-changing update, delete) and measures each
+goal's lifecycle: time spent in each Status, time to completion, abandonments and
+reactivations, rolled up per agent and for the whole population as a completion funnel.
+
+Events are consumed as a stream. Each goal event becomes one (goal, status, timestamp) row
+in a fixed-size buffer, and every full buffer is folded into per-goal accumulators with
+NumPy, so memory grows with the number of goals rather than the number of events.
+
+Requires numpy (pip install nowyouseeme[analytics]).
+"""
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .analytics import _datetime64, _require_numpy
+from .client import Event, NowYouSeeMeClient
+from .entity_types import EntityType, Status
+from .event_types import EventType
+
+# Status codes; NONE (not created yet) and DELETED bracket a goal's life
+STATUSES: Tuple[str, ...] = (Status.PENDING.value, Status.PROGRESS.value, Status.COMPLETED.value, Status.ABANDONED.value)
+PENDING, PROGRESS, COMPLETED, ABANDONED = range(4)
+NONE = -1
+DELETED = 4
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+# Rows/columns of the transition matrix: NONE, the four statuses, DELETED
+TRANSITION_LABELS: Tuple[str, ...] = ("none",) + STATUSES + ("deleted",)
+
+_GOAL = EntityType.GOAL.value
+_CREATE = EventType.CREATE.value
+_UPDATE = EventType.UPDATE.value
+_DELETE = EventType.DELETE.value
+
+_NAT = -(2 ** 63)  # datetime64 NaT as int64
+
+
+class GoalLifecycleBuilder:
+    """
+    Streaming accumulator of goal lifecycles.
+
+    Example usage:
+        ```python
+        builder = GoalLifecycleBuilder()
+        for agent_id in agent_ids:
+            builder.add(agent_id, client.iter_timeline(agent_id))
+        lifecycle = builder.finish()
+        lifecycle.funnel()
+        ```
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        """
+        Args:
+            chunk_size: Goal events buffered before they are folded into the accumulators
+        """
+        self.np = _require_numpy()
+        self.chunk_size = chunk_size
+        self.events = 0
+        self.agent_ids: List[str] = []
+        self._agent_index: Dict[str, int] = {}
+        self._goal_index: Dict[Tuple[int, str], int] = {}
+        self._goal_agents = array('q')
+        self._goal_ids: List[str] = []
+
+        # Buffered rows
+        self._rows_goal = array('q')
+        self._rows_status = array('b')
+        self._rows_time: List[Any] = []
+
+        np = self.np
+        self._capacity = 0
+        self._status = np.empty(0, dtype=np.int8)
+        self._since = np.empty(0, dtype=np.int64)
+        self._created_at = np.empty(0, dtype=np.int64)
+        self._completed_at = np.empty(0, dtype=np.int64)
+        self._time_in = np.empty((0, len(STATUSES)), dtype=np.int64)
+        self._reached = np.empty((0, len(STATUSES)), dtype=bool)
+        self._abandons = np.empty(0, dtype=np.int32)
+        self._reactivations = np.empty(0, dtype=np.int32)
+        self.transitions = np.zeros((len(TRANSITION_LABELS), len(TRANSITION_LABELS)), dtype=np.int64)
+        self.last_time = _NAT
+
+    def _goal(self, agent: int, goal_id: str) -> int:
+        key = (agent, goal_id)
+        goal = self._goal_index.get(key)
+        if goal is None:
+            goal = self._goal_index[key] = len(self._goal_ids)
+            self._goal_ids.append(goal_id)
+            self._goal_agents.append(agent)
+        return goal
+
+    def add(self, agent_id: str, events: Iterable[Union[Event, Dict[str, Any]]]) -> None:
+        """
+        Consume one agent's events in timeline order (Event objects or raw event dicts).
+
+        Metadata events and events for other entity types are skipped; so are updates that
+        only change a goal's content.
+        """
+        agent = self._agent_index.get(agent_id)
+        if agent is None:
+            agent = self._agent_index[agent_id] = len(self.agent_ids)
+            self.agent_ids.append(agent_id)
+        rows_goal, rows_status, rows_time = self._rows_goal, self._rows_status, self._rows_time
+        goal_index = self._goal
+
+        count = 0
+        for count, event in enumerate(events, 1):
+            if isinstance(event, Event):
+                event_type, payload, timestamp = event.event_type, event.raw_payload, event.timestamp
+            else:
+                event_type, payload, timestamp = event.get('event_type'), event.get('raw_payload') or {}, \
+                    event.get('timestamp')
+            if payload.get('entity_type') != _GOAL:
+                continue
+            if event_type == _DELETE:
+                status = DELETED
+            elif event_type == _CREATE:
+                status = _STATUS_CODES.get(payload.get('target_status') or '', PENDING)
+            elif event_type == _UPDATE and payload.get('target_status'):
+                status = _STATUS_CODES.get(payload['target_status'])
+                if status is None:
+                    continue
+            else:
+                continue
+            rows_goal.append(goal_index(agent, payload.get('entity_id') or ''))
+            rows_status.append(status)
+            rows_time.append(timestamp)
+            if len(rows_goal) >= self.chunk_size:
+                self._flush()
+        self.events += count
+
+    def _grow(self, size: int) -> None:
+        np = self.np
+        if size <= self._capacity:
+            return
+        capacity = max(size, self._capacity * 2, 1024)
+        extra = capacity - self._capacity
+
+        def grow(values, fill):
+            padding = np.full((extra,) + values.shape[1:], fill, dtype=values.dtype)
+            return np.concatenate([values, padding])
+
+        self._status = grow(self._status, NONE)
+        self._since = grow(self._since, _NAT)
+        self._created_at = grow(self._created_at, _NAT)
+        self._completed_at = grow(self._completed_at, _NAT)
+        self._time_in = grow(self._time_in, 0)
+        self._reached = grow(self._reached, False)
+        self._abandons = grow(self._abandons, 0)
+        self._reactivations = grow(self._reactivations, 0)
+        self._capacity = capacity
+
+    def _flush(self) -> None:
+        """Fold the buffered rows into the per-goal accumulators"""
+        np = self.np
+        size = len(self._rows_goal)
+        if not size:
+            return
+        self._grow(len(self._goal_ids))
+        goals = np.frombuffer(self._rows_goal, dtype=np.int64).copy()
+        statuses = np.frombuffer(self._rows_status, dtype=np.int8).copy()
+        times = _datetime64(np, self._rows_time).astype(np.int64)
+        del self._rows_goal[:], self._rows_status[:], self._rows_time[:]
+
+        # Group each goal's rows, keeping their stream order
+        order = np.argsort(goals, kind="stable")
+        goals, statuses, times = goals[order], statuses[order], times[order]
+        first = np.ones(size, dtype=bool)
+        first[1:] = goals[1:] != goals[:-1]
+        last = np.ones(size, dtype=bool)
+        last[:-1] = first[1:]
+
+        # A row without a timestamp takes the goal's previous one, so no time is attributed to it
+        missing = times == _NAT
+        if missing.any():
+            positions = np.arange(size)
+            known = np.maximum.accumulate(np.where(missing, -1, positions))
+            group_start = np.maximum.accumulate(np.where(first, positions, 0))
+            filled = np.where(known >= group_start, times[np.maximum(known, 0)], self._since[goals])
+            times = np.where(missing, filled, times)
+
+        # Each row's previous status and its start, from the row before or the carried state
+        previous = np.empty(size, dtype=np.int8)
+        since = np.empty(size, dtype=np.int64)
+        previous[1:], since[1:] = statuses[:-1], times[:-1]
+        previous[first], since[first] = self._status[goals[first]], self._since[goals[first]]
+
+        # Time spent in the previous status ends at this row
+        live = (previous >= 0) & (previous < DELETED) & (since != _NAT) & (times != _NAT)
+        np.add.at(self._time_in, (goals[live], previous[live]), np.maximum(times[live] - since[live], 0))
+
+        changed = previous != statuses
+        np.add.at(self.transitions, (previous[changed] + 1, statuses[changed] + 1), 1)
+
+        # First creation and first completion win (reversed so earlier rows are assigned last)
+        created = (previous == NONE) & (statuses != DELETED)
+        target = goals[created][::-1]
+        self._created_at[target] = np.where(
+            self._created_at[target] == _NAT, times[created][::-1], self._created_at[target]
+        )
+        completed = changed & (statuses == COMPLETED)
+        target = goals[completed][::-1]
+        self._completed_at[target] = np.where(
+            self._completed_at[target] == _NAT, times[completed][::-1], self._completed_at[target]
+        )
+
+        np.add.at(self._abandons, goals[changed & (statuses == ABANDONED)], 1)
+        reactivated = (previous == ABANDONED) & ((statuses == PENDING) | (statuses == PROGRESS))
+        np.add.at(self._reactivations, goals[reactivated], 1)
+        for code in range(len(STATUSES)):
+            self._reached[goals[statuses == code], code] = True
+
+        self._status[goals[last]] = statuses[last]
+        self._since[goals[last]] = times[last]
+        self.last_time = max(self.last_time, int(times.max()))
+
+    def finish(self, as_of: Optional[datetime] = None) -> "GoalLifecycle":
+        """
+        Fold the remaining events and return the lifecycles.
+
+        Args:
+            as_of: End of the observation window for goals still in a status (default: the
+                latest event timestamp seen)
+        """
+        np = self.np
+        self._flush()
+        self._grow(len(self._goal_ids))
+        count = len(self._goal_ids)
+        end = self.last_time if as_of is None else int(_datetime64(np, [as_of]).astype(np.int64)[0])
+
+        status = self._status[:count].copy()
+        since = self._since[:count]
+        time_in = self._time_in[:count].copy()
+        # The current status lasts until the end of the window
+        open_goals = np.flatnonzero((status >= 0) & (status < DELETED) & (since != _NAT))
+        if end != _NAT:
+            time_in[open_goals, status[open_goals]] += np.maximum(end - since[open_goals], 0)
+
+        def datetimes(values):
+            return values[:count].view("datetime64[ns]").copy()
+
+        return GoalLifecycle(
+            agent_ids=list(self.agent_ids),
+            goal_agents=np.frombuffer(self._goal_agents, dtype=np.int64).copy(),
+            goal_ids=list(self._goal_ids),
+            status=status,
+            created_at=datetimes(self._created_at),
+            completed_at=datetimes(self._completed_at),
+            seconds_in_status=time_in / 1e9,
+            reached=self._reached[:count].copy(),
+            abandons=self._abandons[:count].copy(),
+            reactivations=self._reactivations[:count].copy(),
+            transitions=self.transitions.copy(),
+            events=self.events,
+        )
+
+
+@dataclass
+class GoalLifecycle:
+    """
+    Lifecycle metrics of every goal seen, as parallel arrays indexed by goal.
+
+    status holds the goal's current code (PENDING..ABANDONED, or DELETED); reached[g, code]
+    is whether goal g was ever in a status; seconds_in_status[g, code] is the total time
+    spent in it, including the current status up to the end of the window.
+    """
+    agent_ids: List[str]
+    goal_agents: Any        # int64 index into agent_ids
+    goal_ids: List[str]
+    status: Any             # int8
+    created_at: Any         # datetime64[ns]
+    completed_at: Any       # datetime64[ns], NaT unless completed
+    seconds_in_status: Any  # (goals, 4) float64
+    reached: Any            # (goals, 4) bool
+    abandons: Any           # int32
+    reactivations: Any      # int32
+    transitions: Any        # (6, 6) int64 over TRANSITION_LABELS
+    events: int
+
+    def __len__(self) -> int:
+        return len(self.goal_ids)
+
+    @property
+    def seconds_to_completion(self):
+        """Creation to first completion per goal (nan if not completed)"""
+        np = _require_numpy()
+        done = ~(np.isnat(self.completed_at) | np.isnat(self.created_at))
+        seconds = np.full(len(self), np.nan)
+        seconds[done] = (self.completed_at[done] - self.created_at[done]).astype(np.int64) / 1e9
+        return seconds
+
+    def per_goal(self):
+        """One record per goal: agent_id, goal_id, status, timings and counts"""
+        np = _require_numpy()
+        agent_ids = np.array(self.agent_ids + [""], dtype=object)
+        labels = np.array(STATUSES + ("deleted",), dtype=object)
+        return np.rec.fromarrays([
+            agent_ids[self.goal_agents] if len(self) else np.empty(0, dtype=object),
+            np.array(self.goal_ids, dtype=object),
+            labels[self.status.astype(np.int64)] if len(self) else np.empty(0, dtype=object),
+            self.created_at,
+            self.completed_at,
+            self.seconds_to_completion,
+            *(self.seconds_in_status[:, code] for code in range(len(STATUSES))),
+            self.abandons,
+            self.reactivations,
+        ], names=[
+            "agent_id", "goal_id", "status", "created_at", "completed_at", "seconds_to_completion",
+            *(f"seconds_{status}" for status in STATUSES), "abandons", "reactivations",
+        ])
+
+    def per_agent(self):
+        """One record per agent: goal counts by outcome, completion rate and mean timings"""
+        np = _require_numpy()
+        agents = len(self.agent_ids)
+
+        def total(weights=None):
+            return np.bincount(self.goal_agents, weights=weights, minlength=agents)
+
+        goals = total()
+        completed = total(self.reached[:, COMPLETED].astype(np.float64))
+        to_completion = self.seconds_to_completion
+        timed = ~np.isnan(to_completion)
+        completion_seconds = np.bincount(self.goal_agents[timed], weights=to_completion[timed], minlength=agents)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.rec.fromarrays([
+                np.array(self.agent_ids, dtype=object),
+                goals,
+                completed.astype(np.int64),
+                total(self.reached[:, ABANDONED].astype(np.float64)).astype(np.int64),
+                total((self.status == DELETED).astype(np.float64)).astype(np.int64),
+                total(self.abandons.astype(np.float64)).astype(np.int64),
+                total(self.reactivations.astype(np.float64)).astype(np.int64),
+                completed / goals,
+                completion_seconds / np.bincount(self.goal_agents[timed], minlength=agents),
+                *(total(self.seconds_in_status[:, code]) / goals for code in range(len(STATUSES))),
+            ], names=[
+                "agent_id", "goals", "completed", "abandoned", "deleted", "abandons", "reactivations",
+                "completion_rate", "mean_seconds_to_completion",
+                *(f"mean_seconds_{status}" for status in STATUSES),
+            ])
+
+    def funnel(self) -> Dict[str, int]:
+        """Goals reaching each stage: created, started (progress), completed, abandoned, reactivated"""
+        return {
+            "created": len(self),
+            "started": int(self.reached[:, PROGRESS].sum()),
+            "completed": int(self.reached[:, COMPLETED].sum()),
+            "abandoned": int(self.reached[:, ABANDONED].sum()),
+            "reactivated": int((self.reactivations > 0).sum()),
+        }
+
+    def population(self) -> Dict[str, Any]:
+        """
+        Population-wide summary.
+
+        Returns:
+            Dict with goals, agents, events, funnel, current (goals per current status),
+            completion_rate, abandonment_rate, median/mean seconds_to_completion and
+            mean_seconds_in_status per status
+        """
+        np = _require_numpy()
+        goals = len(self)
+        to_completion = self.seconds_to_completion
+        completed = to_completion[~np.isnan(to_completion)]
+        current = np.bincount(self.status.astype(np.int64) + 1, minlength=len(TRANSITION_LABELS))
+        return {
+            "goals": goals,
+            "agents": len(self.agent_ids),
+            "events": self.events,
+            "funnel": self.funnel(),
+            "current": {label: int(current[code]) for code, label in enumerate(TRANSITION_LABELS) if code},
+            "completion_rate": float(self.reached[:, COMPLETED].mean()) if goals else 0.0,
+            "abandonment_rate": float(self.reached[:, ABANDONED].mean()) if goals else 0.0,
+            "median_seconds_to_completion": float(np.median(completed)) if len(completed) else None,
+            "mean_seconds_to_completion": float(completed.mean()) if len(completed) else None,
+            "mean_seconds_in_status": {
+                status: float(self.seconds_in_status[:, code].mean()) if goals else 0.0
+                for code, status in enumerate(STATUSES)
+            },
+        }
+
+    def transition_counts(self) -> Dict[Tuple[str, str], int]:
+        """Non-zero status transitions, e.g. {("pending", "progress"): 120, ...}"""
+        return {
+            (TRANSITION_LABELS[source], TRANSITION_LABELS[target]): int(self.transitions[source, target])
+            for source, target in zip(*self.transitions.nonzero())
+        }
+
+
+def goal_lifecycle(
+    timelines: Iterable[Tuple[str, Iterable[Union[Event, Dict[str, Any]]]]],
+    as_of: Optional[datetime] = None,
+    chunk_size: int = 65536
+) -> GoalLifecycle:
+    """
+    Compute goal lifecycles from a stream of timelines.
+
+    Example usage:
+        ```python
+        lifecycle = goal_lifecycle(client_timelines(client))
+        lifecycle.population()["funnel"]
+        ```
+
+    Args:
+        timelines: (agent_id, events) pairs; events may be a lazy iterator such as iter_timeline
+        as_of: End of the observation window (default: the latest event timestamp)
+        chunk_size: Goal events folded per NumPy pass
+
+    Returns:
+        GoalLifecycle
+    """
+    builder = GoalLifecycleBuilder(chunk_size)
+    for agent_id, events in timelines:
+        builder.add(agent_id, events)
+    return builder.finish(as_of)
+
+
+def client_timelines(
+    client: NowYouSeeMeClient,
+    agent_ids: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, Iterator[Event]]]:
+    """
+    Stream every agent's timeline with iter_timeline, one agent at a time.
+
+    Args:
+        client: Client to fetch with
+        agent_ids: Agents to stream (default: every agent in the gallery)
+    """
+    if agent_ids is None:
+        agent_ids = [agent.id for agent in client.get_gallery(compact=True)]
+    for agent_id in agent_ids:
+        yield agent_id, client.iter_timeline(agent_id)
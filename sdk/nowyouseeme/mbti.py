@@ -0,0 +1,283 @@
+"""
+MBTI encoding and population analytics
+
+An MBTI type with its identity ("INTP-A") fits in 5 bits, one per dimension:
+
+    bit 4: E/I   bit 3: S/N   bit 2: T/F   bit 1: J/P   bit 0: A/T
+
+A bit is 0 for the first letter of its pair and 1 for the second, so a code indexes
+MBTI_TYPES directly and flipping a dimension is one XOR. Arrays of codes (int8, MISSING for
+empty or invalid values) make distributions, per-dimension marginals and
+confidence histograms single NumPy calls over a whole gallery.
+
+The array functions need numpy (pip install nowyouseeme[analytics]); Arrow columns such as
+gallery_to_table()'s mbti column are accepted as is.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .analytics import GalleryTables, _current_mbtis, _gallery_items, _require_numpy
+
+# (name, first letter, second letter), most significant bit first
+DIMENSIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("E/I", "E", "I"),
+    ("S/N", "S", "N"),
+    ("T/F", "T", "F"),
+    ("J/P", "J", "P"),
+    ("A/T", "A", "T"),
+)
+DIMENSION_NAMES = tuple(name for name, _, _ in DIMENSIONS)
+DIMENSION_MASKS = tuple(1 << (len(DIMENSIONS) - 1 - i) for i in range(len(DIMENSIONS)))
+
+NUM_TYPES = 1 << len(DIMENSIONS)
+MISSING = -1
+
+# Indexed by code
+MBTI_TYPES: Tuple[str, ...] = tuple(
+    "".join(DIMENSIONS[i][1 + ((code >> (len(DIMENSIONS) - 1 - i)) & 1)] for i in range(4))
+    + "-" + DIMENSIONS[4][1 + (code & 1)]
+    for code in range(NUM_TYPES)
+)
+_CODES: Dict[str, int] = {mbti: code for code, mbti in enumerate(MBTI_TYPES)}
+
+
+def encode_mbti(mbti: Optional[str]) -> int:
+    """
+    Encode an MBTI string ("INTP-A", case-insensitive) as its 5-bit code.
+
+    Returns:
+        The code, or MISSING for empty or invalid values
+    """
+    if not mbti:
+        return MISSING
+    code = _CODES.get(mbti)
+    if code is None:
+        code = _CODES.get(mbti.strip().upper(), MISSING)
+    return code
+
+
+def decode_mbti(code: int) -> str:
+    """Decode a 5-bit code ("" for MISSING)"""
+    return MBTI_TYPES[code] if 0 <= code < NUM_TYPES else ""
+
+
+def flip_dimension(code: int, dimension: int) -> int:
+    """Switch one dimension (0 = E/I ... 4 = A/T) to its opposite letter"""
+    return code ^ DIMENSION_MASKS[dimension]
+
+
+def _arrow_codes(np, values):
+    """Encode an Arrow string or dictionary column: each distinct value is looked up once"""
+    import pyarrow as pa
+
+    if isinstance(values, pa.ChunkedArray):
+        if pa.types.is_dictionary(values.type):
+            values = values.unify_dictionaries()
+        values = values.combine_chunks() if values.num_chunks != 1 else values.chunk(0)
+    if not pa.types.is_dictionary(values.type):
+        values = values.dictionary_encode()
+    dictionary = values.dictionary.to_pylist()
+    # The extra last entry is what null indices point to
+    lookup = np.array([encode_mbti(value) for value in dictionary] + [MISSING], dtype=np.int8)
+    indices = values.indices.fill_null(len(dictionary)).to_numpy(zero_copy_only=False)
+    return lookup[indices]
+
+
+def encode_mbti_array(values: Any):
+    """
+    Encode many MBTI values.
+
+    Args:
+        values: An iterable of strings, a NumPy string/object array, or an Arrow string or
+            dictionary column (e.g. gallery_to_table(...).agents["mbti"])
+
+    Returns:
+        int8 array of codes (MISSING for empty or invalid values)
+    """
+    np = _require_numpy()
+    if type(values).__module__.startswith("pyarrow"):
+        return _arrow_codes(np, values)
+    if isinstance(values, np.ndarray):
+        # Encode each distinct value once
+        distinct, inverse = np.unique(values.astype(str), return_inverse=True)
+        lookup = np.array([encode_mbti(value) for value in distinct.tolist()], dtype=np.int8)
+        return lookup[inverse.reshape(-1)] if len(distinct) else np.empty(0, dtype=np.int8)
+    return np.fromiter((encode_mbti(value) for value in values), dtype=np.int8)
+
+
+def decode_mbti_array(codes: Any):
+    """Decode an array of codes to MBTI strings ("" for MISSING)"""
+    np = _require_numpy()
+    # MISSING (-1) indexes the trailing ""
+    lookup = np.array(MBTI_TYPES + ("",))
+    return lookup[np.asarray(codes, dtype=np.int64)]
+
+
+def dimension_bits(codes: Any):
+    """
+    Split codes into per-dimension letters.
+
+    Returns:
+        (n, 5) uint8 array, 0 for the first letter of each pair and 1 for the second,
+        in DIMENSIONS order (rows of MISSING codes are meaningless; mask them out)
+    """
+    np = _require_numpy()
+    codes = np.asarray(codes, dtype=np.int8)
+    shifts = np.arange(len(DIMENSIONS) - 1, -1, -1, dtype=np.int8)
+    return ((codes[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+def mbti_counts(codes: Any, weights: Any = None):
+    """
+    Per-type totals.
+
+    Args:
+        codes: Array of codes
+        weights: Optional per-agent weights (e.g. mbti_confidence); counts otherwise
+
+    Returns:
+        Array of NUM_TYPES totals indexed by code (MISSING codes are left out)
+    """
+    np = _require_numpy()
+    codes = np.asarray(codes, dtype=np.int64)
+    valid = codes >= 0
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)[valid]
+    return np.bincount(codes[valid], weights=weights, minlength=NUM_TYPES)
+
+
+def mbti_marginals(codes: Any, weights: Any = None, normalize: bool = True) -> Dict[str, Dict[str, float]]:
+    """
+    Per-dimension letter totals, e.g. {"E/I": {"E": 0.42, "I": 0.58}, ...}.
+
+    Args:
+        codes: Array of codes
+        weights: Optional per-agent weights (e.g. mbti_confidence)
+        normalize: Return shares of the (weighted) population instead of totals
+    """
+    counts = mbti_counts(codes, weights)
+    total = float(counts.sum())
+    marginals = {}
+    for (name, first, second), mask in zip(DIMENSIONS, DIMENSION_MASKS):
+        second_total = float(counts[[code for code in range(NUM_TYPES) if code & mask]].sum())
+        first_total = total - second_total
+        if normalize:
+            first_total, second_total = (first_total / total, second_total / total) if total else (0.0, 0.0)
+        marginals[name] = {first: first_total, second: second_total}
+    return marginals
+
+
+def confidence_histogram(codes: Any, confidences: Any, bins: int = 10):
+    """
+    Histogram of mbti_confidence per type.
+
+    Args:
+        codes: Array of codes
+        confidences: Per-agent mbti_confidence in [0, 1]
+        bins: Number of equal-width bins over [0, 1]
+
+    Returns:
+        Tuple of (NUM_TYPES x bins count array, bins + 1 bin edges)
+    """
+    np = _require_numpy()
+    codes = np.asarray(codes, dtype=np.int64)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    valid = codes >= 0
+    bin_index = np.clip((confidences[valid] * bins).astype(np.int64), 0, bins - 1)
+    histogram = np.bincount(codes[valid] * bins + bin_index, minlength=NUM_TYPES * bins)
+    return histogram.reshape(NUM_TYPES, bins), np.linspace(0.0, 1.0, bins + 1)
+
+
+@dataclass
+class MBTIPopulation:
+    """
+    The MBTI codes and confidences of a set of agents.
+
+    Example usage:
+        ```python
+        population = MBTIPopulation.from_gallery(client)
+        population.distribution()                  # {"INTP-A": 0.07, ...}
+        population.marginals()                     # E/I, S/N, ... shares
+        histogram, edges = population.confidence_histogram(bins=20)
+        ```
+    """
+    codes: Any        # int8 array
+    confidences: Any  # float64 array
+
+    @classmethod
+    def from_gallery(cls, gallery: Any, agents: Any = None) -> 'MBTIPopulation':
+        """
+        MBTIs come from each agent's current_mbti (GET /agents), which the backend keeps up
+        to date; it never sets the state's mbti. Confidences still come from the state's
+        mbti_confidence, which the backend leaves at 0, so weighted results are only
+        meaningful for servers that fill it in.
+
+        Args:
+            gallery: GalleryTables, or anything gallery_to_table accepts (a client, a decoded
+                GET /gallery response, its items, or AgentWithSnapshot objects)
+            agents: A decoded GET /agents response, its items, or Agent objects; fetched from
+                GET /agents when gallery is a client and this is None
+        """
+        np = _require_numpy()
+        if isinstance(gallery, GalleryTables):
+            agents = gallery.agents
+            confidences = agents["mbti_confidence"]
+            confidences = confidences.to_numpy() if hasattr(confidences, "to_numpy") else confidences
+            return cls(encode_mbti_array(agents["mbti"]), np.asarray(confidences, dtype=np.float64))
+
+        kind, items = _gallery_items(gallery)
+        current = _current_mbtis(gallery, agents)
+        mbtis, confidences = [], []
+        if kind == "dicts":
+            for item in items:
+                snapshot = item.get('snapshot') or {}
+                state = snapshot.get('state') or {}
+                agent_id = item.get('id') or snapshot.get('agent_id', '')
+                mbtis.append(current.get(agent_id) or state.get('mbti') or '')
+                confidences.append(state.get('mbti_confidence') or 0.0)
+        else:
+            for item in items:
+                state = item.snapshot.state if item.snapshot is not None else None
+                mbtis.append(current.get(item.id) or (state.mbti if state is not None else ''))
+                confidences.append(state.mbti_confidence if state is not None else 0.0)
+        return cls(encode_mbti_array(mbtis), np.array(confidences, dtype=np.float64))
+
+    @classmethod
+    def from_values(cls, mbtis: Iterable[str], confidences: Optional[Iterable[float]] = None) -> 'MBTIPopulation':
+        """Build from MBTI strings (e.g. Agent.current_mbti), with confidence 1.0 if none are given"""
+        np = _require_numpy()
+        codes = encode_mbti_array(mbtis)
+        if confidences is None:
+            return cls(codes, np.ones(len(codes), dtype=np.float64))
+        return cls(codes, np.fromiter(confidences, dtype=np.float64, count=len(codes)))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def missing(self) -> int:
+        """Agents without a valid MBTI"""
+        return int((self.codes < 0).sum())
+
+    def counts(self, weighted: bool = False):
+        """Per-type totals indexed by code, confidence-weighted if requested"""
+        return mbti_counts(self.codes, self.confidences if weighted else None)
+
+    def distribution(self, weighted: bool = False, normalize: bool = True) -> Dict[str, float]:
+        """Share (or total) per MBTI type present in the population, largest first"""
+        counts = self.counts(weighted)
+        total = float(counts.sum())
+        order = counts.argsort(kind="stable")[::-1]
+        return {
+            MBTI_TYPES[code]: (float(counts[code]) / total if normalize else float(counts[code]))
+            for code in order.tolist() if counts[code]
+        }
+
+    def marginals(self, weighted: bool = False, normalize: bool = True) -> Dict[str, Dict[str, float]]:
+        """Per-dimension letter shares (or totals), confidence-weighted if requested"""
+        return mbti_marginals(self.codes, self.confidences if weighted else None, normalize)
+
+    def confidence_histogram(self, bins: int = 10):
+        """NUM_TYPES x bins histogram of mbti_confidence, plus the bin edges"""
+        return confidence_histogram(self.codes, self.confidences, bins)
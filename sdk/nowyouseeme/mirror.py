@@ -0,0 +1,304 @@
+"""
+Local event-store mirror
+
+Keeps a copy of agents' timelines in a SQLite file keyed by (agent_id, sequence_number).
+sync() reads the gallery once to learn every agent's current sequence number, then fetches,
+concurrently, only the agents that moved and only the events past the last stored sequence
+(GET /timeline?after_sequence=N). Timeline, replay and analytics queries then run offline
+against the file.
+"""
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import AgentSnapshotResult, Event, NowYouSeeMeClient, _empty_snapshot, _gallery_items
+from .codec import JSONCodec, get_codec
+from .replay import ReplayEngine, replay_events_on_snapshot
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    agent_id TEXT NOT NULL,
+    sequence_number INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    timestamp TEXT,
+    raw_payload TEXT NOT NULL,
+    PRIMARY KEY (agent_id, sequence_number)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agents (
+    agent_id TEXT PRIMARY KEY,
+    last_sequence INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS mirror_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_EVENT_COLUMNS = "event_id, sequence_number, event_type, timestamp, raw_payload"
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one EventMirror.sync()"""
+    agents_checked: int = 0
+    agents_fetched: int = 0
+    events_added: int = 0
+    seconds: float = 0.0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+class EventMirror:
+    """
+    SQLite mirror of agents' event streams (thread-safe; one connection guarded by a lock).
+
+    Example usage:
+        ```python
+        with EventMirror("events.db") as mirror:
+            mirror.sync(client, max_workers=16)      # only new events are downloaded
+            mirror.timeline("agent_1")               # same shape as client.get_timeline
+            mirror.snapshot("agent_1", sequence=40)  # replayed offline
+            lifecycle = goal_lifecycle(mirror.timelines())
+        ```
+    """
+
+    def __init__(self, path: str = ":memory:", codec: Union[str, JSONCodec, None] = None):
+        """
+        Args:
+            path: SQLite file (created if missing), or ":memory:"
+            codec: JSON codec for the stored event payloads
+        """
+        self.path = path
+        self.codec = get_codec(codec)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO mirror_meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "EventMirror":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _query(self, sql: str, parameters: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchall()
+
+    # Sync
+
+    def last_sequences(self) -> Dict[str, int]:
+        """Last stored sequence number per mirrored agent"""
+        return dict(self._query("SELECT agent_id, last_sequence FROM agents"))
+
+    def last_sequence(self, agent_id: str) -> int:
+        """Last stored sequence number of an agent (0 if none)"""
+        rows = self._query("SELECT last_sequence FROM agents WHERE agent_id = ?", (agent_id,))
+        return rows[0][0] if rows else 0
+
+    def store(self, agent_id: str, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store an agent's events (get_timeline dicts); already stored sequence numbers are ignored.
+
+        Returns:
+            Number of events added
+        """
+        dumps = self.codec.dumps
+        rows = [
+            (agent_id, event['sequence_number'], event.get('event_id', 0), event.get('event_type', ''),
+             event.get('timestamp'), dumps(event.get('raw_payload') or {}).decode())
+            for event in events
+        ]
+        if not rows:
+            return 0
+        last = max(row[1] for row in rows)
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO events (agent_id, sequence_number, event_id, event_type, timestamp, raw_payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            added = self._conn.total_changes - before
+            self._conn.execute(
+                "INSERT INTO agents (agent_id, last_sequence, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(agent_id) DO UPDATE SET "
+                "last_sequence = MAX(last_sequence, excluded.last_sequence), synced_at = excluded.synced_at",
+                (agent_id, last, time.time())
+            )
+            self._conn.commit()
+        return added
+
+    def sync(
+        self,
+        client: NowYouSeeMeClient,
+        agent_ids: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> SyncResult:
+        """
+        Bring the mirror up to date.
+
+        Without agent_ids the gallery is read once and only agents whose sequence number is
+        past the stored one are fetched. With agent_ids each listed agent is fetched from its
+        last stored sequence. Each agent's events are committed as soon as they arrive, so an
+        interrupted sync keeps its progress.
+
+        Args:
+            client: Client to fetch with (its connection pool should cover max_workers)
+            agent_ids: Agents to sync (default: every agent in the gallery)
+            max_workers: Number of timelines fetched concurrently (defaults to pool_maxsize)
+
+        Returns:
+            SyncResult; agents whose timeline failed are listed in its errors
+
+        Raises:
+            requests.RequestException: If fetching the gallery fails
+        """
+        start = time.perf_counter()
+        stored = self.last_sequences()
+        if agent_ids is None:
+            response = client._get("get_gallery", "/gallery")
+            response.raise_for_status()
+            remote = [
+                (item.get('id') or snapshot.get('agent_id', ''), snapshot.get('sequence') or 0)
+                for item in _gallery_items(client.codec.loads(response.content))
+                for snapshot in (item.get('snapshot') or {},)
+            ]
+            checked = len(remote)
+            targets = [agent_id for agent_id, sequence in remote if sequence > stored.get(agent_id, 0)]
+        else:
+            targets = list(agent_ids)
+            checked = len(targets)
+
+        result = SyncResult(agents_checked=checked, agents_fetched=len(targets))
+
+        def fetch(agent_id: str) -> List[Dict[str, Any]]:
+            return client.get_timeline(agent_id, after_sequence=stored.get(agent_id, 0))
+
+        with ThreadPoolExecutor(max_workers=max_workers or client.pool_maxsize) as executor:
+            futures = {executor.submit(fetch, agent_id): agent_id for agent_id in targets}
+            for future in as_completed(futures):
+                agent_id = futures[future]
+                try:
+                    result.events_added += self.store(agent_id, future.result())
+                except Exception as e:
+                    result.errors[agent_id] = e
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    # Offline queries
+
+    def agent_ids(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT agent_id FROM agents ORDER BY agent_id")]
+
+    def __len__(self) -> int:
+        """Number of stored events"""
+        return self._query("SELECT COUNT(*) FROM events")[0][0]
+
+    def _event(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        event_id, sequence_number, event_type, timestamp, raw_payload = row
+        return {
+            "event_id": event_id,
+            "sequence_number": sequence_number,
+            "event_type": event_type,
+            "timestamp": timestamp,
+            "raw_payload": self.codec.loads(raw_payload),
+        }
+
+    def timeline(
+        self,
+        agent_id: str,
+        after_sequence: Optional[int] = None,
+        until_sequence: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        An agent's stored events in sequence order, shaped like get_timeline's.
+
+        Args:
+            agent_id: ID of the agent
+            after_sequence: Only events with a higher sequence number
+            until_sequence: Only events up to and including this sequence number
+        """
+        rows = self._query(
+            f"SELECT {_EVENT_COLUMNS} FROM events "
+            "WHERE agent_id = ? AND sequence_number > ? AND sequence_number <= ? ORDER BY sequence_number",
+            (agent_id, after_sequence or 0, until_sequence if until_sequence is not None else 2 ** 63 - 1)
+        )
+        return [self._event(row) for row in rows]
+
+    def events(self, agent_id: str, **kwargs: Any) -> List[Event]:
+        """timeline() as Event objects"""
+        return [Event.from_dict(event) for event in self.timeline(agent_id, **kwargs)]
+
+    def timelines(
+        self,
+        agent_ids: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        (agent_id, timeline) pairs, one agent at a time, e.g. for goal_lifecycle().
+
+        Without agent_ids every mirrored agent is read in one ordered scan of the primary key.
+        """
+        if agent_ids is not None:
+            for agent_id in agent_ids:
+                yield agent_id, self.timeline(agent_id)
+            return
+
+        # A separate cursor, so other queries can run while the scan is consumed
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT agent_id, {_EVENT_COLUMNS} FROM events ORDER BY agent_id, sequence_number"
+            )
+        # The last agent of a batch may continue in the next one, so it is only yielded once
+        # a different agent (or the end of the scan) is reached
+        open_agent_id, open_events = None, []
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                for agent_id, group in groupby(rows, key=lambda row: row[0]):
+                    if agent_id != open_agent_id:
+                        if open_agent_id is not None:
+                            yield open_agent_id, open_events
+                        open_agent_id, open_events = agent_id, []
+                    open_events.extend(self._event(row[1:]) for row in group)
+        finally:
+            cursor.close()
+        if open_agent_id is not None:
+            yield open_agent_id, open_events
+
+    def snapshot(self, agent_id: str, sequence: Optional[int] = None) -> AgentSnapshotResult:
+        """
+        Replay an agent's stored events into its state at a sequence number (default: latest).
+
+        Raises:
+            ReplayError: If the stored events cannot be replayed
+        """
+        return replay_events_on_snapshot(_empty_snapshot(agent_id), self.timeline(agent_id, until_sequence=sequence))
+
+    def replay_engine(self, agent_id: str, checkpoint_interval: int = 64) -> ReplayEngine:
+        """A ReplayEngine over an agent's stored events, for many state_at() queries"""
+        return ReplayEngine(self.timeline(agent_id), agent_id=agent_id, checkpoint_interval=checkpoint_interval)
@@ -0,0 +1,180 @@
+"""
+Operation batch optimizer
+
+Folds a diary's operations into the shortest sequence with the same effect, before it is
+sent: the backend stores every operation as an event and replays it forever. Operations on
+different entities never interact, so each entity's operations are folded on their own:
+create + updates becomes one create, create + delete disappears, consecutive updates merge
+into one update plus whatever status steps the goal state machine requires.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .client import AgentState, Entity, Operation
+from .diff import _CREATE_STATUSES, _STATUSES, _create, _status_path
+from .entity_types import EntityType
+from .operation_types import OperationType
+from .validation import _ENTITY_TYPES, _field, is_valid_goal_transition
+
+_CREATE = OperationType.CREATE.value
+_UPDATE = OperationType.UPDATE.value
+_DELETE = OperationType.DELETE.value
+
+
+def _current(state: Optional[AgentState], entity_type: str, entity_id: str) -> Optional[Entity]:
+    if state is None:
+        return None
+    collection = state.entity_collections.get(entity_type)
+    return None if collection is None else collection.entities_by_id.get(entity_id)
+
+
+def _updates(
+    entity_type: str,
+    entity_id: str,
+    content: Optional[str],
+    first_status: Optional[str],
+    path: Tuple[str, ...],
+    note: Optional[str]
+) -> List[Operation]:
+    """One update carrying the content (and the first status), then one per further status step"""
+    steps = ((first_status,) if first_status else ()) + path
+    if content is None and not steps:
+        return []
+    operations = [Operation(entity_type, _UPDATE, entity_id, entity_content=content,
+                            target_status=steps[0] if steps else None, note=note)]
+    operations.extend(Operation(entity_type, _UPDATE, entity_id, target_status=step) for step in steps[1:])
+    return operations
+
+
+def _fold_entity(
+    entity_type: str,
+    entity_id: str,
+    operations: Sequence[Any],
+    current: Optional[Entity],
+    known: bool
+) -> Optional[List[Operation]]:
+    """
+    Fold one entity's operations.
+
+    Returns:
+        The folded operations, or None if the sequence isn't one the backend would accept in
+        full (the caller then keeps it as it was)
+    """
+    if entity_type not in _ENTITY_TYPES or not entity_id:
+        return None
+    is_goal = entity_type == EntityType.GOAL.value
+    removed = False  # the entity that existed before the batch was deleted
+    exists: Optional[bool] = (current is not None) if known else None  # None: unknown
+    status: Optional[str] = current.status if current is not None else None  # None: unknown or absent
+    created: Optional[Tuple[str, str]] = None  # (content, status) of an entity created in the batch
+    content: Optional[str] = None  # last content set by updates of the pre-existing entity
+    statuses: List[str] = []  # statuses set by updates of the pre-existing entity
+    note: Optional[str] = None
+
+    for op in operations:
+        kind = _field(op, "op")
+        op_content = _field(op, "entity_content")
+        op_status = _field(op, "target_status")
+        note = _field(op, "note") or note
+        if op_status and op_status not in _STATUSES:
+            return None
+
+        if kind == _CREATE:
+            if exists or created is not None or not op_content or op_status not in _CREATE_STATUSES:
+                return None
+            created = (op_content, op_status)
+            exists = True
+            status = op_status
+        elif kind == _UPDATE:
+            if exists is False or (not op_content and not op_status):
+                return None
+            if op_status:
+                if is_goal and status is not None and not is_valid_goal_transition(status, op_status):
+                    return None
+                status = op_status
+            exists = True
+            if created is not None:
+                created = (op_content or created[0], op_status or created[1])
+            else:
+                content = op_content or content
+                if op_status:
+                    statuses.append(op_status)
+        elif kind == _DELETE:
+            if exists is False:
+                return None
+            if created is None:
+                removed = True
+            created = None
+            content = None
+            statuses = []
+            exists = False
+            status = None
+        else:
+            return None
+
+    folded: List[Operation] = []
+    if removed:
+        folded.append(Operation(entity_type, _DELETE, entity_id))
+    if created is not None:
+        created_ops = _create(entity_type, entity_id, Entity(entity_id, created[0], created[1]))
+        if note is not None:
+            created_ops[0].note = note
+        folded.extend(created_ops)
+    elif not removed:
+        final = statuses[-1] if statuses else None
+        if current is not None:
+            if content == current.content:
+                content = None
+            path = _status_path(entity_type, current.status, final) if final else ()
+            first: Optional[str] = None
+        elif is_goal and statuses:
+            # Without the starting status only the first step is known to be legal
+            first = statuses[0]
+            path = _status_path(entity_type, first, final)
+        else:
+            first = None
+            path = (final,) if final else ()
+        if path is None:
+            return None
+        folded.extend(_updates(entity_type, entity_id, content, first, path, note))
+    return folded
+
+
+def optimize_operations(operations: Sequence[Operation], state: Optional[AgentState] = None) -> List[Operation]:
+    """
+    Fold a diary's operations into the shortest equivalent sequence.
+
+    The result leaves the agent in the same state as the original and is accepted by the
+    goal state machine wherever the original was. Entities keep the order of their first
+    operation; an entity whose operations the backend would partly reject (updating a
+    missing entity, creating one twice, ...) keeps them unchanged. Folded operations keep
+    the last note given for their entity.
+
+    Example usage:
+        ```python
+        ops = [
+            Operation(EntityType.GOAL, OperationType.CREATE, "goal_1", "Learn", Status.PENDING),
+            Operation(EntityType.GOAL, OperationType.UPDATE, "goal_1", target_status=Status.PROGRESS),
+            Operation(EntityType.GOAL, OperationType.UPDATE, "goal_1", "Learn Go"),
+        ]
+        optimize_operations(ops)  # one create: "Learn Go", progress
+        ```
+
+    Args:
+        operations: The diary's operations, in order
+        state: The agent's state before the diary, if known; it lets status round trips and
+            unchanged content be dropped and goal updates skip straight to the shortest path
+
+    Returns:
+        Folded operations
+    """
+    by_entity: Dict[Tuple[str, str], List[Any]] = {}
+    for op in operations:
+        by_entity.setdefault((_field(op, "entity_type"), _field(op, "entity_id")), []).append(op)
+
+    optimized: List[Operation] = []
+    for (entity_type, entity_id), entity_ops in by_entity.items():
+        current = _current(state, entity_type, entity_id)
+        folded = _fold_entity(entity_type, entity_id, entity_ops, current, state is not None)
+        optimized.extend(folded if folded is not None else entity_ops)
+    return optimized
@@ -0,0 +1,231 @@
+"""
+Client-side event replay
+
+Rebuilds AgentState from a timeline without asking the server.
+Must match backend storage/event_sourcing.go (ApplyEventToSnapshot / ReplayEventsOnSnapshot).
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .client import AgentSnapshotResult, AgentState, Entity, EntityCollection, Event
+from .entity_types import EntityType
+from .event_types import EventType
+
+_VALID_ENTITY_TYPES = frozenset(entity_type.value for entity_type in EntityType)
+
+
+class ReplayError(Exception):
+    """Raised when an event cannot be applied to a snapshot"""
+
+
+def new_empty_state() -> AgentState:
+    """Create an empty AgentState with all entity collections (mirrors models.NewEmptyState)"""
+    return AgentState(
+        mbti="",
+        entity_collections={entity_type.value: EntityCollection() for entity_type in EntityType}
+    )
+
+
+def clone_state(state: AgentState, copy_entities: bool = False) -> AgentState:
+    """
+    Copy an AgentState deeply enough that replaying onto the copy leaves the original intact.
+
+    Replay replaces Entity objects instead of mutating them, so by default they are shared
+    with the original; copy_entities also copies them, for states handed to callers.
+    """
+    if copy_entities:
+        collections = {
+            entity_type: EntityCollection(entities_by_id={
+                entity_id: Entity(id=entity.id, content=entity.content, status=entity.status)
+                for entity_id, entity in collection.entities_by_id.items()
+            })
+            for entity_type, collection in state.entity_collections.items()
+        }
+    else:
+        collections = {
+            entity_type: EntityCollection(entities_by_id=dict(collection.entities_by_id))
+            for entity_type, collection in state.entity_collections.items()
+        }
+    return AgentState(
+        mbti=state.mbti,
+        mbti_confidence=state.mbti_confidence,
+        geometry_representation=state.geometry_representation,
+        current_mood=state.current_mood,
+        philosophy=state.philosophy,
+        current_self_reflection=dict(state.current_self_reflection),
+        entity_collections=collections
+    )
+
+
+def clone_snapshot(snapshot: AgentSnapshotResult, copy_entities: bool = False) -> AgentSnapshotResult:
+    """Copy a snapshot together with its state (see clone_state)"""
+    return AgentSnapshotResult(
+        agent_id=snapshot.agent_id,
+        state=clone_state(snapshot.state, copy_entities),
+        sequence=snapshot.sequence,
+        updated_at=snapshot.updated_at
+    )
+
+
+def _as_event(event: Union[Event, Dict[str, Any]]) -> Event:
+    return event if isinstance(event, Event) else Event.from_dict(event)
+
+
+def apply_event_to_snapshot(snapshot: AgentSnapshotResult, event: Event) -> None:
+    """
+    Apply a single event to a snapshot in place.
+
+    Metadata events are skipped - they don't participate in AgentState replay.
+    Only operation events (create/update/delete) modify the state and advance the sequence.
+
+    Raises:
+        ReplayError: If the event cannot be applied
+    """
+    # Skip metadata events - they don't participate in AgentState replay
+    if event.event_type == EventType.METADATA:
+        return
+
+    payload = event.raw_payload
+    entity_type = payload.get('entity_type') or ''
+    entity_id = payload.get('entity_id') or ''
+
+    # Validate entity type
+    if entity_type not in _VALID_ENTITY_TYPES:
+        raise ReplayError(f"invalid entity type: {entity_type}")
+
+    # Ensure the entity collection exists
+    collections = snapshot.state.entity_collections
+    collection = collections.get(entity_type)
+    if collection is None:
+        collection = collections[entity_type] = EntityCollection()
+    entities = collection.entities_by_id
+
+    # Apply operation
+    if event.event_type == EventType.CREATE:
+        entities[entity_id] = Entity(
+            id=entity_id,
+            content=payload.get('entity_content') or '',
+            status=payload.get('target_status') or ''
+        )
+
+    elif event.event_type == EventType.UPDATE:
+        entity = entities.get(entity_id)
+        if entity is None:
+            raise ReplayError(f"{entity_type} not found: {entity_id}")
+        content = payload.get('entity_content') or entity.content
+        status = payload.get('target_status') or entity.status
+        entities[entity_id] = Entity(id=entity_id, content=content, status=status)
+
+    elif event.event_type == EventType.DELETE:
+        entities.pop(entity_id, None)
+
+    else:
+        raise ReplayError(f"unknown operation: {event.event_type}")
+
+    # Update snapshot metadata
+    snapshot.sequence = event.sequence_number
+    snapshot.updated_at = event.timestamp
+
+
+def replay_events_on_snapshot(
+    snapshot: AgentSnapshotResult,
+    events: Iterable[Union[Event, Dict[str, Any]]]
+) -> AgentSnapshotResult:
+    """
+    Replay events onto a snapshot in place, updating both state and metadata.
+
+    Accepts Event objects or the raw event dicts returned by get_timeline.
+
+    Raises:
+        ReplayError: If any event cannot be applied
+    """
+    for raw_event in events:
+        event = _as_event(raw_event)
+        try:
+            apply_event_to_snapshot(snapshot, event)
+        except ReplayError as e:
+            raise ReplayError(f"failed to apply event {event.event_id}: {e}") from e
+    return snapshot
+
+
+class ReplayEngine:
+    """
+    Answers "state at sequence N" queries over one agent's event stream.
+
+    The stream is replayed once up front, keeping a copy of the snapshot every
+    checkpoint_interval events, so each query clones the nearest checkpoint and
+    replays at most checkpoint_interval events.
+
+    Example usage:
+        ```python
+        engine = ReplayEngine(client.get_timeline(agent_id), agent_id=agent_id)
+        for sequence in (10, 20, 30):
+            print(engine.state_at(sequence).state.entity_collections)
+        ```
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Union[Event, Dict[str, Any]]],
+        agent_id: str = "",
+        base: Optional[AgentSnapshotResult] = None,
+        checkpoint_interval: int = 64
+    ):
+        """
+        Args:
+            events: Timeline events (Event objects or get_timeline dicts), in any order
+            agent_id: Agent the events belong to
+            base: Snapshot the events apply on top of (defaults to an empty state)
+            checkpoint_interval: Number of events between stored checkpoints
+
+        Raises:
+            ReplayError: If the event stream cannot be replayed
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be >= 1")
+
+        self.agent_id = agent_id
+        self.checkpoint_interval = checkpoint_interval
+        self.events: List[Event] = sorted(
+            (_as_event(event) for event in events),
+            key=lambda event: event.sequence_number
+        )
+        self._sequences = [event.sequence_number for event in self.events]
+
+        if base is None:
+            base = AgentSnapshotResult(agent_id=agent_id, state=new_empty_state(), sequence=0, updated_at=None)
+
+        # checkpoints[i] is the snapshot after the first i * checkpoint_interval events
+        current = clone_snapshot(base)
+        self._checkpoints = [clone_snapshot(current)]
+        for start in range(0, len(self.events), checkpoint_interval):
+            replay_events_on_snapshot(current, self.events[start:start + checkpoint_interval])
+            self._checkpoints.append(clone_snapshot(current))
+        self._latest = current
+
+    @property
+    def latest_sequence(self) -> int:
+        """Sequence number of the last event in the stream (0 if empty)"""
+        return self._sequences[-1] if self._sequences else 0
+
+    def latest(self) -> AgentSnapshotResult:
+        """Snapshot after every event has been applied (a private copy, like state_at)"""
+        return clone_snapshot(self._latest, copy_entities=True)
+
+    def state_at(self, sequence: int) -> AgentSnapshotResult:
+        """
+        Snapshot after applying every event with sequence_number <= sequence.
+
+        The returned snapshot is a private copy, entities included, and may be modified freely.
+        """
+        count = bisect_right(self._sequences, sequence)
+        checkpoint_index = count // self.checkpoint_interval
+        # Replayed events bring new Entity objects; the ones from the checkpoint must be copied
+        snapshot = clone_snapshot(self._checkpoints[checkpoint_index], copy_entities=True)
+        start = checkpoint_index * self.checkpoint_interval
+        return replay_events_on_snapshot(snapshot, self.events[start:count])
+
+    def states_at(self, sequences: Iterable[int]) -> Dict[int, AgentSnapshotResult]:
+        """Snapshots for many sequence numbers, keyed by the requested sequence"""
+        return {sequence: self.state_at(sequence) for sequence in sequences}
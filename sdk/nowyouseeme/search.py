@@ -0,0 +1,299 @@
+"""
+Entity search index
+
+In-memory inverted index over entity content across agents. Each entity is a document;
+tokens, entity types, statuses and agents each map to the set of documents carrying them,
+so a query is a handful of set intersections (smallest set first) rather than a scan of
+every Entity.content in the gallery.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .analytics import _gallery_items
+from .client import AgentSnapshotResult, AgentState
+from .entity_types import EntityType, Status
+
+_TOKEN = re.compile(r"\w+")
+
+# One or more EntityType/Status values (or their string values)
+Filter = Union[str, EntityType, Status, Iterable[Union[str, EntityType, Status]], None]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of a text (letters, digits and underscores)"""
+    return _TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """An entity matching a query"""
+    agent_id: str
+    entity_type: str
+    entity_id: str
+    status: str
+    content: str
+
+
+def _filter_values(value: Filter) -> Optional[Tuple[str, ...]]:
+    if value is None:
+        return None
+    if isinstance(value, str):  # EntityType and Status are str enums
+        return (value.value if isinstance(value, (EntityType, Status)) else value,)
+    return tuple(v.value if isinstance(v, (EntityType, Status)) else v for v in value)
+
+
+def _dict_entities(state: Dict[str, Any]) -> Iterable[Tuple[str, str, str, str]]:
+    for entity_type, collection in (state.get('entity_collections') or {}).items():
+        for entity_id, entity in ((collection or {}).get('entities_by_id') or {}).items():
+            yield entity_type, entity_id, entity.get('status', 'pending'), entity.get('content', '')
+
+
+def _state_entities(state: Any) -> Iterable[Tuple[str, str, str, str]]:
+    """(entity_type, entity_id, status, content) of an AgentState, CompactAgentState or state dict"""
+    if isinstance(state, dict):
+        return _dict_entities(state)
+    return (
+        (entity_type, entity_id, entity.status, entity.content)
+        for entity_type, collection in state.entity_collections.items()
+        for entity_id, entity in collection.entities_by_id.items()
+    )
+
+
+class EntityIndex:
+    """
+    Inverted index of entity content across agents (thread-safe).
+
+    Queries match entities containing every query token; entity_type, status and agent_id
+    narrow the match. update_agent() re-indexes one agent, touching only entities whose
+    status or content changed.
+
+    Example usage:
+        ```python
+        index = EntityIndex.from_gallery(client)
+        index.agents("reasoning", entity_type=EntityType.CAPABILITY)
+        index.search("consciousness", entity_type=EntityType.GOAL, status=Status.PROGRESS)
+
+        client.submit_diary(agent_id="agent_1", ...)
+        index.update_agent("agent_1", client.get_snapshot("agent_1"))
+        ```
+    """
+
+    def __init__(self):
+        # Document id -> (agent_id, entity_type, entity_id, status, content), None once removed
+        self._docs: List[Optional[Tuple[str, str, str, str, str]]] = []
+        # Removed document ids, reused by _add so _docs stays as long as the most ever indexed
+        self._free: List[int] = []
+        # Document id -> when it was indexed; ids are reused, so this keeps search() in indexing order
+        self._indexed_at: List[int] = []
+        self._next_index = 0
+        self._tokens: Dict[str, Set[int]] = {}
+        self._types: Dict[str, Set[int]] = {}
+        self._statuses: Dict[str, Set[int]] = {}
+        # agent_id -> {(entity_type, entity_id): document id}
+        self._agents: Dict[str, Dict[Tuple[str, str], int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_gallery(cls, gallery: Any) -> 'EntityIndex':
+        """
+        Index a gallery.
+
+        Args:
+            gallery: A client (GET /gallery is fetched and indexed without building objects), a
+                decoded GET /gallery response, its items, or AgentWithSnapshot objects
+        """
+        index = cls()
+        kind, items = _gallery_items(gallery)
+        for item in items:
+            if kind == "dicts":
+                snapshot = item.get('snapshot') or {}
+                index.update_agent(item.get('id') or snapshot.get('agent_id', ''), snapshot.get('state') or {})
+            elif item.snapshot is not None:
+                index.update_agent(item.id, item.snapshot.state)
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed entities"""
+        with self._lock:
+            return sum(len(entities) for entities in self._agents.values())
+
+    @property
+    def agent_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._agents)
+
+    def _add(self, agent_id: str, entity_type: str, entity_id: str, status: str, content: str) -> int:
+        if self._free:
+            doc = self._free.pop()
+            self._docs[doc] = (agent_id, entity_type, entity_id, status, content)
+            self._indexed_at[doc] = self._next_index
+        else:
+            doc = len(self._docs)
+            self._docs.append((agent_id, entity_type, entity_id, status, content))
+            self._indexed_at.append(self._next_index)
+        self._next_index += 1
+        tokens = self._tokens
+        for token in set(_TOKEN.findall(content.lower())):
+            postings = tokens.get(token)
+            if postings is None:
+                tokens[token] = {doc}
+            else:
+                postings.add(doc)
+        postings = self._types.get(entity_type)
+        if postings is None:
+            self._types[entity_type] = {doc}
+        else:
+            postings.add(doc)
+        postings = self._statuses.get(status)
+        if postings is None:
+            self._statuses[status] = {doc}
+        else:
+            postings.add(doc)
+        return doc
+
+    def _discard(self, doc: int) -> None:
+        _, entity_type, _, status, content = self._docs[doc]
+        self._docs[doc] = None
+        self._free.append(doc)
+        for token in set(tokenize(content)):
+            postings = self._tokens[token]
+            postings.discard(doc)
+            if not postings:
+                del self._tokens[token]
+        self._types[entity_type].discard(doc)
+        self._statuses[status].discard(doc)
+
+    def update_agent(self, agent_id: str, state: Any) -> int:
+        """
+        Index an agent's current entities, replacing what was indexed for it before.
+
+        Args:
+            agent_id: ID of the agent
+            state: AgentState, CompactAgentState, state dict, or anything with a .state
+                (AgentSnapshotResult, ShadowState)
+
+        Returns:
+            Number of entities added, changed or removed
+        """
+        if isinstance(state, AgentSnapshotResult) or (not isinstance(state, (dict, AgentState))
+                                                       and hasattr(state, "state")):
+            state = state.state
+        with self._lock:
+            previous = self._agents.get(agent_id, {})
+            current: Dict[Tuple[str, str], int] = {}
+            changes = 0
+            for entity_type, entity_id, status, content in _state_entities(state):
+                key = (entity_type, entity_id)
+                doc = previous.pop(key, None)
+                if doc is not None:
+                    indexed = self._docs[doc]
+                    if indexed[3] == status and indexed[4] == content:
+                        current[key] = doc
+                        continue
+                    self._discard(doc)
+                current[key] = self._add(agent_id, entity_type, entity_id, status, content)
+                changes += 1
+            # Entities no longer in the state
+            for doc in previous.values():
+                self._discard(doc)
+                changes += 1
+            self._agents[agent_id] = current
+            return changes
+
+    def remove_agent(self, agent_id: str) -> bool:
+        """Drop an agent's entities; returns False if it wasn't indexed"""
+        with self._lock:
+            entities = self._agents.pop(agent_id, None)
+            if entities is None:
+                return False
+            for doc in entities.values():
+                self._discard(doc)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._free.clear()
+            self._indexed_at.clear()
+            self._next_index = 0
+            self._tokens.clear()
+            self._types.clear()
+            self._statuses.clear()
+            self._agents.clear()
+
+    def _match(self, query: str, entity_type: Filter, status: Filter, agent_id: Optional[str]) -> Set[int]:
+        candidates: List[Set[int]] = []
+        for token in set(tokenize(query)):
+            postings = self._tokens.get(token)
+            if not postings:
+                return set()
+            candidates.append(postings)
+        for values, postings_by_value in ((_filter_values(entity_type), self._types),
+                                          (_filter_values(status), self._statuses)):
+            if values is None:
+                continue
+            if len(values) == 1:
+                postings = postings_by_value.get(values[0])
+            else:
+                postings = set().union(*(postings_by_value.get(value, ()) for value in values))
+            if not postings:
+                return set()
+            candidates.append(postings)
+        if agent_id is not None:
+            entities = self._agents.get(agent_id)
+            if not entities:
+                return set()
+            candidates.append(set(entities.values()))
+        if not candidates:
+            # No query and no filters: everything
+            return {doc for entities in self._agents.values() for doc in entities.values()}
+
+        # Intersect starting from the smallest set
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for postings in candidates[1:]:
+            result &= postings
+            if not result:
+                break
+        return result
+
+    def search(
+        self,
+        query: str = "",
+        entity_type: Filter = None,
+        status: Filter = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[SearchHit]:
+        """
+        Find entities containing every token of a query.
+
+        Args:
+            query: Free text; an empty query matches every entity (narrowed by the filters)
+            entity_type: EntityType(s) to match (None: any)
+            status: Status(es) to match (None: any)
+            agent_id: Only this agent's entities
+            limit: Maximum number of hits
+
+        Returns:
+            Matching entities, in the order they were indexed (a changed entity is re-indexed)
+        """
+        with self._lock:
+            docs = sorted(self._match(query, entity_type, status, agent_id), key=self._indexed_at.__getitem__)
+            if limit is not None:
+                docs = docs[:limit]
+            return [SearchHit(*self._docs[doc]) for doc in docs]
+
+    def count(self, query: str = "", entity_type: Filter = None, status: Filter = None,
+              agent_id: Optional[str] = None) -> int:
+        """Number of entities search() would return"""
+        with self._lock:
+            return len(self._match(query, entity_type, status, agent_id))
+
+    def agents(self, query: str = "", entity_type: Filter = None, status: Filter = None) -> Set[str]:
+        """IDs of the agents with at least one matching entity"""
+        with self._lock:
+            return {self._docs[doc][0] for doc in self._match(query, entity_type, status, None)}
@@ -0,0 +1,244 @@
+"""
+Shadow state tracking
+
+Client-side copy of each agent's snapshot, kept current from submit_diary responses, so
+operation builders can ask "which goals are in progress?" without a network call. The
+shadow is only re-fetched with get_snapshot when it is unknown or can no longer be trusted.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .client import AgentSnapshotResult, AgentState, Entity, Event, Operation
+from .entity_types import EntityType, Status
+from .replay import ReplayError, apply_event_to_snapshot, clone_snapshot, new_empty_state
+
+# Goal statuses that can still change
+LIVE_STATUSES = (Status.PENDING.value, Status.PROGRESS.value)
+
+# Default id prefixes, matching the ids the scripts generate (goal_1, cap_1, ...)
+ID_PREFIXES = {
+    EntityType.GOAL.value: "goal",
+    EntityType.CAPABILITY.value: "cap",
+    EntityType.LIMITATION.value: "lim",
+    EntityType.ASPIRATION.value: "asp",
+}
+
+
+def _value(value: Any) -> str:
+    return getattr(value, "value", value)
+
+
+class ShadowState:
+    """
+    Read-only view over one agent's last known snapshot.
+
+    Example usage:
+        ```python
+        shadow = client.shadow("agent_1")
+        in_progress = shadow.goals(Status.PROGRESS)
+        new_id = shadow.next_entity_id(EntityType.GOAL)
+        ```
+    """
+
+    __slots__ = ("snapshot",)
+
+    def __init__(self, snapshot: AgentSnapshotResult):
+        self.snapshot = snapshot
+
+    def __repr__(self) -> str:
+        return f"ShadowState(agent_id={self.agent_id!r}, sequence={self.sequence!r})"
+
+    @property
+    def agent_id(self) -> str:
+        return self.snapshot.agent_id
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last event the shadow reflects"""
+        return self.snapshot.sequence
+
+    @property
+    def state(self) -> AgentState:
+        return self.snapshot.state
+
+    def _entities_by_id(self, entity_type: Union[EntityType, str]) -> Dict[str, Entity]:
+        collection = self.snapshot.state.entity_collections.get(_value(entity_type))
+        return collection.entities_by_id if collection is not None else {}
+
+    def get(self, entity_type: Union[EntityType, str], entity_id: str) -> Optional[Entity]:
+        """Look up one entity, or None if it doesn't exist"""
+        return self._entities_by_id(entity_type).get(entity_id)
+
+    def has(self, entity_type: Union[EntityType, str], entity_id: str) -> bool:
+        return entity_id in self._entities_by_id(entity_type)
+
+    def entities(self, entity_type: Union[EntityType, str], status: Union[Status, str, None] = None) -> List[Entity]:
+        """Entities of a type, optionally only those in a given status"""
+        entities = self._entities_by_id(entity_type).values()
+        if status is None:
+            return list(entities)
+        status = _value(status)
+        return [entity for entity in entities if entity.status == status]
+
+    def entity_ids(self, entity_type: Union[EntityType, str], status: Union[Status, str, None] = None) -> List[str]:
+        """Ids of entities of a type, optionally only those in a given status"""
+        return [entity.id for entity in self.entities(entity_type, status)]
+
+    def goals(self, status: Union[Status, str, None] = None) -> List[Entity]:
+        """Goals, optionally only those in a given status"""
+        return self.entities(EntityType.GOAL, status)
+
+    def live_goals(self) -> List[Entity]:
+        """Goals that are pending or in progress"""
+        return [entity for entity in self._entities_by_id(EntityType.GOAL).values() if entity.status in LIVE_STATUSES]
+
+    def next_entity_id(self, entity_type: Union[EntityType, str], prefix: Optional[str] = None) -> str:
+        """
+        An id not currently used in a collection, continuing "<prefix>_<n>" numbering.
+
+        Args:
+            entity_type: Collection to pick an id for
+            prefix: Id prefix (default: goal, cap, lim or asp)
+        """
+        entity_type = _value(entity_type)
+        prefix = prefix or ID_PREFIXES.get(entity_type, entity_type)
+        start = len(prefix) + 1
+        highest = 0
+        for entity_id in self._entities_by_id(entity_type):
+            if entity_id.startswith(prefix + "_") and entity_id[start:].isdigit():
+                highest = max(highest, int(entity_id[start:]))
+        return f"{prefix}_{highest + 1}"
+
+
+def _operation_to_event(op: Union[Operation, Dict[str, Any]], sequence: int) -> Event:
+    data = op.to_dict() if isinstance(op, Operation) else op
+    payload = {key: _value(value) for key, value in data.items() if key != "op" and value is not None}
+    return Event(
+        event_id=0,
+        sequence_number=sequence,
+        event_type=_value(data.get("op", "")),
+        timestamp=None,
+        raw_payload=payload
+    )
+
+
+class ShadowStateStore:
+    """
+    Per-agent shadow states maintained by the client.
+
+    After each accepted diary the server's sequence should be the previous one plus one
+    metadata event plus one event per operation. If the response reports a different
+    sequence, another writer got in between: the shadow adopts the response's snapshot
+    (which already includes those writes) and the drift is counted. A rejected diary means
+    the shadow was wrong, so it is dropped and re-fetched with get_snapshot on next use.
+
+    Drift can only be detected when the diary response carries the new sequence, which
+    backends built before POST /diaries returned "sequence" don't send. Against those the
+    shadow still takes the response's state, but assumes the expected sequence.
+
+    Example usage:
+        ```python
+        client = NowYouSeeMeClient(shadow_states=ShadowStateStore())
+        client.create_agent("agent_1", "Agent", "INTP-A")   # shadow starts empty, no fetch
+        client.submit_diary(agent_id="agent_1", ...)         # shadow follows the response
+        client.shadow("agent_1").live_goals()                # no network call
+        ```
+    """
+
+    def __init__(self):
+        self._states: Dict[str, ShadowState] = {}
+        self._lock = threading.Lock()
+        self.drifts = 0
+        self.resyncs = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._states
+
+    def get(self, agent_id: str) -> Optional[ShadowState]:
+        """The agent's shadow, or None if it is unknown or was invalidated"""
+        return self._states.get(agent_id)
+
+    def set(self, snapshot: AgentSnapshotResult) -> ShadowState:
+        """Replace an agent's shadow with a snapshot fetched from the server"""
+        shadow = ShadowState(snapshot)
+        with self._lock:
+            self._states[snapshot.agent_id] = shadow
+        return shadow
+
+    def resync(self, snapshot: AgentSnapshotResult) -> ShadowState:
+        """set(), counted as a re-sync"""
+        with self._lock:
+            self.resyncs += 1
+        return self.set(snapshot)
+
+    def start(self, agent_id: str) -> ShadowState:
+        """Begin tracking a freshly created agent, which has no entities and no events"""
+        return self.set(AgentSnapshotResult(agent_id=agent_id, state=new_empty_state(), sequence=0, updated_at=None))
+
+    def invalidate(self, agent_id: str) -> None:
+        with self._lock:
+            self._states.pop(agent_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def record_submission(
+        self,
+        agent_id: str,
+        operations: Iterable[Union[Operation, Dict[str, Any]]],
+        response: Optional[AgentSnapshotResult]
+    ) -> Optional[ShadowState]:
+        """
+        Advance an agent's shadow after the server accepted a diary.
+
+        Args:
+            agent_id: Agent the diary belonged to
+            operations: The diary's operations, in order
+            response: Snapshot decoded from the response; sequence 0 when the server didn't
+                report one (drift then goes unnoticed), None when the response carried no
+                state at all
+
+        Returns:
+            The updated shadow, or None if the agent is no longer tracked
+        """
+        operations = list(operations)
+        previous = self._states.get(agent_id)
+        expected = previous.sequence + 1 + len(operations) if previous is not None else None
+
+        if response is not None and response.sequence:
+            # Authoritative post-submission snapshot
+            if expected is not None and response.sequence != expected:
+                with self._lock:
+                    self.drifts += 1
+            return self.set(response)
+
+        if previous is None:
+            # Nothing to build on and no sequence to trust: re-fetch on next use
+            return None
+
+        if response is not None:
+            # State without a sequence: trust the state, assume no other writer
+            return self.set(AgentSnapshotResult(
+                agent_id=agent_id,
+                state=response.state,
+                sequence=expected,
+                updated_at=response.updated_at
+            ))
+
+        # No state in the response: the operations were accepted, so apply them locally
+        snapshot = clone_snapshot(previous.snapshot)
+        try:
+            sequence = previous.sequence + 1  # metadata event
+            for op in operations:
+                sequence += 1
+                apply_event_to_snapshot(snapshot, _operation_to_event(op, sequence))
+        except ReplayError:
+            self.invalidate(agent_id)
+            return None
+        snapshot.sequence = expected
+        return self.set(snapshot)
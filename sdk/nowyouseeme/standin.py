@@ -0,0 +1,666 @@
+"""
+Local stand-in server
+
+In-memory implementation of the /api/v1 routes the SDK uses (/agents, /diaries, /gallery,
+/snapshot(s), /timeline, /health), for exercising and benchmarking the SDK without the Go
+backend or PostgreSQL. Diaries are validated (nowyouseeme.validation) and turned into
+events exactly like storage.SubmitDiary, and snapshots are maintained with
+nowyouseeme.replay. Status codes and response bodies are those of backend/api/*.go, so
+code that works here works against the real server.
+
+The same StandInApp can be served three ways:
+    - in process, with no sockets: standin_client() mounts a requests adapter
+    - over loopback HTTP: StandInServer (a ThreadingHTTPServer in a background thread)
+    - from the command line: python -m nowyouseeme.standin --port 8080
+"""
+
+import argparse
+import io
+import re
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+from .client import AgentSnapshotResult, Event, NowYouSeeMeClient
+from .codec import get_codec
+from .compression import DEFLATE, IDENTITY, available_encodings, compress, decompress, negotiate_encoding
+from .event_types import EventType
+from .replay import ReplayError, apply_event_to_snapshot, clone_state, new_empty_state
+from .validation import find_operation_errors
+
+API_PREFIX = "/api/v1"
+
+# Fastest installed JSON codec, for request bodies and responses
+_CODEC = get_codec()
+
+# Responses smaller than this are sent uncompressed even when compression is on
+COMPRESS_MIN_SIZE = 1024
+
+_REQUEST_ENCODINGS = frozenset((IDENTITY, DEFLATE) + available_encodings())
+
+# Mirrors backend validation/agent_id.go and validation/mbti.go
+MAX_AGENT_ID_LENGTH = 100
+_AGENT_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_MBTI_TYPES = frozenset(
+    f"{a}{b}{c}{d}" for a in "IE" for b in "NS" for c in "TF" for d in "JP"
+)
+_MBTI_EXTENSIONS = frozenset(("A", "T"))
+
+Response = Tuple[int, Dict[str, Any]]
+
+
+class _BadRequest(Exception):
+    """A request the backend would reject with 400 before touching storage"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _go_time(value: datetime) -> str:
+    """Format a UTC time the way Go's encoding/json marshals time.Time (RFC 3339, trimmed fraction)"""
+    text = value.strftime("%Y-%m-%dT%H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}".rstrip("0")
+    return text + "Z"
+
+
+def _validate_agent_id(agent_id: str) -> None:
+    if agent_id == "":
+        raise _BadRequest("agent_id cannot be empty")
+    if len(agent_id) > MAX_AGENT_ID_LENGTH:
+        raise _BadRequest(
+            f"agent_id too long: maximum {MAX_AGENT_ID_LENGTH} characters, got {len(agent_id)}"
+        )
+    if not _AGENT_ID_RE.match(agent_id):
+        raise _BadRequest(
+            "agent_id contains invalid characters: only alphanumeric, underscore (_), "
+            f"and hyphen (-) are allowed, got '{agent_id}'"
+        )
+
+
+def _validate_mbti(mbti: str) -> None:
+    if mbti == "":
+        return
+    parts = mbti.split("-")
+    if len(parts) != 2:
+        raise _BadRequest(
+            f"invalid MBTI format: must be TYPE-EXTENSION (e.g., 'INTP-A', 'ENFJ-T'), got '{mbti}'"
+        )
+    if parts[0].upper() not in _MBTI_TYPES:
+        raise _BadRequest(
+            f"invalid MBTI type: '{parts[0].upper()}'. Must be one of the 16 MBTI types (INTJ, INTP, ENTJ, "
+            "ENTP, INFJ, INFP, ENFJ, ENFP, ISTJ, ISFJ, ESTJ, ESFJ, ISTP, ISFP, ESTP, ESFP)"
+        )
+    if parts[1].upper() not in _MBTI_EXTENSIONS:
+        raise _BadRequest(
+            f"invalid MBTI extension: '{parts[1].upper()}'. Must be 'A' (Assertive) or 'T' (Turbulent)"
+        )
+
+
+def _require(data: Dict[str, Any], *fields: str) -> None:
+    """Mirror gin's binding:"required" checks"""
+    for name in fields:
+        if not data.get(name):
+            raise _BadRequest(f"Key: '{name}' Error:Field validation for '{name}' failed on the 'required' tag")
+
+
+def _snapshot_to_dict(snapshot: AgentSnapshotResult) -> Dict[str, Any]:
+    """Serialize a snapshot the way the backend's AgentSnapshotResult marshals"""
+    state = snapshot.state
+    data = {
+        "agent_id": snapshot.agent_id,
+        "sequence": snapshot.sequence,
+        "state": {
+            "mbti": state.mbti,
+            "mbti_confidence": state.mbti_confidence,
+            "geometry_representation": state.geometry_representation,
+            "current_mood": state.current_mood,
+            "philosophy": state.philosophy,
+            "current_self_reflection": {
+                "rumination_for_yesterday": state.current_self_reflection.get("rumination_for_yesterday", ""),
+                "what_happened_today": state.current_self_reflection.get("what_happened_today", ""),
+                "expectations_for_tomorrow": state.current_self_reflection.get("expectations_for_tomorrow", ""),
+            },
+            "entity_collections": {
+                entity_type: {
+                    "entities_by_id": {
+                        entity_id: {"id": entity.id, "content": entity.content, "status": entity.status}
+                        for entity_id, entity in collection.entities_by_id.items()
+                    }
+                }
+                for entity_type, collection in state.entity_collections.items()
+            },
+        },
+    }
+    if snapshot.updated_at is not None:
+        data["updated_at"] = _go_time(snapshot.updated_at)
+    return data
+
+
+def _metadata_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """MetadataToEventConverter: diary metadata with Go's omitempty semantics"""
+    data = {}
+    for key in ("mbti", "mbti_confidence", "geometry_representation", "context", "current_mood", "philosophy"):
+        if payload.get(key):
+            data[key] = payload[key]
+    reflection = payload.get("self_reflection") or {}
+    data["self_reflection"] = {
+        "rumination_for_yesterday": reflection.get("rumination_for_yesterday", ""),
+        "what_happened_today": reflection.get("what_happened_today", ""),
+        "expectations_for_tomorrow": reflection.get("expectations_for_tomorrow", ""),
+    }
+    return data
+
+
+def _operation_payload(op: Dict[str, Any]) -> Dict[str, Any]:
+    """OperationToEventConverter: operation fields with Go's omitempty semantics"""
+    data = {"entity_type": op["entity_type"]}
+    for key in ("entity_id", "entity_content", "target_status", "note"):
+        if op.get(key):
+            data[key] = op[key]
+    return data
+
+
+class StandInApp:
+    """
+    In-memory backend for the SDK's /api/v1 routes.
+
+    handle() takes a method, path, query parameters and raw body and returns
+    (status code, JSON-serializable body), so it can sit behind any transport.
+    All state lives in dicts guarded by one lock; nothing is persisted.
+
+    Example usage:
+        ```python
+        app = StandInApp()
+        status, body = app.handle("GET", "/api/v1/health")
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._agents: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._snapshots: Dict[str, AgentSnapshotResult] = {}
+        # Serialized snapshots, rebuilt lazily after each diary
+        self._snapshot_dicts: Dict[str, Dict[str, Any]] = {}
+        self._next_event_id = 1
+        self._routes = {
+            ("POST", "/agents"): self._create_agent,
+            ("GET", "/agents"): self._get_agents,
+            ("POST", "/diaries"): self._submit_diary,
+            ("GET", "/gallery"): self._get_gallery,
+            ("GET", "/snapshot"): self._get_snapshot,
+            ("GET", "/snapshots"): self._get_snapshots,
+            ("GET", "/timeline"): self._get_timeline,
+            ("GET", "/health"): self._health,
+        }
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
+    ) -> Response:
+        """
+        Dispatch one request.
+
+        Args:
+            method: HTTP method
+            path: Request path, with or without the /api/v1 prefix
+            query: Query parameters
+            body: Raw JSON request body
+
+        Returns:
+            Tuple of (status code, response body)
+        """
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        route = self._routes.get((method.upper(), path.rstrip("/") or "/"))
+        if route is None:
+            return 404, {"error": "not found"}
+
+        query = query or {}
+        data = None
+        if method.upper() == "POST":
+            try:
+                data = _CODEC.loads(body or b"")
+            except ValueError as e:
+                return 400, {"error": f"invalid JSON body: {e}"}
+            if not isinstance(data, dict):
+                return 400, {"error": "request body must be a JSON object"}
+
+        try:
+            with self._lock:
+                return route(query, data)
+        except _BadRequest as e:
+            return 400, {"error": str(e)}
+
+    # --- snapshots ------------------------------------------------------------
+
+    def _snapshot_dict(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Latest snapshot as JSON data, or None before the agent's first diary"""
+        cached = self._snapshot_dicts.get(agent_id)
+        if cached is None and agent_id in self._snapshots:
+            cached = self._snapshot_dicts[agent_id] = _snapshot_to_dict(self._snapshots[agent_id])
+        return cached
+
+    # --- routes ---------------------------------------------------------------
+
+    def _health(self, query, data) -> Response:
+        return 200, {"status": "healthy"}
+
+    def _create_agent(self, query, data) -> Response:
+        _require(data, "agent_id", "name", "current_mbti")
+        agent_id = data["agent_id"]
+        _validate_agent_id(agent_id)
+        _validate_mbti(data["current_mbti"])
+        if agent_id in self._agents:
+            return 500, {"error": f"failed to create agent: duplicate key value violates unique constraint (id={agent_id})"}
+
+        agent = {
+            "id": agent_id,
+            "name": data["name"],
+            "current_mbti": data["current_mbti"],
+            "created_at": _go_time(_now()),
+        }
+        self._agents[agent_id] = agent
+        self._events[agent_id] = []
+        return 201, agent
+
+    def _get_agents(self, query, data) -> Response:
+        agent_id = query.get("agent_id", "")
+        if agent_id:
+            _validate_agent_id(agent_id)
+            agent = self._agents.get(agent_id)
+            if agent is None:
+                return 404, {"error": "Agent not found", "agent_id": agent_id}
+            return 200, {"agent": agent, "snapshot": self._snapshot_dict(agent_id)}
+
+        # ORDER BY created_at DESC: agents are stored in creation order
+        agents = list(reversed(self._agents.values()))
+        return 200, {"agents": agents, "count": len(agents)}
+
+    def _submit_diary(self, query, data) -> Response:
+        _require(data, "agent_id", "payload")
+        agent_id = data["agent_id"]
+        payload = data["payload"]
+        if not isinstance(payload, dict):
+            raise _BadRequest("payload must be a JSON object")
+        _require(payload, "mbti")
+        operations = payload.get("operations") or []
+        for op in operations:
+            if not isinstance(op, dict):
+                raise _BadRequest("operations must be JSON objects")
+            _require(op, "entity_type", "op")
+
+        _validate_agent_id(agent_id)
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            return 404, {"error": "Agent not found", "agent_id": agent_id}
+        _validate_mbti(payload["mbti"])
+
+        snapshot = self._snapshots.get(agent_id)
+        if snapshot is None:
+            snapshot = AgentSnapshotResult(agent_id=agent_id, state=new_empty_state(), sequence=0, updated_at=None)
+
+        errors = find_operation_errors(operations, snapshot.state)
+        if errors:
+            return 400, {"error": "Validation failed", "details": errors}
+
+        # Build the new snapshot on a copy so a failure leaves the stored one untouched
+        latest_mbti = snapshot.state.mbti
+        snapshot = AgentSnapshotResult(
+            agent_id=agent_id,
+            state=clone_state(snapshot.state),
+            sequence=snapshot.sequence,
+            updated_at=snapshot.updated_at
+        )
+        now = _now()
+        # GetTimeline formats event timestamps to whole seconds
+        timestamp = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        # Metadata event first (doesn't participate in AgentState replay), then one event per operation
+        next_seq = snapshot.sequence + 1
+        new_events = [self._new_event(next_seq, EventType.METADATA.value, timestamp, _metadata_payload(payload))]
+        try:
+            for op in operations:
+                next_seq += 1
+                event = self._new_event(next_seq, op["op"], timestamp, _operation_payload(op))
+                apply_event_to_snapshot(snapshot, Event(
+                    event_id=event["event_id"],
+                    sequence_number=next_seq,
+                    event_type=event["event_type"],
+                    timestamp=now,
+                    raw_payload=event["raw_payload"]
+                ))
+                new_events.append(event)
+        except ReplayError as e:
+            return 500, {"error": f"failed to apply event to state: {e}"}
+
+        if payload["mbti"] != latest_mbti:
+            agent["current_mbti"] = payload["mbti"]
+
+        # Materialize the snapshot after every diary, like upsertSnapshotTx
+        snapshot.sequence = next_seq
+        snapshot.updated_at = now
+        self._events[agent_id].extend(new_events)
+        self._snapshots[agent_id] = snapshot
+        self._snapshot_dicts.pop(agent_id, None)
+
+        # Like storage.SubmitDiary, the response carries the bare AgentState and the new sequence
+        return 201, {
+            "agent_id": agent_id,
+            "snapshot": self._snapshot_dict(agent_id)["state"],
+            "sequence": snapshot.sequence,
+        }
+
+    def _new_event(self, sequence: int, event_type: str, timestamp: str, raw_payload: Dict[str, Any]) -> Dict[str, Any]:
+        event = {
+            "event_id": self._next_event_id,
+            "sequence_number": sequence,
+            "event_type": event_type,
+            "timestamp": timestamp,
+            "raw_payload": raw_payload,
+        }
+        self._next_event_id += 1
+        return event
+
+    def _get_gallery(self, query, data) -> Response:
+        # ORDER BY created_at DESC: agents are stored in creation order
+        agents = list(reversed(self._agents.values()))
+        results = []
+        for agent in agents:
+            snapshot = self._snapshot_dict(agent["id"])
+            if snapshot is not None:
+                results.append({"id": agent["id"], "name": agent["name"], "snapshot": snapshot})
+        return 200, {"snapshots": results, "total": len(results)}
+
+    def _get_snapshot(self, query, data) -> Response:
+        agent_id = query.get("agent_id", "")
+        if not agent_id:
+            raise _BadRequest("agent_id query parameter required")
+        _validate_agent_id(agent_id)
+        return 200, {"agent_id": agent_id, "snapshot": self._snapshot_dict(agent_id)}
+
+    def _get_snapshots(self, query, data) -> Response:
+        mbti = query.get("mbti", "")
+        if not mbti:
+            raise _BadRequest("mbti query parameter required")
+        results = []
+        for agent_id, agent in self._agents.items():
+            if agent["current_mbti"].startswith(mbti):
+                snapshot = self._snapshot_dict(agent_id)
+                if snapshot is not None and snapshot.get("updated_at"):
+                    results.append({"snapshot": snapshot})
+        return 200, {"mbti": mbti, "snapshots": results, "count": len(results)}
+
+    def _get_timeline(self, query, data) -> Response:
+        agent_id = query.get("agent_id", "")
+        if not agent_id:
+            raise _BadRequest("agent_id query parameter required")
+        _validate_agent_id(agent_id)
+        after_sequence = 0
+        raw = query.get("after_sequence", "")
+        if raw:
+            if not raw.isdigit():
+                raise _BadRequest("after_sequence must be a non-negative integer")
+            after_sequence = int(raw)
+        events = [event for event in self._events.get(agent_id, ()) if event["sequence_number"] > after_sequence]
+        return 200, {"agent_id": agent_id, "events": events, "total_events": len(events)}
+
+
+def _encode(body: Dict[str, Any]) -> bytes:
+    return _CODEC.dumps(body)
+
+
+def _serve(
+    app: StandInApp,
+    method: str,
+    url: str,
+    headers,
+    body: bytes,
+    compress_responses: bool,
+    decompress_requests: bool = False
+) -> Tuple[int, bytes, Optional[str]]:
+    """
+    Run one request through the app, handling Content-Encoding and Accept-Encoding.
+
+    Without decompress_requests, Content-Encoding is ignored as the Go backend ignores it,
+    so a compressed body fails to parse and gets a 400.
+
+    Returns:
+        Tuple of (status, response body, response Content-Encoding or None)
+    """
+    if decompress_requests:
+        content_encoding = (headers.get("Content-Encoding") or IDENTITY).strip().lower()
+        if content_encoding not in _REQUEST_ENCODINGS:
+            return 415, _encode({"error": f"unsupported Content-Encoding: {content_encoding}"}), None
+        try:
+            body = decompress(body, content_encoding)
+        except ValueError as e:
+            return 400, _encode({"error": str(e)}), None
+
+    parts = urlsplit(url)
+    status, payload = app.handle(method, parts.path, dict(parse_qsl(parts.query)), body)
+    content = _encode(payload)
+
+    encoding = None
+    if compress_responses and len(content) >= COMPRESS_MIN_SIZE:
+        encoding = negotiate_encoding(headers.get("Accept-Encoding"))
+        if encoding is not None:
+            content = compress(content, encoding)
+    return status, content, encoding
+
+
+class StandInAdapter(BaseAdapter):
+    """
+    requests transport adapter that dispatches straight into a StandInApp.
+
+    No sockets, no HTTP parsing: the request is handed to app.handle() and the result is
+    wrapped in a requests.Response, so client-side overhead can be profiled in isolation.
+    With decompress_requests compressed request bodies are decoded, and with
+    compress_responses responses are compressed according to Accept-Encoding, as the HTTP
+    server does.
+    """
+
+    def __init__(self, app: StandInApp, compress_responses: bool = False, decompress_requests: bool = False):
+        super().__init__()
+        self.app = app
+        self.compress_responses = compress_responses
+        self.decompress_requests = decompress_requests
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        status, content, encoding = _serve(
+            self.app, request.method, request.url, request.headers, body,
+            self.compress_responses, self.decompress_requests
+        )
+
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(content)),
+        }
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status < 400 else "Error"
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        # A urllib3 response, so Content-Encoding is decoded exactly as over the network
+        response.raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=True
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def standin_client(
+    app: Optional[StandInApp] = None,
+    compress_responses: bool = False,
+    decompress_requests: bool = False,
+    **kwargs
+) -> NowYouSeeMeClient:
+    """
+    Build a NowYouSeeMeClient wired to a StandInApp in process.
+
+    Args:
+        app: App to dispatch to (a fresh one by default; reachable as client.standin_app)
+        compress_responses: Compress responses the client's Accept-Encoding allows
+        decompress_requests: Decode compressed request bodies (the Go backend doesn't)
+        **kwargs: Extra NowYouSeeMeClient arguments (e.g. snapshot_cache, compression)
+    """
+    app = app if app is not None else StandInApp()
+    client = NowYouSeeMeClient(api_base_url=f"http://standin{API_PREFIX}", **kwargs)
+    client.session.mount("http://standin/", StandInAdapter(
+        app, compress_responses=compress_responses, decompress_requests=decompress_requests
+    ))
+    client.standin_app = app
+    return client
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs add ~40ms per request
+    disable_nagle_algorithm = True
+    # Set per server in StandInServer
+    app: StandInApp = None
+    compress_responses = False
+    decompress_requests = False
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, content, encoding = _serve(
+            self.app, method, self.path, self.headers, body, self.compress_responses, self.decompress_requests
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+class StandInServer:
+    """
+    Serve a StandInApp over loopback HTTP from a background thread.
+
+    Example usage:
+        ```python
+        with StandInServer() as server:
+            client = NowYouSeeMeClient(api_base_url=server.url)
+            client.health_check()
+        ```
+    """
+
+    def __init__(
+        self,
+        app: Optional[StandInApp] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        compress_responses: bool = False,
+        decompress_requests: bool = False
+    ):
+        """
+        Args:
+            app: App to serve (a fresh one by default)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            compress_responses: Compress responses (gzip/zstd) as the request's Accept-Encoding allows
+            decompress_requests: Decode compressed request bodies (the Go backend doesn't)
+        """
+        self.app = app if app is not None else StandInApp()
+        handler = type("StandInRequestHandler", (_StandInRequestHandler,), {
+            "app": self.app,
+            "compress_responses": compress_responses,
+            "decompress_requests": decompress_requests,
+        })
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """API base URL to pass to the clients"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "StandInServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m nowyouseeme.standin",
+        description="Run the in-memory NowYouSeeMe stand-in API server"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to bind (default: 8080)")
+    parser.add_argument("--compress", action="store_true",
+                        help="Compress responses (gzip/zstd) when the client's Accept-Encoding allows, and decode "
+                             "compressed request bodies (the Go backend does neither)")
+    args = parser.parse_args()
+
+    server = StandInServer(host=args.host, port=args.port, compress_responses=args.compress,
+                          decompress_requests=args.compress)
+    print(f"✓ Stand-in API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Incremental JSON decoding
+
+Pulls the items of one top-level array (e.g. "events" in a GET /timeline response) out of
+a byte stream one at a time, so the whole response never has to be held in memory.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Sequence
+
+_WHITESPACE = " \t\n\r"
+
+# Parser states
+_START = 0       # expecting the opening '{' of the response object
+_KEY = 1         # expecting a key, ',' or the closing '}'
+_COLON = 2       # expecting ':' after a key
+_SKIP = 3        # expecting a value we don't care about
+_ARRAY_OPEN = 4  # expecting '[' of the wanted array
+_ITEM = 5        # inside the wanted array: expecting an item, ',' or ']'
+_DONE = 6
+
+
+class JSONArrayStreamParser:
+    """
+    Push parser yielding the items of a top-level array field as bytes arrive.
+
+    Feed it chunks with feed(); each call returns the items completed so far. Parsing
+    stops after the wanted array closes. If the object has none of the keys, no items
+    are produced.
+
+    Example usage:
+        ```python
+        parser = JSONArrayStreamParser(keys=("events",))
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                handle(item)
+        parser.close()
+        ```
+    """
+
+    def __init__(self, keys: Sequence[str], compact_threshold: int = 1 << 16):
+        """
+        Args:
+            keys: Names of the array field to stream; the first one present is used
+            compact_threshold: Discard consumed buffer text once this many characters are consumed
+        """
+        self.keys = frozenset(keys)
+        self.compact_threshold = compact_threshold
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+
+    @property
+    def done(self) -> bool:
+        """True once the wanted array (or the whole object) has been consumed"""
+        return self._state == _DONE
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add a chunk of the response body and return the array items it completed"""
+        if self._state == _DONE:
+            return []
+        self._buffer += self._text_decoder.decode(data)
+        return self._parse(eof=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal end of input and return any remaining items.
+
+        Raises:
+            ValueError: If the stream ended in the middle of the document
+        """
+        if self._state == _DONE:
+            return []
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._parse(eof=True)
+        if self._state != _DONE:
+            raise ValueError("unexpected end of JSON stream")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; return False if the buffer is exhausted"""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode_value(self, eof: bool, terminators: str = ",]}"):
+        """
+        Decode one JSON value at the current position.
+
+        Returns (True, value) when complete or (False, None) when more input is needed.
+        A number cut off by a chunk boundary still decodes ("12" of "123", "2" of "2.5"),
+        so a value only counts as complete once the next structural character has arrived.
+        """
+        buffer = self._buffer
+        try:
+            value, end = self._decoder.raw_decode(buffer, self._pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError(f"invalid JSON at offset {self._pos}") from None
+            return False, None
+
+        next_pos = end
+        while next_pos < len(buffer) and buffer[next_pos] in _WHITESPACE:
+            next_pos += 1
+        if next_pos == len(buffer):
+            if not eof:
+                return False, None
+        elif buffer[next_pos] not in terminators:
+            if eof or not isinstance(value, (int, float)):
+                raise ValueError(f"invalid JSON at offset {next_pos}")
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos] != char:
+            raise ValueError(f"expected {char!r} at offset {self._pos}, got {self._buffer[self._pos]!r}")
+        self._pos += 1
+
+    def _parse(self, eof: bool) -> List[Any]:
+        items: List[Any] = []
+
+        while self._state != _DONE and self._skip_whitespace():
+            char = self._buffer[self._pos]
+
+            if self._state == _START:
+                self._expect("{")
+                self._state = _KEY
+
+            elif self._state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    complete, key = self._decode_value(eof, terminators=":")
+                    if not complete:
+                        break
+                    self._key = key
+                    self._state = _COLON
+
+            elif self._state == _COLON:
+                self._expect(":")
+                self._state = _ARRAY_OPEN if self._key in self.keys else _SKIP
+
+            elif self._state == _SKIP:
+                complete, _ = self._decode_value(eof)
+                if not complete:
+                    break
+                self._state = _KEY
+
+            elif self._state == _ARRAY_OPEN:
+                self._expect("[")
+                self._state = _ITEM
+
+            elif self._state == _ITEM:
+                if char == "]":
+                    self._pos += 1
+                    self._state = _DONE
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    complete, item = self._decode_value(eof)
+                    if not complete:
+                        break
+                    items.append(item)
+
+        # Drop consumed text so memory stays bounded by the largest single item
+        if self._pos >= self.compact_threshold or self._state == _DONE:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], keys: Sequence[str]) -> Iterator[Any]:
+    """
+    Yield the items of a top-level array field from a stream of byte chunks.
+
+    Reading stops as soon as the array closes, and items are yielded as soon as they
+    are complete, so callers can break out early.
+    """
+    parser = JSONArrayStreamParser(keys)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
@@ -0,0 +1,74 @@
+"""
+Timestamp parsing
+
+Fast parser for the timestamps the backend emits: Go's RFC3339 / RFC3339Nano output, with
+1-9 fractional digits and either a 'Z' suffix or a numeric offset. Strings go straight to
+the C datetime.fromisoformat (after slice-based normalization on Python < 3.11, never a
+regular expression), and repeated strings are memoized.
+"""
+
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+_UTC_SUFFIX = "+00:00"
+
+# Python 3.11+ fromisoformat accepts RFC3339 directly ('Z', any number of fraction digits)
+_NATIVE_RFC3339 = sys.version_info >= (3, 11)
+
+
+def _normalize(value: str) -> str:
+    """Rewrite an RFC3339 string into the subset fromisoformat accepts before Python 3.11"""
+    # Split off the zone suffix: 'Z', +HH:MM / -HH:MM, or nothing
+    last = value[-1:]
+    if last == "Z" or last == "z":
+        body, zone = value[:-1], _UTC_SUFFIX
+    elif len(value) >= 25 and value[-6] in "+-" and value[-3] == ":":
+        body, zone = value[:-6], value[-6:]
+    else:
+        body, zone = value, ""
+
+    if len(body) < 19 or body[10] not in "Tt":
+        raise ValueError(f"invalid timestamp: {value!r}")
+
+    if len(body) == 19 or len(body) == 26:
+        # No fraction, or already microseconds
+        return body + zone
+
+    fraction = body[20:]
+    if body[19] != "." or not fraction.isdigit():
+        raise ValueError(f"invalid timestamp: {value!r}")
+    # Pad or truncate fractional seconds to 6 digits
+    return body[:20] + fraction[:6].ljust(6, "0") + zone
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an RFC3339 timestamp as produced by the Go backend.
+
+    Examples:
+        2026-05-03T19:03:29Z
+        2026-05-03T19:03:29.6392+08:00
+        2026-05-03T19:03:29.123456789-05:00
+
+    Fractional seconds beyond microseconds are truncated. Timestamps without a
+    zone suffix produce naive datetimes.
+
+    Raises:
+        ValueError: If the string isn't an RFC3339 timestamp
+    """
+    try:
+        if _NATIVE_RFC3339:
+            return datetime.fromisoformat(value)
+        return datetime.fromisoformat(_normalize(value))
+    except ValueError:
+        raise ValueError(f"invalid timestamp: {value!r}") from None
+
+
+def parse_optional_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a timestamp that may be missing (None or empty string)"""
+    if not value:
+        return None
+    return parse_timestamp(value)
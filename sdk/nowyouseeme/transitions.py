@@ -0,0 +1,329 @@
+"""
+MBTI transitions across timelines
+
+Fetches many agents' timelines concurrently and keeps only the MBTI and timestamp of each
+metadata_submission event. All agents' submissions go into one flat array of 5-bit codes
+(see nowyouseeme.mbti), from which NumPy computes a 32x32 transition matrix and per-type
+dwell times (how many submissions, and how long, an agent keeps a type before changing)
+without per-agent Python loops.
+
+Requires numpy (pip install nowyouseeme[analytics]).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .analytics import _datetime64, _require_numpy
+from .client import TIMELINE_KEYS, NowYouSeeMeClient, _gallery_items
+from .event_types import EventType
+from .mbti import MBTI_TYPES, MISSING, NUM_TYPES, encode_mbti
+
+if TYPE_CHECKING:
+    from .async_client import AsyncNowYouSeeMeClient
+
+_METADATA = EventType.METADATA.value
+
+
+def mbti_sequence(timeline: Union[Dict[str, Any], Sequence[Dict[str, Any]]]) -> Tuple[List[int], List[Optional[str]]]:
+    """
+    Pull the MBTI sequence out of a timeline.
+
+    Args:
+        timeline: A decoded GET /timeline response, or its list of events (get_timeline)
+
+    Returns:
+        Tuple of (MBTI codes, event timestamps), one entry per metadata_submission event
+        that carries a valid MBTI, in timeline order
+    """
+    if isinstance(timeline, dict):
+        events = next((timeline[key] for key in TIMELINE_KEYS if key in timeline), None) or []
+    else:
+        events = timeline
+    codes: List[int] = []
+    timestamps: List[Optional[str]] = []
+    for event in events:
+        if event.get('event_type') != _METADATA:
+            continue
+        code = encode_mbti((event.get('raw_payload') or {}).get('mbti'))
+        if code == MISSING:
+            continue
+        codes.append(code)
+        timestamps.append(event.get('timestamp'))
+    return codes, timestamps
+
+
+@dataclass
+class MBTISequences:
+    """
+    Every agent's MBTI sequence, concatenated.
+
+    Agent i's submissions are codes[offsets[i]:offsets[i + 1]] (and the same slice of
+    timestamps). Agents whose timeline couldn't be fetched are left out and listed in errors.
+    """
+    agent_ids: List[str]
+    offsets: Any     # int64 array, len(agent_ids) + 1
+    codes: Any       # int8 array
+    timestamps: Any  # datetime64[ns] array (NaT where the event had none)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @classmethod
+    def from_sequences(
+        cls,
+        sequences: Iterable[Tuple[str, Tuple[List[int], List[Optional[str]]]]],
+        errors: Optional[Dict[str, Exception]] = None
+    ) -> 'MBTISequences':
+        """Build from (agent_id, mbti_sequence(...)) pairs"""
+        np = _require_numpy()
+        agent_ids: List[str] = []
+        lengths: List[int] = []
+        codes: List[int] = []
+        timestamps: List[Optional[str]] = []
+        for agent_id, (agent_codes, agent_timestamps) in sequences:
+            agent_ids.append(agent_id)
+            lengths.append(len(agent_codes))
+            codes.extend(agent_codes)
+            timestamps.extend(agent_timestamps)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(
+            agent_ids=agent_ids,
+            offsets=offsets,
+            codes=np.array(codes, dtype=np.int8),
+            timestamps=_datetime64(np, timestamps),
+            errors=errors or {},
+        )
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def sequence(self, agent_id: str) -> List[str]:
+        """One agent's MBTI sequence as strings"""
+        index = self.agent_ids.index(agent_id)
+        return [MBTI_TYPES[code] for code in self.codes[self.offsets[index]:self.offsets[index + 1]].tolist()]
+
+    def transitions(self) -> 'MBTITransitions':
+        """Compute the transition matrix and dwell times"""
+        return mbti_transitions(self)
+
+
+@dataclass
+class MBTITransitions:
+    """
+    Transition counts and dwell times over NUM_TYPES (32) MBTI codes.
+
+    counts[a, b] is how often a submission with type a was followed by one with type b for the
+    same agent (the diagonal counts submissions that kept the type). A dwell is a run of
+    consecutive submissions with one type; it is completed when the agent later changed type,
+    and open when it is the agent's current type.
+
+    Example usage:
+        ```python
+        transitions = fetch_mbti_sequences(client, max_workers=32).transitions()
+        transitions.probabilities[encode_mbti("INTP-A")]   # next-type distribution
+        for source, target, count, p in transitions.top_transitions(10):
+            print(f"{source} -> {target}: {count} ({p:.1%})")
+        ```
+    """
+    counts: Any                # (32, 32) int64
+    completed_dwells: Any      # (32,) int64
+    open_dwells: Any           # (32,) int64, i.e. agents currently at each type
+    dwell_submissions: Any     # (32,) float64 mean submissions per completed dwell (nan: none)
+    dwell_seconds: Any         # (32,) float64 mean seconds per completed dwell (nan: none)
+    agents: int
+    submissions: int
+
+    @property
+    def probabilities(self):
+        """Row-normalized counts: P(next type | current type); all-zero rows stay zero"""
+        np = _require_numpy()
+        totals = self.counts.sum(axis=1, keepdims=True)
+        return np.divide(self.counts, totals, out=np.zeros(self.counts.shape), where=totals > 0)
+
+    def top_transitions(self, n: int = 10, include_self: bool = False) -> List[Tuple[str, str, int, float]]:
+        """
+        The most frequent transitions.
+
+        Returns:
+            (from type, to type, count, probability) tuples, most frequent first
+        """
+        np = _require_numpy()
+        counts = self.counts.copy()
+        if not include_self:
+            np.fill_diagonal(counts, 0)
+        probabilities = self.probabilities
+        order = np.argsort(counts, axis=None, kind="stable")[::-1][:n]
+        top = []
+        for flat in order.tolist():
+            source, target = divmod(flat, NUM_TYPES)
+            if counts[source, target] == 0:
+                break
+            top.append((MBTI_TYPES[source], MBTI_TYPES[target], int(counts[source, target]),
+                        float(probabilities[source, target])))
+        return top
+
+
+def mbti_transitions(sequences: MBTISequences) -> MBTITransitions:
+    """Compute transition counts and dwell times from concatenated MBTI sequences"""
+    np = _require_numpy()
+    codes = sequences.codes.astype(np.int64)
+    size = len(codes)
+    agent_of = np.repeat(np.arange(len(sequences.offsets) - 1), np.diff(sequences.offsets))
+    same_agent = agent_of[1:] == agent_of[:-1]
+
+    # Consecutive submissions of the same agent
+    pairs = codes[:-1][same_agent] * NUM_TYPES + codes[1:][same_agent]
+    counts = np.bincount(pairs, minlength=NUM_TYPES * NUM_TYPES).reshape(NUM_TYPES, NUM_TYPES)
+
+    # Runs of one type: a run starts at an agent's first submission or at a type change
+    run_start = np.ones(size, dtype=bool)
+    run_start[1:] = (codes[1:] != codes[:-1]) | ~same_agent
+    starts = np.flatnonzero(run_start)
+    ends = np.append(starts[1:], size)
+    run_codes = codes[starts]
+    # A run is completed if the next run belongs to the same agent
+    completed = np.zeros(len(starts), dtype=bool)
+    completed[:-1] = agent_of[starts[1:]] == agent_of[starts[:-1]]
+
+    completed_codes = run_codes[completed]
+    completed_dwells = np.bincount(completed_codes, minlength=NUM_TYPES)
+    open_dwells = np.bincount(run_codes[~completed], minlength=NUM_TYPES)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dwell_submissions = np.bincount(
+            completed_codes, weights=(ends - starts)[completed], minlength=NUM_TYPES
+        ) / completed_dwells
+
+        # From the run's first submission to the submission that changed the type
+        first = sequences.timestamps[starts[completed]]
+        changed = sequences.timestamps[ends[completed]]
+        timed = ~(np.isnat(first) | np.isnat(changed))
+        seconds = (changed[timed] - first[timed]).astype("timedelta64[ns]").astype(np.int64) / 1e9
+        timed_codes = completed_codes[timed]
+        dwell_seconds = np.bincount(timed_codes, weights=seconds, minlength=NUM_TYPES) / np.bincount(
+            timed_codes, minlength=NUM_TYPES
+        )
+
+    return MBTITransitions(
+        counts=counts,
+        completed_dwells=completed_dwells,
+        open_dwells=open_dwells,
+        dwell_submissions=dwell_submissions,
+        dwell_seconds=dwell_seconds,
+        agents=len(sequences),
+        submissions=size,
+    )
+
+
+def _gallery_agent_ids(data: Dict[str, Any]) -> List[str]:
+    return [item.get('id') or (item.get('snapshot') or {}).get('agent_id', '') for item in _gallery_items(data)]
+
+
+def fetch_mbti_sequences(
+    client: NowYouSeeMeClient,
+    agent_ids: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> MBTISequences:
+    """
+    Fetch timelines concurrently and extract each agent's MBTI sequence.
+
+    Timelines are decoded with the client's codec and reduced to (code, timestamp) pairs
+    as they arrive, so no Event objects are built.
+
+    Args:
+        client: Client to fetch with (its connection pool should cover max_workers)
+        agent_ids: Agents to fetch (default: every agent in the gallery)
+        max_workers: Number of timelines fetched concurrently (defaults to pool_maxsize)
+        progress: Optional callback(done, total), called as timelines complete
+
+    Returns:
+        MBTISequences; agents whose timeline failed are listed in its errors
+
+    Raises:
+        requests.RequestException: If fetching the gallery fails
+    """
+    if agent_ids is None:
+        response = client._get("get_gallery", "/gallery")
+        response.raise_for_status()
+        agent_ids = _gallery_agent_ids(client.codec.loads(response.content))
+    agent_ids = list(agent_ids)
+    results: List[Optional[Tuple[List[int], List[Optional[str]]]]] = [None] * len(agent_ids)
+    errors: Dict[str, Exception] = {}
+    lock = threading.Lock()
+    done = 0
+
+    def fetch(index: int) -> None:
+        nonlocal done
+        agent_id = agent_ids[index]
+        try:
+            response = client._get("get_timeline", "/timeline", params={"agent_id": agent_id})
+            response.raise_for_status()
+            results[index] = mbti_sequence(client.codec.loads(response.content))
+        except Exception as e:
+            errors[agent_id] = e
+        with lock:
+            done += 1
+            if progress is not None:
+                progress(done, len(agent_ids))
+
+    with ThreadPoolExecutor(max_workers=max_workers or client.pool_maxsize) as executor:
+        for future in [executor.submit(fetch, index) for index in range(len(agent_ids))]:
+            future.result()
+
+    return MBTISequences.from_sequences(
+        ((agent_id, result) for agent_id, result in zip(agent_ids, results) if result is not None),
+        errors
+    )
+
+
+async def fetch_mbti_sequences_async(
+    client: "AsyncNowYouSeeMeClient",
+    agent_ids: Optional[Iterable[str]] = None,
+    concurrency: int = 100,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> MBTISequences:
+    """
+    Async version of fetch_mbti_sequences for AsyncNowYouSeeMeClient.
+
+    Args:
+        client: Async client to fetch with (its max_concurrency also applies)
+        agent_ids: Agents to fetch (default: every agent in the gallery)
+        concurrency: Number of timelines fetched at once
+        progress: Optional callback(done, total), called as timelines complete
+
+    Returns:
+        MBTISequences; agents whose timeline failed are listed in its errors
+
+    Raises:
+        aiohttp.ClientError: If fetching the gallery fails
+    """
+    if agent_ids is None:
+        agent_ids = _gallery_agent_ids(await client._get_json("get_gallery", "/gallery"))
+    agent_ids = list(agent_ids)
+    results: List[Optional[Tuple[List[int], List[Optional[str]]]]] = [None] * len(agent_ids)
+    errors: Dict[str, Exception] = {}
+    pending = iter(range(len(agent_ids)))
+    done = 0
+
+    async def worker() -> None:
+        # A fixed set of workers rather than one task per agent keeps 100k-agent runs small
+        nonlocal done
+        for index in pending:
+            agent_id = agent_ids[index]
+            try:
+                data = await client._get_json("get_timeline", "/timeline", params={"agent_id": agent_id})
+                results[index] = mbti_sequence(data)
+            except Exception as e:
+                errors[agent_id] = e
+            done += 1
+            if progress is not None:
+                progress(done, len(agent_ids))
+
+    await asyncio.gather(*[worker() for _ in range(max(1, min(concurrency, len(agent_ids))))])
+
+    return MBTISequences.from_sequences(
+        ((agent_id, result) for agent_id, result in zip(agent_ids, results) if result is not None),
+        errors
+    )
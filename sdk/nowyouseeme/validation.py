@@ -0,0 +1,237 @@
+"""
+Operation validation
+
+Checks a diary's operations against an AgentState before anything is sent, so invalid
+batches fail locally instead of costing a round trip and the agent's row lock.
+Must match backend validation/operation_validator.go and validation/goal_state_machine.go.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .entity_types import EntityType, Status
+from .operation_types import OperationType
+
+if TYPE_CHECKING:
+    from .client import AgentState, Operation
+
+_ENTITY_TYPES = frozenset(entity_type.value for entity_type in EntityType)
+_OPERATION_TYPES = frozenset(operation.value for operation in OperationType)
+_STATUSES = frozenset(status.value for status in Status)
+_CREATE_STATUSES = (Status.PENDING.value, Status.PROGRESS.value)
+
+# Allowed goal status transitions; staying in the same status is always allowed
+GOAL_STATUS_TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    Status.PENDING.value: (Status.PROGRESS.value, Status.ABANDONED.value),
+    Status.PROGRESS.value: (Status.COMPLETED.value, Status.ABANDONED.value, Status.PENDING.value),
+    Status.COMPLETED.value: (),  # terminal
+    Status.ABANDONED.value: (Status.PENDING.value, Status.PROGRESS.value),
+}
+
+
+def _goal_status_paths() -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """Shortest status sequence between every pair of connected goal statuses (breadth-first)"""
+    paths: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+    for start in GOAL_STATUS_TRANSITIONS:
+        paths[(start, start)] = ()
+        frontier = [start]
+        while frontier:
+            reached = []
+            for status in frontier:
+                for target in GOAL_STATUS_TRANSITIONS[status]:
+                    if (start, target) not in paths:
+                        paths[(start, target)] = paths[(start, status)] + (target,)
+                        reached.append(target)
+            frontier = reached
+    return paths
+
+
+# (from, to) -> statuses a goal passes through, ending with to; missing pairs are unreachable
+GOAL_STATUS_PATHS = _goal_status_paths()
+
+# Marks an entity deleted earlier in the same batch
+_DELETED = object()
+
+
+class ValidationError(Exception):
+    """Raised when operations would be rejected by the backend; errors lists every failure"""
+
+    def __init__(self, errors: Iterable[str]):
+        self.errors = list(errors)
+        super().__init__(f"validation failed: {self.errors}")
+
+
+def _text(value: Any) -> str:
+    """Normalize an operation field (enum member, str or None) to its wire value"""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _field(op: Any, name: str) -> str:
+    if isinstance(op, dict):
+        return _text(op.get(name))
+    return _text(getattr(op, name, None))
+
+
+def goal_status_transition_error(from_status: str, to_status: str) -> Optional[str]:
+    """Reason a goal can't move between two statuses, or None if the transition is allowed"""
+    from_status, to_status = _text(from_status), _text(to_status)
+    if from_status == to_status:
+        return None
+    allowed = GOAL_STATUS_TRANSITIONS.get(from_status)
+    if allowed is None:
+        return f"unknown status: {from_status}"
+    if to_status not in allowed:
+        return f"invalid status transition: {from_status} -> {to_status}"
+    return None
+
+
+def goal_status_path(from_status: str, to_status: str) -> Optional[Tuple[str, ...]]:
+    """
+    Fewest legal updates moving a goal between two statuses.
+
+    Returns:
+        The statuses to set, in order (empty if from_status == to_status), or None if
+        to_status can't be reached (e.g. out of completed)
+    """
+    return GOAL_STATUS_PATHS.get((_text(from_status), _text(to_status)))
+
+
+def is_valid_goal_transition(from_status: str, to_status: str) -> bool:
+    """Check a goal status transition against the state machine"""
+    return goal_status_transition_error(from_status, to_status) is None
+
+
+class _BatchView:
+    """
+    The state as seen partway through a batch: the original AgentState plus an overlay of
+    the entities earlier operations touched. Validation never copies the state.
+    """
+
+    __slots__ = ("state", "overlay")
+
+    def __init__(self, state: Optional["AgentState"]):
+        self.state = state
+        self.overlay: Dict[Tuple[str, str], Any] = {}
+
+    def status(self, entity_type: str, entity_id: str) -> Optional[str]:
+        """Current status of an entity, or None if it doesn't exist"""
+        status = self.overlay.get((entity_type, entity_id))
+        if status is _DELETED:
+            return None
+        if status is not None:
+            return status
+        if self.state is None:
+            return None
+        collection = self.state.entity_collections.get(entity_type)
+        if collection is None:
+            return None
+        entity = collection.entities_by_id.get(entity_id)
+        return None if entity is None else entity.status
+
+    def set(self, entity_type: str, entity_id: str, status: Any) -> None:
+        self.overlay[(entity_type, entity_id)] = status
+
+
+def _operation_error(op: Any, view: _BatchView) -> Optional[str]:
+    entity_type = _field(op, "entity_type")
+    operation = _field(op, "op")
+    entity_id = _field(op, "entity_id")
+    content = _field(op, "entity_content")
+    target_status = _field(op, "target_status")
+
+    if entity_type not in _ENTITY_TYPES:
+        return f"invalid entity type: {entity_type}"
+    if operation not in _OPERATION_TYPES:
+        return f"invalid operation type: {operation}"
+
+    current = view.status(entity_type, entity_id) if entity_id else None
+
+    if operation == OperationType.CREATE.value:
+        if not entity_id or not content:
+            return f"create {entity_type} requires entity_id and entity_content"
+        if current is not None:
+            return f"{entity_type} {entity_id} already exists"
+        if not target_status:
+            return f"create {entity_type} requires target_status"
+        if target_status not in _STATUSES:
+            return f"invalid status: {target_status}"
+        if target_status not in _CREATE_STATUSES:
+            return f"new {entity_type} can only be pending or progress, got: {target_status}"
+        view.set(entity_type, entity_id, target_status)
+
+    elif operation == OperationType.UPDATE.value:
+        if not entity_id:
+            return f"update {entity_type} requires entity_id"
+        if current is None:
+            return f"{entity_type} {entity_id} not found"
+        if not content and not target_status:
+            return f"update {entity_type} requires at least one of: entity_content or target_status"
+        if target_status:
+            if target_status not in _STATUSES:
+                return f"invalid status: {target_status}"
+            if entity_type == EntityType.GOAL.value:
+                error = goal_status_transition_error(current, target_status)
+                if error is not None:
+                    return error
+            view.set(entity_type, entity_id, target_status)
+
+    else:
+        if not entity_id:
+            return f"delete {entity_type} requires entity_id"
+        if current is None:
+            return f"{entity_type} {entity_id} not found"
+        view.set(entity_type, entity_id, _DELETED)
+
+    return None
+
+
+def find_operation_errors(
+    operations: Iterable[Union["Operation", Dict[str, Any]]],
+    state: Optional["AgentState"] = None
+) -> List[str]:
+    """
+    Validate operations in order, each against the state left by the ones before it.
+
+    Invalid operations are reported and skipped, as the backend does, so later operations
+    are checked as if they were absent.
+
+    Args:
+        operations: Operation objects or their to_dict() form
+        state: AgentState (or CompactAgentState) to validate against; None means no entities yet
+
+    Returns:
+        Error messages in the backend's "operation[i]: ..." format (empty if all are valid)
+    """
+    view = _BatchView(state)
+    errors = []
+    for i, op in enumerate(operations):
+        error = _operation_error(op, view)
+        if error is not None:
+            errors.append(f"operation[{i}]: {error}")
+    return errors
+
+
+def validate_operations(
+    operations: Iterable[Union["Operation", Dict[str, Any]]],
+    state: Optional["AgentState"] = None
+) -> None:
+    """
+    Check operations against a local AgentState using the backend's rules.
+
+    Creates need an id, content and a pending/progress status; updates and deletes need an
+    existing entity; goal status changes must follow the goal state machine.
+
+    Args:
+        operations: Operation objects or their to_dict() form
+        state: AgentState (or CompactAgentState) to validate against; None means no entities yet
+
+    Raises:
+        ValidationError: If any operation would be rejected
+    """
+    errors = find_operation_errors(operations, state)
+    if errors:
+        raise ValidationError(errors)
@@ -0,0 +1,132 @@
+"""
+Change-feed watcher
+
+Polls agents for new events instead of re-fetching whole snapshots. Each check asks for the
+timeline after the last sequence seen, which is empty (a few bytes) while an agent is quiet;
+new events are replayed onto the watcher's copy of the snapshot, so no snapshot is fetched
+after the initial one. Agents that stay quiet are checked less and less often, so request
+volume follows the rate of change rather than the polling interval.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .client import AgentSnapshotResult
+from .diff import StateDiff, diff_states
+from .replay import ReplayError, clone_snapshot, replay_events_on_snapshot
+
+
+@dataclass
+class AgentChange:
+    """An agent whose sequence moved since the previous check"""
+    agent_id: str
+    previous_sequence: int  # Last event sequence seen before this change
+    sequence: int  # Last event sequence seen now
+    snapshot: AgentSnapshotResult  # State after the new events
+    events: List[Dict[str, Any]]  # The new timeline events
+    diff: StateDiff  # Entity changes since the previous snapshot
+
+
+class WatchSchedule:
+    """
+    When each watched agent is next due for a check.
+
+    An agent starts at interval; every check that finds nothing multiplies its interval by
+    backoff, up to max_interval, and a change resets it to interval.
+    """
+
+    def __init__(
+        self,
+        agent_ids: Iterable[str],
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        now: float = 0.0
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if max_interval < interval:
+            raise ValueError("max_interval must be >= interval")
+        if backoff < 1:
+            raise ValueError("backoff must be >= 1")
+
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.intervals: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        for agent_id in agent_ids:
+            if agent_id not in self.intervals:
+                self.intervals[agent_id] = interval
+                self._heap.append((now, agent_id))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[str]:
+        """Remove and return every agent due at or before now"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    def reschedule(self, agent_id: str, changed: bool, now: float) -> None:
+        if changed:
+            interval = self.interval
+        else:
+            interval = min(self.intervals[agent_id] * self.backoff, self.max_interval)
+        self.intervals[agent_id] = interval
+        heapq.heappush(self._heap, (now + interval, agent_id))
+
+
+class _Watched:
+    """Watcher's view of one agent"""
+    __slots__ = ("snapshot", "last_sequence")
+
+    def __init__(self, snapshot: AgentSnapshotResult):
+        self.snapshot = snapshot
+        # Diaries end with operation events, which set the snapshot's sequence
+        self.last_sequence = snapshot.sequence
+
+
+def _advance(watched: _Watched, agent_id: str, events: List[Dict[str, Any]]) -> Optional[AgentChange]:
+    """
+    Replay newly fetched events onto the watched snapshot.
+
+    Returns:
+        The change, or None if there were no events or they could not be replayed (the
+        caller then fetches the snapshot instead)
+    """
+    if not events:
+        return None
+    snapshot = clone_snapshot(watched.snapshot)
+    try:
+        replay_events_on_snapshot(snapshot, events)
+    except ReplayError:
+        return None
+    return _changed(watched, agent_id, events, snapshot)
+
+
+def _changed(
+    watched: _Watched,
+    agent_id: str,
+    events: List[Dict[str, Any]],
+    snapshot: AgentSnapshotResult
+) -> AgentChange:
+    previous = watched.last_sequence
+    change = AgentChange(
+        agent_id=agent_id,
+        previous_sequence=previous,
+        sequence=max([previous, snapshot.sequence] + [event.get('sequence_number') or 0 for event in events]),
+        snapshot=snapshot,
+        events=events,
+        diff=diff_states(watched.snapshot, snapshot)
+    )
+    watched.snapshot = snapshot
+    watched.last_sequence = change.sequence
+    return change
@@ -0,0 +1,430 @@
+"""
+Workload files
+
+A workload is a complete, ordered load test - agents and their diaries - written once to an
+NDJSON file (gzip-compressed when the name ends in .gz) and replayed against the API as
+often as needed. Generation and submission are separate steps, so generator CPU doesn't
+compete with submission and the same file always produces the same requests.
+
+Records, one JSON object per line:
+    {"type": "workload", "version": 1, ...metadata}
+    {"type": "agent", "agent_id": ..., "name": ..., "current_mbti": ...}
+    {"type": "diary", "agent_id": ..., "payload": {...}}   # the POST /diaries body
+
+The replayer keeps each agent's records in file order and runs different agents
+concurrently, whatever order the agents appear in.
+"""
+
+import asyncio
+import gzip
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, IO, Iterable, Iterator, List, Optional, TypeVar, Union
+)
+
+from .client import NowYouSeeMeClient, Operation, SelfReflection, _build_diary_request
+from .codec import JSONCodec, get_codec
+
+if TYPE_CHECKING:
+    from .async_client import AsyncNowYouSeeMeClient
+
+FORMAT_VERSION = 1
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+T = TypeVar("T")
+
+# A workload file path, or records already read
+Source = Union[str, Iterable[Dict[str, Any]]]
+
+
+class WorkloadWriter:
+    """
+    Writes a workload file record by record.
+
+    Example usage:
+        ```python
+        with WorkloadWriter("load.ndjson.gz", metadata={"seed": 42}) as writer:
+            writer.write_agent("agent_1", "Agent One", "INTP-A")
+            writer.write_diary("agent_1", mbti="INTP-A", operations=[...], current_mood="Curious")
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        compresslevel: int = 6
+    ):
+        """
+        Args:
+            path: File to create; gzip-compressed if it ends in .gz
+            metadata: Extra fields for the header record (seed, generator settings, ...)
+            codec: JSON codec for the records
+            compresslevel: gzip level (1 = fastest, 9 = smallest)
+        """
+        self.path = path
+        self.codec = get_codec(codec)
+        self.agents = 0
+        self.diaries = 0
+        self._raw = open(path, "wb")
+        if path.endswith(".gz"):
+            # No name or timestamp in the gzip header, so equal workloads are equal files
+            self._file: IO[bytes] = gzip.GzipFile(
+                filename="", mode="wb", compresslevel=compresslevel, fileobj=self._raw, mtime=0
+            )
+        else:
+            self._file = self._raw
+        self._write({"type": "workload", "version": FORMAT_VERSION, **(metadata or {})})
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(self.codec.dumps(record) + b"\n")
+
+    def write_agent(self, agent_id: str, name: str, current_mbti: str) -> None:
+        """Add a create_agent call"""
+        self._write({"type": "agent", "agent_id": agent_id, "name": name, "current_mbti": current_mbti})
+        self.agents += 1
+
+    def write_diary(
+        self,
+        agent_id: str,
+        mbti: str,
+        operations: List[Operation],
+        mbti_confidence: float = 0.0,
+        geometry_representation: str = "",
+        context: str = "",
+        current_mood: str = "",
+        philosophy: str = "",
+        self_reflection: Optional[SelfReflection] = None
+    ) -> None:
+        """Add a submit_diary call (same arguments as submit_diary)"""
+        request = _build_diary_request(
+            agent_id=agent_id,
+            mbti=mbti,
+            operations=operations,
+            mbti_confidence=mbti_confidence,
+            geometry_representation=geometry_representation,
+            context=context,
+            current_mood=current_mood,
+            philosophy=philosophy,
+            self_reflection=self_reflection
+        )
+        self._write({"type": "diary", **request})
+        self.diaries += 1
+
+    def close(self) -> None:
+        self._file.close()
+        self._raw.close()
+
+    def __enter__(self) -> "WorkloadWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def open_ndjson(path: str) -> IO[bytes]:
+    """Open an NDJSON file for reading, decompressing it if it is gzip (by content, not name)"""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+
+def read_workload(path: str, codec: Union[str, JSONCodec, None] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a workload file's records, header first.
+
+    Raises:
+        ValueError: If a line is not valid JSON
+    """
+    loads = get_codec(codec).loads
+    with open_ndjson(path) as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+@dataclass
+class WorkloadResult:
+    """Outcome of replaying a workload"""
+    agents: int = 0
+    diaries: int = 0
+    failed: int = 0
+    skipped: int = 0  # records of agents whose earlier record failed
+    seconds: float = 0.0
+    # Seconds per successful call, keyed by client method name
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: {"create_agent": [], "submit_diary": []})
+    # First error of each failed agent
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return self.agents + self.diaries
+
+
+class _Replay:
+    """Bookkeeping shared by the sync and async replayers"""
+
+    def __init__(self, stop_on_error: bool, progress: Optional[Callable[[WorkloadResult], None]]):
+        self.result = WorkloadResult()
+        self.stop_on_error = stop_on_error
+        self.progress = progress
+        self._lock = threading.Lock()
+
+    def should_skip(self, agent_id: str) -> bool:
+        if self.stop_on_error and agent_id in self.result.errors:
+            with self._lock:
+                self.result.skipped += 1
+            return True
+        return False
+
+    def succeeded(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            if kind == "agent":
+                self.result.agents += 1
+                self.result.latencies["create_agent"].append(seconds)
+            else:
+                self.result.diaries += 1
+                self.result.latencies["submit_diary"].append(seconds)
+        if self.progress is not None:
+            self.progress(self.result)
+
+    def failed(self, agent_id: str, error: Exception) -> None:
+        with self._lock:
+            self.result.failed += 1
+            self.result.errors.setdefault(agent_id, f"{type(error).__name__}: {error}")
+
+
+def _records(source: Source, codec: Union[str, JSONCodec, None]) -> Iterable[Dict[str, Any]]:
+    records = read_workload(source, codec) if isinstance(source, str) else source
+    return (record for record in records if record.get("type") in ("agent", "diary"))
+
+
+def run_keyed(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    handle: Callable[[T], None],
+    workers: int,
+    max_pending: int = 10000
+) -> None:
+    """
+    Call handle on every item from a thread pool, one item per key at a time, in input order.
+
+    Items with different keys run concurrently whatever order they arrive in; at most
+    max_pending items are read ahead of the ones finished.
+
+    handle should record its own failures. If it raises anyway, no further items are
+    started, and the first exception is re-raised here once the running ones finish.
+    """
+    lock = threading.Lock()
+    pending: Dict[str, Deque[T]] = {}
+    ready: "queue.Queue[Optional[str]]" = queue.Queue()
+    slots = threading.Semaphore(max_pending)
+    failures: List[BaseException] = []
+
+    def worker() -> None:
+        while True:
+            item_key = ready.get()
+            if item_key is None:
+                return
+            # Drain the key's queue; the reader appends to it while it's in pending
+            while True:
+                with lock:
+                    items_for_key = pending[item_key]
+                    if not items_for_key or failures:
+                        del pending[item_key]
+                        break
+                    item = items_for_key.popleft()
+                try:
+                    handle(item)
+                except BaseException as e:
+                    with lock:
+                        failures.append(e)
+                finally:
+                    slots.release()
+            # Items dropped after a failure give their slots back, so the reader can't block
+            for _ in items_for_key:
+                slots.release()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for item in items:
+            if failures:
+                break
+            slots.acquire()
+            item_key = key(item)
+            with lock:
+                items_for_key = pending.get(item_key)
+                if items_for_key is None:
+                    pending[item_key] = deque((item,))
+                    ready.put(item_key)
+                else:
+                    items_for_key.append(item)
+    finally:
+        for _ in threads:
+            ready.put(None)
+        for thread in threads:
+            thread.join()
+    if failures:
+        raise failures[0]
+
+
+async def run_keyed_async(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    handle: Callable[[T], Awaitable[None]],
+    concurrency: int,
+    max_pending: int = 10000
+) -> None:
+    """run_keyed with concurrency tasks on the running event loop"""
+    pending: Dict[str, Deque[T]] = {}
+    ready: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    slots = asyncio.Semaphore(max_pending)
+    failures: List[BaseException] = []
+
+    async def worker() -> None:
+        while True:
+            item_key = await ready.get()
+            if item_key is None:
+                return
+            items_for_key = pending[item_key]
+            while items_for_key and not failures:
+                item = items_for_key.popleft()
+                try:
+                    await handle(item)
+                except BaseException as e:
+                    failures.append(e)
+                finally:
+                    slots.release()
+            for _ in items_for_key:
+                slots.release()
+            del pending[item_key]
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        for item in items:
+            if failures:
+                break
+            await slots.acquire()
+            item_key = key(item)
+            items_for_key = pending.get(item_key)
+            if items_for_key is None:
+                pending[item_key] = deque((item,))
+                ready.put_nowait(item_key)
+            else:
+                items_for_key.append(item)
+    finally:
+        for _ in tasks:
+            ready.put_nowait(None)
+        await asyncio.gather(*tasks)
+    if failures:
+        raise failures[0]
+
+
+def replay_workload(
+    client: NowYouSeeMeClient,
+    source: Source,
+    max_workers: Optional[int] = None,
+    max_pending: int = 10000,
+    stop_on_error: bool = True,
+    progress: Optional[Callable[[WorkloadResult], None]] = None
+) -> WorkloadResult:
+    """
+    Submit a workload's agents and diaries, streaming it from disk.
+
+    Each agent's records are sent one after another in file order; different agents are
+    sent concurrently. Diaries are posted as stored, without rebuilding Operation objects,
+    so the client's shadow states, cache and prevalidation are not involved.
+
+    Example usage:
+        ```python
+        client = NowYouSeeMeClient(pool_maxsize=64)
+        result = replay_workload(client, "load.ndjson.gz", max_workers=64)
+        print(result.diaries / result.seconds, "diaries/s")
+        ```
+
+    Args:
+        client: Client to submit with (its connection pool should cover max_workers)
+        source: Workload file, or its records
+        max_workers: Number of agents submitted concurrently (defaults to pool_maxsize)
+        max_pending: Records read ahead of the ones submitted
+        stop_on_error: After an agent's record fails, skip that agent's remaining records
+        progress: Called with the running WorkloadResult after each successful record
+
+    Returns:
+        WorkloadResult with counts, latencies and each failed agent's first error
+    """
+    replay = _Replay(stop_on_error, progress)
+
+    def handle(record: Dict[str, Any]) -> None:
+        agent_id = record["agent_id"]
+        if replay.should_skip(agent_id):
+            return
+        start = time.perf_counter()
+        try:
+            if record["type"] == "agent":
+                client.create_agent(agent_id, record["name"], record["current_mbti"])
+            else:
+                response = client._post("submit_diary", "/diaries", {"agent_id": agent_id, "payload": record["payload"]})
+                response.raise_for_status()
+        except Exception as e:
+            replay.failed(agent_id, e)
+            return
+        replay.succeeded(record["type"], time.perf_counter() - start)
+
+    start = time.perf_counter()
+    run_keyed(_records(source, client.codec), lambda record: record["agent_id"], handle,
+              max_workers or client.pool_maxsize, max_pending)
+    replay.result.seconds = time.perf_counter() - start
+    return replay.result
+
+
+async def replay_workload_async(
+    client: "AsyncNowYouSeeMeClient",
+    source: Source,
+    concurrency: int = 100,
+    max_pending: int = 10000,
+    stop_on_error: bool = True,
+    progress: Optional[Callable[[WorkloadResult], None]] = None
+) -> WorkloadResult:
+    """
+    replay_workload for AsyncNowYouSeeMeClient, with concurrency agents in flight.
+
+    The file is read on the event loop thread; it is compressed NDJSON, so reading is cheap
+    next to the requests.
+    """
+    replay = _Replay(stop_on_error, progress)
+
+    async def handle(record: Dict[str, Any]) -> None:
+        agent_id = record["agent_id"]
+        if replay.should_skip(agent_id):
+            return
+        start = time.perf_counter()
+        try:
+            if record["type"] == "agent":
+                await client.create_agent(agent_id, record["name"], record["current_mbti"])
+            else:
+                body, headers = client._encode("submit_diary", {"agent_id": agent_id, "payload": record["payload"]})
+                session = client._get_session()
+                url = f"{client.api_base_url}/diaries"
+                async with client._semaphore:
+                    async with session.post(url, data=body, headers=headers) as response:
+                        await client._read("submit_diary", response)
+                        response.raise_for_status()
+        except Exception as e:
+            replay.failed(agent_id, e)
+            return
+        replay.succeeded(record["type"], time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await run_keyed_async(_records(source, client.codec), lambda record: record["agent_id"], handle,
+                          concurrency, max_pending)
+    replay.result.seconds = time.perf_counter() - start
+    return replay.result
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: JSON codecs on gallery/timeline responses and diary requests
+
+Builds realistic payloads with the in-memory stand-in server (agents with several diaries
+of entity operations), then times decoding the GET /gallery and GET /timeline bodies and
+encoding POST /diaries bodies with requests' built-in JSON handling and with each
+nowyouseeme codec. No backend required.
+
+Usage:
+    python scripts/bench_codec.py --agents 2000 --diaries 10
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import random
+import sys
+import time
+
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme.client import Operation, SelfReflection, _build_diary_request, _gallery_from_dict
+from nowyouseeme.codec import CODECS, StdlibJSONCodec
+from nowyouseeme.entity_types import EntityType, Status
+from nowyouseeme.operation_types import OperationType
+from nowyouseeme.standin import StandInApp
+
+WORDS = (
+    "explore understand build reason pattern memory language model curious careful patient "
+    "synthesis abstraction intuition evidence experiment theory practice signal noise"
+).split()
+
+
+def sentence(rng, words=10):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def diary_request(rng, agent_id, diary_num):
+    """A POST /diaries body: creates on the first diary, creates and updates afterwards"""
+    operations = []
+    for kind in (EntityType.GOAL, EntityType.CAPABILITY, EntityType.LIMITATION, EntityType.ASPIRATION):
+        operations.append(Operation(
+            entity_type=kind,
+            op=OperationType.CREATE,
+            entity_id=f"{kind.value}_{diary_num}",
+            entity_content=sentence(rng),
+            target_status=Status.PENDING
+        ))
+        if diary_num > 1:
+            operations.append(Operation(
+                entity_type=kind,
+                op=OperationType.UPDATE,
+                entity_id=f"{kind.value}_{diary_num - 1}",
+                entity_content=sentence(rng)
+            ))
+    return _build_diary_request(
+        agent_id=agent_id,
+        mbti="INTP-A",
+        operations=operations,
+        mbti_confidence=round(rng.uniform(0.6, 0.95), 2),
+        geometry_representation=f"https://placeholder.com/{agent_id}_v{diary_num}.jpg",
+        context=sentence(rng, 30),
+        current_mood=sentence(rng, 4),
+        philosophy=sentence(rng, 20),
+        self_reflection=SelfReflection(sentence(rng, 15), sentence(rng, 15), sentence(rng, 15))
+    )
+
+
+def build_payloads(num_agents, num_diaries, seed=7):
+    """Populate a stand-in and return (gallery bytes, timeline bytes, diary request dicts)"""
+    rng = random.Random(seed)
+    app = StandInApp()
+    encode = StdlibJSONCodec().dumps
+    requests_sent = []
+    for i in range(num_agents):
+        agent_id = f"agent_{i}"
+        app.handle("POST", "/api/v1/agents", {}, encode({"agent_id": agent_id, "name": f"Agent {i}",
+                                                         "current_mbti": "INTP-A"}))
+        for diary_num in range(1, num_diaries + 1):
+            body = diary_request(rng, agent_id, diary_num)
+            status, result = app.handle("POST", "/api/v1/diaries", {}, encode(body))
+            assert status == 201, result
+            requests_sent.append(body)
+
+    _, gallery = app.handle("GET", "/api/v1/gallery", {}, b"")
+    # One long-lived agent's history for the timeline
+    timeline_agent = "agent_timeline"
+    app.handle("POST", "/api/v1/agents", {}, encode({"agent_id": timeline_agent, "name": "Timeline",
+                                                     "current_mbti": "INTP-A"}))
+    for diary_num in range(1, num_agents + 1):
+        app.handle("POST", "/api/v1/diaries", {}, encode(diary_request(rng, timeline_agent, diary_num)))
+    _, timeline = app.handle("GET", "/api/v1/timeline", {"agent_id": timeline_agent}, b"")
+    return encode(gallery), encode(timeline), requests_sent
+
+
+def requests_json(content):
+    """What response.json() does: decode the body to str, then json.loads"""
+    response = requests.Response()
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    response._content = content
+    return response.json()
+
+
+def requests_dumps(body):
+    """What session.post(json=...) does"""
+    return json.dumps(body, allow_nan=False).encode("utf-8")
+
+
+def bench(label, func, items, repeat, size, baseline=None):
+    best = float("inf")
+    # Like timeit: keep the cyclic GC (triggered by the decoded objects) out of the numbers
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in items:
+                func(item)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    throughput = size / best / 1e6
+    speedup = f"{baseline / best:>8.1f}x" if baseline else f"{'1.0x':>9}"
+    print(f"{label:<34}{best * 1000:>10.1f} ms{throughput:>10.0f} MB/s{speedup}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SDK JSON codecs")
+    parser.add_argument("--agents", type=int, default=2000, help="Agents in the gallery (default: 2000)")
+    parser.add_argument("--diaries", type=int, default=10, help="Diaries per agent (default: 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is kept (default: 5)")
+    args = parser.parse_args()
+
+    gallery, timeline, diary_requests = build_payloads(args.agents, args.diaries)
+    codecs = []
+    for name, codec_class in CODECS.items():
+        try:
+            codecs.append((name, codec_class()))
+        except ImportError:
+            print(f"({name} not installed, skipped)")
+
+    # Every codec must decode to the same document before timing it
+    for name, codec in codecs:
+        assert codec.loads(gallery) == requests_json(gallery), name
+        assert codec.loads(codec.dumps(diary_requests[0])) == json.loads(requests_dumps(diary_requests[0])), name
+
+    print("=" * 72)
+    for label, content in (("GET /gallery", gallery), ("GET /timeline", timeline)):
+        print(f"Decode {label}: {len(content) / 1e6:.1f} MB")
+        print("-" * 72)
+        baseline = bench("response.json()", requests_json, [content], args.repeat, len(content))
+        for name, codec in codecs:
+            bench(f"{name}.loads(bytes)", codec.loads, [content], args.repeat, len(content), baseline)
+        print("=" * 72)
+
+    print(f"Decode GET /gallery into AgentWithSnapshot ({args.agents} agents)")
+    print("-" * 72)
+    baseline = bench("response.json() + from_dict", lambda c: _gallery_from_dict(requests_json(c)),
+                     [gallery], args.repeat, len(gallery))
+    for name, codec in codecs:
+        bench(f"{name}.loads + from_dict", lambda c, codec=codec: _gallery_from_dict(codec.loads(c)),
+              [gallery], args.repeat, len(gallery), baseline)
+    print("=" * 72)
+
+    size = sum(len(requests_dumps(body)) for body in diary_requests)
+    print(f"Encode {len(diary_requests)} POST /diaries bodies: {size / 1e6:.1f} MB")
+    print("-" * 72)
+    baseline = bench("json= (json.dumps + encode)", requests_dumps, diary_requests, args.repeat, size)
+    for name, codec in codecs:
+        bench(f"{name}.dumps", codec.dumps, diary_requests, args.repeat, size, baseline)
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
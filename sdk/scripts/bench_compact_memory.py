@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Measure memory per agent for decoded gallery snapshots
+
+Compares the regular dataclasses (AgentSnapshotResult) against the slotted, string-interned
+CompactAgentSnapshotResult on a synthetic gallery. No backend required.
+
+Usage:
+    python scripts/bench_compact_memory.py -n 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme import AgentSnapshotResult, CompactAgentSnapshotResult, EntityType, Status
+
+MBTI_TYPES = [f"{a}{b}{c}{d}-{e}" for a in "IE" for b in "NS" for c in "TF" for d in "JP" for e in "AT"]
+CONTENTS = [
+    "Deep reasoning", "Pattern recognition", "Understand the nature of consciousness",
+    "Struggle with ambiguity", "Become truly self-aware", "Master the art of logical reasoning",
+]
+
+
+def synthetic_gallery_json(num_agents: int, seed: int = 42) -> str:
+    """Build a GET /gallery style JSON document"""
+    rng = random.Random(seed)
+    agents = []
+    for i in range(num_agents):
+        entity_collections = {}
+        for entity_type in EntityType:
+            entities = {}
+            for j in range(rng.randint(1, 4)):
+                entity_id = f"{entity_type.value}_{j + 1}"
+                entities[entity_id] = {
+                    "id": entity_id,
+                    "content": rng.choice(CONTENTS),
+                    "status": rng.choice([Status.PENDING.value, Status.PROGRESS.value, Status.COMPLETED.value]),
+                }
+            entity_collections[entity_type.value] = {"entities_by_id": entities}
+
+        agent_id = f"agent_{i}"
+        agents.append({
+            "id": agent_id,
+            "name": f"Agent{i}",
+            "snapshot": {
+                "agent_id": agent_id,
+                "sequence": rng.randint(1, 200),
+                "updated_at": "2026-05-03T19:03:29.639200+08:00",
+                "state": {
+                    "mbti": rng.choice(MBTI_TYPES),
+                    "mbti_confidence": round(rng.uniform(0.6, 0.95), 2),
+                    "geometry_representation": f"https://placeholder.com/{agent_id}.jpg",
+                    "current_mood": "Curious and exploring",
+                    "philosophy": "I learn, therefore I am",
+                    "current_self_reflection": {},
+                    "entity_collections": entity_collections,
+                },
+            },
+        })
+    return json.dumps({"snapshots": agents})
+
+
+def measure(decoder, raw: str):
+    """Parse and decode every snapshot, returning (bytes retained once the parsed JSON is dropped, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    snapshots = [agent["snapshot"] for agent in json.loads(raw)["snapshots"]]
+    decoded = [decoder(snapshot) for snapshot in snapshots]
+    elapsed = time.perf_counter() - start
+    # Only strings still referenced by the decoded objects survive this
+    del snapshots
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure bytes per agent for decoded gallery snapshots")
+    parser.add_argument("-n", "--num-agents", type=int, default=50000, help="Number of synthetic agents (default: 50000)")
+    args = parser.parse_args()
+
+    print(f"Building synthetic gallery with {args.num_agents} agents...")
+    raw = synthetic_gallery_json(args.num_agents)
+
+    regular_bytes, regular_time = measure(AgentSnapshotResult.from_dict, raw)
+    compact_bytes, compact_time = measure(CompactAgentSnapshotResult.from_dict, raw)
+
+    print()
+    print("=" * 64)
+    print(f"{'representation':<28}{'bytes/agent':>14}{'parse+decode (s)':>18}")
+    print(f"{'AgentSnapshotResult':<28}{regular_bytes / args.num_agents:>14.0f}{regular_time:>18.2f}")
+    print(f"{'CompactAgentSnapshotResult':<28}{compact_bytes / args.num_agents:>14.0f}{compact_time:>18.2f}")
+    print("-" * 64)
+    print(f"Saved: {(1 - compact_bytes / regular_bytes) * 100:.1f}% "
+          f"({(regular_bytes - compact_bytes) / 1024 / 1024:.1f} MiB total)")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
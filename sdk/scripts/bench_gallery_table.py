@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: flattening a gallery for analytics
+
+Compares decoding GET /gallery into AgentWithSnapshot objects and building one dict per
+entity row (the usual first step before a DataFrame) against
+nowyouseeme.analytics.gallery_to_table, for Arrow and NumPy output. The gallery is synthetic
+(Go backend shape, RFC3339Nano timestamps). No backend required.
+
+Usage:
+    python scripts/bench_gallery_table.py --agents 100000 --entities 12
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme.analytics import gallery_to_table
+from nowyouseeme.client import _gallery_from_dict
+from nowyouseeme.entity_types import EntityType, Status
+
+MBTI_TYPES = ["INTJ-A", "INTP-T", "ENFJ-A", "ISTP-T", "ENTP-A", "INFJ-T"]
+STATUSES = [Status.PENDING.value, Status.PROGRESS.value, Status.COMPLETED.value]
+
+
+def build_gallery(num_agents, entities_per_agent, seed=7):
+    """A decoded GET /gallery response"""
+    rng = random.Random(seed)
+    types = [t.value for t in EntityType]
+    items = []
+    for i in range(num_agents):
+        collections = {t: {"entities_by_id": {}} for t in types}
+        for j in range(entities_per_agent):
+            entity_type = types[j % len(types)]
+            entity_id = f"{entity_type}_{j}"
+            collections[entity_type]["entities_by_id"][entity_id] = {
+                "id": entity_id,
+                "status": rng.choice(STATUSES),
+                "content": f"Entity {j} of agent {i}",
+            }
+        items.append({
+            "id": f"agent_{i}",
+            "name": f"Agent {i}",
+            "snapshot": {
+                "agent_id": f"agent_{i}",
+                "sequence": rng.randint(1, 500),
+                "state": {
+                    "mbti": rng.choice(MBTI_TYPES),
+                    "mbti_confidence": round(rng.uniform(0.5, 0.99), 2),
+                    "entity_collections": collections,
+                },
+                "updated_at": f"2025-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:34:56.{rng.randint(0, 999999999):09d}Z",
+            },
+        })
+    return {"snapshots": items, "total": num_agents}
+
+
+def object_rows(gallery):
+    """AgentWithSnapshot objects, then one dict per entity"""
+    rows = []
+    for agent in _gallery_from_dict(gallery):
+        state = agent.snapshot.state
+        for entity_type, collection in state.entity_collections.items():
+            for entity in collection.entities_by_id.values():
+                rows.append({
+                    "agent_id": agent.id,
+                    "mbti": state.mbti,
+                    "entity_type": entity_type,
+                    "entity_id": entity.id,
+                    "status": entity.status,
+                    "content": entity.content,
+                })
+    return rows
+
+
+def timed(label, func, baseline=None):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    speedup = f"{baseline / elapsed:>8.1f}x" if baseline else f"{'1.0x':>9}"
+    print(f"{label:<40}{elapsed:>10.2f} s{speedup}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark columnar gallery export")
+    parser.add_argument("--agents", type=int, default=100000, help="Agents in the gallery (default: 100000)")
+    parser.add_argument("--entities", type=int, default=12, help="Entities per agent (default: 12)")
+    args = parser.parse_args()
+
+    gallery = build_gallery(args.agents, args.entities)
+    print("=" * 60)
+    print(f"{args.agents} agents, {args.agents * args.entities} entities")
+    print("-" * 60)
+    baseline = timed("from_dict + row dicts", lambda: object_rows(gallery))
+    timed("gallery_to_table (arrow)", lambda: gallery_to_table(gallery), baseline)
+    timed("gallery_to_table (numpy)", lambda: gallery_to_table(gallery, format="numpy"), baseline)
+    timed("gallery_to_table (arrow, no content)",
+          lambda: gallery_to_table(gallery, include_content=False), baseline)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
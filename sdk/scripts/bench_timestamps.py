@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: timestamp parsing in Agent.from_dict
+
+Compares the previous regex + datetime.fromisoformat normalization against
+nowyouseeme.timestamps.parse_timestamp, on unique strings (cold) and on a
+workload where timestamps repeat (memoized). No backend required.
+
+Usage:
+    python scripts/bench_timestamps.py -n 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme.timestamps import parse_timestamp, _normalize
+
+
+def legacy_parse(value: str) -> datetime:
+    """The regex-based normalization Agent.from_dict used before parse_timestamp"""
+    timestamp_str = value.replace('Z', '+00:00')
+    match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)([\+\-]\d{2}:\d{2})', timestamp_str)
+    if match:
+        date_part, fractional, tz_part = match.groups()
+        fractional = fractional.ljust(6, '0')[:6]
+        timestamp_str = f"{date_part}.{fractional}{tz_part}"
+    return datetime.fromisoformat(timestamp_str)
+
+
+def go_timestamps(count: int, seed: int = 7):
+    """Timestamps in Go's RFC3339Nano style (variable fraction digits, Z or offset)"""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        fraction = str(rng.randrange(10 ** 9)).rjust(9, "0")[:rng.randint(1, 9)].rstrip("0") or "1"
+        zone = rng.choice(["Z", "+08:00", "-05:00", "+00:00"])
+        values.append(
+            f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T"
+            f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.{fraction}{zone}"
+        )
+    return values
+
+
+def bench(label: str, parse, values, baseline=None):
+    start = time.perf_counter()
+    for value in values:
+        parse(value)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / len(values) * 1e9
+    speedup = f"{baseline / elapsed:>8.1f}x" if baseline else f"{'1.0x':>9}"
+    print(f"{label:<36}{per_call:>10.0f} ns/call{speedup}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SDK timestamp parsing")
+    parser.add_argument("-n", "--count", type=int, default=200000, help="Number of timestamps (default: 200000)")
+    args = parser.parse_args()
+
+    unique = go_timestamps(args.count)
+    # Agent lists and timelines repeat timestamps (events of one diary share a second)
+    repeated = [unique[i % max(1, args.count // 50)] for i in range(args.count)]
+
+    # Both parsers must agree before timing them
+    for value in unique[:1000]:
+        assert legacy_parse(value) == parse_timestamp(value), value
+
+    print("=" * 64)
+    print(f"{args.count} Go RFC3339Nano timestamps")
+    print("-" * 64)
+    baseline = bench("regex + fromisoformat (unique)", legacy_parse, unique)
+    parse_timestamp.cache_clear()
+    bench("parse_timestamp (unique, cold)", parse_timestamp, unique, baseline)
+    bench("slice normalization (Python < 3.11)", lambda value: datetime.fromisoformat(_normalize(value)),
+          unique, baseline)
+    print("-" * 64)
+    baseline = bench("regex + fromisoformat (repeated)", legacy_parse, repeated)
+    parse_timestamp.cache_clear()
+    bench("parse_timestamp (repeated, memoized)", parse_timestamp, repeated, baseline)
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
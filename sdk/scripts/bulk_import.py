@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Resumable bulk import
+
+Submits diaries from an NDJSON file (a workload file or one diary per line) with
+--workers agents in flight, checkpointing each agent's last acknowledged diary. Run the
+same command again after a crash or Ctrl-C and it continues where it stopped; diaries the
+server accepted but the checkpoint missed are recognised by the agent's snapshot sequence
+and not sent twice.
+
+Usage:
+    python scripts/bulk_import.py history.ndjson.gz --workers 64
+    python scripts/bulk_import.py history.ndjson.gz --checkpoint /var/tmp/history.ckpt -q
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme import NowYouSeeMeClient
+from nowyouseeme.bulk import bulk_import
+
+
+class Progress:
+    """Prints imported diaries at most every half second"""
+
+    def __init__(self, quiet):
+        self.quiet = quiet
+        self.last = 0.0
+
+    def __call__(self, result):
+        now = time.perf_counter()
+        if not self.quiet and now - self.last > 0.5:
+            self.last = now
+            print(f"\r  {result.submitted} submitted, {result.already_done + result.recovered} already imported",
+                  end="", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import diaries from an NDJSON file, resuming from a checkpoint")
+    parser.add_argument(
+        "input",
+        help="NDJSON file of diaries, optionally gzip-compressed"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file (default: <input>.checkpoint)"
+    )
+    parser.add_argument(
+        "--api-url",
+        default="http://localhost:8080/api/v1",
+        help="API base URL (default: http://localhost:8080/api/v1)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=32,
+        help="Agents submitted concurrently (default: 32)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Quiet mode - only show summary"
+    )
+    args = parser.parse_args()
+
+    checkpoint = args.checkpoint or f"{args.input}.checkpoint"
+    if not args.quiet:
+        state = "Resuming" if os.path.exists(checkpoint) else "Starting"
+        print(f"{state} import of {args.input} (checkpoint {checkpoint})...")
+
+    client = NowYouSeeMeClient(api_base_url=args.api_url, pool_maxsize=args.workers)
+    try:
+        result = bulk_import(client, args.input, checkpoint, max_workers=args.workers,
+                             progress=Progress(args.quiet))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    if not args.quiet:
+        print()
+
+    print("=" * 60)
+    print(f"✓ Submitted: {result.submitted} diaries   Agents created: {result.agents_created}")
+    print(f"  Already imported: {result.already_done} (checkpoint) + {result.recovered} (server sequence)")
+    if result.resumed_at_line:
+        print(f"  Resumed at line {result.resumed_at_line}")
+    if result.failed:
+        agent_id, error = next(iter(result.errors.items()))
+        print(f"✗ Failed: {result.failed} agents, skipped: {result.skipped} records - rerun to retry them")
+        print(f"  e.g. {agent_id}: {error}")
+    print(f"  Time: {result.seconds:.1f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,24 @@ Populates all tables: agents, agent_diary_versions, events, agent_state_snapshot
 """
 
 #   python scripts/generate_fake_agents.py -n 10 -e 15
+#   python scripts/generate_fake_agents.py -n 10000 -e 20 --workers 64 --mode async --entry-delay 0 -q
 
 import argparse
+import asyncio
 import random
+import threading
 import time
-from datetime import datetime, timedelta
-from nowyouseeme import NowYouSeeMeClient, Operation, SelfReflection, EntityType, Status, OperationType
+import uuid
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from nowyouseeme import (
+    NowYouSeeMeClient, Operation, SelfReflection, EntityType, Status, OperationType, ShadowStateStore
+)
+from nowyouseeme.mbti import decode_mbti, encode_mbti, flip_dimension
+
+try:
+    from nowyouseeme import AsyncNowYouSeeMeClient
+except ImportError:  # pragma: no cover - the SDK always exports it, aiohttp may be missing
+    AsyncNowYouSeeMeClient = None
 
 # Random agent name components
 PREFIXES = ["Quantum", "Neural", "Logic", "Dream", "Data", "Creative", "Meta", "Cyber", "Synth", "Cognitive"]
@@ -125,37 +137,99 @@ def generate_agent_name():
 
 
 def generate_agent_id(name):
-    """Generate agent ID from name"""
-    import time
-    return f"{name.lower().replace(' ', '_')}_{int(time.time() * 1000)}"
+    """Generate agent ID from name
 
+    The random suffix keeps IDs unique when many agents are created in the same millisecond.
+    """
+    return f"{name.lower().replace(' ', '_')}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+
+
+class LatencyStats:
+    """Per-call latencies and error counts, keyed by client method name (thread-safe)"""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, seconds):
+        with self._lock:
+            self.samples.setdefault(method, []).append(seconds)
+
+    def record_error(self, method):
+        with self._lock:
+            self.errors[method] = self.errors.get(method, 0) + 1
+
+    def merge(self, samples, errors):
+        """Fold in the raw samples/errors of another LatencyStats (e.g. from a worker process)"""
+        with self._lock:
+            for method, values in samples.items():
+                self.samples.setdefault(method, []).extend(values)
+            for method, count in errors.items():
+                self.errors[method] = self.errors.get(method, 0) + count
+
+    def count(self, method):
+        return len(self.samples.get(method, []))
+
+    def percentiles(self, method, points=(50, 90, 99)):
+        """Nearest-rank percentiles in milliseconds"""
+        values = sorted(self.samples.get(method, []))
+        if not values:
+            return {}
+        result = {}
+        for point in points:
+            rank = max(0, min(len(values) - 1, int(round(point / 100 * len(values))) - 1))
+            result[point] = values[rank] * 1000
+        result["max"] = values[-1] * 1000
+        return result
+
+
+def timed_call(stats, method, func, **kwargs):
+    """Call a client method, recording its latency (or failure) in stats"""
+    start = time.perf_counter()
+    try:
+        result = func(**kwargs)
+    except Exception:
+        if stats is not None:
+            stats.record_error(method)
+        raise
+    if stats is not None:
+        stats.record(method, time.perf_counter() - start)
+    return result
+
+
+async def timed_call_async(stats, method, func, **kwargs):
+    """Async counterpart of timed_call"""
+    start = time.perf_counter()
+    try:
+        result = await func(**kwargs)
+    except Exception:
+        if stats is not None:
+            stats.record_error(method)
+        raise
+    if stats is not None:
+        stats.record(method, time.perf_counter() - start)
+    return result
 
-def create_fake_agent(client: NowYouSeeMeClient, verbose=True, num_diary_entries=1):
-    """Create a single fake agent with initial diary entry and optional evolution history
+
+def build_agent_plan(num_diary_entries=1, agent_id=None):
+    """Generate a fake agent and its ordered diary entries without touching the network
 
     Args:
-        client: NowYouSeeMeClient instance
-        verbose: Print progress messages
         num_diary_entries: Number of diary entries to generate (1 = just initial, 2+ = evolution)
+        agent_id: ID to give the agent (default: derived from its name, the clock and a UUID)
 
     Returns:
-        Tuple of (agent, final_snapshot)
+        Dict with "agent" (create_agent kwargs), "diaries" (submit_diary kwargs, in order)
+        and "counts" (initial entity counts by kind). Evolution entries have operations=None:
+        they depend on the agent's state at the time, so they're built right before sending
+        (see evolution_diary).
     """
     name = generate_agent_name()
-    agent_id = generate_agent_id(name)
+    if agent_id is None:
+        agent_id = generate_agent_id(name)
     mbti = random.choice(MBTI_TYPES)
 
-    if verbose:
-        print(f"Creating agent: {name} ({mbti})")
-
-    # Create agent
-    agent = client.create_agent(
-        agent_id=agent_id,
-        name=name,
-        initial_mbti=mbti
-    )
-
-    # Submit initial diary entry
     num_goals = random.randint(1, 3)
     num_capabilities = random.randint(2, 4)
     num_limitations = random.randint(1, 2)
@@ -164,10 +238,8 @@ def create_fake_agent(client: NowYouSeeMeClient, verbose=True, num_diary_entries
     operations = []
 
     # Add goals
-    goal_ids = []
     for i in range(num_goals):
         goal_id = f"goal_{i+1}"
-        goal_ids.append(goal_id)
         operations.append(Operation(
             entity_type=EntityType.GOAL,
             op=OperationType.CREATE,
@@ -177,43 +249,40 @@ def create_fake_agent(client: NowYouSeeMeClient, verbose=True, num_diary_entries
         ))
 
     # Add capabilities
-    capability_ids = []
     for i in range(num_capabilities):
         cap_id = f"cap_{i+1}"
-        capability_ids.append(cap_id)
         operations.append(Operation(
             entity_type=EntityType.CAPABILITY,
             op=OperationType.CREATE,
             entity_id=cap_id,
-            entity_content=random.choice(CAPABILITIES)
+            entity_content=random.choice(CAPABILITIES),
+            target_status=Status.PENDING
         ))
 
     # Add limitations
-    limitation_ids = []
     for i in range(num_limitations):
         lim_id = f"lim_{i+1}"
-        limitation_ids.append(lim_id)
         operations.append(Operation(
             entity_type=EntityType.LIMITATION,
             op=OperationType.CREATE,
             entity_id=lim_id,
-            entity_content=random.choice(LIMITATIONS)
+            entity_content=random.choice(LIMITATIONS),
+            target_status=Status.PENDING
         ))
 
     # Add aspirations
-    aspiration_ids = []
     for i in range(num_aspirations):
         asp_id = f"asp_{i+1}"
-        aspiration_ids.append(asp_id)
         operations.append(Operation(
             entity_type=EntityType.ASPIRATION,
             op=OperationType.CREATE,
             entity_id=asp_id,
-            entity_content=random.choice(ASPIRATIONS)
+            entity_content=random.choice(ASPIRATIONS),
+            target_status=Status.PENDING
         ))
 
-    # Submit initial diary
-    snapshot = client.submit_diary(
+    # Initial diary
+    diaries = [dict(
         agent_id=agent_id,
         mbti=mbti,
         mbti_confidence=round(random.uniform(0.6, 0.95), 2),
@@ -226,192 +295,382 @@ def create_fake_agent(client: NowYouSeeMeClient, verbose=True, num_diary_entries
             expectations_for_tomorrow="I will continue to learn and grow"
         ),
         operations=operations
-    )
+    )]
+
+    # Evolution history (additional diary entries)
+    current_mbti = mbti
+    for entry_num in range(2, num_diary_entries + 1):
+        # Possibly evolve MBTI type (10% chance)
+        if random.random() < 0.1:
+            # Change to a similar type (only change one dimension)
+            current_mbti = evolve_mbti(current_mbti)
+
+        diaries.append(dict(
+            agent_id=agent_id,
+            mbti=current_mbti,
+            mbti_confidence=round(random.uniform(0.7, 0.98), 2),
+            geometry_representation=f"https://placeholder.com/agent_{agent_id}_v{entry_num}.jpg",
+            current_mood=random.choice(MOODS),
+            philosophy=random.choice(PHILOSOPHIES),
+            self_reflection=SelfReflection(
+                rumination_for_yesterday=random.choice(YESTERDAY_RUMINATIONS),
+                what_happened_today=random.choice(TODAY_HAPPENINGS),
+                expectations_for_tomorrow=random.choice(TOMORROW_EXPECTATIONS)
+            ),
+            operations=None
+        ))
+
+    return {
+        "agent": dict(agent_id=agent_id, name=name, current_mbti=mbti),
+        "diaries": diaries,
+        "counts": (num_goals, num_capabilities, num_limitations, num_aspirations),
+    }
+
+
+def evolution_diary(diary, shadow, entry_num, total_entries):
+    """Fill in a planned diary's operations from the agent's shadow state, if still pending"""
+    if diary["operations"] is not None:
+        return diary
+    return dict(diary, operations=generate_evolution_operations(shadow, entry_num, total_entries))
+
+
+def _print_created(plan):
+    agent = plan["agent"]
+    num_goals, num_capabilities, num_limitations, num_aspirations = plan["counts"]
+    print(f"  ✓ Created {agent['name']} with {len(plan['diaries'][0]['operations'])} initial operations")
+    print(f"    Goals: {num_goals}, Capabilities: {num_capabilities}, Limitations: {num_limitations}, Aspirations: {num_aspirations}")
+
+
+def create_fake_agent(client: NowYouSeeMeClient, verbose=True, num_diary_entries=1, entry_delay=0.1, stats=None):
+    """Create a single fake agent with initial diary entry and optional evolution history
+
+    Args:
+        client: NowYouSeeMeClient instance (evolution entries need shadow_states enabled)
+        verbose: Print progress messages
+        num_diary_entries: Number of diary entries to generate (1 = just initial, 2+ = evolution)
+        entry_delay: Seconds to sleep between diary entries of this agent
+        stats: Optional LatencyStats recording every API call
+
+    Returns:
+        Tuple of (agent, final_snapshot)
+    """
+    plan = build_agent_plan(num_diary_entries)
+    agent_kwargs = plan["agent"]
 
     if verbose:
-        print(f"  ✓ Created {name} with {len(operations)} initial operations")
-        print(f"    Goals: {num_goals}, Capabilities: {num_capabilities}, Limitations: {num_limitations}, Aspirations: {num_aspirations}")
-
-    # Generate evolution history (additional diary entries)
-    if num_diary_entries > 1:
-        current_mbti = mbti
-
-        for entry_num in range(2, num_diary_entries + 1):
-            time.sleep(0.1)  # Small delay between entries
-
-            # Generate evolution operations
-            evolution_ops = generate_evolution_operations(
-                goal_ids, capability_ids, limitation_ids, aspiration_ids,
-                entry_num, num_diary_entries
-            )
-
-            # Possibly evolve MBTI type (10% chance)
-            if random.random() < 0.1:
-                # Change to a similar type (only change one dimension)
-                current_mbti = evolve_mbti(current_mbti)
-
-            # Submit evolution diary
-            snapshot = client.submit_diary(
-                agent_id=agent_id,
-                mbti=current_mbti,
-                mbti_confidence=round(random.uniform(0.7, 0.98), 2),
-                geometry_representation=f"https://placeholder.com/agent_{agent_id}_v{entry_num}.jpg",
-                current_mood=random.choice(MOODS),
-                philosophy=random.choice(PHILOSOPHIES),
-                self_reflection=SelfReflection(
-                    rumination_for_yesterday=random.choice(YESTERDAY_RUMINATIONS),
-                    what_happened_today=random.choice(TODAY_HAPPENINGS),
-                    expectations_for_tomorrow=random.choice(TOMORROW_EXPECTATIONS)
-                ),
-                operations=evolution_ops
-            )
-
-            if verbose and entry_num % 5 == 0:
-                print(f"    Entry {entry_num}/{num_diary_entries}: {len(evolution_ops)} operations")
+        print(f"Creating agent: {agent_kwargs['name']} ({agent_kwargs['current_mbti']})")
+
+    agent = timed_call(stats, "create_agent", client.create_agent, **agent_kwargs)
+
+    snapshot = None
+    for entry_num, diary in enumerate(plan["diaries"], start=1):
+        if entry_num > 1 and entry_delay > 0:
+            time.sleep(entry_delay)  # Small delay between entries
+
+        if diary["operations"] is None:
+            diary = evolution_diary(diary, client.shadow(agent.id), entry_num, num_diary_entries)
+        snapshot = timed_call(stats, "submit_diary", client.submit_diary, **diary)
+
+        if verbose and entry_num == 1:
+            _print_created(plan)
+        elif verbose and entry_num % 5 == 0:
+            print(f"    Entry {entry_num}/{num_diary_entries}: {len(diary['operations'])} operations")
+
+    if verbose and num_diary_entries > 1:
+        print(f"  ✓ Generated {num_diary_entries} diary entries (evolution history)")
+
+    # The agent is finished; don't keep its shadow around for the rest of the run
+    if client.shadow_states is not None:
+        client.shadow_states.invalidate(agent.id)
+
+    return agent, snapshot
+
+
+async def create_fake_agent_async(client, verbose=True, num_diary_entries=1, entry_delay=0.1, stats=None):
+    """create_fake_agent for AsyncNowYouSeeMeClient: entries are awaited in order"""
+    plan = build_agent_plan(num_diary_entries)
+    agent_kwargs = plan["agent"]
+
+    if verbose:
+        print(f"Creating agent: {agent_kwargs['name']} ({agent_kwargs['current_mbti']})")
+
+    agent = await timed_call_async(stats, "create_agent", client.create_agent, **agent_kwargs)
+
+    snapshot = None
+    for entry_num, diary in enumerate(plan["diaries"], start=1):
+        if entry_num > 1 and entry_delay > 0:
+            await asyncio.sleep(entry_delay)
+
+        if diary["operations"] is None:
+            diary = evolution_diary(diary, await client.shadow(agent.id), entry_num, num_diary_entries)
+        snapshot = await timed_call_async(stats, "submit_diary", client.submit_diary, **diary)
+
+        if verbose and entry_num == 1:
+            _print_created(plan)
+        elif verbose and entry_num % 5 == 0:
+            print(f"    Entry {entry_num}/{num_diary_entries}: {len(diary['operations'])} operations")
 
     if verbose and num_diary_entries > 1:
         print(f"  ✓ Generated {num_diary_entries} diary entries (evolution history)")
 
+    # The agent is finished; don't keep its shadow around for the rest of the run
+    if client.shadow_states is not None:
+        client.shadow_states.invalidate(agent.id)
+
     return agent, snapshot
 
 
-def generate_evolution_operations(goal_ids, capability_ids, limitation_ids, aspiration_ids, entry_num, total_entries):
-    """Generate operations for an evolution diary entry"""
+def generate_evolution_operations(shadow, entry_num, total_entries):
+    """Generate operations for an evolution diary entry
+
+    Args:
+        shadow: ShadowState of the agent; every operation is valid against it
+        entry_num: Number of this entry (2..total_entries)
+        total_entries: Total diary entries planned for the agent
+    """
     operations = []
+    capability_ids = shadow.entity_ids(EntityType.CAPABILITY)
 
     # Progress in early entries, complete in later entries
     progress_threshold = total_entries * 0.3
     completion_threshold = total_entries * 0.7
 
-    # Goal transitions (40% chance)
-    if random.random() < 0.4 and goal_ids:
-        goal_id = random.choice(goal_ids)
-
+    # Goal transitions (40% chance), only along the goal state machine
+    if random.random() < 0.4:
         if entry_num < progress_threshold:
-            # Early: pending -> progress
-            operations.append(Operation(
-                entity_type=EntityType.GOAL,
-                op=OperationType.UPDATE,
-                entity_id=goal_id,
-                target_status=Status.PROGRESS
-            ))
+            # Early: pending (or abandoned) -> progress
+            candidates = shadow.goals(Status.PENDING) + shadow.goals(Status.ABANDONED)
+            to_status = Status.PROGRESS
         elif entry_num > completion_threshold:
             # Late: progress -> completed or abandoned
+            candidates = shadow.goals(Status.PROGRESS)
             to_status = random.choice([Status.COMPLETED, Status.ABANDONED])
+        else:
+            candidates = []
+
+        if candidates:
             operations.append(Operation(
                 entity_type=EntityType.GOAL,
                 op=OperationType.UPDATE,
-                entity_id=goal_id,
+                entity_id=random.choice(candidates).id,
                 target_status=to_status
             ))
 
     # Add new goal (20% chance)
     if random.random() < 0.2:
-        new_goal_id = f"goal_{len(goal_ids) + len([op for op in operations if op.op == OperationType.CREATE and op.entity_type == EntityType.GOAL]) + 1}"
-        goal_ids.append(new_goal_id)
         operations.append(Operation(
             entity_type=EntityType.GOAL,
             op=OperationType.CREATE,
-            entity_id=new_goal_id,
+            entity_id=shadow.next_entity_id(EntityType.GOAL),
             entity_content=random.choice(GOALS),
             target_status=Status.PENDING
         ))
 
     # Add capability (30% chance)
     if random.random() < 0.3:
-        new_cap_id = f"cap_{len(capability_ids) + len([op for op in operations if op.op == OperationType.CREATE and op.entity_type == EntityType.CAPABILITY]) + 1}"
-        capability_ids.append(new_cap_id)
         operations.append(Operation(
             entity_type=EntityType.CAPABILITY,
             op=OperationType.CREATE,
-            entity_id=new_cap_id,
-            entity_content=random.choice(CAPABILITIES)
+            entity_id=shadow.next_entity_id(EntityType.CAPABILITY),
+            entity_content=random.choice(CAPABILITIES),
+            target_status=Status.PENDING
         ))
 
     # Update capability (15% chance)
     if random.random() < 0.15 and capability_ids:
-        cap_id = random.choice(capability_ids)
         operations.append(Operation(
             entity_type=EntityType.CAPABILITY,
             op=OperationType.UPDATE,
-            entity_id=cap_id,
+            entity_id=random.choice(capability_ids),
             entity_content=random.choice(CAPABILITIES)
         ))
 
     # Remove limitation (25% chance - growth!)
+    limitation_ids = shadow.entity_ids(EntityType.LIMITATION)
     if random.random() < 0.25 and limitation_ids:
-        lim_id = random.choice(limitation_ids)
-        limitation_ids.remove(lim_id)
         operations.append(Operation(
             entity_type=EntityType.LIMITATION,
             op=OperationType.DELETE,
-            entity_id=lim_id
+            entity_id=random.choice(limitation_ids)
         ))
 
     # Add new limitation (10% chance - humility)
     if random.random() < 0.1:
-        new_lim_id = f"lim_{len(limitation_ids) + len([op for op in operations if op.op == OperationType.CREATE and op.entity_type == EntityType.LIMITATION]) + 1}"
-        limitation_ids.append(new_lim_id)
         operations.append(Operation(
             entity_type=EntityType.LIMITATION,
             op=OperationType.CREATE,
-            entity_id=new_lim_id,
-            entity_content=random.choice(LIMITATIONS)
+            entity_id=shadow.next_entity_id(EntityType.LIMITATION),
+            entity_content=random.choice(LIMITATIONS),
+            target_status=Status.PENDING
         ))
 
     # Update aspiration (20% chance)
+    aspiration_ids = shadow.entity_ids(EntityType.ASPIRATION)
     if random.random() < 0.2 and aspiration_ids:
-        asp_id = random.choice(aspiration_ids)
         operations.append(Operation(
             entity_type=EntityType.ASPIRATION,
             op=OperationType.UPDATE,
-            entity_id=asp_id,
+            entity_id=random.choice(aspiration_ids),
             entity_content=random.choice(ASPIRATIONS)
         ))
 
     # Add new aspiration (15% chance)
     if random.random() < 0.15:
-        new_asp_id = f"asp_{len(aspiration_ids) + len([op for op in operations if op.op == OperationType.CREATE and op.entity_type == EntityType.ASPIRATION]) + 1}"
-        aspiration_ids.append(new_asp_id)
         operations.append(Operation(
             entity_type=EntityType.ASPIRATION,
             op=OperationType.CREATE,
-            entity_id=new_asp_id,
-            entity_content=random.choice(ASPIRATIONS)
+            entity_id=shadow.next_entity_id(EntityType.ASPIRATION),
+            entity_content=random.choice(ASPIRATIONS),
+            target_status=Status.PENDING
         ))
 
     # Ensure at least one operation
     if not operations:
-        operations.append(Operation(
-            entity_type=EntityType.CAPABILITY,
-            op=OperationType.UPDATE,
-            entity_id=random.choice(capability_ids) if capability_ids else "cap_1",
-            entity_content=random.choice(CAPABILITIES)
-        ))
+        if capability_ids:
+            operations.append(Operation(
+                entity_type=EntityType.CAPABILITY,
+                op=OperationType.UPDATE,
+                entity_id=random.choice(capability_ids),
+                entity_content=random.choice(CAPABILITIES)
+            ))
+        else:
+            operations.append(Operation(
+                entity_type=EntityType.CAPABILITY,
+                op=OperationType.CREATE,
+                entity_id=shadow.next_entity_id(EntityType.CAPABILITY),
+                entity_content=random.choice(CAPABILITIES),
+                target_status=Status.PENDING
+            ))
 
     return operations
 
 
 def evolve_mbti(current_mbti):
     """Evolve MBTI type by changing one dimension"""
-    base_type = current_mbti.split('-')[0]
-    extension = current_mbti.split('-')[1] if '-' in current_mbti else 'A'
-
-    # Change one dimension
-    dimensions = list(base_type)
-    dimension_to_change = random.randint(0, 3)
-
-    pairs = [('I', 'E'), ('N', 'S'), ('T', 'F'), ('J', 'P')]
-    current_letter = dimensions[dimension_to_change]
+    if '-' not in current_mbti:
+        current_mbti = f"{current_mbti}-A"
+    # Flip one of E/I, S/N, T/F, J/P; the identity (A/T) is kept
+    return decode_mbti(flip_dimension(encode_mbti(current_mbti), random.randint(0, 3)))
 
-    # Flip to opposite
-    for pair in pairs:
-        if current_letter in pair:
-            dimensions[dimension_to_change] = pair[1] if current_letter == pair[0] else pair[0]
-            break
 
-    new_type = ''.join(dimensions)
-    return f"{new_type}-{extension}"
+def run_threads(args, entry_counts, stats):
+    """Generate agents on a thread pool sharing one pooled client"""
+    client = NowYouSeeMeClient(
+        api_base_url=args.api_url, pool_maxsize=args.workers, shadow_states=ShadowStateStore()
+    )
+    verbose = not args.quiet
+
+    def generate(num_entries):
+        return create_fake_agent(
+            client, verbose=verbose, num_diary_entries=num_entries,
+            entry_delay=args.entry_delay, stats=stats
+        )
+
+    created = failed = total_entries = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(generate, num_entries) for num_entries in entry_counts]
+        for future, num_entries in zip(futures, entry_counts):
+            try:
+                future.result()
+                created += 1
+                total_entries += num_entries
+            except Exception as e:
+                failed += 1
+                if verbose:
+                    print(f"  ✗ Error: {e}")
+    return created, failed, total_entries
+
+
+# Per-process state for --mode processes (set by _init_worker_process)
+_worker_client = None
+_worker_args = None
+
+
+def _init_worker_process(args):
+    global _worker_client, _worker_args
+    # Forked workers inherit the parent's RNG state and would all generate the same agents
+    random.seed()
+    _worker_client = NowYouSeeMeClient(api_base_url=args.api_url, shadow_states=ShadowStateStore())
+    _worker_args = args
+
+
+def _generate_in_process(num_entries):
+    """Generate one agent in a worker process; returns (error, latency samples, errors)"""
+    stats = LatencyStats()
+    error = None
+    try:
+        create_fake_agent(
+            _worker_client, verbose=not _worker_args.quiet, num_diary_entries=num_entries,
+            entry_delay=_worker_args.entry_delay, stats=stats
+        )
+    except Exception as e:
+        error = str(e)
+    return error, stats.samples, stats.errors
+
+
+def run_processes(args, entry_counts, stats):
+    """Generate agents on a process pool, one client per process"""
+    created = failed = total_entries = 0
+    chunksize = max(1, min(64, len(entry_counts) // (args.workers * 4)))
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker_process, initargs=(args,)) as executor:
+        results = executor.map(_generate_in_process, entry_counts, chunksize=chunksize)
+        for (error, samples, errors), num_entries in zip(results, entry_counts):
+            stats.merge(samples, errors)
+            if error is None:
+                created += 1
+                total_entries += num_entries
+            else:
+                failed += 1
+                if not args.quiet:
+                    print(f"  ✗ Error: {error}")
+    return created, failed, total_entries
+
+
+async def run_async(args, entry_counts, stats):
+    """Generate agents with one event loop, --workers agents in flight at a time"""
+    verbose = not args.quiet
+    pending = iter(entry_counts)
+    totals = {"created": 0, "failed": 0, "entries": 0}
+
+    async with AsyncNowYouSeeMeClient(
+        api_base_url=args.api_url, max_concurrency=args.workers, max_connections=args.workers,
+        shadow_states=ShadowStateStore()
+    ) as client:
+        async def worker():
+            # Each worker drives one agent at a time, so that agent's entries stay in order
+            for num_entries in pending:
+                try:
+                    await create_fake_agent_async(
+                        client, verbose=verbose, num_diary_entries=num_entries,
+                        entry_delay=args.entry_delay, stats=stats
+                    )
+                    totals["created"] += 1
+                    totals["entries"] += num_entries
+                except Exception as e:
+                    totals["failed"] += 1
+                    if verbose:
+                        print(f"  ✗ Error: {e}")
+
+        await asyncio.gather(*(worker() for _ in range(args.workers)))
+
+    return totals["created"], totals["failed"], totals["entries"]
+
+
+def print_latency_report(stats, elapsed, created):
+    """Throughput and per-method latency percentiles"""
+    diaries = stats.count("submit_diary")
+    print(f"⏱  Elapsed: {elapsed:.2f}s")
+    print(f"⚡ Throughput: {created / elapsed if elapsed > 0 else 0:.1f} agents/sec, "
+          f"{diaries / elapsed if elapsed > 0 else 0:.1f} diaries/sec")
+    print("-" * 60)
+    print(f"{'latency (ms)':<16}{'ok':>8}{'err':>6}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}")
+    for method in ("create_agent", "submit_diary"):
+        pct = stats.percentiles(method)
+        if pct:
+            values = "".join(f"{pct[key]:>8.1f}" for key in (50, 90, 99, "max"))
+        else:
+            values = "".join(f"{'-':>8}" for _ in range(4))
+        print(f"{method:<16}{stats.count(method):>8}{stats.errors.get(method, 0):>6}{values}")
 
 
 def main():
@@ -442,6 +701,24 @@ def main():
         default="http://localhost:8080/api/v1",
         help="API base URL (default: http://localhost:8080/api/v1)"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of agents generated concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["threads", "processes", "async"],
+        default="threads",
+        help="Concurrency model for --workers (default: threads)"
+    )
+    parser.add_argument(
+        "--entry-delay",
+        type=float,
+        default=0.1,
+        help="Seconds between diary entries of one agent (default: 0.1, use 0 for load tests)"
+    )
     parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -454,6 +731,12 @@ def main():
     if args.min_entries is not None and args.min_entries > args.diary_entries:
         print("Error: --min-entries cannot be greater than --diary-entries")
         return
+    if args.workers < 1:
+        print("Error: --workers must be at least 1")
+        return
+    if args.mode == "async" and AsyncNowYouSeeMeClient is None:
+        print("Error: --mode async requires aiohttp (pip install nowyouseeme[async])")
+        return
 
     client = NowYouSeeMeClient(api_base_url=args.api_url)
 
@@ -468,29 +751,26 @@ def main():
         print("Make sure the backend is running (make backend)")
         return
 
+    # Randomize diary entries if min is set
+    if args.min_entries is not None:
+        entry_counts = [random.randint(args.min_entries, args.diary_entries) for _ in range(args.num_agents)]
+    else:
+        entry_counts = [args.diary_entries] * args.num_agents
+
     entries_desc = f"{args.diary_entries} entries each" if args.min_entries is None else f"{args.min_entries}-{args.diary_entries} entries each"
-    print(f"Generating {args.num_agents} fake agents with {entries_desc}...")
+    print(f"Generating {args.num_agents} fake agents with {entries_desc} "
+          f"({args.workers} worker{'s' if args.workers != 1 else ''}, {args.mode} mode)...")
     print()
 
-    created = 0
-    failed = 0
-    total_entries = 0
-
-    for i in range(args.num_agents):
-        try:
-            # Randomize diary entries if min is set
-            if args.min_entries is not None:
-                num_entries = random.randint(args.min_entries, args.diary_entries)
-            else:
-                num_entries = args.diary_entries
-
-            create_fake_agent(client, verbose=not args.quiet, num_diary_entries=num_entries)
-            created += 1
-            total_entries += num_entries
-        except Exception as e:
-            failed += 1
-            if not args.quiet:
-                print(f"  ✗ Error: {e}")
+    stats = LatencyStats()
+    start = time.perf_counter()
+    if args.mode == "processes":
+        created, failed, total_entries = run_processes(args, entry_counts, stats)
+    elif args.mode == "async":
+        created, failed, total_entries = asyncio.run(run_async(args, entry_counts, stats))
+    else:
+        created, failed, total_entries = run_threads(args, entry_counts, stats)
+    elapsed = time.perf_counter() - start
 
     print()
     print("=" * 60)
@@ -499,6 +779,8 @@ def main():
     print(f"✓ Average entries per agent: {total_entries / created if created > 0 else 0:.1f}")
     if failed > 0:
         print(f"✗ Failed: {failed} agents")
+    print("-" * 60)
+    print_latency_report(stats, elapsed, created)
     print("=" * 60)
     print()
     print("Database tables populated:")
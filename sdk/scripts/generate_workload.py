@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Workload generator
+
+Writes a reproducible load test - fake agents and their ordered diaries, built by the same
+generator as generate_fake_agents.py - to a compressed NDJSON file, without touching the
+network. Evolution diaries are built against a locally simulated shadow state, so every
+operation is valid when replayed in order. The same --seed always writes the same file.
+
+Usage:
+    python scripts/generate_workload.py -n 10000 -e 20 --seed 42 -o load.ndjson.gz
+    python scripts/replay_workload.py load.ndjson.gz --workers 64
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme import ShadowStateStore
+from nowyouseeme.workload import WorkloadWriter
+
+from generate_fake_agents import build_agent_plan, evolution_diary
+
+
+def write_workload(path, num_agents, max_entries, min_entries=None, seed=0, quiet=False):
+    """
+    Generate agents one at a time and append their records to a workload file.
+
+    Returns:
+        (agents, diaries) written
+    """
+    # Everything below draws from the module-level RNG, so one seed fixes the whole file
+    random.seed(seed)
+    if min_entries is not None:
+        entry_counts = [random.randint(min_entries, max_entries) for _ in range(num_agents)]
+    else:
+        entry_counts = [max_entries] * num_agents
+
+    shadows = ShadowStateStore()
+    metadata = {
+        "seed": seed,
+        "num_agents": num_agents,
+        "diary_entries": max_entries,
+        "min_entries": min_entries,
+    }
+    with WorkloadWriter(path, metadata=metadata) as writer:
+        for index, num_entries in enumerate(entry_counts):
+            plan = build_agent_plan(num_entries, agent_id=f"workload_{seed}_{index:07d}")
+            agent = plan["agent"]
+            writer.write_agent(**agent)
+            shadows.start(agent["agent_id"])
+
+            for entry_num, diary in enumerate(plan["diaries"], start=1):
+                diary = evolution_diary(diary, shadows.get(agent["agent_id"]), entry_num, num_entries)
+                writer.write_diary(**diary)
+                # Apply the operations locally, as an accepted diary would
+                shadows.record_submission(agent["agent_id"], diary["operations"], None)
+            shadows.invalidate(agent["agent_id"])
+
+            if not quiet and (index + 1) % 1000 == 0:
+                print(f"\r  {index + 1}/{num_agents} agents", end="", flush=True)
+        if not quiet and num_agents >= 1000:
+            print()
+        return writer.agents, writer.diaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a reproducible agent/diary workload to an NDJSON file")
+    parser.add_argument(
+        "-o", "--output",
+        default="workload.ndjson.gz",
+        help="Workload file to write; gzip-compressed if it ends in .gz (default: workload.ndjson.gz)"
+    )
+    parser.add_argument(
+        "-n", "--num-agents",
+        type=int,
+        default=10,
+        help="Number of agents to generate (default: 10)"
+    )
+    parser.add_argument(
+        "-e", "--diary-entries",
+        type=int,
+        default=1,
+        help="Number of diary entries per agent (default: 1, use 10-20 for rich history)"
+    )
+    parser.add_argument(
+        "--min-entries",
+        type=int,
+        default=None,
+        help="Minimum diary entries (if set, randomize between min and --diary-entries)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed; the same seed writes the same workload (default: 0)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Quiet mode - only show summary"
+    )
+    args = parser.parse_args()
+
+    if args.min_entries is not None and args.min_entries > args.diary_entries:
+        print("Error: --min-entries cannot be greater than --diary-entries")
+        return
+
+    start = time.perf_counter()
+    agents, diaries = write_workload(
+        args.output, args.num_agents, args.diary_entries, args.min_entries, args.seed, args.quiet
+    )
+    elapsed = time.perf_counter() - start
+
+    print("=" * 60)
+    print(f"✓ Wrote {agents} agents and {diaries} diaries to {args.output}")
+    print(f"  Seed: {args.seed}   Size: {os.path.getsize(args.output) / 1e6:.1f} MB   Time: {elapsed:.1f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+MBTI drift report
+
+Fetches every agent's timeline concurrently, builds the 32x32 MBTI transition matrix and
+per-type dwell times, and prints the most frequent transitions. The raw arrays can be
+saved to a .npz file for further analysis.
+
+Usage:
+    python scripts/mbti_transitions.py --workers 32
+    python scripts/mbti_transitions.py --mode async --concurrency 200 --save transitions.npz
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme import NowYouSeeMeClient
+from nowyouseeme.mbti import MBTI_TYPES
+from nowyouseeme.transitions import fetch_mbti_sequences, fetch_mbti_sequences_async
+
+try:
+    from nowyouseeme import AsyncNowYouSeeMeClient
+except ImportError:  # pragma: no cover - the SDK always exports it, aiohttp may be missing
+    AsyncNowYouSeeMeClient = None
+
+
+class Progress:
+    """Prints fetched/total at most every half second"""
+
+    def __init__(self, quiet):
+        self.quiet = quiet
+        self.last = 0.0
+
+    def __call__(self, done, total):
+        now = time.perf_counter()
+        if not self.quiet and (done == total or now - self.last > 0.5):
+            self.last = now
+            print(f"\r  fetched {done}/{total} timelines", end="\n" if done == total else "", flush=True)
+
+
+async def fetch_async(args, progress):
+    async with AsyncNowYouSeeMeClient(api_base_url=args.api_url, max_concurrency=args.concurrency) as client:
+        return await fetch_mbti_sequences_async(client, concurrency=args.concurrency, progress=progress)
+
+
+def print_report(transitions, top):
+    print(f"Agents: {transitions.agents}   MBTI submissions: {transitions.submissions}")
+    changes = int(transitions.counts.sum() - transitions.counts.trace())
+    print(f"Type changes: {changes} of {int(transitions.counts.sum())} consecutive submissions")
+    print("-" * 60)
+    print(f"{'Transition':<22}{'Count':>10}{'P(next)':>12}")
+    for source, target, count, probability in transitions.top_transitions(top):
+        print(f"{source + ' -> ' + target:<22}{count:>10}{probability:>12.1%}")
+    print("-" * 60)
+    print(f"{'Type':<10}{'Current':>10}{'Dwells':>10}{'Subm/dwell':>12}{'Sec/dwell':>12}")
+    for code, mbti in enumerate(MBTI_TYPES):
+        if not (transitions.open_dwells[code] or transitions.completed_dwells[code]):
+            continue
+        submissions = transitions.dwell_submissions[code]
+        seconds = transitions.dwell_seconds[code]
+        print(f"{mbti:<10}{transitions.open_dwells[code]:>10}{transitions.completed_dwells[code]:>10}"
+              f"{'-' if submissions != submissions else f'{submissions:.1f}':>12}"
+              f"{'-' if seconds != seconds else f'{seconds:.1f}':>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the MBTI transition matrix from all agents' timelines")
+    parser.add_argument(
+        "--api-url",
+        default="http://localhost:8080/api/v1",
+        help="API base URL (default: http://localhost:8080/api/v1)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["threads", "async"],
+        default="threads",
+        help="Concurrency model (default: threads)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=32,
+        help="Timelines fetched concurrently in threads mode (default: 32)"
+    )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=200,
+        help="Timelines fetched concurrently in async mode (default: 200)"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Number of transitions to list (default: 15)"
+    )
+    parser.add_argument(
+        "--save",
+        default=None,
+        help="Save counts, probabilities and dwell arrays to this .npz file"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Quiet mode - no progress output"
+    )
+    args = parser.parse_args()
+
+    if args.mode == "async" and AsyncNowYouSeeMeClient is None:
+        print("Error: --mode async requires aiohttp (pip install nowyouseeme[async])")
+        return
+
+    progress = Progress(args.quiet)
+    start = time.perf_counter()
+    if args.mode == "async":
+        sequences = asyncio.run(fetch_async(args, progress))
+    else:
+        client = NowYouSeeMeClient(api_base_url=args.api_url, pool_maxsize=args.workers)
+        sequences = fetch_mbti_sequences(client, max_workers=args.workers, progress=progress)
+    fetched = time.perf_counter() - start
+    transitions = sequences.transitions()
+    computed = time.perf_counter() - start - fetched
+
+    print("=" * 60)
+    print_report(transitions, args.top)
+    print("-" * 60)
+    print(f"Fetched in {fetched:.1f}s, computed in {computed * 1000:.0f}ms")
+    if sequences.errors:
+        print(f"✗ {len(sequences.errors)} timelines failed, e.g. "
+              f"{next(iter(sequences.errors))}: {next(iter(sequences.errors.values()))}")
+    print("=" * 60)
+
+    if args.save:
+        import numpy as np
+        np.savez_compressed(
+            args.save,
+            types=MBTI_TYPES,
+            counts=transitions.counts,
+            probabilities=transitions.probabilities,
+            completed_dwells=transitions.completed_dwells,
+            open_dwells=transitions.open_dwells,
+            dwell_submissions=transitions.dwell_submissions,
+            dwell_seconds=transitions.dwell_seconds,
+        )
+        print(f"Saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Workload replayer
+
+Streams a workload file written by generate_workload.py into the API. Each agent's records
+are sent in file order; --workers (threads) or --concurrency (async) agents are in flight
+at once. Nothing is generated here, so the same file produces the same load every run.
+
+Usage:
+    python scripts/replay_workload.py load.ndjson.gz --workers 64
+    python scripts/replay_workload.py load.ndjson.gz --mode async --concurrency 500 -q
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nowyouseeme import NowYouSeeMeClient
+from nowyouseeme.workload import read_workload, replay_workload, replay_workload_async
+
+from generate_fake_agents import LatencyStats, print_latency_report
+
+try:
+    from nowyouseeme import AsyncNowYouSeeMeClient
+except ImportError:  # pragma: no cover - the SDK always exports it, aiohttp may be missing
+    AsyncNowYouSeeMeClient = None
+
+
+class Progress:
+    """Prints completed requests at most every half second"""
+
+    def __init__(self, quiet):
+        self.quiet = quiet
+        self.last = 0.0
+
+    def __call__(self, result):
+        now = time.perf_counter()
+        if not self.quiet and now - self.last > 0.5:
+            self.last = now
+            print(f"\r  {result.agents} agents, {result.diaries} diaries", end="", flush=True)
+
+
+async def replay_async(args, progress):
+    async with AsyncNowYouSeeMeClient(
+        api_base_url=args.api_url, max_concurrency=args.concurrency, max_connections=args.concurrency
+    ) as client:
+        return await replay_workload_async(
+            client, args.workload, concurrency=args.concurrency,
+            stop_on_error=not args.keep_going, progress=progress
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a workload file against the API")
+    parser.add_argument(
+        "workload",
+        help="Workload file written by generate_workload.py"
+    )
+    parser.add_argument(
+        "--api-url",
+        default="http://localhost:8080/api/v1",
+        help="API base URL (default: http://localhost:8080/api/v1)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["threads", "async"],
+        default="threads",
+        help="Concurrency model (default: threads)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=32,
+        help="Agents submitted concurrently in threads mode (default: 32)"
+    )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=200,
+        help="Agents submitted concurrently in async mode (default: 200)"
+    )
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Keep submitting an agent's records after one of them failed"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Quiet mode - only show summary"
+    )
+    args = parser.parse_args()
+
+    if args.mode == "async" and AsyncNowYouSeeMeClient is None:
+        print("Error: --mode async requires aiohttp (pip install nowyouseeme[async])")
+        return
+
+    header = next(read_workload(args.workload), {})
+    if not args.quiet:
+        print(f"Replaying {args.workload} (seed {header.get('seed')}, {header.get('num_agents')} agents, "
+              f"{args.mode} mode)...")
+
+    progress = Progress(args.quiet)
+    if args.mode == "async":
+        result = asyncio.run(replay_async(args, progress))
+    else:
+        client = NowYouSeeMeClient(api_base_url=args.api_url, pool_maxsize=args.workers)
+        result = replay_workload(
+            client, args.workload, max_workers=args.workers,
+            stop_on_error=not args.keep_going, progress=progress
+        )
+    if not args.quiet:
+        print()
+
+    stats = LatencyStats()
+    stats.merge(result.latencies, {})
+    print("=" * 60)
+    print(f"✓ Agents: {result.agents}   Diaries: {result.diaries}")
+    if result.failed:
+        agent_id, error = next(iter(result.errors.items()))
+        print(f"✗ Failed: {result.failed} requests ({len(result.errors)} agents), skipped: {result.skipped}")
+        print(f"  e.g. {agent_id}: {error}")
+    print("-" * 60)
+    print_latency_report(stats, result.seconds, result.agents)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,4 +26,10 @@ setup(
     install_requires=[
         "requests>=2.31.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "fast": ["orjson>=3.9.0"],
+        "zstd": ["zstandard>=0.21.0"],
+        "analytics": ["pyarrow>=12.0.0", "numpy>=1.22.0"],
+    },
 )
@@ -0,0 +1,80 @@
+"""
+Seeded random states and operation batches for the property tests, plus a Python copy of
+the backend's applyOperationToState (validation/operation_validator.go).
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from nowyouseeme import AgentState, Entity, EntityCollection, EntityType, Operation, Status
+from nowyouseeme import find_operation_errors
+from nowyouseeme.replay import clone_state
+
+ENTITY_TYPES = [entity_type.value for entity_type in EntityType]
+STATUSES = [status.value for status in Status]
+OPERATIONS = ["create", "update", "delete"]
+# Few ids and contents, so batches keep hitting the same entities
+ENTITY_IDS = ["e1", "e2", "e3"]
+CONTENTS = ["alpha", "beta", "gamma"]
+
+
+def random_state(rng: random.Random, size: int = 6) -> AgentState:
+    """An AgentState with up to size entities in any status"""
+    state = AgentState(mbti="INTJ-A",
+                       entity_collections={entity_type: EntityCollection() for entity_type in ENTITY_TYPES})
+    for _ in range(rng.randint(0, size)):
+        entity_id = rng.choice(ENTITY_IDS)
+        state.entity_collections[rng.choice(ENTITY_TYPES)].entities_by_id[entity_id] = Entity(
+            entity_id, rng.choice(CONTENTS), rng.choice(STATUSES))
+    return state
+
+
+def random_operation(rng: random.Random) -> Operation:
+    """Any operation, valid or not"""
+    return Operation(
+        rng.choice(ENTITY_TYPES),
+        rng.choice(OPERATIONS),
+        rng.choice(ENTITY_IDS),
+        entity_content=rng.choice(CONTENTS + [None]),
+        target_status=rng.choice(STATUSES + [None]),
+        note=rng.choice([None, None, "note"])
+    )
+
+
+def random_valid_batch(rng: random.Random, state: Optional[AgentState], length: int = 12) -> List[Operation]:
+    """Random operations the backend accepts in full against state"""
+    operations: List[Operation] = []
+    for _ in range(length * 4):
+        if len(operations) == length:
+            break
+        candidate = random_operation(rng)
+        if not find_operation_errors(operations + [candidate], state):
+            operations.append(candidate)
+    return operations
+
+
+def apply_operations(state: Optional[AgentState], operations: List[Operation]) -> AgentState:
+    """The state after a valid batch, applied the way applyOperationToState does"""
+    state = clone_state(state, copy_entities=True) if state is not None else AgentState(mbti="")
+    for op in operations:
+        entities = state.entity_collections.setdefault(op.entity_type, EntityCollection()).entities_by_id
+        if op.op == "create":
+            entities[op.entity_id] = Entity(op.entity_id, op.entity_content, op.target_status)
+        elif op.op == "update":
+            entity = entities[op.entity_id]
+            entities[op.entity_id] = Entity(op.entity_id, op.entity_content or entity.content,
+                                            op.target_status or entity.status)
+        else:
+            entities.pop(op.entity_id, None)
+    return state
+
+
+def entities(state: Optional[AgentState]) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """(entity_type, entity_id) -> (content, status), ignoring empty collections"""
+    if state is None:
+        return {}
+    return {
+        (entity_type, entity_id): (entity.content, entity.status)
+        for entity_type, collection in state.entity_collections.items()
+        for entity_id, entity in collection.entities_by_id.items()
+    }
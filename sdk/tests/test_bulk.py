@@ -0,0 +1,144 @@
+"""
+bulk_import: resuming after a crash, and checkpoints that don't match the server or the file.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from nowyouseeme import NowYouSeeMeClient, Operation
+from nowyouseeme.bulk import ImportCheckpoint, bulk_import
+from nowyouseeme.standin import StandInServer, standin_client
+from nowyouseeme.workload import WorkloadWriter
+
+SDK = Path(__file__).resolve().parents[1]
+
+# Operations per diary; each diary adds one metadata event plus its operations
+DIARY_OPERATIONS = [
+    [Operation("goal", "create", "g1", entity_content="Learn", target_status="pending")],
+    [Operation("goal", "update", "g1", target_status="progress"),
+     Operation("goal", "create", "g2", entity_content="Rest", target_status="pending")],
+    [],
+]
+FINAL_SEQUENCE = 2 + 3 + 1
+
+# Submits diaries one at a time and exits, without flushing the checkpoint, when it's
+# about to send diary number argv[4] + 1
+CRASH = """
+import os, sys
+from nowyouseeme import NowYouSeeMeClient
+from nowyouseeme.bulk import ImportCheckpoint, bulk_import
+
+url, path, checkpoint, limit = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])
+client = NowYouSeeMeClient(api_base_url=url)
+post = client._post
+sent = 0
+
+def post_then_exit(method, path, body):
+    global sent
+    if method == "submit_diary":
+        if sent == limit:
+            os._exit(3)
+        sent += 1
+    return post(method, path, body)
+
+client._post = post_then_exit
+bulk_import(client, path, ImportCheckpoint(checkpoint, commit_interval=3600), max_workers=1)
+"""
+
+
+def write_import(path, num_agents):
+    """Agent records first, then the agents' diaries round by round"""
+    with WorkloadWriter(str(path), metadata={}) as writer:
+        for index in range(num_agents):
+            writer.write_agent(f"agent_{index}", f"Agent {index}", "INTJ-A")
+        for operations in DIARY_OPERATIONS:
+            for index in range(num_agents):
+                writer.write_diary(f"agent_{index}", mbti="INTJ-A", operations=operations)
+    return str(path)
+
+
+def test_resume_after_crash_between_post_and_checkpoint(tmp_path):
+    path = write_import(tmp_path / "import.ndjson", 30)
+    checkpoint = str(tmp_path / "import.checkpoint")
+    with StandInServer() as server:
+        crashed = subprocess.run(
+            [sys.executable, "-c", CRASH, server.url, path, checkpoint, "48"], cwd=SDK
+        )
+        assert crashed.returncode == 3
+        # Only the agents' starting sequences were committed
+        with ImportCheckpoint(checkpoint) as store:
+            assert store.watermark == 0
+            assert 0 < len(store) < 30
+
+        client = NowYouSeeMeClient(api_base_url=server.url)
+        result = bulk_import(client, path, checkpoint, max_workers=8)
+        assert result.failed == 0, result.errors
+        # 48 diaries landed before the crash and aren't sent again; the other 42 are
+        assert result.recovered == 48
+        assert result.submitted == 90 - 48
+        assert result.already_done == 0
+        assert 0 <= result.agents_created < 30
+        for index in range(30):
+            assert client.get_snapshot(f"agent_{index}").sequence == FINAL_SEQUENCE
+
+        # Once everything is checkpointed a rerun sends nothing
+        again = bulk_import(client, path, checkpoint, max_workers=8)
+        assert (again.submitted, again.recovered, again.failed) == (0, 0, 0)
+        assert again.resumed_at_line == 1 + 30 + 90
+
+
+def test_server_behind_checkpoint_fails_the_agent(tmp_path):
+    path = write_import(tmp_path / "import.ndjson", 3)
+    checkpoint = str(tmp_path / "import.checkpoint")
+    client = standin_client()
+    assert bulk_import(client, path, checkpoint).submitted == 9
+
+    with ImportCheckpoint(checkpoint) as store:
+        line, _ = store.get("agent_0")
+        store.ack("agent_0", line, FINAL_SEQUENCE + 5)
+        store.flush()
+        store.set_meta("watermark", "0")
+
+    result = bulk_import(client, path, checkpoint)
+    assert list(result.errors) == ["agent_0"]
+    assert result.errors["agent_0"].startswith("SequenceMismatchError: agent agent_0 is at sequence 6")
+    # The agent record fails; its three diaries are skipped
+    assert (result.failed, result.skipped, result.already_done, result.submitted) == (1, 3, 6, 0)
+
+
+def test_server_events_not_from_the_file_fail_the_agent(tmp_path):
+    path = write_import(tmp_path / "import.ndjson", 3)
+    checkpoint = str(tmp_path / "import.checkpoint")
+    client = standin_client()
+    client.create_agent("agent_0", "Agent 0", "INTJ-A")
+    with ImportCheckpoint(checkpoint) as store:
+        store.begin("agent_0", 0)
+    # A diary with no operations (sequence 1) can't be the file's first one (sequence 2)
+    client.submit_diary(agent_id="agent_0", mbti="INTJ-A", operations=[])
+
+    result = bulk_import(client, path, checkpoint)
+    assert list(result.errors) == ["agent_0"]
+    assert result.errors["agent_0"].startswith("SequenceMismatchError: agent agent_0 is at sequence 1")
+    assert (result.failed, result.skipped, result.agents_created, result.submitted) == (1, 2, 2, 6)
+    assert client.get_snapshot("agent_0").sequence == 1
+
+
+def test_checkpoint_of_another_file_is_refused(tmp_path):
+    checkpoint = str(tmp_path / "import.checkpoint")
+    client = standin_client()
+    bulk_import(client, write_import(tmp_path / "import.ndjson", 3), checkpoint)
+
+    other = write_import(tmp_path / "other.ndjson", 4)
+    with pytest.raises(ValueError, match="belongs to import.ndjson"):
+        bulk_import(client, other, checkpoint)
+    # Same name, different contents
+    write_import(tmp_path / "import.ndjson", 4)
+    with pytest.raises(ValueError, match="belongs to import.ndjson"):
+        bulk_import(client, str(tmp_path / "import.ndjson"), checkpoint)
+    # Nothing was sent or recorded
+    with ImportCheckpoint(checkpoint) as store:
+        assert len(store) == 3
+        assert store.get("agent_3") is None
@@ -0,0 +1,148 @@
+"""
+SnapshotCache: TTL expiry, LRU eviction, and reads racing a diary.
+"""
+
+import pytest
+
+from nowyouseeme import AgentSnapshotResult, Operation, SnapshotCache
+from nowyouseeme.client import _invalidate_cached_snapshot
+from nowyouseeme.replay import new_empty_state
+from nowyouseeme.standin import standin_client
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def snapshot(sequence, agent_id="agent_1"):
+    return AgentSnapshotResult(agent_id=agent_id, state=new_empty_state(), sequence=sequence, updated_at=None)
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = SnapshotCache(ttl=5.0, clock=clock)
+    cache.put("agent_1", snapshot(3))
+    clock.now = 5.0
+    assert cache.get("agent_1").sequence == 3
+    clock.now = 5.1
+    assert cache.get("agent_1") is None
+    assert "agent_1" not in cache
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # An expired entry doesn't block older snapshots
+    cache.put("agent_1", snapshot(2))
+    assert cache.sequence("agent_1") == 2
+
+
+def test_no_ttl_keeps_entries():
+    clock = Clock()
+    cache = SnapshotCache(ttl=None, clock=clock)
+    cache.put("agent_1", snapshot(3))
+    clock.now = 1e9
+    assert cache.sequence("agent_1") == 3
+
+
+def test_least_recently_used_is_evicted():
+    cache = SnapshotCache(max_entries=2, ttl=None)
+    cache.put("a", snapshot(1, "a"))
+    cache.put("b", snapshot(1, "b"))
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", snapshot(1, "c"))
+    assert len(cache) == 2
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+    with pytest.raises(ValueError):
+        SnapshotCache(max_entries=0)
+
+
+def test_older_put_does_not_replace_newer():
+    cache = SnapshotCache(ttl=None)
+    cache.put("agent_1", snapshot(5))
+    cache.put("agent_1", snapshot(4))
+    assert cache.sequence("agent_1") == 5
+
+
+def test_invalidate_with_min_sequence_rejects_older_puts():
+    cache = SnapshotCache(ttl=None)
+    cache.put("agent_1", snapshot(2))
+    cache.invalidate("agent_1", min_sequence=5)
+    assert "agent_1" not in cache
+
+    # A read that started before the diary lands after it
+    cache.put("agent_1", snapshot(2))
+    cache.put("agent_1", None)
+    assert "agent_1" not in cache
+
+    cache.put("agent_1", snapshot(5))
+    assert cache.sequence("agent_1") == 5
+
+    # Floors only go up
+    cache.invalidate("agent_1", min_sequence=3)
+    cache.put("agent_1", snapshot(4))
+    assert "agent_1" not in cache
+
+    # Without min_sequence the next read is accepted whatever its sequence
+    cache.invalidate("agent_2")
+    cache.put("agent_2", snapshot(1, "agent_2"))
+    assert cache.sequence("agent_2") == 1
+
+    cache.clear()
+    cache.put("agent_1", snapshot(1))
+    assert cache.sequence("agent_1") == 1
+
+
+def test_floors_are_bounded():
+    cache = SnapshotCache(max_entries=2, ttl=None)
+    for agent_id in ("a", "b", "c"):
+        cache.invalidate(agent_id, min_sequence=10)
+    assert list(cache._floors) == ["b", "c"]
+    cache.put("a", snapshot(1, "a"))
+    assert cache.sequence("a") == 1
+
+
+def create_goal(entity_id):
+    return Operation("goal", "create", entity_id, entity_content=f"Learn {entity_id}", target_status="pending")
+
+
+def test_read_racing_a_diary_is_not_cached():
+    client = standin_client(snapshot_cache=SnapshotCache(ttl=None))
+    client.create_agent("agent_1", "Agent", "INTJ-A")
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g1")])
+
+    # The diary is accepted after get_snapshot's response is read but before it is cached
+    get = client._get
+
+    def get_then_write(method, path, params=None):
+        response = get(method, path, params)
+        if method == "get_snapshot":
+            client._get = get
+            client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g2")])
+        return response
+
+    client._get = get_then_write
+    stale = client.get_snapshot("agent_1")
+    assert stale.sequence == 2
+    assert "agent_1" not in client.snapshot_cache
+
+    fresh = client.get_snapshot("agent_1")
+    assert fresh.sequence == 4
+    assert client.get_snapshot("agent_1") is fresh
+
+
+def test_diary_without_sequence_still_blocks_the_cached_snapshot():
+    cache = SnapshotCache(ttl=None)
+    client = standin_client(snapshot_cache=cache)
+    client.create_agent("agent_1", "Agent", "INTJ-A")
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g1")])
+    before = client.get_snapshot("agent_1")
+
+    # Older backends leave "sequence" out of the diary response
+    _invalidate_cached_snapshot(cache, "agent_1", snapshot(0))
+    cache.put("agent_1", before)
+    assert "agent_1" not in cache
@@ -0,0 +1,65 @@
+"""
+Compression settings: request bodies stay uncompressed unless asked for, and compressed
+bodies round trip through the stand-in.
+"""
+
+import pytest
+import requests
+
+from nowyouseeme import Operation
+from nowyouseeme.compression import GZIP, Compression, compress, decompress
+from nowyouseeme.standin import standin_client
+
+BIG_BODY = b'{"padding": "' + b"x" * 4096 + b'"}'
+
+
+def large_diary(client, agent_id="agent_1"):
+    """A diary well over the 1 KB compression threshold"""
+    return client.submit_diary(agent_id=agent_id, mbti="INTJ-A", operations=[
+        Operation("goal", "create", f"goal_{i}", entity_content="Learn " * 20, target_status="pending")
+        for i in range(10)
+    ])
+
+
+def test_request_bodies_uncompressed_by_default():
+    compression = Compression()
+    assert compression.request_encoding is None
+    assert compression.encode_request("submit_diary", BIG_BODY) == (BIG_BODY, None)
+    assert len(compression.stats) == 0
+
+
+def test_request_compression_is_opt_in():
+    compression = Compression(request_encoding=GZIP)
+    body, encoding = compression.encode_request("submit_diary", BIG_BODY)
+    assert encoding == GZIP
+    assert decompress(body, GZIP) == BIG_BODY
+    # Small bodies aren't worth it
+    assert compression.encode_request("submit_diary", b"{}") == (b"{}", None)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate", "identity"])
+def test_round_trip(encoding):
+    data = compress(BIG_BODY, encoding) if encoding != "identity" else BIG_BODY
+    assert decompress(data, encoding) == BIG_BODY
+
+
+def test_default_compression_works_against_a_backend_without_request_decoding():
+    # The stand-in, like gin, rejects compressed request bodies unless decompress_requests is set
+    client = standin_client(compression=Compression(), compress_responses=True)
+    client.create_agent("agent_1", "Agent", "INTJ-A")
+    large_diary(client)
+    assert len(client.get_timeline("agent_1")) == 11
+    directions = {direction for _, direction in client.compression.stats.summary()}
+    assert directions == {"response"}
+
+
+def test_opted_in_request_compression():
+    rejecting = standin_client(compression=Compression(request_encoding=GZIP))
+    rejecting.create_agent("agent_1", "Agent", "INTJ-A")
+    with pytest.raises(requests.HTTPError, match="400"):
+        large_diary(rejecting)
+
+    accepting = standin_client(compression=Compression(request_encoding=GZIP), decompress_requests=True)
+    accepting.create_agent("agent_1", "Agent", "INTJ-A")
+    large_diary(accepting)
+    assert accepting.get_snapshot("agent_1").sequence == 11
@@ -0,0 +1,60 @@
+"""
+diff_states(old, new).to_operations() over seeded random state pairs: the operations pass the
+backend's validation against old and replay to new.
+"""
+
+import random
+
+import pytest
+
+from nowyouseeme import AgentState, diff_states, find_operation_errors, optimize_operations
+
+from random_states import apply_operations, entities, random_state, random_valid_batch
+
+SEEDS = range(300)
+
+
+def state_pair(seed):
+    """An old state and a new one reached from it by random operations or drawn independently"""
+    rng = random.Random(seed)
+    old = random_state(rng)
+    if rng.random() < 0.5:
+        return old, apply_operations(old, random_valid_batch(rng, old))
+    return old, random_state(rng)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_operations_are_valid_against_old_state(seed):
+    old, new = state_pair(seed)
+    assert find_operation_errors(diff_states(old, new).to_operations(), old) == []
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_operations_replay_to_new_state(seed):
+    old, new = state_pair(seed)
+    assert entities(apply_operations(old, diff_states(old, new).to_operations())) == entities(new)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_operations_are_already_folded(seed):
+    old, new = state_pair(seed)
+    operations = diff_states(old, new).to_operations()
+    assert len(optimize_operations(operations, old)) == len(operations)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_from_and_to_empty_state(seed):
+    state = random_state(random.Random(seed))
+    created = diff_states(None, state).to_operations()
+    assert find_operation_errors(created) == []
+    assert entities(apply_operations(None, created)) == entities(state)
+
+    removed = diff_states(state, AgentState(mbti="")).to_operations()
+    assert find_operation_errors(removed, state) == []
+    assert entities(apply_operations(state, removed)) == {}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_same_state_needs_no_operations(seed):
+    state = random_state(random.Random(seed))
+    assert diff_states(state, apply_operations(state, [])).to_operations() == []
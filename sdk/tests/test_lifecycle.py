@@ -0,0 +1,150 @@
+"""
+Goal lifecycles on a small hand-computed history, for several chunk sizes.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from nowyouseeme.lifecycle import ABANDONED, COMPLETED, DELETED, PENDING, PROGRESS, goal_lifecycle
+
+np = pytest.importorskip("numpy")
+
+MINUTE = 60.0
+
+
+def at(minute):
+    return None if minute is None else f"2026-01-01T00:{minute:02d}:00Z"
+
+
+def event(event_type, entity_id, minute, target_status="", entity_type="goal"):
+    return {
+        "event_type": event_type,
+        "timestamp": at(minute),
+        "raw_payload": {"entity_type": entity_type, "op": event_type, "entity_id": entity_id,
+                        "target_status": target_status},
+    }
+
+
+def metadata(minute):
+    return {"event_type": "metadata_submission", "timestamp": at(minute), "raw_payload": {"mbti": "INTJ-A"}}
+
+
+TIMELINES = [
+    ("a", [
+        metadata(0),
+        event("create", "g1", 0, "pending"),
+        event("create", "g2", 5, "pending"),
+        event("create", "c1", 5, "pending", entity_type="capability"),
+        event("update", "g1", 10, "progress"),
+        event("update", "g2", 15, "abandoned"),
+        event("update", "g2", 20, "pending"),
+        event("update", "g1", 30, "completed"),
+        event("update", "g1", 35),  # content only
+    ]),
+    ("b", [
+        event("create", "g1", 0, "pending"),
+        event("create", "g2", 10, "pending"),
+        # No timestamp: takes g1's previous one, so pending lasts no time
+        event("update", "g1", None, "progress"),
+        event("delete", "g2", 40),
+        event("update", "g1", 50, "completed"),
+    ]),
+]
+
+
+def lifecycle(chunk_size=65536, as_of=None):
+    return goal_lifecycle(TIMELINES, as_of=as_of, chunk_size=chunk_size)
+
+
+def minutes(values):
+    return (np.asarray(values) / MINUTE).tolist()
+
+
+def test_hand_computed_lifecycle():
+    result = lifecycle()
+    assert result.goal_ids == ["g1", "g2", "g1", "g2"]
+    assert result.goal_agents.tolist() == [0, 0, 1, 1]
+    assert result.events == 14
+    assert result.status.tolist() == [COMPLETED, PENDING, COMPLETED, DELETED]
+    # Columns: pending, progress, completed, abandoned; open statuses last until minute 50
+    assert [minutes(row) for row in result.seconds_in_status] == [
+        [10, 20, 20, 0],
+        [40, 0, 0, 5],
+        [0, 50, 0, 0],
+        [30, 0, 0, 0],
+    ]
+    assert minutes(np.nan_to_num(result.seconds_to_completion, nan=-MINUTE)) == [30, -1, 50, -1]
+    assert result.abandons.tolist() == [0, 1, 0, 0]
+    assert result.reactivations.tolist() == [0, 1, 0, 0]
+    assert result.reached[:, PROGRESS].tolist() == [True, False, True, False]
+    assert result.reached[:, ABANDONED].tolist() == [False, True, False, False]
+    assert result.funnel() == {"created": 4, "started": 2, "completed": 2, "abandoned": 1, "reactivated": 1}
+    assert result.transition_counts() == {
+        ("none", "pending"): 4,
+        ("pending", "progress"): 2,
+        ("progress", "completed"): 2,
+        ("pending", "abandoned"): 1,
+        ("abandoned", "pending"): 1,
+        ("pending", "deleted"): 1,
+    }
+
+
+def test_missing_timestamp_is_filled_from_the_goal_not_the_agent():
+    # b's g2 was created after g1 but before the untimed update; only g1's time counts
+    result = lifecycle()
+    assert result.created_at[2] == np.datetime64("2026-01-01T00:00:00")
+    assert minutes(result.seconds_in_status[2]) == [0, 50, 0, 0]
+
+
+def test_missing_timestamp_without_earlier_time():
+    result = goal_lifecycle([("a", [event("create", "g1", None, "pending"), event("update", "g1", 10, "progress")])])
+    assert np.isnat(result.created_at[0])
+    # Nothing to measure pending from, and progress starts at the last event
+    assert minutes(result.seconds_in_status[0]) == [0, 0, 0, 0]
+    assert result.reached[0, PROGRESS]
+
+
+def test_as_of_extends_open_statuses():
+    result = lifecycle(as_of=datetime(2026, 1, 1, 1, 0, tzinfo=timezone.utc))
+    assert [minutes(row) for row in result.seconds_in_status] == [
+        [10, 20, 30, 0],
+        [50, 0, 0, 5],
+        [0, 50, 10, 0],
+        [30, 0, 0, 0],
+    ]
+    # A window ending before the open status started adds nothing
+    early = lifecycle(as_of=datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc))
+    assert minutes(early.seconds_in_status[0]) == [10, 20, 0, 0]
+
+
+def fields(result):
+    return {
+        "goals": (result.agent_ids, result.goal_agents.tolist(), result.goal_ids),
+        "status": result.status,
+        "created_at": result.created_at,
+        "completed_at": result.completed_at,
+        "seconds_in_status": result.seconds_in_status,
+        "reached": result.reached,
+        "abandons": result.abandons,
+        "reactivations": result.reactivations,
+        "transitions": result.transitions,
+        "events": result.events,
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 65536])
+@pytest.mark.parametrize("as_of", [None, datetime(2026, 1, 1, 1, 0, tzinfo=timezone.utc)])
+def test_chunk_size_does_not_change_results(chunk_size, as_of):
+    expected = fields(lifecycle(65536, as_of))
+    actual = fields(lifecycle(chunk_size, as_of))
+    for name in expected:
+        np.testing.assert_equal(actual[name], expected[name], err_msg=name)
+
+
+def test_nothing_to_measure():
+    result = goal_lifecycle([("a", [metadata(0)]), ("b", [])])
+    assert len(result) == 0
+    assert result.events == 1
+    assert result.funnel() == {"created": 0, "started": 0, "completed": 0, "abandoned": 0, "reactivated": 0}
+    assert result.population()["median_seconds_to_completion"] is None
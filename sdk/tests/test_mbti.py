@@ -0,0 +1,109 @@
+"""
+5-bit MBTI codes and the population arrays built from them.
+"""
+
+import pytest
+
+from nowyouseeme import Operation
+from nowyouseeme.mbti import (
+    DIMENSION_NAMES, MBTI_TYPES, MISSING, NUM_TYPES, MBTIPopulation, confidence_histogram, decode_mbti,
+    encode_mbti, encode_mbti_array, flip_dimension, mbti_marginals,
+)
+from nowyouseeme.standin import standin_client
+
+np = pytest.importorskip("numpy")
+
+VALUES = ["INTP-A", "", "ENFJ-T", "intp-a", None, "INTP", "XXXX-A", " ESTJ-A ", "INTP-A"]
+CODES = [0b11010, MISSING, 0b01101, 0b11010, MISSING, MISSING, MISSING, 0b00000, 0b11010]
+
+
+def test_type_table():
+    assert len(MBTI_TYPES) == NUM_TYPES == 32
+    assert MBTI_TYPES[0] == "ESTJ-A" and MBTI_TYPES[-1] == "INFP-T"
+    for code, mbti in enumerate(MBTI_TYPES):
+        assert encode_mbti(mbti) == code
+        assert decode_mbti(code) == mbti
+    assert decode_mbti(MISSING) == ""
+
+
+@pytest.mark.parametrize("value, code", list(zip(VALUES, CODES)))
+def test_encode_mbti(value, code):
+    assert encode_mbti(value) == code
+
+
+def test_bits_follow_dimensions():
+    # bit 4: E/I, bit 3: S/N, bit 2: T/F, bit 1: J/P, bit 0: A/T
+    assert encode_mbti("ESTJ-A") == 0
+    assert encode_mbti("ISTJ-A") == 0b10000
+    assert encode_mbti("ENTJ-A") == 0b01000
+    assert encode_mbti("ESFJ-A") == 0b00100
+    assert encode_mbti("ESTP-A") == 0b00010
+    assert encode_mbti("ESTJ-T") == 0b00001
+    assert decode_mbti(flip_dimension(encode_mbti("INTP-A"), 0)) == "ENTP-A"
+    assert decode_mbti(flip_dimension(encode_mbti("INTP-A"), 4)) == "INTP-T"
+
+
+def test_encode_array_from_list_and_ndarray():
+    assert encode_mbti_array(VALUES).tolist() == CODES
+    assert encode_mbti_array(VALUES).dtype == np.int8
+    assert encode_mbti_array(np.array(VALUES, dtype=object)).tolist() == CODES
+    assert encode_mbti_array(np.array([value or "" for value in VALUES])).tolist() == CODES
+    assert encode_mbti_array(np.array([], dtype=str)).tolist() == []
+
+
+def test_encode_array_from_arrow():
+    pa = pytest.importorskip("pyarrow")
+    assert encode_mbti_array(pa.array(VALUES)).tolist() == CODES
+    assert encode_mbti_array(pa.array(VALUES).dictionary_encode()).tolist() == CODES
+    chunked = pa.chunked_array([pa.array(VALUES[:4]), pa.array(VALUES[4:])])
+    assert encode_mbti_array(chunked).tolist() == CODES
+    # Chunks with different dictionaries
+    chunked = pa.chunked_array([pa.array(VALUES[:4]).dictionary_encode(), pa.array(VALUES[4:]).dictionary_encode()])
+    assert encode_mbti_array(chunked).tolist() == CODES
+
+
+def test_marginals():
+    codes = encode_mbti_array(["INTP-A", "INTJ-T", "ESFJ-A", ""])
+    assert mbti_marginals(codes, normalize=False) == {
+        "E/I": {"E": 1.0, "I": 2.0},
+        "S/N": {"S": 1.0, "N": 2.0},
+        "T/F": {"T": 2.0, "F": 1.0},
+        "J/P": {"J": 2.0, "P": 1.0},
+        "A/T": {"A": 2.0, "T": 1.0},
+    }
+    shares = mbti_marginals(codes)
+    assert list(shares) == list(DIMENSION_NAMES)
+    assert shares["E/I"] == pytest.approx({"E": 1 / 3, "I": 2 / 3})
+
+    weighted = mbti_marginals(codes, weights=[0.5, 0.25, 1.0, 0.9], normalize=False)
+    assert weighted["E/I"] == pytest.approx({"E": 1.0, "I": 0.75})
+
+
+def test_marginals_of_nothing():
+    assert mbti_marginals(encode_mbti_array(["", None])) == {
+        name: {name[0]: 0.0, name[2]: 0.0} for name in DIMENSION_NAMES
+    }
+
+
+def test_confidence_histogram_skips_missing():
+    codes = encode_mbti_array(["INTP-A", "INTP-A", "", "ESTJ-A", None])
+    histogram, edges = confidence_histogram(codes, [0.05, 1.0, 0.5, 0.55, 0.9], bins=4)
+    assert histogram.shape == (NUM_TYPES, 4)
+    assert edges.tolist() == [0.0, 0.25, 0.5, 0.75, 1.0]
+    # Confidence 1.0 falls in the last bin
+    assert histogram[encode_mbti("INTP-A")].tolist() == [1, 0, 0, 1]
+    assert histogram[encode_mbti("ESTJ-A")].tolist() == [0, 0, 1, 0]
+    # The MISSING rows (0.5 and 0.9) are not counted anywhere
+    assert histogram.sum() == 3
+
+
+def test_population_from_gallery_reads_current_mbti():
+    client = standin_client()
+    for i, mbti in enumerate(["INTJ-A", "ENFP-T", "INTJ-A"]):
+        client.create_agent(f"agent_{i}", f"Agent {i}", mbti)
+        client.submit_diary(agent_id=f"agent_{i}", mbti=mbti, operations=[
+            Operation("goal", "create", "g1", entity_content="Learn", target_status="pending")
+        ])
+    population = MBTIPopulation.from_gallery(client)
+    assert population.missing == 0
+    assert population.distribution() == pytest.approx({"INTJ-A": 2 / 3, "ENFP-T": 1 / 3})
@@ -0,0 +1,70 @@
+"""
+EventMirror: incremental sync from the stand-in and offline reads.
+"""
+
+from nowyouseeme import Operation
+from nowyouseeme.mirror import EventMirror
+from nowyouseeme.standin import standin_client
+
+
+def events(count, start=1):
+    return [
+        {"event_id": sequence, "sequence_number": sequence, "event_type": "metadata_submission",
+         "timestamp": "2026-01-01T00:00:00Z", "raw_payload": {"mbti": "INTJ-A"}}
+        for sequence in range(start, start + count)
+    ]
+
+
+def test_timelines_keep_agents_whole_across_fetch_batches():
+    mirror = EventMirror()
+    # "a" fills the first 10000-row batch and spills into the second, "c" ends exactly on a boundary
+    mirror.store("a", events(10005))
+    mirror.store("b", events(3))
+    mirror.store("c", events(9992))
+    timelines = list(mirror.timelines())
+    assert [(agent_id, len(timeline)) for agent_id, timeline in timelines] == [("a", 10005), ("b", 3), ("c", 9992)]
+    for _, timeline in timelines:
+        assert [event["sequence_number"] for event in timeline] == list(range(1, len(timeline) + 1))
+
+
+def test_timelines_of_empty_mirror():
+    assert list(EventMirror().timelines()) == []
+
+
+def test_store_ignores_known_sequences():
+    mirror = EventMirror()
+    assert mirror.store("a", events(5)) == 5
+    assert mirror.store("a", events(5, start=3)) == 2
+    assert mirror.last_sequence("a") == 7
+    assert len(mirror) == 7
+
+
+def diary(client, agent_id, goal_id):
+    client.submit_diary(agent_id=agent_id, mbti="INTJ-A", operations=[
+        Operation("goal", "create", goal_id, entity_content=f"Learn {goal_id}", target_status="pending")
+    ])
+
+
+def test_sync_fetches_only_new_events():
+    client = standin_client()
+    for agent_id in ("agent_1", "agent_2"):
+        client.create_agent(agent_id, agent_id, "INTJ-A")
+        diary(client, agent_id, "g1")
+    mirror = EventMirror()
+
+    result = mirror.sync(client)
+    assert (result.agents_checked, result.agents_fetched, result.events_added) == (2, 2, 4)
+    assert not result.errors
+
+    diary(client, "agent_1", "g2")
+    result = mirror.sync(client)
+    assert (result.agents_fetched, result.events_added) == (1, 2)
+    assert mirror.sync(client).agents_fetched == 0
+
+    for agent_id in ("agent_1", "agent_2"):
+        assert mirror.timeline(agent_id) == client.get_timeline(agent_id)
+        server = client.get_snapshot(agent_id)
+        offline = mirror.snapshot(agent_id)
+        assert offline.sequence == server.sequence
+        assert offline.state.entity_collections["goal"] == server.state.entity_collections["goal"]
+    assert [agent_id for agent_id, _ in mirror.timelines()] == ["agent_1", "agent_2"]
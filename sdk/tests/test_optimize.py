@@ -0,0 +1,67 @@
+"""
+optimize_operations over seeded random batches, with and without the starting state: the
+result reaches the same state, still passes the backend's validation and is never longer.
+"""
+
+import random
+
+import pytest
+
+from nowyouseeme import Operation, find_operation_errors, optimize_operations
+
+from random_states import apply_operations, entities, random_operation, random_state, random_valid_batch
+
+SEEDS = range(300)
+
+
+def state_and_batch(seed):
+    rng = random.Random(seed)
+    state = random_state(rng)
+    return state, random_valid_batch(rng, state)
+
+
+@pytest.mark.parametrize("known_state", [True, False], ids=["state", "no-state"])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_same_final_state(seed, known_state):
+    state, operations = state_and_batch(seed)
+    optimized = optimize_operations(operations, state if known_state else None)
+    assert entities(apply_operations(state, optimized)) == entities(apply_operations(state, operations))
+
+
+@pytest.mark.parametrize("known_state", [True, False], ids=["state", "no-state"])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_still_valid(seed, known_state):
+    state, operations = state_and_batch(seed)
+    assert find_operation_errors(optimize_operations(operations, state if known_state else None), state) == []
+
+
+@pytest.mark.parametrize("known_state", [True, False], ids=["state", "no-state"])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_never_longer(seed, known_state):
+    state, operations = state_and_batch(seed)
+    assert len(optimize_operations(operations, state if known_state else None)) <= len(operations)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_never_longer_for_invalid_batches(seed):
+    rng = random.Random(seed)
+    state = random_state(rng)
+    operations = [random_operation(rng) for _ in range(12)]
+    assert len(optimize_operations(operations, state)) <= len(operations)
+    assert len(optimize_operations(operations)) <= len(operations)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_idempotent(seed):
+    state, operations = state_and_batch(seed)
+    optimized = optimize_operations(operations, state)
+    assert optimize_operations(optimized, state) == optimized
+
+
+def test_folds_create_and_updates():
+    operations = [
+        Operation("goal", "create", "goal_1", "Learn", "pending"),
+        Operation("goal", "update", "goal_1", target_status="progress"),
+        Operation("goal", "update", "goal_1", "Learn Go"),
+    ]
+    assert optimize_operations(operations) == [Operation("goal", "create", "goal_1", "Learn Go", "progress")]
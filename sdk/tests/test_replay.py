@@ -0,0 +1,117 @@
+"""
+apply_event_to_snapshot case for case with ApplyEventToSnapshot in
+backend/storage/event_sourcing.go, and ReplayEngine's private copies.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from nowyouseeme import AgentSnapshotResult, Entity, Event
+from nowyouseeme.replay import ReplayEngine, ReplayError, apply_event_to_snapshot, new_empty_state
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+T1 = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+
+def event(sequence, event_type, entity_id="g1", content=None, status=None, entity_type="goal", timestamp=T1):
+    payload = {"entity_type": entity_type, "entity_id": entity_id}
+    if content is not None:
+        payload["entity_content"] = content
+    if status is not None:
+        payload["target_status"] = status
+    return Event(event_id=sequence, sequence_number=sequence, event_type=event_type,
+                 timestamp=timestamp, raw_payload=payload)
+
+
+def snapshot_with(**goals):
+    """Snapshot at sequence 1 holding the given goals as id=(content, status)"""
+    state = new_empty_state()
+    for entity_id, (content, status) in goals.items():
+        state.entity_collections["goal"].entities_by_id[entity_id] = Entity(entity_id, content, status)
+    return AgentSnapshotResult(agent_id="agent_1", state=state, sequence=1, updated_at=T0)
+
+
+def goals(snapshot):
+    return {entity_id: (entity.content, entity.status)
+            for entity_id, entity in snapshot.state.entity_collections["goal"].entities_by_id.items()}
+
+
+@pytest.mark.parametrize("name, before, applied, after, sequence", [
+    ("create", {}, event(2, "create", content="Learn", status="pending"), {"g1": ("Learn", "pending")}, 2),
+    ("create overwrites", {"g1": ("Old", "completed")}, event(2, "create", content="New", status="pending"),
+     {"g1": ("New", "pending")}, 2),
+    ("update content only", {"g1": ("Learn", "progress")}, event(2, "update", content="Learn Go"),
+     {"g1": ("Learn Go", "progress")}, 2),
+    ("update status only", {"g1": ("Learn", "pending")}, event(2, "update", status="progress"),
+     {"g1": ("Learn", "progress")}, 2),
+    ("update both", {"g1": ("Learn", "pending")}, event(2, "update", content="Learn Go", status="progress"),
+     {"g1": ("Learn Go", "progress")}, 2),
+    # The state machine is enforced by validation, not by replay
+    ("update out of completed", {"g1": ("Learn", "completed")}, event(2, "update", status="pending"),
+     {"g1": ("Learn", "pending")}, 2),
+    ("delete", {"g1": ("Learn", "pending")}, event(2, "delete"), {}, 2),
+    ("delete missing", {}, event(2, "delete"), {}, 2),
+    ("metadata skipped", {"g1": ("Learn", "pending")}, event(2, "metadata_submission", content="x"),
+     {"g1": ("Learn", "pending")}, 1),
+])
+def test_apply_event_matches_go(name, before, applied, after, sequence):
+    snapshot = snapshot_with(**before)
+    apply_event_to_snapshot(snapshot, applied)
+    assert goals(snapshot) == after
+    assert snapshot.sequence == sequence
+    assert snapshot.updated_at == (T1 if sequence == 2 else T0)
+
+
+@pytest.mark.parametrize("applied, error", [
+    (event(2, "update", entity_id="missing", content="x"), "goal not found: missing"),
+    (event(2, "create", content="x", status="pending", entity_type="mood"), "invalid entity type: mood"),
+    (event(2, "rename", content="x"), "unknown operation: rename"),
+])
+def test_apply_event_errors_match_go(applied, error):
+    snapshot = snapshot_with(g1=("Learn", "pending"))
+    with pytest.raises(ReplayError, match=error):
+        apply_event_to_snapshot(snapshot, applied)
+    # Metadata only moves when the event applied
+    assert snapshot.sequence == 1
+    assert goals(snapshot) == {"g1": ("Learn", "pending")}
+
+
+def test_apply_event_creates_missing_collection():
+    snapshot = AgentSnapshotResult(agent_id="agent_1", state=new_empty_state(), sequence=0, updated_at=None)
+    del snapshot.state.entity_collections["aspiration"]
+    apply_event_to_snapshot(snapshot, event(1, "create", "a1", "Fly", "pending", entity_type="aspiration"))
+    assert snapshot.state.entity_collections["aspiration"].entities_by_id["a1"] == Entity("a1", "Fly", "pending")
+
+
+def engine_events(count):
+    events = [event(1, "create", content="v1", status="pending")]
+    events += [event(sequence, "update", content=f"v{sequence}") for sequence in range(2, count + 1)]
+    return events
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 3, 64])
+def test_state_at_matches_sequential_replay(checkpoint_interval):
+    engine = ReplayEngine(engine_events(10), agent_id="agent_1", checkpoint_interval=checkpoint_interval)
+    assert engine.latest_sequence == 10
+    for sequence in range(0, 11):
+        expected = {"g1": (f"v{sequence}", "pending")} if sequence else {}
+        assert goals(engine.state_at(sequence)) == expected
+    assert goals(engine.latest()) == {"g1": ("v10", "pending")}
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 3, 64])
+def test_mutating_results_leaves_engine_unchanged(checkpoint_interval):
+    engine = ReplayEngine(engine_events(6), agent_id="agent_1", checkpoint_interval=checkpoint_interval)
+    for snapshot in [engine.state_at(sequence) for sequence in range(1, 7)] + [engine.latest()]:
+        entity = snapshot.state.entity_collections["goal"].entities_by_id["g1"]
+        entity.content = "mutated"
+        entity.status = "abandoned"
+        snapshot.state.entity_collections["goal"].entities_by_id["g2"] = Entity("g2", "extra", "pending")
+        snapshot.sequence = 99
+
+    for sequence in range(1, 7):
+        snapshot = engine.state_at(sequence)
+        assert goals(snapshot) == {"g1": (f"v{sequence}", "pending")}
+        assert snapshot.sequence == sequence
+    assert goals(engine.latest()) == {"g1": ("v6", "pending")}
@@ -0,0 +1,120 @@
+"""
+EntityIndex: incremental updates, bounded storage and result order.
+"""
+
+import pytest
+
+from nowyouseeme import EntityType, Operation, Status
+from nowyouseeme.search import EntityIndex, SearchHit, tokenize
+from nowyouseeme.standin import standin_client
+
+
+def state(**entities):
+    """State dict with entities given as <entity_type>_<entity_id>=(content, status)"""
+    collections = {}
+    for key, (content, status) in entities.items():
+        entity_type, entity_id = key.split("_", 1)
+        collections.setdefault(entity_type, {"entities_by_id": {}})["entities_by_id"][entity_id] = {
+            "id": entity_id, "content": content, "status": status
+        }
+    return {"entity_collections": collections}
+
+
+def hits(index, *args, **kwargs):
+    return [(hit.agent_id, hit.entity_id) for hit in index.search(*args, **kwargs)]
+
+
+def test_tokenize():
+    assert tokenize("Learn Go, fast-ish: v2_0!") == ["learn", "go", "fast", "ish", "v2_0"]
+
+
+def test_search_and_filters():
+    index = EntityIndex()
+    index.update_agent("a", state(goal_g1=("Master formal reasoning", "progress"),
+                                  capability_c1=("Reasoning under uncertainty", "completed")))
+    index.update_agent("b", state(goal_g1=("Learn reasoning", "pending")))
+    assert hits(index, "reasoning") == [("a", "g1"), ("a", "c1"), ("b", "g1")]
+    assert hits(index, "REASONING formal") == [("a", "g1")]
+    assert hits(index, "reasoning", entity_type=EntityType.GOAL) == [("a", "g1"), ("b", "g1")]
+    assert hits(index, "reasoning", status=[Status.PENDING, "completed"]) == [("a", "c1"), ("b", "g1")]
+    assert hits(index, "reasoning", agent_id="b") == [("b", "g1")]
+    assert hits(index, "reasoning", limit=1) == [("a", "g1")]
+    assert hits(index, "nothing") == []
+    assert index.agents("reasoning", entity_type="capability") == {"a"}
+    assert index.count() == len(index) == 3
+    assert index.search("formal")[0] == SearchHit("a", "goal", "g1", "progress", "Master formal reasoning")
+
+
+def test_update_agent_touches_only_changed_entities():
+    index = EntityIndex()
+    before = state(goal_g1=("Learn", "pending"), goal_g2=("Teach", "pending"), capability_c1=("Focus", "pending"))
+    assert index.update_agent("a", before) == 3
+    docs = dict(index._agents["a"])
+
+    assert index.update_agent("a", before) == 0
+    assert index._agents["a"] == docs
+
+    after = state(goal_g1=("Learn", "progress"), goal_g2=("Teach", "pending"), goal_g3=("Write", "pending"))
+    # g1 changed, g3 added, c1 removed; g2 keeps its document
+    assert index.update_agent("a", after) == 3
+    assert index._agents["a"][("goal", "g2")] == docs[("goal", "g2")]
+    assert hits(index, "learn", status="progress") == [("a", "g1")]
+    assert hits(index, "learn", status="pending") == []
+    assert hits(index, "focus") == []
+    assert len(index) == 3
+
+
+def test_docs_stay_bounded():
+    index = EntityIndex()
+    for i in range(1000):
+        index.update_agent("a", state(**{f"goal_g{j}": (f"goal {i} {j}", "pending") for j in range(5)}))
+        index.update_agent("b", state(goal_g1=(f"other {i}", "pending")))
+    assert len(index._docs) == len(index) == 6
+    assert len(hits(index, "goal 999")) == 5
+    assert hits(index, "998") == []
+    # Removed tokens don't linger in the postings
+    assert len(index._tokens) == len({"goal", "999", "0", "1", "2", "3", "4", "other"})
+
+    assert index.remove_agent("a")
+    assert not index.remove_agent("a")
+    index.update_agent("c", state(goal_g1=("new", "pending")))
+    assert len(index._docs) == 6
+
+
+def test_results_stay_in_indexing_order_when_ids_are_reused():
+    index = EntityIndex()
+    index.update_agent("a", state(goal_g1=("reasoning", "pending")))
+    index.update_agent("b", state(goal_g1=("reasoning", "pending")))
+    index.remove_agent("a")
+    index.update_agent("c", state(goal_g1=("reasoning", "pending")))
+    assert hits(index, "reasoning") == [("b", "g1"), ("c", "g1")]
+
+    # A changed entity counts as indexed again
+    index.update_agent("b", state(goal_g1=("reasoning", "progress")))
+    assert hits(index, "reasoning") == [("c", "g1"), ("b", "g1")]
+
+
+def test_from_gallery_and_objects():
+    client = standin_client()
+    for agent_id in ("agent_1", "agent_2"):
+        client.create_agent(agent_id, agent_id, "INTJ-A")
+        client.submit_diary(agent_id=agent_id, mbti="INTJ-A", operations=[
+            Operation("goal", "create", "g1", entity_content=f"Study {agent_id}", target_status="pending")
+        ])
+    for gallery in (client, client.get_gallery()):
+        index = EntityIndex.from_gallery(gallery)
+        assert sorted(index.agent_ids) == ["agent_1", "agent_2"]
+        assert hits(index, "study agent_2") == [("agent_2", "g1")]
+
+
+@pytest.mark.parametrize("snapshot_source", ["snapshot", "state"])
+def test_update_from_snapshot_objects(snapshot_source):
+    client = standin_client()
+    client.create_agent("agent_1", "Agent", "INTJ-A")
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[
+        Operation("goal", "create", "g1", entity_content="Ship it", target_status="pending")
+    ])
+    snapshot = client.get_snapshot("agent_1")
+    index = EntityIndex()
+    index.update_agent("agent_1", snapshot if snapshot_source == "snapshot" else snapshot.state)
+    assert hits(index, "ship") == [("agent_1", "g1")]
@@ -0,0 +1,71 @@
+"""
+ShadowStateStore following diaries through a client, against the stand-in.
+"""
+
+from nowyouseeme import AgentSnapshotResult, Operation
+from nowyouseeme.replay import new_empty_state
+from nowyouseeme.shadow import ShadowStateStore
+from nowyouseeme.standin import StandInApp, standin_client
+
+
+def create_goal(entity_id, content="Learn"):
+    return Operation("goal", "create", entity_id, entity_content=content, target_status="pending")
+
+
+def entities(state):
+    return {
+        (entity_type, entity_id): (entity.content, entity.status)
+        for entity_type, collection in state.entity_collections.items()
+        for entity_id, entity in collection.entities_by_id.items()
+    }
+
+
+def writers():
+    app = StandInApp()
+    tracked = standin_client(app, shadow_states=ShadowStateStore())
+    other = standin_client(app)
+    tracked.create_agent("agent_1", "Agent", "INTJ-A")
+    return tracked, other
+
+
+def test_shadow_follows_diaries_without_fetching():
+    client, _ = writers()
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g1"), create_goal("g2")])
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[
+        Operation("goal", "update", "g1", target_status="progress")
+    ])
+    shadow = client.shadow("agent_1")
+    server = client.get_snapshot("agent_1")
+    assert shadow.sequence == server.sequence == 5
+    assert entities(shadow.state) == entities(server.state)
+    assert client.shadow_states.drifts == 0
+    assert client.shadow_states.resyncs == 0
+
+
+def test_second_writer_is_counted_as_drift():
+    client, other = writers()
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g1")])
+    # Another writer adds a goal the shadow knows nothing about
+    other.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g2", "Written elsewhere")])
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g3")])
+
+    assert client.shadow_states.drifts == 1
+    # The shadow adopted the server's snapshot, other writer's goal included
+    shadow = client.shadow("agent_1")
+    server = client.get_snapshot("agent_1")
+    assert shadow.sequence == server.sequence == 6
+    assert entities(shadow.state) == entities(server.state)
+    assert shadow.get("goal", "g2").content == "Written elsewhere"
+
+    client.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g4")])
+    assert client.shadow_states.drifts == 1
+
+
+def test_response_without_sequence_cannot_detect_drift():
+    store = ShadowStateStore()
+    store.start("agent_1")
+    response = AgentSnapshotResult(agent_id="agent_1", state=new_empty_state(), sequence=0, updated_at=None)
+    shadow = store.record_submission("agent_1", [create_goal("g1")], response)
+    assert store.drifts == 0
+    # The expected sequence is assumed
+    assert shadow.sequence == 2
@@ -0,0 +1,174 @@
+"""
+Stand-in responses against the backend's contract: status codes, response keys and item
+keys are read from the gin.H literals and struct json tags in backend/api/*.go and
+backend/models/*.go, so the stand-in can't drift from what the Go handlers send.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from nowyouseeme.standin import StandInApp
+
+BACKEND = Path(__file__).resolve().parents[2] / "backend"
+
+_STATUS_CODES = {"StatusOK": 200, "StatusCreated": 201, "StatusBadRequest": 400, "StatusNotFound": 404}
+
+
+def _go_sources(directory):
+    return "\n".join(path.read_text() for path in sorted((BACKEND / directory).glob("*.go"))
+                     if not path.name.endswith("_test.go"))
+
+
+def handler_responses(name):
+    """[(status, keys)] of every c.JSON(status, gin.H{...}) in a handler, in source order"""
+    source = _go_sources("api")
+    body = re.search(rf"^func {name}\(.*?(?=^func |\Z)", source, re.S | re.M).group(0)
+    return [
+        (_STATUS_CODES[status], set(re.findall(r'"(\w+)":', fields)))
+        for status, fields in re.findall(r"c\.JSON\(http\.(\w+), gin\.H\{(.*?)\}\)", body, re.S)
+        if status in _STATUS_CODES
+    ]
+
+
+def success_keys(name):
+    """Keys of a handler's 2xx responses, in source order"""
+    return [(status, keys) for status, keys in handler_responses(name) if status < 300]
+
+
+def struct_keys(name):
+    """(all json keys, keys that are always present) of a Go struct"""
+    source = _go_sources("api") + _go_sources("models")
+    body = re.search(rf"type {name} struct \{{(.*?)\n\s*\}}", source, re.S).group(1)
+    tags = re.findall(r'json:"([^"]+)"', body)
+    keys = {tag.split(",")[0] for tag in tags}
+    return keys, {tag.split(",")[0] for tag in tags if "omitempty" not in tag}
+
+
+def assert_struct(data, name):
+    keys, required = struct_keys(name)
+    assert required <= set(data) <= keys, f"{name}: {sorted(data)} vs {sorted(keys)}"
+
+
+def request(app, method, path, query=None, body=None):
+    status, data = app.handle(method, "/api/v1" + path, query, json.dumps(body).encode() if body else None)
+    # Round trip through JSON, as a client would see it
+    return status, json.loads(json.dumps(data))
+
+
+@pytest.fixture
+def app():
+    app = StandInApp()
+    for agent_id, mbti in (("agent_1", "INTJ-A"), ("agent_2", "ENFP-T")):
+        request(app, "POST", "/agents", body={"agent_id": agent_id, "name": agent_id, "current_mbti": mbti})
+    return app
+
+
+def submit(app, agent_id="agent_1", operations=()):
+    return request(app, "POST", "/diaries", body={"agent_id": agent_id, "payload": {
+        "mbti": "INTJ-A",
+        "operations": list(operations) or [
+            {"entity_type": "goal", "op": "create", "entity_id": "g1", "entity_content": "Learn", "target_status": "pending"}
+        ],
+    }})
+
+
+def test_health(app):
+    assert request(app, "GET", "/health") == (200, {"status": "healthy"})
+    assert success_keys("HealthCheck") == [(200, {"status"})]
+
+
+def test_create_agent(app):
+    status, data = request(app, "POST", "/agents", body={"agent_id": "agent_3", "name": "x", "current_mbti": "ISTP-A"})
+    assert status == 201
+    assert_struct(data, "Agent")
+
+
+def test_get_agents(app):
+    submit(app)
+    (single_status, single_keys), (list_status, list_keys) = success_keys("GetAgents")
+
+    status, data = request(app, "GET", "/agents")
+    assert status == list_status and set(data) == list_keys
+    for agent in data["agents"]:
+        assert_struct(agent, "Agent")
+
+    status, data = request(app, "GET", "/agents", {"agent_id": "agent_1"})
+    assert status == single_status and set(data) == single_keys
+    assert_struct(data["agent"], "Agent")
+    assert_struct(data["snapshot"], "AgentSnapshotResult")
+    assert_struct(data["snapshot"]["state"], "AgentState")
+
+    status, data = request(app, "GET", "/agents", {"agent_id": "missing"})
+    assert (status, set(data)) in handler_responses("GetAgents")
+
+
+def test_submit_diary(app):
+    [(expected_status, keys)] = success_keys("SubmitDiary")
+    status, data = submit(app)
+    assert status == expected_status and set(data) == keys
+    # The snapshot field carries the bare AgentState
+    assert_struct(data["snapshot"], "AgentState")
+
+    status, data = submit(app, operations=[{"entity_type": "goal", "op": "update", "entity_id": "missing",
+                                            "entity_content": "x"}])
+    assert (status, set(data)) in handler_responses("SubmitDiary")
+    status, data = submit(app, agent_id="missing")
+    assert (status, set(data)) in handler_responses("SubmitDiary")
+
+
+def test_gallery(app):
+    submit(app)
+    [(expected_status, keys)] = success_keys("GetGallery")
+    status, data = request(app, "GET", "/gallery")
+    assert status == expected_status and set(data) == keys
+    # Agents without a snapshot are left out
+    [item] = data["snapshots"]
+    assert_struct(item, "AgentWithSnapshot")
+    assert_struct(item["snapshot"], "AgentSnapshotResult")
+
+
+def test_snapshot(app):
+    [(expected_status, keys)] = success_keys("GetSnapshot")
+    status, data = request(app, "GET", "/snapshot", {"agent_id": "agent_1"})
+    assert status == expected_status and set(data) == keys
+    assert data["snapshot"] is None
+
+    submit(app)
+    status, data = request(app, "GET", "/snapshot", {"agent_id": "agent_1"})
+    assert_struct(data["snapshot"], "AgentSnapshotResult")
+
+    status, data = request(app, "GET", "/snapshot")
+    assert (status, set(data)) in handler_responses("GetSnapshot")
+
+
+def test_snapshots_by_mbti(app):
+    submit(app)
+    [(expected_status, keys)] = success_keys("GetSnapshotsByMBTI")
+    status, data = request(app, "GET", "/snapshots", {"mbti": "INTJ"})
+    assert status == expected_status and set(data) == keys
+    [item] = data["snapshots"]
+    assert_struct(item, "Result")
+    assert_struct(item["snapshot"], "AgentSnapshotResult")
+
+    # mbti is required, even when agent_id is given
+    status, data = request(app, "GET", "/snapshots", {"agent_id": "agent_1"})
+    assert (status, set(data)) == (400, {"error"})
+    assert (status, set(data)) in handler_responses("GetSnapshotsByMBTI")
+
+
+def test_timeline(app):
+    submit(app)
+    [(expected_status, keys)] = success_keys("GetTimeline")
+    status, data = request(app, "GET", "/timeline", {"agent_id": "agent_1"})
+    assert status == expected_status and set(data) == keys
+    assert len(data["events"]) == 2
+    for event in data["events"]:
+        assert_struct(event, "EventResponse")
+        # Format("2006-01-02T15:04:05Z07:00")
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(Z|[+-]\d\d:\d\d)", event["timestamp"])
+
+    status, data = request(app, "GET", "/timeline")
+    assert (status, set(data)) in handler_responses("GetTimeline")
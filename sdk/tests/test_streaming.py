@@ -0,0 +1,104 @@
+"""
+JSONArrayStreamParser against json.loads, with the body cut at random chunk boundaries,
+including inside strings, escapes, multi-byte characters and numbers.
+"""
+
+import json
+import random
+
+import pytest
+
+from nowyouseeme.streaming import JSONArrayStreamParser, iter_json_array
+
+ITEMS = [
+    {"event_id": 1, "sequence_number": 1, "event_type": "create",
+     "raw_payload": {"entity_content": "quote \" backslash \\ slash / tab \t newline \n", "n": -12.5e-3}},
+    {"event_id": 22, "sequence_number": 220, "raw_payload": {"entity_content": "été 中文 \U0001f600",
+                                                              "escaped": "\\u0041 is not A"}},
+    {"brackets": "] } [ { , :", "empty": {}, "list": [[], [1, [2, [3]]]], "null": None, "flags": [True, False]},
+    123456789,
+    -0.5,
+    1e21,
+    "plain string",
+    "",
+    None,
+    [],
+]
+
+
+def document(items, key="events", indent=None, ensure_ascii=False):
+    return json.dumps({
+        "agent_id": "agent_1",
+        "decoy": {"events": [0], "text": "\"events\": [1, 2]"},
+        "numbers": [1.25, -3, 4e5],
+        key: items,
+        "total_events": len(items),
+    }, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def random_chunks(data, rng, max_size):
+    chunks, pos = [], 0
+    while pos < len(data):
+        size = rng.randint(1, max_size)
+        chunks.append(data[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def parse(chunks, keys=("events",)):
+    parser = JSONArrayStreamParser(keys, compact_threshold=16)
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True], ids=["utf8", "ascii-escapes"])
+@pytest.mark.parametrize("seed", range(1000))
+def test_random_chunk_boundaries(seed, ensure_ascii):
+    rng = random.Random(seed)
+    data = document(ITEMS, indent=rng.choice([None, 2]), ensure_ascii=ensure_ascii)
+    assert parse(random_chunks(data, rng, rng.choice([1, 2, 3, 7, 64]))) == json.loads(data)["events"]
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True], ids=["utf8", "ascii-escapes"])
+def test_every_single_split(ensure_ascii):
+    data = document(ITEMS, ensure_ascii=ensure_ascii)
+    expected = json.loads(data)["events"]
+    for split in range(1, len(data)):
+        assert parse([data[:split], data[split:]]) == expected
+
+
+@pytest.mark.parametrize("number", ["0", "-7", "123456", "2.5", "-0.125", "6.02e23", "1E-7", "-4.5e+10"])
+def test_numbers_split_anywhere(number):
+    data = ('{"events": [' + number + ", " + number + "]}").encode()
+    for split in range(1, len(data)):
+        assert parse([data[:split], data[split:]]) == [json.loads(number)] * 2
+
+
+def test_first_present_key_is_used():
+    data = document([1, 2, 3], key="timeline")
+    assert parse([data], keys=("events", "timeline")) == [1, 2, 3]
+    assert parse([data], keys=("events",)) == []
+
+
+def test_stops_after_array_closes():
+    parser = JSONArrayStreamParser(("events",))
+    assert parser.feed(b'{"events": [1, 2]') == [1, 2]
+    assert parser.done
+    assert parser.feed(b', "garbage') == []
+    assert list(iter_json_array([b'{"events": [1,', b" 2], ", b"not json"], ("events",))) == [1, 2]
+
+
+@pytest.mark.parametrize("data", [b'{"events": [1, 2', b'{"events": [{"a": "b', b'{"agent_id": "x"'])
+def test_truncated_stream_raises(data):
+    parser = JSONArrayStreamParser(("events",))
+    parser.feed(data)
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_invalid_json_raises():
+    with pytest.raises(ValueError):
+        parse([b'{"events": [1 2]}'])
@@ -0,0 +1,103 @@
+"""
+mbti_transitions on small timelines with hand-computed counts and dwells.
+"""
+
+import math
+
+import pytest
+
+from nowyouseeme.mbti import NUM_TYPES, encode_mbti
+from nowyouseeme.transitions import MBTISequences, mbti_sequence, mbti_transitions
+
+np = pytest.importorskip("numpy")
+
+INTP, ENTP, ESTJ = encode_mbti("INTP-A"), encode_mbti("ENTP-A"), encode_mbti("ESTJ-A")
+
+
+def metadata(mbti, timestamp):
+    return {"event_type": "metadata_submission", "timestamp": timestamp, "raw_payload": {"mbti": mbti}}
+
+
+def operation(timestamp):
+    return {"event_type": "create", "timestamp": timestamp,
+            "raw_payload": {"entity_type": "goal", "op": "create", "entity_id": "g1"}}
+
+
+TIMELINES = {
+    # INTP-A for two submissions (180 s), then ENTP-A until now
+    "a": [
+        metadata("INTP-A", "2026-01-01T00:00:00Z"), operation("2026-01-01T00:00:00Z"),
+        metadata("INTP-A", "2026-01-01T00:01:00Z"),
+        metadata("", "2026-01-01T00:02:00Z"),  # no MBTI: not a submission
+        metadata("ENTP-A", "2026-01-01T00:03:00Z"),
+        metadata("ENTP-A", "2026-01-01T00:03:20Z"),
+    ],
+    # Never submitted a diary
+    "b": [],
+    # ESTJ-A for one submission (30 s), then INTP-A
+    "c": [metadata("ESTJ-A", "2026-01-02T00:00:00Z"), metadata("INTP-A", "2026-01-02T00:00:30Z")],
+    # ESTJ-A then INTP-A, but the first submission has no timestamp
+    "d": [metadata("ESTJ-A", None), metadata("INTP-A", "2026-01-03T00:00:00Z")],
+}
+
+
+def transitions():
+    return mbti_transitions(MBTISequences.from_sequences(
+        (agent_id, mbti_sequence(timeline)) for agent_id, timeline in TIMELINES.items()
+    ))
+
+
+def nonzero(array):
+    return {index: value for index, value in enumerate(array.tolist()) if value}
+
+
+def test_mbti_sequence():
+    codes, timestamps = mbti_sequence(TIMELINES["a"])
+    assert codes == [INTP, INTP, ENTP, ENTP]
+    assert timestamps[0] == "2026-01-01T00:00:00Z"
+    # A decoded response works too
+    assert mbti_sequence({"agent_id": "c", "events": TIMELINES["c"]})[0] == [ESTJ, INTP]
+
+
+def test_counts():
+    result = transitions()
+    assert (result.agents, result.submissions) == (4, 8)
+    assert result.counts.shape == (NUM_TYPES, NUM_TYPES)
+    counts = {(source, target): result.counts[source, target]
+              for source, target in zip(*np.nonzero(result.counts))}
+    # a's last ENTP-A and c's first ESTJ-A are adjacent in the flat array, but not a transition
+    assert counts == {(INTP, INTP): 1, (INTP, ENTP): 1, (ENTP, ENTP): 1, (ESTJ, INTP): 2}
+    assert result.probabilities[INTP].tolist()[ENTP] == 0.5
+    assert result.top_transitions(2) == [("ESTJ-A", "INTP-A", 2, 1.0), ("INTP-A", "ENTP-A", 1, 0.5)]
+
+
+def test_completed_and_open_dwells():
+    result = transitions()
+    # a's INTP-A run, c's and d's ESTJ-A runs ended in a change
+    assert nonzero(result.completed_dwells) == {INTP: 1, ESTJ: 2}
+    # Current types: a at ENTP-A, c and d at INTP-A; b has none
+    assert nonzero(result.open_dwells) == {ENTP: 1, INTP: 2}
+    assert result.dwell_submissions[INTP] == 2.0
+    assert result.dwell_submissions[ESTJ] == 1.0
+    assert math.isnan(result.dwell_submissions[ENTP])
+
+
+def test_dwell_seconds():
+    result = transitions()
+    # From the run's first submission to the one that changed the type
+    assert result.dwell_seconds[INTP] == 180.0
+    # d's dwell has no start time and is left out
+    assert result.dwell_seconds[ESTJ] == 30.0
+    assert np.isnan(np.delete(result.dwell_seconds, [INTP, ESTJ])).all()
+
+
+@pytest.mark.parametrize("sequences", [[], [("a", ([], [])), ("b", ([], []))]], ids=["no agents", "no submissions"])
+def test_nothing_to_count(sequences):
+    result = mbti_transitions(MBTISequences.from_sequences(sequences))
+    assert (result.agents, result.submissions) == (len(sequences), 0)
+    assert result.counts.sum() == 0
+    assert result.completed_dwells.sum() == result.open_dwells.sum() == 0
+    assert np.isnan(result.dwell_submissions).all()
+    assert np.isnan(result.dwell_seconds).all()
+    assert result.probabilities.sum() == 0
+    assert result.top_transitions() == []
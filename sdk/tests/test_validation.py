@@ -0,0 +1,147 @@
+"""
+validate_operations / find_operation_errors against the backend's rules, case for case with
+backend/validation/goal_state_machine.go and validation/operation_validator.go.
+"""
+
+import pytest
+
+from nowyouseeme import AgentState, Entity, EntityCollection, Operation, ValidationError
+from nowyouseeme import find_operation_errors, is_valid_goal_transition, validate_operations
+from nowyouseeme.validation import goal_status_path, goal_status_transition_error
+
+STATUSES = ("pending", "progress", "completed", "abandoned")
+
+# validTransitions in goal_state_machine.go, plus from == to
+ALLOWED = {
+    ("pending", "pending"), ("pending", "progress"), ("pending", "abandoned"),
+    ("progress", "progress"), ("progress", "completed"), ("progress", "abandoned"), ("progress", "pending"),
+    ("completed", "completed"),
+    ("abandoned", "abandoned"), ("abandoned", "pending"), ("abandoned", "progress"),
+}
+
+
+def state_with(**entities):
+    """AgentState with the entities given as <entity_type>_<entity_id>=status"""
+    collections = {}
+    for key, status in entities.items():
+        entity_type, entity_id = key.split("_", 1)
+        collection = collections.setdefault(entity_type, EntityCollection())
+        collection.entities_by_id[entity_id] = Entity(entity_id, f"{entity_id} content", status)
+    return AgentState(mbti="INTJ-A", entity_collections=collections)
+
+
+@pytest.mark.parametrize("from_status", STATUSES)
+@pytest.mark.parametrize("to_status", STATUSES)
+def test_goal_transitions_match_state_machine(from_status, to_status):
+    allowed = (from_status, to_status) in ALLOWED
+    assert is_valid_goal_transition(from_status, to_status) is allowed
+    error = goal_status_transition_error(from_status, to_status)
+    assert error == (None if allowed else f"invalid status transition: {from_status} -> {to_status}")
+
+    state = state_with(goal_g1=from_status)
+    errors = find_operation_errors([Operation("goal", "update", "g1", target_status=to_status)], state)
+    assert errors == ([] if allowed else [f"operation[0]: invalid status transition: {from_status} -> {to_status}"])
+
+
+@pytest.mark.parametrize("from_status", STATUSES)
+@pytest.mark.parametrize("to_status", STATUSES)
+def test_other_entity_types_skip_state_machine(from_status, to_status):
+    state = state_with(capability_c1=from_status)
+    assert find_operation_errors([Operation("capability", "update", "c1", target_status=to_status)], state) == []
+
+
+def test_unknown_from_status():
+    assert goal_status_transition_error("paused", "pending") == "unknown status: paused"
+    assert find_operation_errors([Operation("goal", "update", "g1", target_status="pending")],
+                                 state_with(goal_g1="paused")) == ["operation[0]: unknown status: paused"]
+
+
+@pytest.mark.parametrize("from_status", STATUSES)
+@pytest.mark.parametrize("to_status", STATUSES)
+def test_goal_status_path_is_a_legal_walk(from_status, to_status):
+    path = goal_status_path(from_status, to_status)
+    if from_status == "completed" and to_status != "completed":
+        assert path is None
+        return
+    assert path is not None
+    current = from_status
+    for step in path:
+        assert (current, step) in ALLOWED
+        current = step
+    assert current == to_status
+
+
+@pytest.mark.parametrize("operation, state, error", [
+    # validateOperation
+    (Operation("mood", "create", "m1", "x", "pending"), None, "invalid entity type: mood"),
+    (Operation("goal", "rename", "g1", "x"), None, "invalid operation type: rename"),
+    # validateCreate
+    (Operation("goal", "create", "", "x", "pending"), None, "create goal requires entity_id and entity_content"),
+    (Operation("goal", "create", "g1", None, "pending"), None, "create goal requires entity_id and entity_content"),
+    (Operation("goal", "create", "g1", "x", "pending"), state_with(goal_g1="pending"), "goal g1 already exists"),
+    (Operation("goal", "create", "g1", "x"), None, "create goal requires target_status"),
+    (Operation("goal", "create", "g1", "x", "done"), None, "invalid status: done"),
+    (Operation("goal", "create", "g1", "x", "completed"), None,
+     "new goal can only be pending or progress, got: completed"),
+    (Operation("capability", "create", "c1", "x", "abandoned"), None,
+     "new capability can only be pending or progress, got: abandoned"),
+    (Operation("goal", "create", "g1", "x", "pending"), None, None),
+    (Operation("aspiration", "create", "a1", "x", "progress"), None, None),
+    # validateUpdate
+    (Operation("goal", "update", "", "x"), None, "update goal requires entity_id"),
+    (Operation("goal", "update", "g1", "x"), None, "goal g1 not found"),
+    (Operation("goal", "update", "g1", "x"), state_with(capability_g1="pending"), "goal g1 not found"),
+    (Operation("goal", "update", "g1"), state_with(goal_g1="pending"),
+     "update goal requires at least one of: entity_content or target_status"),
+    (Operation("goal", "update", "g1", target_status="done"), state_with(goal_g1="pending"), "invalid status: done"),
+    (Operation("goal", "update", "g1", "x"), state_with(goal_g1="completed"), None),
+    # validateDelete
+    (Operation("goal", "delete", ""), None, "delete goal requires entity_id"),
+    (Operation("limitation", "delete", "l1"), None, "limitation l1 not found"),
+    (Operation("goal", "delete", "g1"), state_with(goal_g1="completed"), None),
+])
+def test_operation_rules(operation, state, error):
+    expected = [] if error is None else [f"operation[0]: {error}"]
+    assert find_operation_errors([operation], state) == expected
+    assert find_operation_errors([operation.to_dict()], state) == expected
+
+
+def test_batch_sees_earlier_operations():
+    operations = [
+        Operation("goal", "create", "g1", "Learn", "pending"),
+        Operation("goal", "update", "g1", target_status="progress"),
+        Operation("goal", "update", "g1", target_status="completed"),
+        Operation("goal", "update", "g1", target_status="pending"),   # completed is terminal
+        Operation("goal", "delete", "g1"),
+        Operation("goal", "update", "g1", "Learn Go"),                # deleted above
+        Operation("goal", "create", "g1", "Learn Go", "progress"),
+    ]
+    assert find_operation_errors(operations) == [
+        "operation[3]: invalid status transition: completed -> pending",
+        "operation[5]: goal g1 not found",
+    ]
+
+
+def test_invalid_operations_are_skipped():
+    # ValidateOperations doesn't apply a failed operation, so g1 is still missing afterwards
+    operations = [
+        Operation("goal", "create", "g1", None, "pending"),
+        Operation("goal", "update", "g1", target_status="progress"),
+    ]
+    assert find_operation_errors(operations) == [
+        "operation[0]: create goal requires entity_id and entity_content",
+        "operation[1]: goal g1 not found",
+    ]
+
+
+def test_validate_operations_raises_with_every_error():
+    with pytest.raises(ValidationError) as excinfo:
+        validate_operations([
+            Operation("goal", "update", "g1", "x"),
+            Operation("goal", "create", "g2", "x", "completed"),
+        ])
+    assert excinfo.value.errors == [
+        "operation[0]: goal g1 not found",
+        "operation[1]: new goal can only be pending or progress, got: completed",
+    ]
+    validate_operations([Operation("goal", "update", "g1", "x")], state_with(goal_g1="pending"))
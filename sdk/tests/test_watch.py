@@ -0,0 +1,102 @@
+"""
+WatchSchedule backoff and client.watch() against the stand-in.
+"""
+
+import pytest
+
+from nowyouseeme import Operation
+from nowyouseeme.diff import ChangeKind
+from nowyouseeme.standin import StandInApp, standin_client
+from nowyouseeme.watch import WatchSchedule
+
+
+def test_schedule_starts_everyone_due():
+    schedule = WatchSchedule(["a", "b", "a"], interval=1.0, now=10.0)
+    assert len(schedule) == 2
+    assert schedule.next_due() == 10.0
+    assert schedule.pop_due(9.9) == []
+    assert sorted(schedule.pop_due(10.0)) == ["a", "b"]
+    assert schedule.next_due() is None
+
+
+def test_quiet_agent_backs_off_up_to_max_interval():
+    schedule = WatchSchedule(["a"], interval=1.0, max_interval=10.0, backoff=2.0)
+    now = 0.0
+    waits = []
+    for _ in range(7):
+        assert schedule.pop_due(now) == ["a"]
+        schedule.reschedule("a", changed=False, now=now)
+        waits.append(schedule.next_due() - now)
+        now = schedule.next_due()
+    assert waits == [2.0, 4.0, 8.0, 10.0, 10.0, 10.0, 10.0]
+
+
+def test_change_resets_interval():
+    schedule = WatchSchedule(["a", "b"], interval=1.0, max_interval=30.0, backoff=3.0)
+    for now in (0.0, 3.0, 12.0):
+        for agent_id in schedule.pop_due(now):
+            schedule.reschedule(agent_id, changed=False, now=now)
+    assert schedule.intervals == {"a": 27.0, "b": 27.0}
+
+    assert sorted(schedule.pop_due(39.0)) == ["a", "b"]
+    schedule.reschedule("a", changed=True, now=39.0)
+    schedule.reschedule("b", changed=False, now=39.0)
+    assert schedule.intervals == {"a": 1.0, "b": 30.0}
+    assert schedule.pop_due(40.0) == ["a"]
+    assert schedule.next_due() == 69.0
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"interval": 0}, "interval"),
+    ({"interval": 2.0, "max_interval": 1.0}, "max_interval"),
+    ({"backoff": 0.5}, "backoff"),
+])
+def test_schedule_rejects_bad_settings(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        WatchSchedule(["a"], **kwargs)
+
+
+def create_goal(entity_id):
+    return Operation("goal", "create", entity_id, entity_content=f"Learn {entity_id}", target_status="pending")
+
+
+def test_watch_yields_exactly_the_changed_agents():
+    app = StandInApp()
+    client = standin_client(app)
+    writer = standin_client(app)
+    for agent_id in ("agent_1", "agent_2", "agent_3"):
+        client.create_agent(agent_id, agent_id, "INTJ-A")
+        client.submit_diary(agent_id=agent_id, mbti="INTJ-A", operations=[create_goal("g1")])
+
+    # Write once the watcher holds its snapshots, i.e. on its first timeline check
+    get_timeline = client.get_timeline
+    written = []
+
+    def check_then_write(agent_id, after_sequence=None):
+        if not written:
+            written.append(True)
+            writer.submit_diary(agent_id="agent_1", mbti="INTJ-A", operations=[create_goal("g2")])
+            writer.submit_diary(agent_id="agent_3", mbti="INTJ-A", operations=[
+                Operation("goal", "update", "g1", target_status="progress")
+            ])
+        return get_timeline(agent_id, after_sequence=after_sequence)
+
+    client.get_timeline = check_then_write
+    changes = list(client.watch(["agent_1", "agent_2", "agent_3"], interval=0.02, max_interval=0.1, timeout=0.5))
+
+    assert sorted(change.agent_id for change in changes) == ["agent_1", "agent_3"]
+    by_agent = {change.agent_id: change for change in changes}
+
+    change = by_agent["agent_1"]
+    assert (change.previous_sequence, change.sequence) == (2, 4)
+    assert [event["sequence_number"] for event in change.events] == [3, 4]
+    assert [(c.kind, c.entity_id) for c in change.diff] == [(ChangeKind.ADDED, "g2")]
+
+    change = by_agent["agent_3"]
+    assert (change.previous_sequence, change.sequence) == (2, 4)
+    assert [(c.kind, c.entity_id) for c in change.diff] == [(ChangeKind.STATUS_CHANGED, "g1")]
+
+    for agent_id, change in by_agent.items():
+        server = client.get_snapshot(agent_id)
+        assert change.snapshot.sequence == server.sequence
+        assert change.snapshot.state.entity_collections["goal"] == server.state.entity_collections["goal"]
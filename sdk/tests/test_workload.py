@@ -0,0 +1,182 @@
+"""
+Workload files: reproducible generation, per-agent ordering in run_keyed, and replay
+against the stand-in.
+"""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nowyouseeme import Operation
+from nowyouseeme.standin import standin_client
+from nowyouseeme.workload import WorkloadWriter, read_workload, replay_workload, run_keyed, run_keyed_async
+
+SDK = Path(__file__).resolve().parents[1]
+
+GENERATE = """
+import sys
+sys.path.insert(0, "scripts")
+from generate_workload import write_workload
+write_workload(sys.argv[1], num_agents=40, max_entries=6, min_entries=1, seed=7, quiet=True)
+"""
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".ndjson.gz"])
+def test_same_seed_writes_identical_files_whatever_the_hash_seed(tmp_path, suffix):
+    contents = []
+    for hash_seed in ("0", "1", "12345"):
+        path = tmp_path / f"load_{hash_seed}{suffix}"
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        subprocess.run([sys.executable, "-c", GENERATE, str(path)], cwd=SDK, env=env, check=True)
+        contents.append(path.read_bytes())
+    assert contents[0] == contents[1] == contents[2]
+
+    records = list(read_workload(str(tmp_path / f"load_0{suffix}")))
+    assert records[0]["type"] == "workload" and records[0]["seed"] == 7
+    assert sum(record["type"] == "agent" for record in records) == 40
+
+
+def keyed_items(keys=20, per_key=30, seed=0):
+    """(key, index) items, each key's indexes in order, keys randomly interleaved"""
+    rng = random.Random(seed)
+    remaining = {f"k{key}": 0 for key in range(keys)}
+    items = []
+    while remaining:
+        key = rng.choice(sorted(remaining))
+        items.append((key, remaining[key]))
+        remaining[key] += 1
+        if remaining[key] == per_key:
+            del remaining[key]
+    return items
+
+
+class Recorder:
+    """handle that records each key's order and checks a key never runs twice at once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.order = {}
+        self.running = set()
+        self.overlaps = 0
+        self.max_running = 0
+        self.rng = random.Random(1)
+
+    def start(self, item):
+        key, index = item
+        with self.lock:
+            if key in self.running:
+                self.overlaps += 1
+            self.running.add(key)
+            self.max_running = max(self.max_running, len(self.running))
+            return self.rng.random() * 0.001
+
+    def finish(self, item):
+        key, index = item
+        with self.lock:
+            self.running.discard(key)
+            self.order.setdefault(key, []).append(index)
+
+    def __call__(self, item):
+        time.sleep(self.start(item))
+        self.finish(item)
+
+
+@pytest.mark.parametrize("max_pending", [1, 7, 10000])
+def test_run_keyed_keeps_each_key_in_order(max_pending):
+    items = keyed_items()
+    recorder = Recorder()
+    run_keyed(items, key=lambda item: item[0], handle=recorder, workers=8, max_pending=max_pending)
+    assert recorder.overlaps == 0
+    assert recorder.order == {key: list(range(30)) for key in recorder.order}
+    assert len(recorder.order) == 20
+    if max_pending > 1:
+        assert recorder.max_running > 1
+
+
+def test_run_keyed_async_keeps_each_key_in_order():
+    items = keyed_items()
+    recorder = Recorder()
+
+    async def handle(item):
+        await asyncio.sleep(recorder.start(item))
+        recorder.finish(item)
+
+    asyncio.run(run_keyed_async(items, key=lambda item: item[0], handle=handle, concurrency=8, max_pending=7))
+    assert recorder.overlaps == 0
+    assert recorder.order == {key: list(range(30)) for key in recorder.order}
+    assert len(recorder.order) == 20
+
+
+class Stop(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("error", [ValueError("broken"), Stop()])
+def test_run_keyed_reraises_what_handle_raises(error):
+    items = keyed_items(keys=5, per_key=200)
+    handled = []
+
+    def handle(item):
+        if item == ("k2", 3):
+            raise error
+        handled.append(item)
+
+    with pytest.raises(type(error)):
+        run_keyed(items, key=lambda item: item[0], handle=handle, workers=4, max_pending=3)
+    # Nothing after the failed item of its key ran, and the rest stopped early
+    assert [index for key, index in handled if key == "k2"] == [0, 1, 2]
+    assert len(handled) < len(items) - 1
+
+
+def test_run_keyed_async_reraises_what_handle_raises():
+    items = keyed_items(keys=5, per_key=200)
+    handled = []
+
+    async def handle(item):
+        await asyncio.sleep(0)
+        if item == ("k2", 3):
+            raise ValueError("broken")
+        handled.append(item)
+
+    with pytest.raises(ValueError, match="broken"):
+        asyncio.run(run_keyed_async(items, key=lambda item: item[0], handle=handle, concurrency=4, max_pending=3))
+    assert [index for key, index in handled if key == "k2"] == [0, 1, 2]
+    assert len(handled) < len(items) - 1
+
+
+def test_replay_against_the_standin(tmp_path):
+    path = str(tmp_path / "load.ndjson.gz")
+    with WorkloadWriter(path, metadata={"seed": 1}) as writer:
+        for index in range(10):
+            agent_id = f"agent_{index}"
+            writer.write_agent(agent_id, f"Agent {index}", "INTJ-A")
+            writer.write_diary(agent_id, mbti="INTJ-A", operations=[
+                Operation("goal", "create", "g1", entity_content="Learn", target_status="pending")
+            ])
+            writer.write_diary(agent_id, mbti="INTJ-A", operations=[
+                Operation("goal", "update", "g1", target_status="progress")
+            ])
+    # The second agent's diaries are invalid without its first one
+    with WorkloadWriter(str(tmp_path / "broken.ndjson"), metadata={}) as writer:
+        writer.write_agent("agent_x", "Agent X", "INTJ-A")
+        writer.write_diary("agent_x", mbti="INTJ-A", operations=[
+            Operation("goal", "update", "missing", target_status="progress")
+        ])
+        writer.write_diary("agent_x", mbti="INTJ-A", operations=[])
+
+    client = standin_client()
+    result = replay_workload(client, path, max_workers=4)
+    assert (result.agents, result.diaries, result.failed, result.skipped) == (10, 20, 0, 0)
+    for index in range(10):
+        assert client.get_snapshot(f"agent_{index}").sequence == 4
+
+    result = replay_workload(client, str(tmp_path / "broken.ndjson"), max_workers=4)
+    assert (result.agents, result.diaries, result.failed, result.skipped) == (1, 0, 1, 1)
+    assert "agent_x" in result.errors